@@ -0,0 +1 @@
+"""Benchmarks - 処理性能の計測スクリプト"""
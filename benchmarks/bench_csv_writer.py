@@ -0,0 +1,86 @@
+"""CSV書き出しのベンチマーク
+
+CsvWriter と DataFrame.to_csv() で結合結果と同じ形式のDataFrameを書き出し、
+1秒あたりの行数を比較します。
+
+使用例:
+    python -m benchmarks.bench_csv_writer
+    python -m benchmarks.bench_csv_writer --days 3650 --repeat 3
+"""
+import argparse
+import io
+import time
+
+import numpy as np
+import pandas as pd
+
+from domain.models.csv_schema import CsvSchema
+from infra.repositories.csv_writer import CsvWriter
+
+
+def make_merged_frame(days: int, seed: int = 0) -> pd.DataFrame:
+    """結合結果と同じ形式（1時間ごと、7列）のDataFrameを生成する
+
+    Args:
+        days: 日数
+        seed: 乱数のシード
+
+    Returns:
+        格納型に変換済みのDataFrame
+    """
+    rng = np.random.default_rng(seed)
+    rows = days * 24
+    return CsvSchema.to_storage_dtypes(pd.DataFrame({
+        "No": np.arange(1, rows + 1),
+        "日時": pd.date_range("2016-01-01", periods=rows, freq="h"),
+        "電圧": rng.integers(95, 106, rows),
+        "周波数": rng.integers(49, 52, rows),
+        "パワー": rng.integers(0, 5000, rows),
+        "工事フラグ": rng.integers(0, 2, rows),
+        "参照": np.ones(rows, dtype=np.int64),
+    }))
+
+
+def _best_seconds(write, repeat: int) -> float:
+    """repeat 回実行した中で最短の所要時間を返す"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        write()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CSV書き出しのベンチマーク")
+    parser.add_argument("--days", type=int, default=365, help="データの日数（デフォルト: 365）")
+    parser.add_argument("--repeat", type=int, default=3, help="計測回数（デフォルト: 3）")
+    args = parser.parse_args()
+
+    df = make_merged_frame(args.days)
+    writer = CsvWriter()
+
+    def write_to_csv() -> bytes:
+        buffer = io.StringIO()
+        df.to_csv(buffer, index=False, date_format=CsvSchema.DATETIME_OUTPUT_FORMAT)
+        return buffer.getvalue().encode("utf-8")
+
+    def write_csv_writer() -> bytes:
+        buffer = io.BytesIO()
+        writer.write(df, buffer, header=True)
+        return buffer.getvalue()
+
+    if write_to_csv() != write_csv_writer():
+        raise SystemExit("出力が to_csv() と一致しません")
+
+    rows = len(df)
+    baseline = _best_seconds(write_to_csv, args.repeat)
+    fast = _best_seconds(write_csv_writer, args.repeat)
+    print(f"行数: {rows:,}")
+    print(f"to_csv()  : {baseline:.3f}秒 ({rows / baseline:,.0f} 行/秒)")
+    print(f"CsvWriter : {fast:.3f}秒 ({rows / fast:,.0f} 行/秒)")
+    print(f"速度比    : {baseline / fast:.1f}倍")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""ベンチマーク用の時系列CSVデータ生成
+
+1日1ファイル（00時〜23時の24行）の日次CSVを、CsvRepository が受け付ける
+すべてのレイアウト・文字コードで生成します。値は実データに近い動き
+（電圧・周波数の小さな揺らぎ、パワーの日周変動、まれな工事フラグ）をします。
+
+使用例:
+    python -m benchmarks.data_generator /tmp/bench_10y --scale 10y
+    python -m benchmarks.data_generator /tmp/bench_cp932 --days 30 --layout headerless --encoding cp932
+"""
+import argparse
+import gzip
+from datetime import date, timedelta
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from domain.models.csv_schema import CsvSchema
+
+
+class FileLayout(NamedTuple):
+    """日次CSVファイルのレイアウト
+
+    Attributes:
+        header: ヘッダー行を書き出す場合はTrue
+        columns: 書き出すカラム（ヘッダーなしの場合は日時・電圧・周波数・パワー・工事フラグの順）
+        quoted: すべてのフィールドをダブルクォートで囲む場合はTrue
+        trailing_comma: 各行の末尾にカンマを付ける（空の列が1つ増える）場合はTrue
+    """
+
+    header: bool
+    columns: tuple[str, ...]
+    quoted: bool = False
+    trailing_comma: bool = False
+
+
+_FULL = ("No", "日時", "電圧", "周波数", "パワー", "工事フラグ", "参照")
+_HEADERLESS = ("日時", "電圧", "周波数", "パワー", "工事フラグ")
+
+# CsvRepository が受け付けるレイアウト
+LAYOUTS: dict[str, FileLayout] = {
+    "full": FileLayout(header=True, columns=_FULL),
+    "without_no": FileLayout(header=True, columns=_FULL[1:]),
+    "without_ref": FileLayout(header=True, columns=_FULL[:-1]),
+    "without_no_ref": FileLayout(header=True, columns=_FULL[1:-1]),
+    "shuffled": FileLayout(header=True, columns=("日時", "電圧", "No", "周波数", "パワー", "参照", "工事フラグ")),
+    "quoted": FileLayout(header=True, columns=_FULL, quoted=True),
+    "trailing_comma": FileLayout(header=True, columns=_FULL, trailing_comma=True),
+    "headerless": FileLayout(header=False, columns=_HEADERLESS),
+    "headerless_trailing_comma": FileLayout(header=False, columns=_HEADERLESS, trailing_comma=True),
+}
+
+# 文字コード（utf-8-sig は BOM 付き UTF-8）
+ENCODINGS: tuple[str, ...] = ("utf-8", "utf-8-sig", "cp932", "shift_jis")
+
+# データセットの規模（日数 = ファイル数）
+# 妥当な年の範囲（1900〜2100年）に収まる連続した日数は最大 73,414 日のため、
+# 最大規模の "max" はその全範囲を 1900-01-01 から生成する
+SCALES: dict[str, int] = {
+    "1d": 1,
+    "1w": 7,
+    "1m": 30,
+    "1y": 365,
+    "10y": 3652,
+    "30y": 10957,
+    "max": (date(CsvSchema.MAX_VALID_YEAR, 12, 31) - date(CsvSchema.MIN_VALID_YEAR, 1, 1)).days + 1,
+}
+
+# 既定の開始日（"max" 以外）
+DEFAULT_START = date(2000, 1, 1)
+
+# 複数のレイアウト・文字コードを混在させる指定
+MIXED = "mixed"
+
+
+class DatasetInfo(NamedTuple):
+    """生成したデータセットの概要
+
+    Attributes:
+        files: 生成したファイルのパス（日付順）
+        rows: データ行数の合計
+        bytes: ファイルサイズの合計
+    """
+
+    files: list[Path]
+    rows: int
+    bytes: int
+
+
+def generate_dataset(
+    output_dir: str | Path,
+    days: int,
+    start: date | None = None,
+    layout: str = MIXED,
+    encoding: str = MIXED,
+    compression: str | None = None,
+    seed: int = 0,
+) -> DatasetInfo:
+    """日次CSVのデータセットを生成する
+
+    Args:
+        output_dir: 出力先のディレクトリ
+        days: 日数（= ファイル数）
+        start: 開始日（Noneの場合は DEFAULT_START、全範囲の場合は妥当な範囲の最初の日）
+        layout: レイアウト名（LAYOUTS のキー、"mixed" の場合はファイルごとに無作為に選ぶ）
+        encoding: 文字コード（ENCODINGS の値、"mixed" の場合はファイルごとに無作為に選ぶ）
+        compression: "gzip" の場合は .csv.gz で書き出す
+        seed: 乱数のシード（同じ引数からは同じファイルが生成される）
+
+    Returns:
+        生成したデータセットの概要
+
+    Raises:
+        ValueError: 引数が不正、または日付が妥当な年の範囲を超える場合
+    """
+    if days < 1:
+        raise ValueError(f"日数は1以上を指定してください: {days}")
+    if layout != MIXED and layout not in LAYOUTS:
+        raise ValueError(f"未対応のレイアウトです: {layout}（対応: {MIXED}, {', '.join(LAYOUTS)}）")
+    if encoding != MIXED and encoding not in ENCODINGS:
+        raise ValueError(f"未対応の文字コードです: {encoding}（対応: {MIXED}, {', '.join(ENCODINGS)}）")
+    if compression not in (None, "gzip"):
+        raise ValueError(f"未対応の圧縮形式です: {compression}")
+
+    if start is None:
+        start = DEFAULT_START if days <= SCALES["30y"] else date(CsvSchema.MIN_VALID_YEAR, 1, 1)
+    end = start + timedelta(days=days - 1)
+    if start.year < CsvSchema.MIN_VALID_YEAR or end.year > CsvSchema.MAX_VALID_YEAR:
+        raise ValueError(
+            f"日付が妥当な範囲（{CsvSchema.MIN_VALID_YEAR}〜{CsvSchema.MAX_VALID_YEAR}年）を超えます: "
+            f"{start} 〜 {end}"
+        )
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    layout_names = list(LAYOUTS)
+    values = _generate_values(rng, days)
+
+    files: list[Path] = []
+    total_bytes = 0
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        file_layout = LAYOUTS[
+            layout_names[rng.integers(len(layout_names))] if layout == MIXED else layout
+        ]
+        file_encoding = ENCODINGS[rng.integers(len(ENCODINGS))] if encoding == MIXED else encoding
+        text = _render_day(day, file_layout, {name: column[offset] for name, column in values.items()})
+        data = text.encode(file_encoding)
+        path = output_path / f"{day:%Y%m%d}.csv"
+        if compression == "gzip":
+            data = gzip.compress(data, mtime=0)
+            path = path.with_name(path.name + ".gz")
+        path.write_bytes(data)
+        files.append(path)
+        total_bytes += len(data)
+
+    return DatasetInfo(files=files, rows=days * CsvSchema.EXPECTED_RECORDS_PER_DAY, bytes=total_bytes)
+
+
+def _generate_values(rng: np.random.Generator, days: int) -> dict[str, np.ndarray]:
+    """全期間の値を (日数, 24) の配列でまとめて生成する
+
+    Args:
+        rng: 乱数生成器
+        days: 日数
+
+    Returns:
+        カラム名ごとの (日数, 24) の整数配列
+    """
+    hours = CsvSchema.EXPECTED_RECORDS_PER_DAY
+    shape = (days, hours)
+    # 電圧: 100V 前後の小さな揺らぎ
+    voltage = 100 + np.clip(np.rint(rng.normal(0, 1.5, shape)), -6, 6)
+    # 周波数: 50Hz でまれに ±1
+    frequency = 50 + rng.choice([-1, 0, 1], size=shape, p=[0.02, 0.96, 0.02])
+    # パワー: 昼に大きくなる日周変動と日ごとの変動
+    daily_curve = 1000 + 800 * np.sin(np.linspace(-np.pi / 2, 3 * np.pi / 2, hours))
+    power = daily_curve * rng.uniform(0.7, 1.3, (days, 1)) + rng.normal(0, 50, shape)
+    # 工事フラグ: まれな日の日中のみ
+    construction = np.zeros(shape, dtype=np.int64)
+    construction_days = rng.random(days) < 0.02
+    construction[construction_days, 9:17] = 1
+    return {
+        "No": np.broadcast_to(np.arange(1, hours + 1), shape),
+        "電圧": voltage.astype(np.int64),
+        "周波数": frequency.astype(np.int64),
+        "パワー": np.clip(np.rint(power), 0, None).astype(np.int64),
+        "工事フラグ": construction,
+        "参照": rng.integers(0, 2, shape),
+    }
+
+
+def _render_day(day: date, layout: FileLayout, values: dict[str, np.ndarray]) -> str:
+    """1日分のCSV文字列を生成する
+
+    Args:
+        day: 日付
+        layout: レイアウト
+        values: カラム名ごとの24時間分の値
+
+    Returns:
+        CSV文字列
+    """
+    stamps = [f"{day:%Y/%m/%d} {hour:02d}:00:00" for hour in range(CsvSchema.EXPECTED_RECORDS_PER_DAY)]
+    columns = [
+        stamps if name == CsvSchema.TIMESTAMP_COLUMN else [str(v) for v in values[name].tolist()]
+        for name in layout.columns
+    ]
+    rows = [list(layout.columns)] if layout.header else []
+    rows += [list(row) for row in zip(*columns)]
+    if layout.quoted:
+        rows = [[f'"{field}"' for field in row] for row in rows]
+    suffix = "," if layout.trailing_comma else ""
+    return "".join(",".join(row) + suffix + "\n" for row in rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ベンチマーク用の日次CSVを生成します")
+    parser.add_argument("output_dir", help="出力先のディレクトリ")
+    size = parser.add_mutually_exclusive_group(required=True)
+    size.add_argument("--scale", choices=list(SCALES), help="データセットの規模")
+    size.add_argument("--days", type=int, help="日数（= ファイル数）")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="開始日（YYYY-MM-DD）")
+    parser.add_argument("--layout", default=MIXED, help=f"レイアウト（{MIXED}, {', '.join(LAYOUTS)}）")
+    parser.add_argument("--encoding", default=MIXED, help=f"文字コード（{MIXED}, {', '.join(ENCODINGS)}）")
+    parser.add_argument("--compress", choices=["gzip"], default=None, help="gzip 圧縮して書き出す")
+    parser.add_argument("--seed", type=int, default=0, help="乱数のシード（デフォルト: 0）")
+    args = parser.parse_args()
+
+    info = generate_dataset(
+        args.output_dir,
+        days=SCALES[args.scale] if args.scale else args.days,
+        start=args.start,
+        layout=args.layout,
+        encoding=args.encoding,
+        compression=args.compress,
+        seed=args.seed,
+    )
+    print(f"{len(info.files)}ファイル、{info.rows:,}行、{info.bytes / 1e6:.1f}MB を生成しました: {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""読み込み・結合・保存のベンチマーク
+
+data_generator で生成したデータセットに対して CsvRepository.load_many()、
+CsvMerger.merge()、CsvRepository.save() の所要時間をフェーズごとに計測し、
+行/秒・MB/秒・ピークRSSを JSON に記録します。保存済みのベースラインとの
+比較結果を表示し、許容範囲を超えて遅くなったフェーズがあれば終了コード1で終了します。
+
+各規模は新しいプロセス（spawn）で計測するため、ピークRSSは規模ごとの値になります。
+
+使用例:
+    python -m benchmarks.run_benchmarks --scales 1y 10y
+    python -m benchmarks.run_benchmarks --scales 1y 10y --output result.json
+    python -m benchmarks.run_benchmarks --scales 1y 10y --save-baseline
+"""
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.data_generator import SCALES, generate_dataset
+from domain.services.csv_merger import CsvMerger
+from infra.repositories.csv_repository import CsvRepository
+
+
+# 保存済みのベースライン
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+# 既定で計測する規模
+DEFAULT_SCALES = ["1m", "1y", "10y"]
+
+# 計測するフェーズ
+PHASES = ("load", "merge", "save")
+
+# ベースラインより遅いとみなす所要時間の比率の許容幅（0.25 = 25%増まで許容）
+DEFAULT_TOLERANCE = 0.25
+
+
+def _peak_rss_mb() -> float:
+    """このプロセスのピークRSS（MB）"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux は KB、macOS はバイト単位
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_scale(scale: str, repeat: int = 1, seed: int = 0) -> dict:
+    """1つの規模のデータセットを生成して各フェーズを計測する
+
+    Args:
+        scale: データセットの規模（SCALES のキー）
+        repeat: 計測回数（各フェーズの最短時間を記録）
+        seed: データ生成の乱数のシード
+
+    Returns:
+        計測結果
+    """
+    with tempfile.TemporaryDirectory(prefix=f"bench_{scale}_") as work_dir:
+        dataset = generate_dataset(Path(work_dir) / "input", SCALES[scale], seed=seed)
+        output_dir = Path(work_dir) / "output"
+        best = {phase: float("inf") for phase in PHASES}
+        for _ in range(repeat):
+            repository = CsvRepository()
+            merger = CsvMerger()
+
+            start = time.perf_counter()
+            csv_files = repository.load_many(dataset.files)
+            loaded = time.perf_counter()
+            merged = merger.merge(csv_files)
+            merged_at = time.perf_counter()
+            output_path = repository.save(merged, output_dir)
+            saved = time.perf_counter()
+
+            best["load"] = min(best["load"], loaded - start)
+            best["merge"] = min(best["merge"], merged_at - loaded)
+            best["save"] = min(best["save"], saved - merged_at)
+            output_bytes = output_path.stat().st_size
+            merged_bytes = merged.memory_bytes
+            rows = len(merged.data)
+            output_path.unlink()
+            del csv_files, merged
+
+    # load は入力ファイル、merge は結合結果のメモリ上のサイズ、save は出力ファイルを基準にする
+    phase_bytes = {"load": dataset.bytes, "merge": merged_bytes, "save": output_bytes}
+    return {
+        "files": len(dataset.files),
+        "rows": rows,
+        "input_bytes": dataset.bytes,
+        "output_bytes": output_bytes,
+        "phases": {
+            phase: {
+                "seconds": round(best[phase], 6),
+                "rows_per_sec": round(rows / best[phase]),
+                "mb_per_sec": round(phase_bytes[phase] / 1e6 / best[phase], 3),
+            }
+            for phase in PHASES
+        },
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def run_benchmarks(scales: list[str], repeat: int = 1, seed: int = 0) -> dict:
+    """各規模を別プロセスで計測する
+
+    Args:
+        scales: 計測する規模
+        repeat: 計測回数
+        seed: データ生成の乱数のシード
+
+    Returns:
+        実行環境と規模ごとの計測結果
+    """
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for scale in scales:
+        with context.Pool(processes=1) as pool:
+            results[scale] = pool.apply(run_scale, (scale, repeat, seed))
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": multiprocessing.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def compare_with_baseline(result: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """ベースラインと比較し、遅くなったフェーズを返す
+
+    Args:
+        result: 今回の計測結果
+        baseline: ベースラインの計測結果
+        tolerance: 所要時間の比率の許容幅
+
+    Returns:
+        許容範囲を超えて遅くなった "規模/フェーズ" のリスト
+    """
+    regressions = []
+    for scale, measured in result["results"].items():
+        reference = baseline.get("results", {}).get(scale)
+        if reference is None:
+            continue
+        for phase in PHASES:
+            ratio = measured["phases"][phase]["seconds"] / reference["phases"][phase]["seconds"]
+            if ratio > 1 + tolerance:
+                regressions.append(f"{scale}/{phase}")
+    return regressions
+
+
+def format_report(result: dict, baseline: dict | None) -> str:
+    """計測結果を表形式の文字列にする
+
+    Args:
+        result: 今回の計測結果
+        baseline: ベースラインの計測結果（Noneの場合は比較しない）
+
+    Returns:
+        表示用の文字列
+    """
+    lines = [f"{'規模':<6}{'フェーズ':<8}{'秒':>10}{'行/秒':>14}{'MB/秒':>10}{'基準比':>8}"]
+    for scale, measured in result["results"].items():
+        reference = (baseline or {}).get("results", {}).get(scale)
+        for phase in PHASES:
+            values = measured["phases"][phase]
+            ratio = ""
+            if reference is not None:
+                ratio = f"{values['seconds'] / reference['phases'][phase]['seconds']:.2f}x"
+            lines.append(
+                f"{scale:<6}{phase:<8}{values['seconds']:>10.3f}"
+                f"{values['rows_per_sec']:>14,}{values['mb_per_sec']:>10.1f}{ratio:>8}"
+            )
+        lines.append(f"{scale:<6}{'peak RSS':<8}{measured['peak_rss_mb']:>10.1f} MB")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="読み込み・結合・保存のベンチマーク")
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=DEFAULT_SCALES,
+                        help=f"計測する規模（デフォルト: {' '.join(DEFAULT_SCALES)}）")
+    parser.add_argument("--repeat", type=int, default=1, help="計測回数（最短時間を記録、デフォルト: 1）")
+    parser.add_argument("--seed", type=int, default=0, help="データ生成の乱数のシード（デフォルト: 0）")
+    parser.add_argument("--output", type=Path, default=None, help="計測結果のJSONの出力先")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help=f"比較するベースラインのJSON（デフォルト: {DEFAULT_BASELINE.name}）")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"所要時間の増加の許容幅（デフォルト: {DEFAULT_TOLERANCE}）")
+    parser.add_argument("--save-baseline", action="store_true", help="計測結果をベースラインとして保存する")
+    args = parser.parse_args()
+
+    result = run_benchmarks(args.scales, repeat=args.repeat, seed=args.seed)
+    baseline = None
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    print(format_report(result, baseline))
+
+    serialized = json.dumps(result, ensure_ascii=False, indent=2) + "\n"
+    if args.output:
+        args.output.write_text(serialized, encoding="utf-8")
+    if args.save_baseline:
+        args.baseline.write_text(serialized, encoding="utf-8")
+        print(f"ベースラインを保存しました: {args.baseline}")
+        return 0
+
+    if baseline is not None:
+        regressions = compare_with_baseline(result, baseline, args.tolerance)
+        if regressions:
+            print(f"ベースラインより遅くなりました: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
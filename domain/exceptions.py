@@ -3,6 +3,7 @@
 このモジュールはflet-csvアプリケーションのドメイン固有の例外を定義します。
 すべてのドメイン例外はCsvMergerErrorを基底クラスとして継承します。
 """
+from pathlib import Path
 
 
 class CsvMergerError(Exception):
@@ -125,3 +126,41 @@ class EmptyDataError(CsvMergerError):
     """
     pass
 
+
+class LoadCancelledError(CsvMergerError):
+    """他の入力ファイルの失敗により読み込みを中止した場合の例外
+    
+    並列読み込みでいずれかのワーカーが失敗した場合に、実行中の他のワーカーが
+    残りのファイルを読まずに終了するために発生します（結果としては報告されません）。
+    """
+    pass
+
+
+class MultipleFileErrors(CsvMergerError):
+    """複数の入力ファイルのエラーをまとめた例外
+    
+    エラーをまとめて報告するモード（collect_errors）で、すべての入力を
+    1回ずつ確認した後に、失敗したファイルがあれば発生します。
+    
+    Attributes:
+        errors: (ファイルのパス, 例外) のリスト（入力順）
+    """
+    
+    def __init__(self, errors: list[tuple[Path, Exception]]):
+        """MultipleFileErrorsを初期化
+        
+        Args:
+            errors: (ファイルのパス, 例外) のリスト（入力順）
+        """
+        self.errors = list(errors)
+        super().__init__(f"{len(self.errors)}件のファイルでエラーが発生しました")
+
+
+class StorageDtypeWarning(UserWarning):
+    """整数カラムを格納型に縮小できなかった場合の警告
+    
+    値の範囲が CsvSchema.STORAGE_DTYPES の格納型に収まらず、
+    カラムを元の型のまま保持した場合に発生します（値は失われない）。
+    例外ではないため CsvMergerError は継承しません。
+    """
+    pass
@@ -6,6 +6,7 @@ from pathlib import Path
 import pandas as pd
 
 from domain.exceptions import EmptyDataError, InvalidCsvFormatError
+from domain.models.csv_file_summary import CsvFileSummary
 from domain.models.csv_schema import CsvSchema
 
 
@@ -13,10 +14,15 @@ class CsvFile:
     """CSVファイルを表現するドメインモデル
     
     CSVファイルのパス、データ、メタデータを保持します。
+    日時カラムは解釈できる限りdatetime64型で保持します（文字列化は書き出し時のみ）。
+    整数カラムは値が収まる限り CsvSchema.STORAGE_DTYPES の格納型で保持します
+    （収まらないカラムは元の型のまま保持し、StorageDtypeWarning で警告する）。
+    日時カラムの要約（日番号・最小/最大の日時・並び順・行数）は生成時に1回だけ求めます。
     
     Attributes:
         file_path: CSVファイルのパス
         data: CSVデータ（pandas.DataFrame）
+        summary: 日時カラムの要約（日時をdatetime64型に変換できない場合はNone）
     """
 
     def __init__(
@@ -46,15 +52,61 @@ class CsvFile:
         # スキーマバリデーション（必須カラムのチェック）
         CsvSchema.validate_and_raise(list(data.columns))
         
+        # 日時カラムをdatetime64型に揃える（変換済みなら再変換しない）
+        data = self._with_parsed_timestamps(data)
+        
+        # 整数カラムを格納型に縮小（範囲を確認し、収まらない場合は元の型のまま）
+        data = CsvSchema.to_storage_dtypes(data)
+        
         # 1日分のデータ制約の検証（スキップオプションで無効化可能）
         if not skip_daily_validation and CsvSchema.TIMESTAMP_COLUMN in data.columns:
-            datetime_values = data[CsvSchema.TIMESTAMP_COLUMN].astype(str).tolist()
-            if not CsvSchema.validate_daily_time_range(datetime_values):
+            if not CsvSchema.validate_daily_time_series(data[CsvSchema.TIMESTAMP_COLUMN]):
                 raise InvalidCsvFormatError(
                     f"CSV file '{self.file_name}' は1日分のデータ（00時〜23時）を含む必要があります"
                 )
         
         self._data = data
+        self._summary = self._summarize(data)
+
+    @staticmethod
+    def _with_parsed_timestamps(data: pd.DataFrame) -> pd.DataFrame:
+        """日時カラムをdatetime64型に変換したDataFrameを返す
+        
+        すでにdatetime64型の場合や、解釈できない値を含む場合は
+        元のDataFrameをそのまま返します（呼び出し元のDataFrameは変更しない）。
+        
+        Args:
+            data: CSVデータ
+            
+        Returns:
+            日時カラムがdatetime64型のDataFrame
+        """
+        timestamp_col = CsvSchema.TIMESTAMP_COLUMN
+        if timestamp_col not in data.columns or pd.api.types.is_datetime64_dtype(data[timestamp_col]):
+            return data
+        
+        parsed = CsvSchema.parse_datetime_series(data[timestamp_col])
+        if parsed.isna().any():
+            return data
+        
+        data = data.copy(deep=False)
+        data[timestamp_col] = parsed
+        return data
+
+    @staticmethod
+    def _summarize(data: pd.DataFrame) -> CsvFileSummary | None:
+        """日時カラムの要約を求める
+        
+        Args:
+            data: CSVデータ
+            
+        Returns:
+            要約。日時カラムがdatetime64型でない場合はNone
+        """
+        timestamp_col = CsvSchema.TIMESTAMP_COLUMN
+        if timestamp_col not in data.columns or not pd.api.types.is_datetime64_dtype(data[timestamp_col]):
+            return None
+        return CsvFileSummary.of(data[timestamp_col].to_numpy(dtype="datetime64[ns]"))
 
     @property
     def file_path(self) -> Path:
@@ -66,6 +118,11 @@ class CsvFile:
         """CSVデータを取得"""
         return self._data
 
+    @property
+    def summary(self) -> CsvFileSummary | None:
+        """日時カラムの要約を取得（生成時に求めた値）"""
+        return self._summary
+
     @property
     def file_name(self) -> str:
         """ファイル名を取得"""
@@ -86,6 +143,24 @@ class CsvFile:
         """カラム名のリストを取得"""
         return list(self._data.columns)
 
+    @property
+    def memory_bytes(self) -> int:
+        """データが使用しているメモリ量（バイト）を取得"""
+        return int(self._data.memory_usage(index=False, deep=True).sum())
+
+    @property
+    def bytes_per_row(self) -> float:
+        """1行あたりのメモリ量（バイト）を取得
+        
+        格納型に縮小できなかったカラム（storage_fallbacks）があると、その分大きくなります。
+        """
+        return self.memory_bytes / len(self._data)
+
+    @property
+    def storage_fallbacks(self) -> dict[str, tuple[int, int]]:
+        """格納型に縮小できず元の型のまま保持している整数カラムと、その値の範囲を取得"""
+        return CsvSchema.storage_fallbacks(self._data)
+
     @property
     def is_empty(self) -> bool:
         """データが空かどうかを判定"""
@@ -0,0 +1,120 @@
+"""CSVファイルのメタデータのドメインモデル
+
+このモジュールは、DataFrameを保持せずに1ファイル分の日付・行数・文字コード・
+レイアウト・ファイルの同一性を表現する、小さな固定長のレコードを定義します。
+"""
+from datetime import date, timedelta
+from pathlib import Path
+
+
+class CsvFileMetadata:
+    """1ファイル分のメタデータ（走査時に取得）
+
+    大量の入力ファイルのメタデータを同時に保持できるよう、__slots__ で
+    属性を固定し、日付は1970-01-01からの日数（日番号）、ファイルの同一性は
+    サイズと更新日時から求めた1つの整数で保持します。
+    パスは呼び出し元から渡されたオブジェクトをそのまま参照します。
+
+    Attributes:
+        path: ファイルのパス
+        day: 日番号（1970-01-01からの日数）
+        rows: データ行数
+        encoding: 文字コード（判定できない場合はNone）
+        headerless: ヘッダーなしの場合はTrue（判定できない場合はNone）
+        fingerprint: 走査時のファイルの同一性（fingerprint_of() の値。同じプロセスの中での確認用）
+    """
+
+    __slots__ = ("_path", "_day", "_rows", "_encoding", "_headerless", "_fingerprint")
+
+    _EPOCH = date(1970, 1, 1)
+
+    def __init__(
+        self,
+        path: Path,
+        day: int,
+        rows: int,
+        encoding: str | None,
+        headerless: bool | None,
+        fingerprint: int
+    ):
+        """CsvFileMetadataを初期化
+
+        Args:
+            path: ファイルのパス
+            day: 日番号（1970-01-01からの日数）
+            rows: データ行数
+            encoding: 文字コード
+            headerless: ヘッダーなしの場合はTrue
+            fingerprint: 走査時のファイルの同一性（fingerprint_of() の値）
+        """
+        self._path = path
+        self._day = day
+        self._rows = rows
+        self._encoding = encoding
+        self._headerless = headerless
+        self._fingerprint = fingerprint
+
+    @classmethod
+    def day_number(cls, day: date) -> int:
+        """日付を日番号に変換"""
+        return (day - cls._EPOCH).days
+
+    @staticmethod
+    def fingerprint_of(size: int, mtime_ns: int) -> int:
+        """ファイルのサイズと更新日時から同一性の値を求める
+
+        走査から読み込みまでの間にファイルが変更されていないかを、同じプロセスの中で
+        確認するための簡易な値です。内容は読まないため、サイズと更新日時を変えずに
+        書き換えられた場合は検出できず、hash() の値なので衝突もありえます。
+        ファイルの内容の指紋（ParsedCsvCache.key_for() の blake2b のキー）の代わりには使えません。
+
+        Args:
+            size: ファイルサイズ（バイト）
+            mtime_ns: 更新日時（ナノ秒）
+
+        Returns:
+            同一性の値（同じプロセスの中での比較にのみ使う）
+        """
+        return hash((size, mtime_ns))
+
+    @property
+    def path(self) -> Path:
+        """ファイルのパス"""
+        return self._path
+
+    @property
+    def day(self) -> int:
+        """日番号（1970-01-01からの日数）"""
+        return self._day
+
+    @property
+    def date(self) -> date:
+        """日付"""
+        return self._EPOCH + timedelta(days=self._day)
+
+    @property
+    def rows(self) -> int:
+        """データ行数"""
+        return self._rows
+
+    @property
+    def encoding(self) -> str | None:
+        """文字コード（判定できない場合はNone）"""
+        return self._encoding
+
+    @property
+    def headerless(self) -> bool | None:
+        """ヘッダーなしの場合はTrue（判定できない場合はNone）"""
+        return self._headerless
+
+    @property
+    def fingerprint(self) -> int:
+        """走査時のファイルの同一性（fingerprint_of() の値）"""
+        return self._fingerprint
+
+    def __repr__(self) -> str:
+        """repr表現"""
+        return (
+            f"CsvFileMetadata(path={self._path!r}, date={self.date}, rows={self._rows}, "
+            f"encoding={self._encoding!r}, headerless={self._headerless})"
+        )
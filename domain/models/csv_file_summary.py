@@ -0,0 +1,67 @@
+"""CSVファイルの日時の要約のドメインモデル
+
+このモジュールは、CsvFile の生成時に1回だけ求める日時カラムの要約
+（日番号・最小/最大の日時・並び順・行数）を表現する値オブジェクトを定義します。
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+# 1日のナノ秒数
+_DAY_NS = 24 * 60 * 60 * 10**9
+
+
+class CsvFileSummary(NamedTuple):
+    """1ファイル分の日時の要約（変更不可）
+
+    CsvMerger は連続日の検証・連結後の並び順の確認に、データを見ずにこの要約を使います。
+
+    Attributes:
+        rows: 行数
+        first_stamp: 最も古い日時（1970-01-01からのナノ秒）
+        last_stamp: 最も新しい日時（1970-01-01からのナノ秒）
+        is_sorted: 日時が行の順に狭義単調増加（ソート済みかつ重複なし）の場合はTrue
+        day: すべての行が同じ日の場合はその日番号（1970-01-01からの日数）、それ以外はNone
+    """
+
+    rows: int
+    first_stamp: int
+    last_stamp: int
+    is_sorted: bool
+    day: int | None
+
+    @staticmethod
+    def day_start(day: int) -> int:
+        """日番号の日の0時の日時を返す
+
+        Args:
+            day: 日番号（1970-01-01からの日数）
+
+        Returns:
+            その日の0時の日時（1970-01-01からのナノ秒）
+        """
+        return day * _DAY_NS
+
+    @classmethod
+    def of(cls, stamps: np.ndarray) -> "CsvFileSummary | None":
+        """日時の配列から要約を求める
+
+        Args:
+            stamps: 日時カラムの値（datetime64[ns]）
+
+        Returns:
+            要約。空の場合や欠損値（NaT）を含む場合はNone
+        """
+        if len(stamps) == 0:
+            return None
+        values = stamps.view(np.int64)
+        is_sorted = bool((values[1:] > values[:-1]).all())
+        if is_sorted:
+            first, last = int(values[0]), int(values[-1])
+        else:
+            first, last = int(values.min()), int(values.max())
+        if first == np.iinfo(np.int64).min:
+            # NaT は int64 の最小値
+            return None
+        day = first // _DAY_NS
+        return cls(len(values), first, last, is_sorted, day if last // _DAY_NS == day else None)
@@ -0,0 +1,28 @@
+"""CSVファイルの列構成の定数
+
+このモジュールは、CsvSchema と、pandas を読み込まない CsvPreflight が共有する
+列構成と1日分のデータの規則の定数を定義します（pandas・NumPy を使いません）。
+"""
+
+
+class CsvLayout:
+    """CSVファイルの列構成と1日分のデータの規則"""
+
+    # 時系列カラム（ソートの基準）
+    TIMESTAMP_COLUMN: str = "日時"
+
+    # 必須カラム（順序は問わない）
+    REQUIRED_COLUMNS: tuple[str, ...] = ("日時", "No", "電圧", "周波数", "パワー", "工事フラグ", "参照")
+
+    # ヘッダーなしCSVで欠落している列（正規化で追加する列）
+    HEADERLESS_OMITTED_COLUMNS: tuple[str, ...] = ("No", "参照")
+
+    # ヘッダーなしCSVの列（REQUIRED_COLUMNS から HEADERLESS_OMITTED_COLUMNS を除いた列）
+    HEADERLESS_COLUMNS: tuple[str, ...] = ("日時", "電圧", "周波数", "パワー", "工事フラグ")
+
+    # 1日あたりの期待レコード数（00時〜23時の24時間）
+    EXPECTED_RECORDS_PER_DAY: int = 24
+
+    # 妥当とみなす年の範囲（両端を含む）
+    MIN_VALID_YEAR: int = 1900
+    MAX_VALID_YEAR: int = 2100
@@ -3,10 +3,15 @@
 このモジュールはアプリケーションで扱うCSVファイルの
 カラム構造を定義します。
 """
+from collections.abc import Iterator
 from typing import Any
+import warnings
+import numpy as np
 import pandas as pd
 
-from domain.exceptions import InvalidCsvFormatError
+from domain.exceptions import InvalidCsvFormatError, StorageDtypeWarning
+from domain.models.csv_layout import CsvLayout
+from domain.services.datetime_parser import DatetimeParser
 
 
 class CsvSchema:
@@ -24,22 +29,22 @@ class CsvSchema:
         - 参照: 参照情報
     """
 
+    # 正規化・検証済みデータの構造のバージョン
+    # カラム構成・格納型・正規化や検証の規則を変更した場合に更新する（永続キャッシュの無効化に使用）
+    SCHEMA_VERSION: int = 1
+
     # 時系列カラム（ソートの基準）
-    TIMESTAMP_COLUMN: str = "日時"
+    TIMESTAMP_COLUMN: str = CsvLayout.TIMESTAMP_COLUMN
+
+    # 出力時の日時フォーマット
+    # 注: メモリ上の日時カラムはdatetime64型で保持し、文字列化は書き出し時のみ行う
+    DATETIME_OUTPUT_FORMAT: str = "%Y/%m/%d %H:%M:%S"
 
     # 必須カラム（順序は問わない）
-    REQUIRED_COLUMNS: list[str] = [
-        "日時",
-        "No",
-        "電圧",
-        "周波数",
-        "パワー",
-        "工事フラグ",
-        "参照",
-    ]
+    REQUIRED_COLUMNS: list[str] = list(CsvLayout.REQUIRED_COLUMNS)
 
     # ヘッダーなしCSVで欠落している列（正規化で追加する列）
-    HEADERLESS_OMITTED_COLUMNS: list[str] = ["No", "参照"]
+    HEADERLESS_OMITTED_COLUMNS: list[str] = list(CsvLayout.HEADERLESS_OMITTED_COLUMNS)
 
     # 各カラムのデータ型定義
     # "datetime_string"は特殊な型で、pandasが認識できる日時文字列を示す
@@ -53,8 +58,28 @@ class CsvSchema:
         "参照": int,  # 0 または 1
     }
 
+    # メモリ上で保持する各カラムの格納型（COLUMN_TYPES の値を収められる最小の型）
+    # 整数カラムは値が範囲に収まる場合のみこの型に縮小し、収まらない場合は元の型のまま保持する
+    # （元の型のまま保持したカラムは StorageDtypeWarning で警告する）
+    STORAGE_DTYPES: dict[str, str] = {
+        "日時": "datetime64[ns]",
+        "No": "int32",
+        "電圧": "int16",
+        "周波数": "int16",
+        "パワー": "int32",
+        "工事フラグ": "int8",  # 0 または 1
+        "参照": "int8",  # 0 または 1
+    }
+
     # 1日あたりの期待レコード数（00時〜23時の24時間）
-    EXPECTED_RECORDS_PER_DAY: int = 24
+    EXPECTED_RECORDS_PER_DAY: int = CsvLayout.EXPECTED_RECORDS_PER_DAY
+
+    # 00時〜23時がすべて揃ったときの時刻ビットマスク（ビットiがi時に対応）
+    FULL_DAY_HOUR_MASK: int = (1 << 24) - 1
+
+    # 妥当とみなす年の範囲（両端を含む）
+    MIN_VALID_YEAR: int = CsvLayout.MIN_VALID_YEAR
+    MAX_VALID_YEAR: int = CsvLayout.MAX_VALID_YEAR
 
     @classmethod
     def validate_columns(cls, columns: list[str]) -> bool:
@@ -133,6 +158,7 @@ class CsvSchema:
         
         pandasが認識可能な日時文字列かを確認します。
         フォーマットは固定されておらず、pandasが解釈できれば有効とみなします。
+        典型的なフォーマット（YYYY/MM/DD HH:MM:SS など）はpandasを呼ばずに判定します。
         
         Args:
             datetime_str: 検証する日時文字列
@@ -147,12 +173,7 @@ class CsvSchema:
         if not datetime_str.strip():
             return False
         
-        try:
-            # pandasでパースできるか試す
-            pd.to_datetime(datetime_str)
-            return True
-        except (ValueError, pd.errors.ParserError, Exception):
-            return False
+        return DatetimeParser.is_datetime(datetime_str)
 
     @classmethod
     def validate_datetime_value(cls, datetime_str: str) -> bool:
@@ -178,7 +199,7 @@ class CsvSchema:
             dt = pd.to_datetime(datetime_str)
             
             # 年の範囲をチェック（1900年〜2100年）
-            if dt.year < 1900 or dt.year > 2100:
+            if dt.year < cls.MIN_VALID_YEAR or dt.year > cls.MAX_VALID_YEAR:
                 return False
             
             return True
@@ -186,6 +207,41 @@ class CsvSchema:
             # パースに失敗した場合は不正な日付
             return False
 
+    @classmethod
+    def parse_datetime_series(cls, values: pd.Series) -> pd.Series:
+        """日時カラムを一括でdatetime64型に変換
+        
+        先頭の値から判別したフォーマット（YYYY/MM/DD HH:MM:SS、ISO 8601 など）を
+        明示して列全体を変換します。合わない行だけを要素ごとの解釈（format="mixed"）で
+        再試行するため、validate_datetime_format() と同じ値を受け付けます。
+        タイムゾーン付きの値は壁時計時刻を保ったままタイムゾーンを外します。
+        
+        Args:
+            values: 日時カラム（文字列など）。datetime64型ならそのまま返す
+            
+        Returns:
+            datetime64型のSeries（解釈できない値はNaT）
+        """
+        return DatetimeParser.parse(values)
+
+    @classmethod
+    def invalid_datetime_mask(cls, parsed: pd.Series) -> np.ndarray:
+        """日時カラムの不正な行を示すマスクを配列演算で作成
+        
+        以下のいずれかに該当する行をTrueとします：
+        - 日時として解釈できない（NaT）
+        - 年が妥当な範囲（1900年〜2100年）の外
+        
+        Args:
+            parsed: parse_datetime_series() で変換済みの日時カラム
+            
+        Returns:
+            不正な行がTrueのbool配列
+        """
+        years = parsed.dt.year
+        invalid = parsed.isna() | (years < cls.MIN_VALID_YEAR) | (years > cls.MAX_VALID_YEAR)
+        return invalid.to_numpy(dtype=bool)
+
     @classmethod
     def validate_binary_flag(cls, value: Any) -> bool:
         """0/1のフラグ値を検証
@@ -210,6 +266,98 @@ class CsvSchema:
         """
         return cls.COLUMN_TYPES.get(column_name, object)
 
+    @classmethod
+    def to_storage_dtypes(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """整数カラムを STORAGE_DTYPES の格納型に縮小したDataFrameを返す
+        
+        縮小は値の最小値・最大値が格納型の範囲に収まることを確認した上で行い、
+        収まらないカラムや整数型でないカラムは元の型のまま残します（値は失われない）。
+        範囲に収まらず元の型のまま残したカラムは、カラム名と値の範囲を
+        StorageDtypeWarning で警告します（storage_fallbacks() でも取得できる）。
+        変換が不要な場合は元のDataFrameをそのまま返します（呼び出し元のDataFrameは変更しない）。
+        
+        Args:
+            df: 変換するDataFrame
+            
+        Returns:
+            整数カラムが格納型に揃ったDataFrame
+        """
+        converted = {}
+        for column, values, target in cls._integer_columns_to_downcast(df):
+            if cls._fits_integer_dtype(values, target):
+                converted[column] = values.astype(target)
+            else:
+                warnings.warn(
+                    cls._fallback_message(column, values, target),
+                    StorageDtypeWarning,
+                    stacklevel=2,
+                )
+        
+        if not converted:
+            return df
+        df = df.copy(deep=False)
+        for column, values in converted.items():
+            df[column] = values
+        return df
+
+    @classmethod
+    def storage_fallbacks(cls, df: pd.DataFrame) -> dict[str, tuple[int, int]]:
+        """格納型の範囲に収まらない整数カラムと、その値の範囲を返す
+        
+        to_storage_dtypes() が元の型のまま残すカラムを求めます。
+        
+        Args:
+            df: 確認するDataFrame
+            
+        Returns:
+            カラム名 → (最小値, 最大値) の辞書（すべて収まる場合は空）
+        """
+        return {
+            column: (int(values.min()), int(values.max()))
+            for column, values, target in cls._integer_columns_to_downcast(df)
+            if not cls._fits_integer_dtype(values, target)
+        }
+
+    @classmethod
+    def _integer_columns_to_downcast(
+        cls, df: pd.DataFrame
+    ) -> Iterator[tuple[str, np.ndarray, np.dtype]]:
+        """格納型と異なる整数型の整数カラムを (カラム名, 値, 格納型) で列挙"""
+        # カラムごとのSeries生成を避けるため、型はまとめて取得する
+        dtypes = dict(zip(df.columns, df.dtypes))
+        for column, storage_dtype in cls.STORAGE_DTYPES.items():
+            target = np.dtype(storage_dtype)
+            dtype = dtypes.get(column)
+            if target.kind not in "iu" or dtype is None or dtype == target:
+                continue
+            if not isinstance(dtype, np.dtype) or dtype.kind not in "iu":
+                continue
+            yield column, df[column].to_numpy(), target
+
+    @staticmethod
+    def _fallback_message(column: str, values: np.ndarray, target: np.dtype) -> str:
+        """格納型に縮小できなかったカラムの警告メッセージを作成"""
+        return (
+            f"{column}: 値の範囲（{values.min()}〜{values.max()}）が格納型 {target} に"
+            f"収まらないため {values.dtype} のまま保持します"
+        )
+
+    @staticmethod
+    def _fits_integer_dtype(values: np.ndarray, target: np.dtype) -> bool:
+        """整数配列の値がすべて指定した整数型の範囲に収まるかを判定
+        
+        Args:
+            values: 整数配列
+            target: 格納先の整数型
+            
+        Returns:
+            全ての値が範囲内の場合True
+        """
+        if len(values) == 0:
+            return True
+        info = np.iinfo(target)
+        return bool(info.min <= values.min() and values.max() <= info.max)
+
     @classmethod
     def validate_daily_time_range(cls, datetime_strings: list[str]) -> bool:
         """1日分の時刻範囲を検証
@@ -226,41 +374,39 @@ class CsvSchema:
         Returns:
             有効な1日分のデータの場合True、それ以外はFalse
         """
-        # レコード数チェック
-        if len(datetime_strings) != cls.EXPECTED_RECORDS_PER_DAY:
-            return False
+        return cls.validate_daily_time_series(pd.Series(datetime_strings, dtype=object))
+
+    @classmethod
+    def validate_daily_time_series(cls, values: pd.Series) -> bool:
+        """1日分の時刻範囲を列単位で検証
         
-        # 日時フォーマットの検証と日付・時刻の抽出
-        dates = set()
-        hours = set()
+        validate_daily_time_range() と同じ条件を、1回のベクトル化変換と
+        整数の時刻配列に対するビットマスク演算で検証します。
+        - レコード数が24個（00時〜23時）
+        - すべて同じ日付
+        - 時刻が00時から23時まで揃っている（重複なし）
         
-        for dt_str in datetime_strings:
-            if not cls.validate_datetime_format(dt_str):
-                return False
+        Args:
+            values: 日時カラム。datetime64型の場合は再変換せずにそのまま使う
             
-            try:
-                # pandasでパース
-                dt = pd.to_datetime(dt_str)
-                
-                # 日付部分を抽出（年月日）
-                date_part = dt.date()
-                
-                # 時刻部分を抽出
-                hour = dt.hour
-                
-                dates.add(date_part)
-                hours.add(hour)
-            except (ValueError, pd.errors.ParserError, Exception):
-                return False
+        Returns:
+            有効な1日分のデータの場合True、それ以外はFalse
+        """
+        # レコード数チェック
+        if len(values) != cls.EXPECTED_RECORDS_PER_DAY:
+            return False
         
-        # すべて同じ日付かチェック
-        if len(dates) != 1:
+        stamps = cls.parse_datetime_series(values).to_numpy(dtype="datetime64[ns]")
+        if np.isnat(stamps).any():
             return False
         
-        # 00時から23時まで全て揃っているかチェック
-        expected_hours = set(range(24))
-        if hours != expected_hours:
+        # すべて同じ日付かチェック
+        days = stamps.astype("datetime64[D]")
+        if (days != days[0]).any():
             return False
         
-        return True
-
+        # 時刻（0〜23）をビットに対応させ、24ビットすべて立っているかチェック
+        # レコード数が24なので、全ビットが立てば重複もない
+        hours = (stamps - days).astype("timedelta64[h]").astype(np.int64)
+        hour_mask = int(np.bitwise_or.reduce(np.left_shift(np.int64(1), hours)))
+        return hour_mask == cls.FULL_DAY_HOUR_MASK
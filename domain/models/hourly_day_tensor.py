@@ -0,0 +1,400 @@
+"""1時間ごとのデータを日数 × 24時間の配列で保持するドメインモデル
+
+このモジュールは、1日分（00時〜23時の24件）のデータを日番号で位置を決めた
+密な NumPy 配列（日数 × 24 × 値のカラム）に格納するモデルを定義します。
+日付の追加・重複日・欠損日の判定は位置の計算だけで行い、結合結果のDataFrameは
+値のカラムをコピーせずに作成できます。
+"""
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from domain.exceptions import MergeError
+from domain.models.csv_file import CsvFile
+from domain.models.csv_schema import CsvSchema
+from domain.services.day_continuity import DayContinuity
+
+
+class HourlyDayTensor:
+    """1時間ごとのデータを日番号で位置を決めた配列に格納するストア
+
+    日番号は1970-01-01からの日数で、配列の位置は「日番号 - 先頭位置の日番号」です。
+    日付の追加は位置への書き込み（容量が足りない場合は倍に拡張するため償却O(1)）、
+    重複日は追加時に書き込み済みかどうか、欠損日は最小日〜最大日の範囲で
+    書き込まれていない位置として求めます。重複した日は最初に追加したデータを保持します。
+
+    日時は「日番号 + 時（配列の2番目の位置）+ 時の先頭からのオフセット（ナノ秒）」で表し、
+    No列は持ちません（to_frame() で1から採番します）。オフセットの配列は、毎正時でない
+    日時を追加した時点で確保します（通常の毎正時のデータでは値の配列だけを保持します）。
+
+    Attributes:
+        values: 最小日〜最大日の値（日数 × 24 × VALUE_COLUMNS。欠損日の位置は0）
+        offsets: 最小日〜最大日の各時の先頭からのオフセット（日数 × 24、ナノ秒。
+            すべて毎正時の場合はNone）
+        present: 最小日〜最大日の各日にデータがある場合True
+    """
+
+    # 配列に格納する値のカラム（この順に3番目の軸に並べる）
+    VALUE_COLUMNS: tuple[str, ...] = ("電圧", "周波数", "パワー", "工事フラグ", "参照")
+
+    # 値の格納型（VALUE_COLUMNS の STORAGE_DTYPES をすべて収められる型）
+    DTYPE: np.dtype = np.dtype(np.int32)
+
+    # 1日あたりの時の数
+    HOURS: int = CsvSchema.EXPECTED_RECORDS_PER_DAY
+
+    _HOUR_NS: int = 3600 * 10**9
+    _DAY_NS: int = 24 * _HOUR_NS
+    _EPOCH: date = date(1970, 1, 1)
+
+    def __init__(self, capacity: int = 0):
+        """空のHourlyDayTensorを初期化
+
+        Args:
+            capacity: あらかじめ確保する日数
+        """
+        self._origin: int | None = None
+        self._first: int | None = None
+        self._last: int | None = None
+        self._day_count = 0
+        self._duplicates: list[int] = []
+        self._values: np.ndarray
+        self._offsets: np.ndarray | None
+        self._present: np.ndarray
+        self._allocate(capacity)
+
+    @classmethod
+    def from_csv_files(cls, csv_files: Iterable[CsvFile]) -> "HourlyDayTensor":
+        """1日分のCsvFileをまとめて格納したHourlyDayTensorを作成
+
+        Args:
+            csv_files: 1日分のCSVファイル
+
+        Returns:
+            すべてのファイルを追加したHourlyDayTensor
+        """
+        csv_files = list(csv_files)
+        tensor = cls(capacity=len(csv_files))
+        tensor.add_many(csv_files)
+        return tensor
+
+    @classmethod
+    def from_arrays(
+        cls,
+        first_day: date,
+        values: np.ndarray,
+        offsets: np.ndarray | None,
+        present: np.ndarray
+    ) -> "HourlyDayTensor":
+        """最小日からの配列をコピーせずに使うHourlyDayTensorを作成
+
+        メモリマップした配列を渡すと、必要な部分だけがディスクから読まれます。
+        読み取り専用の配列に日付を追加した場合は、その時点で配列をコピーします。
+
+        Args:
+            first_day: 配列の先頭の日付
+            values: 値（日数 × 24 × VALUE_COLUMNS）
+            offsets: 各時の先頭からのオフセット（日数 × 24、ナノ秒。Noneの場合は毎正時）
+            present: 各日にデータがある場合True（日数）
+
+        Returns:
+            配列を格納したHourlyDayTensor
+
+        Raises:
+            ValueError: 配列の形・型が合わない場合
+        """
+        days = len(present)
+        if values.shape != (days, cls.HOURS, len(cls.VALUE_COLUMNS)) or values.dtype != cls.DTYPE:
+            raise ValueError(f"値の配列の形・型が一致しません: {values.shape} {values.dtype}")
+        if offsets is not None and (offsets.shape != (days, cls.HOURS) or offsets.dtype != np.int64):
+            raise ValueError(f"オフセットの配列の形・型が一致しません: {offsets.shape} {offsets.dtype}")
+
+        tensor = cls()
+        tensor._values, tensor._offsets, tensor._present = values, offsets, np.asarray(present, dtype=bool)
+        tensor._origin = cls._day_number(first_day)
+        positions = np.flatnonzero(tensor._present)
+        tensor._day_count = len(positions)
+        if len(positions) > 0:
+            tensor._first = tensor._origin + int(positions[0])
+            tensor._last = tensor._origin + int(positions[-1])
+        return tensor
+
+    def add(self, csv_file: CsvFile) -> None:
+        """1日分のCsvFileを追加
+
+        Args:
+            csv_file: 1日分（24件、各時に1件）のCSVファイル
+
+        Raises:
+            MergeError: 1日分のデータでない場合
+            ValueError: 値が DTYPE に収まらない場合
+        """
+        self.add_many([csv_file])
+
+    def add_many(self, csv_files: Iterable[CsvFile]) -> None:
+        """1日分のCsvFileをまとめて追加
+
+        ファイルのDataFrameを1回で連結し、日番号・時の計算と配列への書き込みを
+        まとめて配列演算で行います。同じ日のファイルは最初のものを格納し、
+        残りは重複日として記録します。
+
+        Args:
+            csv_files: 1日分（24件、各時に1件）のCSVファイル
+
+        Raises:
+            MergeError: 1日分のデータでないファイルがある場合（何も追加しない）
+            ValueError: 値が DTYPE に収まらない場合（何も追加しない）
+        """
+        csv_files = list(csv_files)
+        if not csv_files:
+            return
+        if any(len(csv_file.data) != self.HOURS for csv_file in csv_files):
+            raise MergeError("各入力CSVは1日分のデータである必要があります")
+        # ファイルごとにカラムを取り出すより、連結してから取り出す方が速い
+        data = (
+            csv_files[0].data if len(csv_files) == 1
+            else pd.concat([csv_file.data for csv_file in csv_files], ignore_index=True)
+        )
+        stamps: np.ndarray = data[CsvSchema.TIMESTAMP_COLUMN].to_numpy(dtype="datetime64[ns]")
+        if np.isnat(stamps).any():
+            raise MergeError("各入力CSVは1日分のデータである必要があります")
+        stamps = stamps.view(np.int64).reshape(-1, self.HOURS)
+        days = stamps // self._DAY_NS
+        within = stamps - days * self._DAY_NS
+        hours = within // self._HOUR_NS
+        # 各ファイルが同じ日付で、00時〜23時が1件ずつ揃っていること
+        hour_masks = np.bitwise_or.reduce(np.left_shift(np.int64(1), hours), axis=1)
+        if (days != days[:, :1]).any() or (hour_masks != CsvSchema.FULL_DAY_HOUR_MASK).any():
+            raise MergeError("各入力CSVは1日分のデータである必要があります")
+
+        values = np.empty(stamps.shape + (len(self.VALUE_COLUMNS),), dtype=self.DTYPE)
+        info = np.iinfo(self.DTYPE)
+        for index, column in enumerate(self.VALUE_COLUMNS):
+            raw = data[column].to_numpy()
+            if raw.dtype.kind not in "iu":
+                raise ValueError(f"{column}が整数ではありません")
+            outside = np.flatnonzero((raw < info.min) | (raw > info.max))
+            if len(outside) > 0:
+                name = csv_files[outside[0] // self.HOURS].file_name
+                raise ValueError(f"{name}: {column}の値が{self.DTYPE}に収まりません")
+            values[..., index] = raw.reshape(stamps.shape)
+        remainders = within - hours * self._HOUR_NS
+
+        numbers = days[:, 0]
+        self._reserve(int(numbers.min()))
+        positions = numbers - self._reserve(int(numbers.max()))
+        # 同じ日のファイルは最初のもの（格納済みの日はそのまま）を残す
+        keep = np.zeros(len(numbers), dtype=bool)
+        keep[np.unique(positions, return_index=True)[1]] = True
+        keep &= ~self._present[positions]
+        self._duplicates.extend(int(number) for number in numbers[~keep])
+        rows = np.flatnonzero(keep)
+        if len(rows) == 0:
+            return
+        targets = positions[rows]
+        self._values[targets[:, None], hours[rows]] = values[rows]
+        if remainders[rows].any() and self._offsets is None:
+            self._offsets = np.zeros(self._present.shape + (self.HOURS,), dtype=np.int64)
+        if self._offsets is not None:
+            self._offsets[targets[:, None], hours[rows]] = remainders[rows]
+        self._present[targets] = True
+        self._day_count += len(rows)
+        first, last = int(numbers[rows].min()), int(numbers[rows].max())
+        self._first = first if self._first is None else min(self._first, first)
+        self._last = last if self._last is None else max(self._last, last)
+
+    def add_day(self, day: date | int, values: np.ndarray, offsets: np.ndarray | None = None) -> None:
+        """1日分の値を追加
+
+        Args:
+            day: 日付または日番号（1970-01-01からの日数）
+            values: 時の順に並んだ値（24 × VALUE_COLUMNS）
+            offsets: 各時の先頭からのオフセット（ナノ秒、Noneの場合は毎正時）
+        """
+        number = self._day_number(day) if isinstance(day, date) else int(day)
+        position = number - self._reserve(number)
+        if self._present[position]:
+            self._duplicates.append(number)
+            return
+        self._values[position] = values
+        if offsets is not None and np.any(offsets):
+            if self._offsets is None:
+                self._offsets = np.zeros(self._present.shape + (self.HOURS,), dtype=np.int64)
+            self._offsets[position] = offsets
+        elif self._offsets is not None:
+            self._offsets[position] = 0
+        self._present[position] = True
+        self._day_count += 1
+        self._first = number if self._first is None else min(self._first, number)
+        self._last = number if self._last is None else max(self._last, number)
+
+    @property
+    def day_count(self) -> int:
+        """データがある日数（重複した日は1日と数える）"""
+        return self._day_count
+
+    @property
+    def row_count(self) -> int:
+        """データの行数"""
+        return self._day_count * self.HOURS
+
+    @property
+    def first_day(self) -> date | None:
+        """最小日（データがない場合はNone）"""
+        return None if self._first is None else self._date_of(self._first)
+
+    @property
+    def last_day(self) -> date | None:
+        """最大日（データがない場合はNone）"""
+        return None if self._last is None else self._date_of(self._last)
+
+    @property
+    def values(self) -> np.ndarray:
+        """最小日〜最大日の値（日数 × 24 × VALUE_COLUMNS。欠損日の位置は0）"""
+        return self._values[self._span()]
+
+    @property
+    def offsets(self) -> np.ndarray | None:
+        """最小日〜最大日の各時の先頭からのオフセット（日数 × 24、ナノ秒。すべて毎正時の場合はNone）"""
+        return None if self._offsets is None else self._offsets[self._span()]
+
+    @property
+    def present(self) -> np.ndarray:
+        """最小日〜最大日の各日にデータがある場合True"""
+        return self._present[self._span()]
+
+    @property
+    def duplicate_days(self) -> list[date]:
+        """2回以上追加された日付（昇順）"""
+        return [self._date_of(int(number)) for number in np.unique(self._duplicates)]
+
+    @property
+    def missing_days(self) -> list[date]:
+        """最小日から最大日までの間で、データのない日付（昇順）"""
+        bounds = self._bounds()
+        if bounds is None:
+            return []
+        return [self._date_of(bounds[0] + int(offset)) for offset in np.flatnonzero(~self.present)]
+
+    @property
+    def is_continuous(self) -> bool:
+        """重複日も欠損日もない場合はTrue"""
+        bounds = self._bounds()
+        span = 0 if bounds is None else bounds[1] - bounds[0] + 1
+        return not self._duplicates and self._day_count == span
+
+    def validate(self) -> None:
+        """重複日・欠損日がある場合に MergeError を送出する（DayContinuity と同じ規則）
+
+        Raises:
+            MergeError: 重複日または欠損日がある場合
+        """
+        bounds = self._bounds()
+        if self.is_continuous or bounds is None:
+            return
+        days = [self._date_of(bounds[0] + int(offset)) for offset in np.flatnonzero(self.present)]
+        DayContinuity(days + [self._date_of(number) for number in self._duplicates]).validate()
+
+    def to_frame(self) -> pd.DataFrame:
+        """結合結果と同じ列構成のDataFrameを作成
+
+        値のカラムは values のビューで、コピーしません。
+        No列は1からの連番、日時は日番号・時・オフセットから求めます。
+
+        Returns:
+            CsvSchema の列順（No, 日時, 値のカラム）で日時順に並んだDataFrame
+
+        Raises:
+            MergeError: 重複日・欠損日がある場合
+        """
+        self.validate()
+        values = self.values.reshape(-1, len(self.VALUE_COLUMNS))
+        stamps: np.ndarray = np.zeros(0, dtype=np.int64)
+        bounds = self._bounds()
+        if bounds is not None:
+            starts = np.arange(bounds[0], bounds[1] + 1, dtype=np.int64) * self._DAY_NS
+            hours = np.arange(self.HOURS, dtype=np.int64) * self._HOUR_NS
+            stamps = starts[:, None] + hours
+            if self._offsets is not None:
+                stamps = stamps + self._offsets[self._span()]
+            stamps = stamps.reshape(-1)
+        columns = {
+            "No": np.arange(1, len(stamps) + 1, dtype=CsvSchema.STORAGE_DTYPES["No"]),
+            CsvSchema.TIMESTAMP_COLUMN: stamps.view("datetime64[ns]"),
+        }
+        for index, column in enumerate(self.VALUE_COLUMNS):
+            columns[column] = values[:, index]
+        return pd.DataFrame(columns, copy=False)
+
+    def _allocate(self, capacity: int) -> None:
+        """指定した日数の空の配列を確保"""
+        self._values = np.zeros((capacity, self.HOURS, len(self.VALUE_COLUMNS)), dtype=self.DTYPE)
+        self._offsets = None
+        self._present = np.zeros(capacity, dtype=bool)
+
+    def _reserve(self, number: int) -> int:
+        """日番号の位置を書き込めるよう配列を確保・拡張する
+
+        範囲の外の日は、拡張する側に現在の容量以上の余裕を取って配列を作り直すため、
+        一方向に日付を追加し続けても配列の作り直しは対数回で済みます。
+        読み取り専用の配列（メモリマップ）は、最初の追加時にコピーします。
+
+        Returns:
+            配列の先頭位置の日番号
+        """
+        capacity = len(self._present)
+        current = number if self._origin is None else self._origin
+        self._origin = current
+        inside = current <= number < current + capacity
+        if inside and self._present.flags.writeable:
+            return current
+        if inside:
+            origin, new_capacity = current, capacity
+        else:
+            start = min(current, number)
+            end = max(current + capacity, number + 1)
+            new_capacity = max(end - start, 2 * capacity, 1)
+            origin = end - new_capacity if number < current else start
+        values, offsets, present = self._values, self._offsets, self._present
+        shift = current - origin
+        self._allocate(new_capacity)
+        self._values[shift:shift + capacity] = values
+        self._present[shift:shift + capacity] = present
+        if offsets is not None:
+            self._offsets = np.zeros((new_capacity, self.HOURS), dtype=np.int64)
+            self._offsets[shift:shift + capacity] = offsets
+        self._origin = origin
+        return origin
+
+    def _span(self) -> slice:
+        """最小日〜最大日の位置の範囲"""
+        bounds = self._bounds()
+        if bounds is None or self._origin is None:
+            return slice(0, 0)
+        return slice(bounds[0] - self._origin, bounds[1] - self._origin + 1)
+
+    def _bounds(self) -> tuple[int, int] | None:
+        """(最小日, 最大日) の日番号（データがない場合はNone）"""
+        if self._first is None or self._last is None:
+            return None
+        return self._first, self._last
+
+    @classmethod
+    def _day_number(cls, day: date) -> int:
+        """日付の日番号（1970-01-01からの日数）"""
+        return (day - cls._EPOCH).days
+
+    @classmethod
+    def _date_of(cls, number: int) -> date:
+        """日番号の日付"""
+        return cls._EPOCH + timedelta(days=number)
+
+    def __repr__(self) -> str:
+        """repr表現"""
+        return (
+            f"HourlyDayTensor(days={self._day_count}, first_day={self.first_day}, "
+            f"last_day={self.last_day}, duplicate_days={len(self.duplicate_days)}, "
+            f"missing_days={len(self.missing_days)})"
+        )
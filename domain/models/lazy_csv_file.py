@@ -0,0 +1,94 @@
+"""必要になった時点でデータを読み込むCSVファイルのドメインモデル
+
+このモジュールは、走査時に取得したメタデータだけを保持し、
+データは結合処理が使う時点で読み込むCsvFileの代わりのモデルを定義します。
+"""
+from collections.abc import Callable
+from pathlib import Path
+import pandas as pd
+
+from domain.exceptions import MergeError
+from domain.models.csv_file import CsvFile
+from domain.models.csv_file_metadata import CsvFileMetadata
+from domain.models.csv_schema import CsvSchema
+
+
+class LazyCsvFile:
+    """メタデータだけを保持し、データを必要な時点で読み込むCSVファイル
+
+    日付・行数などはメタデータから返し、データは load() または data を
+    参照するたびに読み込みます。読み込んだCsvFileは保持しないため、
+    呼び出し元が使い終えた時点で解放されます。
+
+    CsvMerger は日付の検証にメタデータを使い、データは結合する時点で読み込みます。
+
+    Attributes:
+        metadata: 走査時に取得したメタデータ
+    """
+
+    __slots__ = ("_metadata", "_loader")
+
+    def __init__(self, metadata: CsvFileMetadata, loader: Callable[[CsvFileMetadata], CsvFile]):
+        """LazyCsvFileを初期化
+
+        Args:
+            metadata: 走査時に取得したメタデータ
+            loader: メタデータのファイルのCsvFileを読み込む関数（呼び出すたびに読み込む）。
+                多数のファイルで同じ関数を共有できるよう、メタデータを引数に取る
+        """
+        self._metadata = metadata
+        self._loader = loader
+
+    def load(self) -> CsvFile:
+        """データを読み込む（保持はしない）
+
+        Returns:
+            読み込んだCsvFile
+
+        Raises:
+            MergeError: 読み込んだデータの日付が走査時の日付と異なる場合
+            CsvMergerError: 読み込みに失敗した場合（読み込み時の例外）
+        """
+        csv_file = self._loader(self._metadata)
+        summary = csv_file.summary
+        if summary is None or summary.day != self._metadata.day:
+            first = pd.Timestamp(csv_file.data[CsvSchema.TIMESTAMP_COLUMN].iloc[0])
+            raise MergeError(
+                f"{self.file_name}: 読み込んだデータの日付（{first.date()}）が"
+                f"走査時の日付（{self._metadata.date}）と異なります"
+            )
+        return csv_file
+
+    @property
+    def metadata(self) -> CsvFileMetadata:
+        """走査時に取得したメタデータ"""
+        return self._metadata
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """データを読み込んで返す（参照するたびに読み込む）"""
+        return self.load().data
+
+    @property
+    def file_path(self) -> Path:
+        """ファイルパスを取得"""
+        return self._metadata.path
+
+    @property
+    def file_name(self) -> str:
+        """ファイル名を取得"""
+        return self._metadata.path.name
+
+    @property
+    def day(self) -> int:
+        """日番号（1970-01-01からの日数）"""
+        return self._metadata.day
+
+    @property
+    def row_count(self) -> int:
+        """行数を取得（走査時のデータ行数）"""
+        return self._metadata.rows
+
+    def __repr__(self) -> str:
+        """repr表現"""
+        return f"LazyCsvFile({self._metadata!r})"
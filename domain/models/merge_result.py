@@ -4,6 +4,8 @@
 """
 from pathlib import Path
 
+from domain.models.merge_stats import MergeStats
+
 
 class MergeResult:
     """CSV結合処理の結果を表現するドメインモデル
@@ -17,6 +19,7 @@ class MergeResult:
         total_rows: 結合後の総行数
         message: 処理結果メッセージ
         error_message: エラーメッセージ（エラー時のみ）
+        stats: フェーズ別の計測結果（計測しない場合はNone）
     """
 
     def __init__(
@@ -26,7 +29,8 @@ class MergeResult:
         merged_file_count: int,
         total_rows: int,
         message: str | None = None,
-        error_message: str | None = None
+        error_message: str | None = None,
+        stats: MergeStats | None = None
     ):
         """MergeResultを初期化
         
@@ -37,6 +41,7 @@ class MergeResult:
             total_rows: 結合後の総行数
             message: 処理結果メッセージ
             error_message: エラーメッセージ（エラー時のみ）
+            stats: フェーズ別の計測結果
         """
         self._success = success
         self._output_path = Path(output_path) if output_path and isinstance(output_path, str) else output_path
@@ -44,6 +49,7 @@ class MergeResult:
         self._total_rows = total_rows
         self._message = message or self._generate_default_message()
         self._error_message = error_message
+        self._stats = stats
 
     def _generate_default_message(self) -> str:
         """デフォルトメッセージを生成"""
@@ -82,6 +88,11 @@ class MergeResult:
         """エラーメッセージ"""
         return self._error_message
 
+    @property
+    def stats(self) -> MergeStats | None:
+        """フェーズ別の計測結果（計測しない場合はNone）"""
+        return self._stats
+
     @property
     def is_successful(self) -> bool:
         """処理が成功したかどうか（successのエイリアス）"""
@@ -151,6 +162,25 @@ class MergeResult:
             error_message=error_message
         )
 
+    def with_stats(self, stats: MergeStats | None) -> "MergeResult":
+        """計測結果を付けた複製を返す
+        
+        Args:
+            stats: フェーズ別の計測結果
+            
+        Returns:
+            stats 以外が同じMergeResultインスタンス
+        """
+        return MergeResult(
+            success=self._success,
+            output_path=self._output_path,
+            merged_file_count=self._merged_file_count,
+            total_rows=self._total_rows,
+            message=self._message,
+            error_message=self._error_message,
+            stats=stats
+        )
+
     def __str__(self) -> str:
         """文字列表現"""
         if self._success:
@@ -0,0 +1,136 @@
+"""結合処理の計測結果を表現するドメインモデル
+
+このモジュールはCSV結合処理のフェーズごとの所要時間・CPU時間・
+ピークメモリと、時間のかかったファイルを表現するモデルを定義します。
+"""
+from pathlib import Path
+from typing import NamedTuple
+
+
+class PhaseStats(NamedTuple):
+    """1フェーズ分の計測結果
+
+    Attributes:
+        wall_seconds: 経過時間（秒、内側のフェーズの時間を除く）
+        cpu_seconds: CPU時間（秒、内側のフェーズの時間を除く）
+        peak_memory_bytes: フェーズ実行中の tracemalloc のピーク（計測しない場合はNone）
+        calls: 計測した回数
+    """
+
+    wall_seconds: float
+    cpu_seconds: float
+    peak_memory_bytes: int | None
+    calls: int
+
+    def to_dict(self) -> dict:
+        """辞書に変換"""
+        return {
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "calls": self.calls,
+        }
+
+
+class FileTiming(NamedTuple):
+    """1ファイルの読み込みにかかった時間
+
+    Attributes:
+        path: ファイルのパス
+        seconds: 所要時間（秒）
+    """
+
+    path: Path
+    seconds: float
+
+    def to_dict(self) -> dict:
+        """辞書に変換"""
+        return {"path": str(self.path), "seconds": round(self.seconds, 6)}
+
+
+class MergeStats:
+    """結合処理の計測結果
+
+    フェーズは PHASE_ORDER の順に並び、計測されなかったフェーズは含みません。
+
+    Attributes:
+        phases: フェーズ名ごとの計測結果
+        slowest_files: 読み込みに時間のかかったファイル（遅い順）
+        total_wall_seconds: 結合処理全体の経過時間（秒）
+        total_cpu_seconds: 結合処理全体のCPU時間（秒、このプロセスのみ）
+    """
+
+    # フェーズの表示順（discovery は入力ファイルの検出、write は出力の書き出し）
+    PHASE_ORDER: tuple[str, ...] = (
+        "discovery",
+        "precheck",
+        "scan",
+        "read",
+        "cache",
+        "detect_encoding",
+        "parse",
+        "normalize",
+        "dedup",
+        "validate",
+        "merge",
+        "write",
+    )
+
+    def __init__(
+        self,
+        phases: dict[str, PhaseStats],
+        slowest_files: list[FileTiming],
+        total_wall_seconds: float,
+        total_cpu_seconds: float
+    ):
+        """MergeStatsを初期化
+
+        Args:
+            phases: フェーズ名ごとの計測結果
+            slowest_files: 読み込みに時間のかかったファイル（遅い順）
+            total_wall_seconds: 結合処理全体の経過時間（秒）
+            total_cpu_seconds: 結合処理全体のCPU時間（秒）
+        """
+        order = {phase: index for index, phase in enumerate(self.PHASE_ORDER)}
+        self._phases = dict(
+            sorted(phases.items(), key=lambda item: (order.get(item[0], len(order)), item[0]))
+        )
+        self._slowest_files = list(slowest_files)
+        self._total_wall_seconds = total_wall_seconds
+        self._total_cpu_seconds = total_cpu_seconds
+
+    @property
+    def phases(self) -> dict[str, PhaseStats]:
+        """フェーズ名ごとの計測結果"""
+        return dict(self._phases)
+
+    @property
+    def slowest_files(self) -> list[FileTiming]:
+        """読み込みに時間のかかったファイル（遅い順）"""
+        return list(self._slowest_files)
+
+    @property
+    def total_wall_seconds(self) -> float:
+        """結合処理全体の経過時間（秒）"""
+        return self._total_wall_seconds
+
+    @property
+    def total_cpu_seconds(self) -> float:
+        """結合処理全体のCPU時間（秒）"""
+        return self._total_cpu_seconds
+
+    def to_dict(self) -> dict:
+        """辞書に変換（JSON出力用）"""
+        return {
+            "total_wall_seconds": round(self._total_wall_seconds, 6),
+            "total_cpu_seconds": round(self._total_cpu_seconds, 6),
+            "phases": {name: phase.to_dict() for name, phase in self._phases.items()},
+            "slowest_files": [timing.to_dict() for timing in self._slowest_files],
+        }
+
+    def __repr__(self) -> str:
+        """repr表現"""
+        return (
+            f"MergeStats(phases={list(self._phases)}, "
+            f"total_wall_seconds={self._total_wall_seconds:.3f})"
+        )
@@ -0,0 +1,125 @@
+"""事前チェックの結果を表現するドメインモデル
+
+このモジュールは、DataFrameを読み込まずに各入力ファイルの先頭・末尾の
+データ行から推定した日付・行数・レイアウトと、入力全体の重複日・欠損日を
+表現するモデルを定義します。
+"""
+from datetime import date
+from pathlib import Path
+from typing import NamedTuple
+
+from domain.exceptions import CsvMergerError
+from domain.services.day_continuity import DayContinuity
+
+
+class FileProbe(NamedTuple):
+    """1ファイル分の事前チェックの結果
+
+    Attributes:
+        path: ファイルのパス
+        day: 先頭のデータ行から推定した日付（推定できない場合はNone）
+        rows: データ行数（ヘッダー・空行を除く）
+        headerless: ヘッダーなしの場合はTrue（データがない場合はNone）
+        encoding: 先頭・末尾の行をデコードできた文字コード
+        issues: 結合できない原因となるレイアウトの異常
+        warnings: 結合できる可能性はあるが確認が必要な点（重複行を含む可能性など）
+        error: 読み込みが確実に失敗するレイアウトの異常（空ファイル・必須カラムの不足など）。
+            全体を読み込む前に、全体を読み込んだ場合と同じ例外で報告するために使う。
+            行数・日時の値の異常は、全体を読み込めばより詳しく報告できるため含めない
+    """
+
+    path: Path
+    day: date | None
+    rows: int
+    headerless: bool | None
+    encoding: str | None
+    issues: tuple[str, ...] = ()
+    warnings: tuple[str, ...] = ()
+    error: CsvMergerError | None = None
+
+
+class PreflightReport:
+    """入力ディレクトリ全体の事前チェックの結果
+
+    Attributes:
+        probes: ファイルごとの結果（入力順）
+        continuity: 日付を推定できたファイルの重複日・欠損日
+        is_mergeable: レイアウトの異常・重複日・欠損日がない場合はTrue
+    """
+
+    def __init__(self, probes: list[FileProbe], continuity: DayContinuity):
+        """PreflightReportを初期化
+
+        Args:
+            probes: ファイルごとの結果
+            continuity: 日付を推定できたファイルの重複日・欠損日
+        """
+        self._probes = list(probes)
+        self._continuity = continuity
+
+    @property
+    def probes(self) -> list[FileProbe]:
+        """ファイルごとの結果（入力順）"""
+        return list(self._probes)
+
+    @property
+    def continuity(self) -> DayContinuity:
+        """日付を推定できたファイルの重複日・欠損日"""
+        return self._continuity
+
+    @property
+    def file_count(self) -> int:
+        """チェックしたファイル数"""
+        return len(self._probes)
+
+    @property
+    def total_rows(self) -> int:
+        """データ行数の合計"""
+        return sum(probe.rows for probe in self._probes)
+
+    @property
+    def first_day(self) -> date | None:
+        """最も古い日付（日付を推定できたファイルがない場合はNone）"""
+        days = self._continuity.days
+        return min(days) if days else None
+
+    @property
+    def last_day(self) -> date | None:
+        """最も新しい日付（日付を推定できたファイルがない場合はNone）"""
+        days = self._continuity.days
+        return max(days) if days else None
+
+    @property
+    def files_with_issues(self) -> list[FileProbe]:
+        """レイアウトの異常があるファイル"""
+        return [probe for probe in self._probes if probe.issues]
+
+    @property
+    def files_with_warnings(self) -> list[FileProbe]:
+        """確認が必要な点があるファイル"""
+        return [probe for probe in self._probes if probe.warnings]
+
+    def files_on(self, day: date) -> list[Path]:
+        """指定した日付のファイル（重複日の表示用）
+
+        Args:
+            day: 日付
+
+        Returns:
+            その日付と推定したファイルのパス
+        """
+        return [probe.path for probe in self._probes if probe.day == day]
+
+    @property
+    def is_mergeable(self) -> bool:
+        """レイアウトの異常・重複日・欠損日がない場合はTrue"""
+        return not self.files_with_issues and self._continuity.is_continuous
+
+    def __repr__(self) -> str:
+        """repr表現"""
+        return (
+            f"PreflightReport(files={self.file_count}, "
+            f"duplicate_days={len(self._continuity.duplicate_days)}, "
+            f"missing_days={len(self._continuity.missing_days)}, "
+            f"files_with_issues={len(self.files_with_issues)})"
+        )
@@ -3,13 +3,19 @@
 このモジュールは複数のCSVファイルを1つに結合する
 ドメインサービスを提供します。
 """
+from collections.abc import Callable, Iterator, Sequence
+from datetime import date, timedelta
 from pathlib import Path
+import heapq
+import numpy as np
 import pandas as pd
-from datetime import timedelta
 
 from domain.models.csv_file import CsvFile
+from domain.models.csv_file_summary import CsvFileSummary
+from domain.models.lazy_csv_file import LazyCsvFile
 from domain.models.csv_schema import CsvSchema
 from domain.exceptions import MergeError
+from domain.services.day_continuity import DayContinuity
 
 
 class CsvMerger:
@@ -20,17 +26,33 @@ class CsvMerger:
     日時順にソートして1つのCsvFileに結合します。
     """
 
-    def merge(self, csv_files: list[CsvFile]) -> CsvFile:
+    # merge_streaming() が1回に返す行数の既定値
+    DEFAULT_CHUNK_ROWS: int = 100_000
+
+    # 日番号の起点
+    _EPOCH = date(1970, 1, 1)
+
+    def merge(self, csv_files: Sequence[CsvFile | LazyCsvFile]) -> CsvFile:
         """複数のCSVファイルを1つに結合
         
         以下の処理を行います：
         1. 入力の妥当性チェック
         2. 連続日検証（最小日〜最大日に欠損日がないこと、重複日がないこと）
-        3. 全てのDataFrameを結合
-        4. 日時カラムで昇順ソート
-        5. 日時の重複チェック
-        6. No列の再採番（1から連番）
-        7. 新しいCsvFileオブジェクトを生成して返却
+        3. ファイルを日付順に並べて全てのDataFrameを結合
+        4. 日時の昇順を確認（崩れている場合のみ日時カラムでソートし、
+           日時の重複をチェック）
+        5. No列の再採番（1から連番）
+        6. 新しいCsvFileオブジェクトを生成して返却
+        
+        各ファイルは1日分で、リポジトリが日時順にソート済みのため、
+        通常はファイルを日付順に並べて連結するだけで全体が日時順になり、
+        全体のソートは不要です。
+        
+        連続日検証と昇順の確認には、CsvFile の生成時に求めた日時の要約
+        （CsvFile.summary の日番号・並び順）を使い、データは見ません。
+        
+        LazyCsvFile の日付は走査時のメタデータから取得し、データは
+        日付順に連結する時点で読み込みます。
         
         Args:
             csv_files: 結合するCSVファイルのリスト
@@ -50,29 +72,181 @@ class CsvMerger:
         if len(csv_files) == 1:
             return self._renumber_and_create_csv_file(csv_files[0].data)
         
-        # 入力CSVが連続日であることを検証
-        self._validate_continuous_days(csv_files)
+        # 入力CSVが連続日であることを検証（各ファイルの日番号の整数演算のみ）
+        days = self._validate_continuous_days(csv_files)
 
-        # 複数ファイルの結合
-        dataframes = [csv_file.data for csv_file in csv_files]
-        merged_df = pd.concat(dataframes, ignore_index=True)
+        # ファイルを日付順に並べて結合（各日付は1ファイルのみであることを検証済み）
+        ordered = [self._materialize(csv_files[i]) for i in np.argsort(days, kind="stable")]
+        # 1日分のファイルがそれぞれ狭義単調増加なら、日付順に連結した全体も狭義単調増加
+        presorted = all(self._is_sorted_day(csv_file) for csv_file in ordered)
+        merged_df = pd.concat([csv_file.data for csv_file in ordered], ignore_index=True)
+        del ordered
         
-        # 日時カラムでソート（datetime型に変換してソート）
-        timestamp_col = CsvSchema.TIMESTAMP_COLUMN
-        merged_df[timestamp_col] = pd.to_datetime(merged_df[timestamp_col])
-        merged_df = merged_df.sort_values(by=timestamp_col).reset_index(drop=True)
-        # ソート後、標準フォーマット（YYYY/MM/DD HH:MM:SS）に統一
-        # 注: 入力は様々なフォーマット（ISO 8601など）を受け入れるが、
-        #     出力は統一されたフォーマットに変換される
-        merged_df[timestamp_col] = merged_df[timestamp_col].dt.strftime("%Y/%m/%d %H:%M:%S")
-        
-        # 日時の重複チェック
-        self._check_duplicate_datetime(merged_df)
+        # 日時が狭義単調増加なら、ソート済みかつ重複なしが確定する
+        # （要約から確定しない場合のみ、日時カラムをO(n)で確認）
+        if not presorted and not self._is_strictly_increasing(merged_df):
+            # ファイル内の順序が崩れている場合のみ日時カラムでソート
+            # （datetime64型のままソートし、文字列化は書き出し時に行う）
+            timestamp_col = CsvSchema.TIMESTAMP_COLUMN
+            merged_df = merged_df.sort_values(by=timestamp_col).reset_index(drop=True)
+            
+            # 日時の重複チェック
+            self._check_duplicate_datetime(merged_df)
         
         # No列の再採番
         return self._renumber_and_create_csv_file(merged_df)
 
-    def _validate_continuous_days(self, csv_files: list[CsvFile]) -> None:
+    def merge_streaming(
+        self,
+        sources: Sequence[Callable[[], CsvFile] | LazyCsvFile],
+        chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> Iterator[pd.DataFrame]:
+        """複数のCSVファイルを結合し、結合結果を行数上限付きのチャンクで順に返す
+        
+        結合後のDataFrame全体を生成しないストリーミング版の merge() です。
+        各入力はCsvFileを返す関数として渡し、必要になった時点で開いて、
+        読み終えた時点で解放します。
+        
+        以下の処理を行います：
+        1. 各入力を1つずつ開いて日付と先頭日時を取得し、すぐに解放
+           （連続日検証はこの時点で行い、出力前にエラーを検出する）
+        2. 先頭日時をキーとするヒープで入力をk-wayマージ
+           （次に小さい入力の先頭日時までの行をまとめて取り出す）
+        3. 日時の重複を直前の出力行との比較で逐次チェック
+        4. No列を1から連番で振りながら、chunk_rows行ごとに返す
+        
+        日付が重ならない通常の入力では同時に開く入力は1つだけで、
+        メモリ使用量は総行数ではなく開いている入力の数に比例します。
+        
+        LazyCsvFile の入力は手順1で開かず、走査時のメタデータの日付と
+        その日の0時を先頭日時として使います（各入力は1日分で重複日がないため、
+        日の0時の順に開けば日時順に取り出せる）。
+        
+        Args:
+            sources: CsvFileを返す関数、または LazyCsvFile のリスト（開くたびに読み込み直す）
+            chunk_rows: 1チャンクあたりの最大行数
+            
+        Yields:
+            No列が再採番された結合結果のチャンク（日時の昇順）
+            
+        Raises:
+            ValueError: 空リストが渡された場合
+            MergeError: 連続日でない場合、日時の重複がある場合
+        """
+        # 空リストチェック
+        if not sources:
+            raise ValueError("結合するCSVファイルが指定されていません（空リスト）")
+        
+        # 各入力の日番号と先頭日時だけを保持してヒープを構築
+        heap: list[tuple[np.int64, int]] = []
+        days = []
+        for index, source in enumerate(sources):
+            if isinstance(source, LazyCsvFile):
+                days.append(source.day)
+                heap.append((np.int64(CsvFileSummary.day_start(source.day)), index))
+                continue
+            csv_file = source()
+            if len(sources) > 1:
+                days.append(self._day_number(csv_file))
+            summary = csv_file.summary
+            if summary is not None:
+                heap.append((np.int64(summary.first_stamp), index))
+            else:
+                heap.append((self._sorted_stamps(csv_file)[1][0], index))
+            del csv_file
+        if len(sources) > 1:
+            self._validate_day_numbers(np.array(days, dtype=np.int64))
+        heapq.heapify(heap)
+        
+        # 開いている入力ごとの (DataFrame, 日時配列, 次に取り出す行位置)
+        opened: dict[int, tuple[pd.DataFrame, np.ndarray, int]] = {}
+        pending: list[pd.DataFrame] = []
+        pending_rows = 0
+        next_no = 1
+        last_stamp = None
+        while heap:
+            _, index = heapq.heappop(heap)
+            if index not in opened:
+                opened[index] = (*self._sorted_stamps(self._open(sources[index])), 0)
+            df, stamps, start = opened.pop(index)
+            
+            # 次に小さい入力の先頭日時以下の行をまとめて取り出す
+            if heap:
+                end = int(np.searchsorted(stamps, heap[0][0], side="right"))
+            else:
+                end = len(stamps)
+            
+            # 日時の重複を直前の出力行との比較で逐次チェック
+            run = stamps[start:end]
+            if last_stamp is not None and run[0] <= last_stamp:
+                self._raise_duplicate_datetime(run[:1].view("datetime64[ns]"))
+            repeated = np.flatnonzero(run[1:] <= run[:-1])
+            if len(repeated) > 0:
+                self._raise_duplicate_datetime(run[repeated + 1].view("datetime64[ns]"))
+            last_stamp = run[-1]
+            
+            pending.append(df.iloc[start:end])
+            pending_rows += end - start
+            if end < len(stamps):
+                opened[index] = (df, stamps, end)
+                heapq.heappush(heap, (stamps[end], index))
+            # 読み終えた入力は opened から外れ、参照がなくなった時点で解放される
+            
+            # chunk_rows行たまるごと（最後は残り全て）にNo列を振って返す
+            if pending_rows >= chunk_rows or (not heap and pending_rows > 0):
+                merged = pd.concat(pending, ignore_index=True) if len(pending) > 1 else pending[0]
+                ready = len(merged) if not heap else len(merged) - len(merged) % chunk_rows
+                for offset in range(0, ready, chunk_rows):
+                    chunk = merged.iloc[offset:min(offset + chunk_rows, ready)]
+                    chunk = chunk.reset_index(drop=True)
+                    chunk["No"] = np.arange(next_no, next_no + len(chunk))
+                    next_no += len(chunk)
+                    yield CsvSchema.to_storage_dtypes(chunk)
+                pending = [merged.iloc[ready:]] if ready < len(merged) else []
+                pending_rows = len(merged) - ready
+
+    def _open(self, source: Callable[[], CsvFile] | LazyCsvFile) -> CsvFile:
+        """ストリーミング結合の入力を開く
+        
+        Args:
+            source: CsvFileを返す関数、または LazyCsvFile
+            
+        Returns:
+            読み込んだCsvFile
+        """
+        return source.load() if isinstance(source, LazyCsvFile) else source()
+
+    def _materialize(self, csv_file: CsvFile | LazyCsvFile) -> CsvFile:
+        """結合する時点でデータを取得する（LazyCsvFile はここで読み込む）
+        
+        Args:
+            csv_file: 結合するCSVファイル
+            
+        Returns:
+            データを持つCsvFile
+        """
+        return csv_file.load() if isinstance(csv_file, LazyCsvFile) else csv_file
+
+    def _sorted_stamps(self, csv_file: CsvFile) -> tuple[pd.DataFrame, np.ndarray]:
+        """日時順に並んだDataFrameと日時の整数配列を取得
+        
+        CsvRepositoryが返すCsvFileはソート済みのため、通常は並べ替えません
+        （要約でソート済みと分かる場合は並び順も確認しない）。
+        
+        Args:
+            csv_file: 1ファイル分のCSVファイル
+            
+        Returns:
+            (日時順のDataFrame, 日時のint64配列（ナノ秒）)
+        """
+        df = csv_file.data
+        summary = csv_file.summary
+        if not (summary is not None and summary.is_sorted) and not self._is_strictly_increasing(df):
+            df = df.sort_values(by=CsvSchema.TIMESTAMP_COLUMN).reset_index(drop=True)
+        stamps = df[CsvSchema.TIMESTAMP_COLUMN].to_numpy(dtype="datetime64[ns]")
+        return df, stamps.view(np.int64)
+
+    def _validate_continuous_days(self, csv_files: Sequence[CsvFile | LazyCsvFile]) -> np.ndarray:
         """入力CSVが連続した日付で並ぶことを検証
         
         前提:
@@ -82,28 +256,78 @@ class CsvMerger:
           - 最小日から最大日まで欠損日がないこと（完全連続）
         違反時:
           - MergeError を送出
+        
+        各ファイルの日付は生成時に求めた日番号を使い、データは見ません。
+        
+        Returns:
+            入力順に並んだ各ファイルの日番号（int64）
+        """
+        days = np.fromiter(map(self._day_number, csv_files), dtype=np.int64, count=len(csv_files))
+        self._validate_day_numbers(days)
+        return days
+
+    def _day_number(self, csv_file: CsvFile | LazyCsvFile) -> int:
+        """1日分のCsvFileの日番号を取得
+        
+        LazyCsvFile は走査時のメタデータ、CsvFile は生成時に求めた要約の日番号を返します。
+        
+        Args:
+            csv_file: 1日分のCSVファイル
+            
+        Returns:
+            日番号（1970-01-01からの日数）
+            
+        Raises:
+            MergeError: 複数日のデータを含む場合
         """
-        # 各ファイルの日付（date型）を抽出
-        dates = []
-        for csv_file in csv_files:
-            dt_series = pd.to_datetime(csv_file.data[CsvSchema.TIMESTAMP_COLUMN])
-            unique_dates = dt_series.dt.date.unique()
-            if len(unique_dates) != 1:
-                # 1日分制約は通常 CsvFile 側で保証されるが、念のため
-                raise MergeError("各入力CSVは1日分のデータである必要があります")
-            dates.append(unique_dates[0])
-
-        # 重複日付の検出
-        if len(set(dates)) != len(dates):
-            raise MergeError("入力CSVに同一日付のファイルが含まれています（重複日）")
-
-        # 連続性チェック（最小日〜最大日が連続しているか）
-        min_date = min(dates)
-        max_date = max(dates)
-        unique_count = len(set(dates))
-        expected_count = (max_date - min_date).days + 1
-        if expected_count != unique_count:
-            raise MergeError("入力CSVは連続した日付である必要があります（欠損日が存在）")
+        if isinstance(csv_file, LazyCsvFile):
+            return csv_file.day
+        summary = csv_file.summary
+        if summary is None or summary.day is None:
+            # 1日分制約は通常 CsvFile 側で保証されるが、念のため
+            raise MergeError("各入力CSVは1日分のデータである必要があります")
+        return summary.day
+
+    def _validate_day_numbers(self, days: np.ndarray) -> None:
+        """日番号の並びに重複日・欠損日がないことを検証
+        
+        ソートした日番号の隣接差がすべて1であれば、重複日も欠損日もありません。
+        違反がある場合のみ、事前チェック（--check）と共通の規則（DayContinuity）で
+        重複日・欠損日を求めてエラーを送出します。
+        
+        Args:
+            days: 各ファイルの日番号（int64）
+            
+        Raises:
+            MergeError: 重複日または欠損日がある場合
+        """
+        if (np.diff(np.sort(days)) == 1).all():
+            return
+        DayContinuity(self._EPOCH + timedelta(days=day) for day in days.tolist()).validate()
+
+    def _is_sorted_day(self, csv_file: CsvFile) -> bool:
+        """要約から、1日分のデータで日時が狭義単調増加と分かる場合はTrue
+        
+        Args:
+            csv_file: 1ファイル分のCSVファイル
+            
+        Returns:
+            要約があり、1日分でソート済みかつ日時の重複がない場合はTrue
+        """
+        summary = csv_file.summary
+        return summary is not None and summary.is_sorted and summary.day is not None
+
+    def _is_strictly_increasing(self, df: pd.DataFrame) -> bool:
+        """日時カラムが狭義単調増加かをO(n)で判定
+        
+        Args:
+            df: 判定対象のDataFrame
+            
+        Returns:
+            隣接する全ての行で日時が増加している場合はTrue
+        """
+        stamps = df[CsvSchema.TIMESTAMP_COLUMN].to_numpy(dtype="datetime64[ns]")
+        return bool((stamps[1:] > stamps[:-1]).all())
 
     def _check_duplicate_datetime(self, df: pd.DataFrame) -> None:
         """日時カラムの重複をチェック
@@ -119,13 +343,26 @@ class CsvMerger:
         
         if duplicates.any():
             # 重複している日時を取得
-            duplicate_values = df[duplicates][timestamp_col].unique()
-            duplicate_str = ", ".join(str(v) for v in duplicate_values[:5])
+            self._raise_duplicate_datetime(df[duplicates][timestamp_col].unique())
+
+    def _raise_duplicate_datetime(self, duplicate_values) -> None:
+        """重複した日時を含むMergeErrorを送出
+        
+        Args:
+            duplicate_values: 重複している日時の配列
             
-            raise MergeError(
-                f"日時の重複が検出されました: {duplicate_str}"
-                + ("..." if len(duplicate_values) > 5 else "")
-            )
+        Raises:
+            MergeError: 常に送出
+        """
+        duplicate_str = ", ".join(
+            pd.Timestamp(v).strftime(CsvSchema.DATETIME_OUTPUT_FORMAT)
+            for v in duplicate_values[:5]
+        )
+        
+        raise MergeError(
+            f"日時の重複が検出されました: {duplicate_str}"
+            + ("..." if len(duplicate_values) > 5 else "")
+        )
 
     def _renumber_and_create_csv_file(self, df: pd.DataFrame) -> CsvFile:
         """No列を再採番して新しいCsvFileを作成
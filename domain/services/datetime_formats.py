@@ -0,0 +1,65 @@
+"""日時のフォーマットの定義
+
+このモジュールは、DatetimeParser が判別する日時のフォーマットと、
+pandas を呼ばずにそれらのフォーマットで日時を組み立てる関数を提供します。
+pandas を読み込まない CsvPreflight も同じフォーマットで日時を判別します。
+"""
+from datetime import datetime
+from typing import NamedTuple
+import re
+
+
+class DatetimeFormat(NamedTuple):
+    """判別できる日時のフォーマット
+
+    Attributes:
+        pattern: 値全体に一致する正規表現（年・月・日・時・分・秒の順にグループを持つ）
+        directive: pd.to_datetime() に渡す strftime 形式のフォーマット
+    """
+
+    pattern: re.Pattern
+    directive: str
+
+
+def _format(separator: str, time: str, directive: str) -> DatetimeFormat:
+    """日付の区切り文字・時刻部分の正規表現からフォーマットを作成"""
+    date = rf"(\d{{4}}){separator}(\d{{2}}){separator}(\d{{2}})"
+    # 全角数字などを受け付けないよう ASCII の数字に限る
+    return DatetimeFormat(re.compile(date + time, re.ASCII), directive)
+
+
+# 判別するフォーマット（先に一致したものを使う。数字は0埋めした桁数のみ）
+DATETIME_FORMATS: tuple[DatetimeFormat, ...] = (
+    _format("/", r" (\d{2}):(\d{2}):(\d{2})", "%Y/%m/%d %H:%M:%S"),
+    _format("-", r" (\d{2}):(\d{2}):(\d{2})", "%Y-%m-%d %H:%M:%S"),
+    _format("-", r"T(\d{2}):(\d{2}):(\d{2})", "%Y-%m-%dT%H:%M:%S"),
+    _format("/", r" (\d{2}):(\d{2})", "%Y/%m/%d %H:%M"),
+    _format("-", r" (\d{2}):(\d{2})", "%Y-%m-%d %H:%M"),
+    _format("/", "", "%Y/%m/%d"),
+    _format("-", "", "%Y-%m-%d"),
+)
+
+
+def match_datetime(value: str) -> datetime | None:
+    """DATETIME_FORMATS のいずれかに一致する値を日時として組み立てる
+
+    最初に一致したフォーマットだけを使います。
+
+    Args:
+        value: 日時の文字列
+
+    Returns:
+        組み立てた日時。一致するフォーマットがない場合や、
+        実在しない日時（13月・4月31日など）の場合はNone
+    """
+    for candidate in DATETIME_FORMATS:
+        match = candidate.pattern.fullmatch(value)
+        if match is None:
+            continue
+        # 日付だけ・秒なしのフォーマットでは、時刻の欠けた部分は0
+        parts = [int(group) for group in match.groups()] + [0, 0, 0]
+        try:
+            return datetime(parts[0], parts[1], parts[2], parts[3], parts[4], parts[5])
+        except ValueError:
+            return None
+    return None
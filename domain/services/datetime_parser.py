@@ -0,0 +1,145 @@
+"""日時カラムのフォーマット判別と高速な解釈
+
+このモジュールは、日時の値の先頭行からフォーマット（YYYY/MM/DD HH:MM:SS、
+ISO 8601 など）を判別し、明示したフォーマットで列全体を解釈するドメインサービスを
+提供します。判別したフォーマットに合わない値だけを pandas の汎用的な解釈に回すため、
+受け付ける値は pd.to_datetime() で解釈できる値と同じです。
+"""
+from collections.abc import Iterable
+from datetime import datetime
+from functools import lru_cache
+import warnings
+
+import pandas as pd
+
+from domain.services.datetime_formats import DATETIME_FORMATS, DatetimeFormat, match_datetime
+
+
+class DatetimeParser:
+    """日時の値をフォーマットを判別して解釈する
+
+    FORMATS のいずれかに一致する値は正規表現と明示したフォーマットで解釈し、
+    一致しない値・一致しても日付として実在しない値は pd.to_datetime() の
+    汎用的な解釈（要素ごとのフォーマット推定）で判定します。
+    """
+
+    # 判別するフォーマット（pandas を読み込まない CsvPreflight と共有）
+    FORMATS: tuple[DatetimeFormat, ...] = DATETIME_FORMATS
+
+    # フォーマットの判別に使う先頭の値の数
+    SAMPLE_ROWS: int = 8
+
+    # pandas の datetime64[ns] で表せる範囲（この外の値は汎用的な解釈で判定する）
+    _MIN = datetime(1677, 9, 22)
+    _MAX = datetime(2262, 4, 11)
+
+    @classmethod
+    def classify(cls, values: Iterable[str]) -> DatetimeFormat | None:
+        """先頭の値に共通するフォーマットを判別
+
+        Args:
+            values: 日時の文字列（先頭の SAMPLE_ROWS 件を使う）
+
+        Returns:
+            すべての標本に一致するフォーマット（ない場合はNone）
+        """
+        sample = [value for value, _ in zip(values, range(cls.SAMPLE_ROWS))]
+        if not sample:
+            return None
+        for candidate in cls.FORMATS:
+            if all(candidate.pattern.fullmatch(value) for value in sample):
+                return candidate
+        return None
+
+    @classmethod
+    def is_datetime(cls, value: str) -> bool:
+        """pd.to_datetime() で解釈できる値かを判定
+
+        FORMATS のいずれかに一致し、実在する日時として組み立てられる値は
+        pandas を呼ばずに判定します。
+
+        Args:
+            value: 日時の文字列
+
+        Returns:
+            日時として解釈できる場合True
+        """
+        # 一致しない値・13月や4月31日など組み立てられない値は pandas の解釈に任せる
+        parsed = match_datetime(value)
+        if parsed is not None and cls._MIN <= parsed <= cls._MAX:
+            return True
+        return cls._parses_generically(value)
+
+    @classmethod
+    def parse(cls, values: pd.Series) -> pd.Series:
+        """日時カラムを一括でdatetime64型に変換
+
+        先頭の値から判別したフォーマットを明示して列全体を変換し、
+        そのフォーマットで解釈できなかった行だけを要素ごとの解釈（format="mixed"）で
+        再試行します。フォーマットを判別できない場合は、pandas が先頭要素から
+        推定したフォーマットで変換してから同様に再試行します。
+        タイムゾーン付きの値は壁時計時刻を保ったままタイムゾーンを外します。
+
+        Args:
+            values: 日時カラム（文字列など）。datetime64型ならそのまま返す
+
+        Returns:
+            datetime64型のSeries（解釈できない値はNaT）
+        """
+        if pd.api.types.is_datetime64_dtype(values):
+            return values
+
+        text = values.astype(str)
+        present = values.notna()
+        detected = cls.classify(text[present])
+        with warnings.catch_warnings():
+            # フォーマット推定失敗・タイムゾーン混在の警告は結果に影響しないため抑止
+            warnings.simplefilter("ignore", UserWarning)
+            warnings.simplefilter("ignore", FutureWarning)
+            if detected is not None:
+                parsed = pd.to_datetime(text, errors="coerce", format=detected.directive)
+            else:
+                parsed = cls._to_naive_datetime(pd.to_datetime(text, errors="coerce"))
+
+            # 判別・推定したフォーマットで解釈できなかった行だけ個別に再試行
+            retry = parsed.isna() & present
+            if retry.any():
+                retried = cls._to_naive_datetime(
+                    pd.to_datetime(text[retry], errors="coerce", format="mixed")
+                )
+                parsed = parsed.copy()
+                parsed[retry] = retried
+
+        return parsed
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parses_generically(value: str) -> bool:
+        """pd.to_datetime() で解釈できるか（ヘッダーの列名など同じ値が繰り返し現れるため結果を覚える）"""
+        try:
+            pd.to_datetime(value)
+            return True
+        except (ValueError, pd.errors.ParserError, Exception):
+            return False
+
+    @staticmethod
+    def _to_naive_datetime(parsed: pd.Series) -> pd.Series:
+        """タイムゾーン付きの変換結果をタイムゾーンなしのdatetime64型に揃える
+
+        Args:
+            parsed: pd.to_datetime() の結果
+
+        Returns:
+            タイムゾーンなしのdatetime64型Series（壁時計時刻を保持）
+        """
+        if isinstance(parsed.dtype, pd.DatetimeTZDtype):
+            return parsed.dt.tz_localize(None)
+        if pd.api.types.is_datetime64_dtype(parsed):
+            return parsed
+        # タイムゾーンが混在するとobject型になるため要素ごとに外す
+        naive = parsed.map(
+            lambda value: pd.Timestamp(value).tz_localize(None)
+            if not pd.isna(value) and pd.Timestamp(value).tzinfo is not None
+            else value
+        )
+        return pd.to_datetime(naive, errors="coerce")
@@ -0,0 +1,75 @@
+"""日付の連続性の検証
+
+このモジュールは各入力ファイルの日付の並びについて、重複日・欠損日を
+求めるドメインサービスを提供します。pandas・numpy に依存しないため、
+DataFrameを読み込まない事前チェック（--check）でも同じ規則を使えます。
+"""
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+from domain.exceptions import MergeError
+
+
+class DayContinuity:
+    """日付の並びの重複日・欠損日
+
+    CsvMerger の連続日検証と同じ規則で判定します。
+    - 同一日付の重複がないこと（重複日なし）
+    - 最小日から最大日まで欠損日がないこと（完全連続）
+
+    Attributes:
+        days: 各ファイルの日付（入力順）
+        duplicate_days: 複数のファイルに現れる日付（昇順）
+        missing_days: 最小日から最大日までの間で、どのファイルにも現れない日付（昇順）
+    """
+
+    def __init__(self, days: Iterable[date]):
+        """DayContinuityを初期化
+
+        Args:
+            days: 各ファイルの日付
+        """
+        self._days = list(days)
+        counts = Counter(self._days)
+        self._duplicate_days = sorted(day for day, count in counts.items() if count > 1)
+        self._missing_days = []
+        if counts:
+            first = min(counts)
+            span = (max(counts) - first).days + 1
+            if span != len(counts):
+                self._missing_days = [
+                    day for day in (first + timedelta(days=offset) for offset in range(span))
+                    if day not in counts
+                ]
+
+    @property
+    def days(self) -> list[date]:
+        """各ファイルの日付（入力順）"""
+        return list(self._days)
+
+    @property
+    def duplicate_days(self) -> list[date]:
+        """複数のファイルに現れる日付（昇順）"""
+        return list(self._duplicate_days)
+
+    @property
+    def missing_days(self) -> list[date]:
+        """最小日から最大日までの間の欠損日（昇順）"""
+        return list(self._missing_days)
+
+    @property
+    def is_continuous(self) -> bool:
+        """重複日も欠損日もない場合はTrue"""
+        return not self._duplicate_days and not self._missing_days
+
+    def validate(self) -> None:
+        """重複日・欠損日がある場合に MergeError を送出する
+
+        Raises:
+            MergeError: 重複日または欠損日がある場合（重複日を先に判定）
+        """
+        if self._duplicate_days:
+            raise MergeError("入力CSVに同一日付のファイルが含まれています（重複日）")
+        if self._missing_days:
+            raise MergeError("入力CSVは連続した日付である必要があります（欠損日が存在）")
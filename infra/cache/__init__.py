@@ -0,0 +1 @@
+"""Cache - 読み込み結果の永続キャッシュ"""
@@ -0,0 +1,158 @@
+"""入力元ごとの文字コードの学習結果
+
+このモジュールは、文字コード判定で採用された文字コードを入力元の
+ディレクトリ・ファイル名のパターンごとに記録し、次回以降（実行をまたいで）
+最初に試す文字コードとして使うためのプロファイルを提供します。
+"""
+from pathlib import Path
+import json
+import os
+import re
+import tempfile
+
+
+class EncodingProfile:
+    """入力元（ディレクトリ・ファイル名のパターン）ごとに学習した文字コード
+
+    ファイル名のパターンは数字の並びを "#" に置き換えたもの（"20251018.csv" → "#.csv"）です。
+    参照時は「ディレクトリ + パターン」、見つからなければ「パターンのみ」の順に探すため、
+    同じロガーの出力を別のディレクトリに置いた場合にも学習結果を使えます。
+
+    記録はメモリ上で行い、path を指定した場合のみ save() でJSONファイルに保存します。
+    記録数が MAX_ENTRIES を超えた場合は、最後に記録した時期が古いものから削除します。
+
+    Attributes:
+        path: 保存先のJSONファイル（Noneの場合は保存しない）
+        changed: 読み込み後・保存後に記録が変わった場合はTrue
+    """
+
+    # 保存形式のバージョン（形式の変更時に更新）
+    FORMAT_VERSION: int = 1
+
+    # 保持する記録の最大数
+    MAX_ENTRIES: int = 1024
+
+    _DIGITS = re.compile(r"\d+")
+
+    def __init__(self, path: str | Path | None = None):
+        """EncodingProfileを初期化
+
+        path のファイルが存在する場合は読み込みます。読み込めない・形式が異なる
+        ファイルは無視して、空の状態から学習します。
+
+        Args:
+            path: 保存先のJSONファイル（Noneの場合はメモリ上のみ）
+        """
+        self.path = Path(path) if path is not None else None
+        self.changed = False
+        self._entries: dict[str, str] = {}
+        # ディレクトリ → 絶対パス（ファイルごとに絶対パスを求めないよう覚えておく）
+        self._directories: dict[str, str] = {}
+        if self.path is not None:
+            self._entries = self._read(self.path)
+
+    @classmethod
+    def pattern_of(cls, path: str | Path) -> str:
+        """ファイル名のパターン（数字の並びを "#" に置き換えたもの）"""
+        return cls._DIGITS.sub("#", os.path.basename(path))
+
+    def lookup(self, path: str | Path) -> str | None:
+        """ファイルに対して学習した文字コードを取得
+
+        Args:
+            path: CSVファイルのパス
+
+        Returns:
+            学習した文字コード（記録がない場合はNone）
+        """
+        directory_key, pattern = self._keys(path)
+        return self._entries.get(directory_key) or self._entries.get(pattern)
+
+    def record(self, path: str | Path, encoding: str) -> None:
+        """ファイルで採用された文字コードを記録
+
+        Args:
+            path: CSVファイルのパス
+            encoding: 採用された文字コード
+        """
+        for key in self._keys(path):
+            if self._entries.get(key) == encoding:
+                continue
+            # 記録し直したものを末尾（新しい側）に移す
+            self._entries.pop(key, None)
+            self._entries[key] = encoding
+            self.changed = True
+        while len(self._entries) > self.MAX_ENTRIES:
+            del self._entries[next(iter(self._entries))]
+
+    def merge(self, other: "EncodingProfile") -> None:
+        """別プロセス等で学習した記録を合算（other の記録を優先）
+
+        Args:
+            other: 合算するプロファイル
+        """
+        for key, encoding in other.entries.items():
+            if self._entries.get(key) != encoding:
+                self._entries.pop(key, None)
+                self._entries[key] = encoding
+                self.changed = True
+        while len(self._entries) > self.MAX_ENTRIES:
+            del self._entries[next(iter(self._entries))]
+
+    @property
+    def entries(self) -> dict[str, str]:
+        """記録（キー → 文字コード、古い順）"""
+        return dict(self._entries)
+
+    def save(self) -> bool:
+        """記録が変わっていればJSONファイルに保存
+
+        並列に保存しても壊れたファイルが見えないよう、一時ファイルに書いてから置き換えます。
+
+        Returns:
+            保存した場合True（path がNone、または変更がない場合はFalse）
+        """
+        if self.path is None or not self.changed:
+            return False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        content = json.dumps(
+            {"version": self.FORMAT_VERSION, "entries": self._entries},
+            ensure_ascii=False,
+            indent=1,
+        )
+        fd, temp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(temp_name, self.path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        self.changed = False
+        return True
+
+    def _keys(self, path: str | Path) -> tuple[str, str]:
+        """(ディレクトリ + パターンのキー, パターンのみのキー)"""
+        directory, name = os.path.split(os.fspath(path))
+        absolute = self._directories.get(directory)
+        if absolute is None:
+            absolute = self._directories[directory] = os.path.abspath(directory)
+        pattern = self._DIGITS.sub("#", name)
+        return os.path.join(absolute, pattern), pattern
+
+    @classmethod
+    def _read(cls, path: Path) -> dict[str, str]:
+        """保存済みの記録を読み込む（読み込めない場合は空）"""
+        try:
+            content = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(content, dict) or content.get("version") != cls.FORMAT_VERSION:
+            return {}
+        entries = content.get("entries")
+        if not isinstance(entries, dict):
+            return {}
+        return {
+            key: encoding for key, encoding in entries.items()
+            if isinstance(key, str) and isinstance(encoding, str)
+        }
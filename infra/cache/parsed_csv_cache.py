@@ -0,0 +1,267 @@
+"""正規化・検証済みCSVデータのディスクキャッシュ
+
+このモジュールは CsvRepository が読み込んだ正規化・検証済みのデータを
+バイナリの列指向フォーマットでディスクに保存し、同じファイルを再度読み込む際に
+文字コード判定・パース・検証を省略するためのキャッシュを提供します。
+"""
+from pathlib import Path
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from domain.models.csv_schema import CsvSchema
+
+
+class ParsedCsvCache:
+    """正規化・検証済みデータのディスクキャッシュ（オプトイン）
+
+    キーはファイルの指紋（パス・サイズ・更新時刻・内容のハッシュ）と
+    スキーマバージョンから生成するため、ファイルの変更やスキーマの変更で
+    自動的に無効になります。キャッシュの合計サイズが上限を超えた場合は、
+    最後に使用された時刻（ファイルの更新時刻）が古いものから削除します（LRU）。
+
+    エントリのフォーマット:
+        [ヘッダー長 (4バイト, little endian)] [JSONヘッダー] [各カラムのバッファ]
+        各カラムのバッファはNumPy配列のバイト列をそのまま8バイト境界に揃えて並べたもので、
+        読み込み時は np.frombuffer() でコピーせずに配列として扱えます。
+
+    Attributes:
+        cache_dir: キャッシュディレクトリ
+        max_bytes: キャッシュの合計サイズの上限（バイト）
+    """
+
+    # エントリのフォーマットバージョン（フォーマット変更時に更新）
+    FORMAT_VERSION: int = 1
+
+    # エントリファイルの拡張子
+    ENTRY_SUFFIX: str = ".pcsv"
+
+    # キャッシュの合計サイズの上限の既定値（256MB）
+    DEFAULT_MAX_BYTES: int = 256 * 1024 * 1024
+
+    # 上限を超えた場合に、この割合まで削除する（削除の頻度を抑えるため）
+    EVICTION_LOW_WATER_RATIO: float = 0.9
+
+    # バッファの境界
+    _ALIGNMENT: int = 8
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """ParsedCsvCacheを初期化
+
+        Args:
+            cache_dir: キャッシュディレクトリ（存在しない場合は保存時に作成）
+            max_bytes: キャッシュの合計サイズの上限（バイト）
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._total_bytes: int | None = None
+        self._stats: dict[str, int] = dict.fromkeys(("hits", "misses", "stores", "evictions"), 0)
+
+    def key_for(self, path: Path, raw: bytes) -> str:
+        """ファイルの指紋からキャッシュキーを生成
+
+        Args:
+            path: CSVファイルのパス
+            raw: ファイルの内容（バイト列）
+
+        Returns:
+            キャッシュキー（16進文字列）
+        """
+        stat = path.stat()
+        content_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        fingerprint = "\0".join([
+            str(path.resolve()),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            content_hash,
+            str(CsvSchema.SCHEMA_VERSION),
+            str(self.FORMAT_VERSION),
+        ])
+        return hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """キャッシュからデータを取得
+
+        壊れたエントリは削除してミスとして扱います。
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            キャッシュされたデータ。存在しない場合はNone
+        """
+        entry = self._entry_path(key)
+        try:
+            # 書き込み可能なバッファに読み込み、配列をコピーせずに共有する
+            buffer = bytearray(entry.read_bytes())
+            data = self._decode(buffer)
+        except FileNotFoundError:
+            self._stats["misses"] += 1
+            return None
+        except (ValueError, KeyError, TypeError):
+            entry.unlink(missing_ok=True)
+            self._stats["misses"] += 1
+            return None
+
+        # LRUのため、使用した時刻を更新時刻として記録
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        self._stats["hits"] += 1
+        return data
+
+    def put(self, key: str, data: pd.DataFrame) -> bool:
+        """データをキャッシュに保存
+
+        数値・日時以外のカラムを含む場合は保存しません。
+        並列に保存しても壊れたエントリが見えないよう、一時ファイルに書いてから置き換えます。
+
+        Args:
+            key: キャッシュキー
+            data: 保存するデータ
+
+        Returns:
+            保存した場合True
+        """
+        encoded = self._encode(data)
+        if encoded is None:
+            return False
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(encoded)
+            os.replace(temp_name, self._entry_path(key))
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+        self._stats["stores"] += 1
+        if self._total_bytes is not None:
+            self._total_bytes += len(encoded)
+        self._evict_if_needed()
+        return True
+
+    def reset_stats(self) -> None:
+        """ヒット・ミス等の集計をリセット"""
+        for name in self._stats:
+            self._stats[name] = 0
+
+    def merge_stats(self, stats: dict[str, int]) -> None:
+        """別プロセス等で集計した値を合算
+
+        Args:
+            stats: 合算する集計値（stats プロパティの形式）
+        """
+        for name, count in stats.items():
+            self._stats[name] = self._stats.get(name, 0) + count
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """ヒット・ミス・保存・削除の件数を取得"""
+        return dict(self._stats)
+
+    @property
+    def hits(self) -> int:
+        """キャッシュヒット件数を取得"""
+        return self._stats["hits"]
+
+    @property
+    def misses(self) -> int:
+        """キャッシュミス件数を取得"""
+        return self._stats["misses"]
+
+    def _entry_path(self, key: str) -> Path:
+        """キャッシュキーに対応するエントリのパスを取得"""
+        return self.cache_dir / f"{key}{self.ENTRY_SUFFIX}"
+
+    def _encode(self, data: pd.DataFrame) -> bytes | None:
+        """DataFrameをエントリのバイト列に変換
+
+        Args:
+            data: 変換するデータ
+
+        Returns:
+            エントリのバイト列。保存できない型のカラムを含む場合はNone
+        """
+        arrays = [np.ascontiguousarray(data[column].to_numpy()) for column in data.columns]
+        if any(array.dtype.kind not in "biufM" for array in arrays):
+            return None
+
+        columns = [
+            [str(column), array.dtype.str, len(array)]
+            for column, array in zip(data.columns, arrays)
+        ]
+        header = json.dumps({"columns": columns}, ensure_ascii=False).encode("utf-8")
+        parts = [len(header).to_bytes(4, "little"), header]
+        offset = 4 + len(header)
+        for array in arrays:
+            padding = -offset % self._ALIGNMENT
+            parts.append(b"\0" * padding)
+            parts.append(array.tobytes())
+            offset += padding + array.nbytes
+        return b"".join(parts)
+
+    def _decode(self, buffer: bytearray) -> pd.DataFrame:
+        """エントリのバイト列をDataFrameに変換
+
+        Args:
+            buffer: エントリのバイト列
+
+        Returns:
+            復元したデータ
+
+        Raises:
+            ValueError: バイト列が壊れている場合
+        """
+        header_size = int.from_bytes(buffer[:4], "little")
+        header = json.loads(bytes(buffer[4:4 + header_size]).decode("utf-8"))
+        offset = 4 + header_size
+        columns = {}
+        for name, dtype_str, count in header["columns"]:
+            dtype = np.dtype(dtype_str)
+            offset += -offset % self._ALIGNMENT
+            columns[name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+            offset += dtype.itemsize * count
+        if offset != len(buffer):
+            raise ValueError("キャッシュエントリのサイズが一致しません")
+        return pd.DataFrame(columns, copy=False)
+
+    def _evict_if_needed(self) -> None:
+        """合計サイズが上限を超えていれば、古いエントリから削除"""
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, _, size in self._scan_entries())
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        low_water = int(self.max_bytes * self.EVICTION_LOW_WATER_RATIO)
+        entries = sorted(self._scan_entries())
+        total = sum(size for _, _, size in entries)
+        for _, entry, size in entries:
+            if total <= low_water:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+            self._stats["evictions"] += 1
+        self._total_bytes = total
+
+    def _scan_entries(self) -> list[tuple[int, Path, int]]:
+        """キャッシュディレクトリ内のエントリを列挙
+
+        Returns:
+            (最終使用時刻, パス, サイズ) のリスト
+        """
+        entries = []
+        for entry in self.cache_dir.glob(f"*{self.ENTRY_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, entry, stat.st_size))
+        return entries
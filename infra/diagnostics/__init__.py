@@ -0,0 +1 @@
+"""Diagnostics - 計測・プロファイリング・トレース"""
@@ -0,0 +1,259 @@
+"""読み込み・結合処理のフェーズ別の計測
+
+このモジュールはCSV結合処理の各フェーズの経過時間・CPU時間・
+ピークメモリと、ファイルごとの読み込み時間を集計するタイマーを提供します。
+"""
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+import heapq
+import time
+import tracemalloc
+
+from domain.models.merge_stats import FileTiming, MergeStats, PhaseStats
+from infra.diagnostics.span_tracer import SpanTracer
+
+
+class PhaseTimer:
+    """フェーズ別の経過時間・CPU時間・ピークメモリを集計するタイマー
+
+    無効な場合、measure() は何もしないコンテキストを返すため、
+    計測しない通常の実行にはほとんど負荷をかけません。
+
+    フェーズは入れ子にでき、外側のフェーズの時間からは内側のフェーズの時間を
+    除きます（各フェーズの時間の合計が全体の時間を超えないようにするため）。
+    ピークメモリは、そのフェーズが最も内側で実行中だった間の tracemalloc の
+    ピーク（トレース中の総量）の最大値です。
+
+    tracer を指定した場合、各フェーズと span() の範囲をスパンとしても記録します
+    （enabled でなくても記録するため、集計なしでタイムラインだけを取れます）。
+
+    Attributes:
+        enabled: 計測する場合はTrue
+        trace_memory: tracemalloc でピークメモリを計測する場合はTrue
+        tracer: スパンを記録するトレーサー（Noneの場合は記録しない）
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        trace_memory: bool = False,
+        tracer: SpanTracer | None = None
+    ):
+        """PhaseTimerを初期化
+
+        Args:
+            enabled: 計測する場合はTrue
+            trace_memory: ピークメモリも計測する場合はTrue（計測中は処理が遅くなる）
+            tracer: スパンを記録するトレーサー
+        """
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.tracer = tracer
+        self._wall: dict[str, float] = {}
+        self._cpu: dict[str, float] = {}
+        self._peak: dict[str, int] = {}
+        self._calls: dict[str, int] = {}
+        self._file_seconds: dict[Path, float] = {}
+        # 実行中のフェーズ（内側が末尾）と、最後に時間を区切った時刻
+        self._stack: list[str] = []
+        self._mark_wall = 0.0
+        self._mark_cpu = 0.0
+        # tracemalloc をこのタイマーが開始した場合はTrue（to_stats() で停止する）
+        self._owns_tracing = False
+        # 全体の時間の計測開始時刻（生成時または reset() 時）
+        self._started_wall = time.perf_counter()
+        self._started_cpu = time.process_time()
+
+    @property
+    def tracing(self) -> bool:
+        """スパンを記録している場合はTrue"""
+        return self.tracer is not None
+
+    def measure(self, phase: str, **tags):
+        """フェーズの実行時間を計測するコンテキストを返す
+
+        Args:
+            phase: フェーズ名（MergeStats.PHASE_ORDER を参照）
+            **tags: スパンに付けるタグ（tracer がある場合のみ使用）
+
+        Returns:
+            with 文で使うコンテキスト
+        """
+        if self.tracer is not None:
+            if not self.enabled:
+                return self.tracer.span(phase, **tags)
+            return self._measure_and_trace(phase, self.tracer, tags)
+        if not self.enabled:
+            return nullcontext()
+        return self._measure(phase)
+
+    @contextmanager
+    def _measure(self, phase: str) -> Iterator[None]:
+        self._switch()
+        self._stack.append(phase)
+        self._calls[phase] = self._calls.get(phase, 0) + 1
+        try:
+            yield
+        finally:
+            self._switch()
+            self._stack.pop()
+
+    @contextmanager
+    def _measure_and_trace(self, phase: str, tracer: SpanTracer, tags: dict) -> Iterator[None]:
+        with self._measure(phase), tracer.span(phase, **tags):
+            yield
+
+    def span(self, name: str, **tags):
+        """集計せずにスパンだけを記録するコンテキストを返す
+
+        Args:
+            name: スパン名
+            **tags: スパンに付けるタグ
+
+        Returns:
+            with 文で使うコンテキスト（tracer がない場合は何もしない）
+        """
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, **tags)
+
+    def annotate(self, **tags) -> None:
+        """実行中の最も内側のスパンにタグを追加する
+
+        Args:
+            **tags: 追加するタグ
+        """
+        if self.tracer is not None:
+            self.tracer.annotate(**tags)
+
+    def measure_iter(self, phase: str, iterable: Iterable) -> Iterator:
+        """イテレーターの各要素の生成時間をフェーズとして計測する
+
+        ジェネレーターで遅延実行される処理（ストリーミング結合等）の計測に使います。
+
+        Args:
+            phase: フェーズ名
+            iterable: 計測するイテラブル
+
+        Returns:
+            iterable の要素を順に返すイテレーター
+        """
+        if not self.enabled and self.tracer is None:
+            return iter(iterable)
+        return self._measure_iter(phase, iter(iterable))
+
+    def _measure_iter(self, phase: str, iterator: Iterator) -> Iterator:
+        while True:
+            with self.measure(phase):
+                item = next(iterator, _END)
+            if item is _END:
+                return
+            yield item
+
+    def _switch(self) -> None:
+        """直前の区切りからの時間・ピークメモリを実行中の最も内側のフェーズに加算する"""
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        if self._stack:
+            phase = self._stack[-1]
+            self._wall[phase] = self._wall.get(phase, 0.0) + wall - self._mark_wall
+            self._cpu[phase] = self._cpu.get(phase, 0.0) + cpu - self._mark_cpu
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                self._peak[phase] = max(self._peak.get(phase, 0), peak)
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        self._mark_wall = wall
+        self._mark_cpu = cpu
+
+    def add_file(self, path: Path, seconds: float) -> None:
+        """ファイルの読み込み時間を加算
+
+        Args:
+            path: ファイルのパス
+            seconds: 所要時間（秒）
+        """
+        if self.enabled:
+            self._file_seconds[path] = self._file_seconds.get(path, 0.0) + seconds
+
+    def merge(self, other: "PhaseTimer") -> None:
+        """別のタイマーの値を合算（時間は合計、ピークメモリは最大値）
+
+        Args:
+            other: 合算するタイマー
+        """
+        for phase, seconds in other._wall.items():
+            self._wall[phase] = self._wall.get(phase, 0.0) + seconds
+        for phase, seconds in other._cpu.items():
+            self._cpu[phase] = self._cpu.get(phase, 0.0) + seconds
+        for phase, peak in other._peak.items():
+            self._peak[phase] = max(self._peak.get(phase, 0), peak)
+        for phase, calls in other._calls.items():
+            self._calls[phase] = self._calls.get(phase, 0) + calls
+        for path, seconds in other._file_seconds.items():
+            self._file_seconds[path] = self._file_seconds.get(path, 0.0) + seconds
+        if self.tracer is not None and other.tracer is not None:
+            self.tracer.merge(other.tracer)
+
+    def reset(self) -> None:
+        """計測値をリセット"""
+        self._wall.clear()
+        self._cpu.clear()
+        self._peak.clear()
+        self._calls.clear()
+        self._file_seconds.clear()
+        if self.tracer is not None:
+            self.tracer.reset()
+        self._started_wall = time.perf_counter()
+        self._started_cpu = time.process_time()
+
+    def to_stats(self, slowest: int = 10) -> MergeStats:
+        """計測結果を MergeStats に変換
+
+        全体の時間は、タイマーの生成（または reset()）からの経過時間です。
+        このタイマーが開始した tracemalloc はここで停止します。
+
+        Args:
+            slowest: 記録する遅いファイルの数
+
+        Returns:
+            計測結果
+        """
+        phases = {
+            phase: PhaseStats(
+                wall_seconds=self._wall.get(phase, 0.0),
+                cpu_seconds=self._cpu.get(phase, 0.0),
+                peak_memory_bytes=self._peak.get(phase) if self.trace_memory else None,
+                calls=calls,
+            )
+            for phase, calls in self._calls.items()
+        }
+        slowest_files = [
+            FileTiming(path, seconds)
+            for path, seconds in heapq.nlargest(
+                slowest, self._file_seconds.items(), key=lambda item: item[1]
+            )
+        ]
+        if self._owns_tracing and not self._stack:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        return MergeStats(
+            phases,
+            slowest_files,
+            total_wall_seconds=time.perf_counter() - self._started_wall,
+            total_cpu_seconds=time.process_time() - self._started_cpu,
+        )
+
+    def __getstate__(self) -> dict:
+        # 並列読み込みのワーカーとの受け渡しでは実行中のフェーズは引き継がない
+        state = self.__dict__.copy()
+        state["_stack"] = []
+        return state
+
+
+# measure_iter() の終端を表す番兵
+_END = object()
@@ -0,0 +1,223 @@
+"""結合処理のプロファイリング
+
+このモジュールは cProfile による関数ごとのCPU時間の集計と、
+tracemalloc によるフェーズごとの行単位のメモリ割り当ての集計を行う
+プロファイラを提供します。並列読み込みではワーカーごとに計測した結果を合算します。
+"""
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, TextIO, cast
+import tracemalloc
+
+if TYPE_CHECKING:
+    import cProfile
+
+
+# このプロセスで有効になっている cProfile.Profile（fork したワーカーに引き継がれた場合に止めるため）
+_active_profile = None
+
+
+class _StatsSnapshot:
+    """pstats.Stats に渡すための、計測済みの集計値の入れ物
+
+    cProfile.Profile はプロセス間で受け渡せないため、集計値（辞書）だけを保持します。
+    """
+
+    def __init__(self, stats: dict):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        """pstats.Stats.load_stats() から呼ばれる（集計済みのため何もしない）"""
+
+    def as_profile(self) -> "cProfile.Profile":
+        """pstats.Stats に渡す型として返す（pstats は create_stats() と stats だけを使う）"""
+        return cast("cProfile.Profile", self)
+
+
+class RunProfiler:
+    """結合処理のCPU・メモリのプロファイラ
+
+    無効な場合、cpu_profile() / memory_phase() は何もしないコンテキストを返すため、
+    通常の実行には負荷をかけません。
+
+    メモリは、フェーズの開始時と終了時の tracemalloc のスナップショットの差分を
+    行ごとに集計します（フェーズ終了時点で残っている割り当ての増分）。
+    フェーズの中で開始したフェーズは外側のフェーズに含めて集計します。
+
+    Attributes:
+        cpu: cProfile で関数ごとのCPU時間を計測する場合はTrue
+        memory: tracemalloc でフェーズごとの割り当てを計測する場合はTrue
+    """
+
+    # 行ごとの割り当ての記録から除くファイル（計測自体の割り当て）
+    _IGNORED_FILES: tuple[str, ...] = (tracemalloc.__file__, __file__)
+
+    def __init__(self, cpu: bool = False, memory: bool = False):
+        """RunProfilerを初期化
+
+        Args:
+            cpu: CPU時間を計測する場合はTrue
+            memory: メモリの割り当てを計測する場合はTrue
+        """
+        self.cpu = cpu
+        self.memory = memory
+        self._cpu_stats: list[dict] = []
+        # フェーズ名 -> 行（"ファイル:行番号"） -> [増加バイト数, 増加ブロック数]
+        self._memory_stats: dict[str, dict[str, list[int]]] = {}
+        self._memory_depth = 0
+        self._owns_tracing = False
+
+    @property
+    def enabled(self) -> bool:
+        """いずれかの計測が有効な場合はTrue"""
+        return self.cpu or self.memory
+
+    def cpu_profile(self):
+        """with 文の間、cProfile で関数ごとのCPU時間を計測するコンテキストを返す
+
+        Returns:
+            with 文で使うコンテキスト
+        """
+        if not self.cpu:
+            return nullcontext()
+        return self._cpu_profile()
+
+    @contextmanager
+    def _cpu_profile(self) -> Iterator[None]:
+        # cProfile は計測する場合のみ使うため、CLIの起動を遅くしないよう遅延import
+        import cProfile
+
+        global _active_profile
+        if _active_profile is not None:
+            # fork したワーカーに親プロセスの cProfile が引き継がれている
+            _active_profile.disable()
+        profile = cProfile.Profile()
+        _active_profile = profile
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            _active_profile = None
+            profile.create_stats()
+            self._cpu_stats.append(profile.stats)
+
+    def memory_phase(self, phase: str):
+        """with 文の間のメモリの割り当てを、フェーズごとに行単位で集計するコンテキストを返す
+
+        Args:
+            phase: フェーズ名
+
+        Returns:
+            with 文で使うコンテキスト
+        """
+        if not self.memory or self._memory_depth:
+            return nullcontext()
+        return self._memory_phase(phase)
+
+    @contextmanager
+    def _memory_phase(self, phase: str) -> Iterator[None]:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        self._memory_depth += 1
+        before = tracemalloc.take_snapshot()
+        try:
+            yield
+        finally:
+            after = tracemalloc.take_snapshot()
+            self._memory_depth -= 1
+            lines = self._memory_stats.setdefault(phase, {})
+            for diff in after.compare_to(before, "lineno"):
+                frame = diff.traceback[0]
+                if diff.size_diff <= 0 or frame.filename in self._IGNORED_FILES:
+                    continue
+                totals = lines.setdefault(f"{frame.filename}:{frame.lineno}", [0, 0])
+                totals[0] += diff.size_diff
+                totals[1] += diff.count_diff
+
+    def merge(self, other: "RunProfiler") -> None:
+        """別のプロファイラ（並列読み込みのワーカー）の計測結果を合算
+
+        Args:
+            other: 合算するプロファイラ
+        """
+        self._cpu_stats.extend(other._cpu_stats)
+        for phase, lines in other._memory_stats.items():
+            merged = self._memory_stats.setdefault(phase, {})
+            for location, (size, count) in lines.items():
+                totals = merged.setdefault(location, [0, 0])
+                totals[0] += size
+                totals[1] += count
+
+    def reset(self) -> None:
+        """計測結果をリセット"""
+        self._cpu_stats.clear()
+        self._memory_stats.clear()
+
+    def stop(self) -> None:
+        """このプロファイラが開始した tracemalloc を停止する"""
+        if self._owns_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._owns_tracing = False
+
+    def write_cpu_report(self, path: str | Path, top: int = 50) -> Path:
+        """CPU時間の上位の関数を、累積時間順と自己時間順でファイルに書き出す
+
+        Args:
+            path: 出力先のパス
+            top: 各順序で書き出す関数の数
+
+        Returns:
+            書き出したファイルのパス
+        """
+        import pstats
+
+        output = Path(path)
+        with open(output, "w", encoding="utf-8") as f:
+            if not self._cpu_stats:
+                f.write("CPU時間の計測結果がありません\n")
+                return output
+            stats = pstats.Stats(_StatsSnapshot(self._cpu_stats[0]).as_profile(), stream=f)
+            for snapshot in self._cpu_stats[1:]:
+                stats.add(_StatsSnapshot(snapshot).as_profile())
+            stats.strip_dirs()
+            for sort_key, title in (("cumulative", "累積時間順"), ("tottime", "自己時間順")):
+                f.write(f"=== {title}（上位{top}件） ===\n")
+                stats.sort_stats(sort_key).print_stats(top)
+        return output
+
+    def write_memory_report(self, path: str | Path, top: int = 20) -> Path:
+        """フェーズごとにメモリの割り当てが多い行をファイルに書き出す
+
+        Args:
+            path: 出力先のパス
+            top: フェーズごとに書き出す行の数
+
+        Returns:
+            書き出したファイルのパス
+        """
+        output = Path(path)
+        with open(output, "w", encoding="utf-8") as f:
+            self._format_memory_report(f, top)
+        return output
+
+    def _format_memory_report(self, f: TextIO, top: int) -> None:
+        if not self._memory_stats:
+            f.write("メモリの計測結果がありません\n")
+            return
+        for phase, lines in self._memory_stats.items():
+            total = sum(size for size, _ in lines.values())
+            f.write(f"=== {phase}（増加 {total / 1e6:.1f} MB、上位{top}行） ===\n")
+            f.write(f"{'増加(KB)':>12}{'ブロック数':>12}  行\n")
+            ranked = sorted(lines.items(), key=lambda item: item[1][0], reverse=True)[:top]
+            for location, (size, count) in ranked:
+                f.write(f"{size / 1024:>12.1f}{count:>12}  {location}\n")
+            f.write("\n")
+
+    def __getstate__(self) -> dict:
+        # 並列読み込みのワーカーには計測中のフェーズや tracemalloc の所有を引き継がない
+        state = self.__dict__.copy()
+        state["_memory_depth"] = 0
+        state["_owns_tracing"] = False
+        return state
@@ -0,0 +1,169 @@
+"""結合処理のスパンの記録と Chrome trace event 形式での書き出し
+
+このモジュールは読み込み・結合・保存の各処理の開始・終了時刻を
+スパンとして記録し、chrome://tracing や Perfetto で表示できる
+trace event 形式の JSON に書き出すトレーサーを提供します。
+"""
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+import json
+import os
+import threading
+import time
+
+
+class SpanTracer:
+    """処理のスパン（名前・開始時刻・所要時間・タグ）を記録するトレーサー
+
+    スパンはプロセスID・スレッドIDと一緒に記録するため、並列読み込みの
+    ワーカーや圧縮スレッドのスパンも同じタイムライン上に並びます。
+    ワーカーで記録したスパンは merge() で親プロセスのトレーサーに合算します。
+
+    記録するのはスパンごとに1つのタプルで、最大 max_events 件を超えた場合は
+    古いものから捨てるため、常時有効にしてもメモリ使用量は一定に収まります。
+
+    Attributes:
+        max_events: 保持するスパンの最大数
+    """
+
+    # 保持するスパンの既定の最大数
+    DEFAULT_MAX_EVENTS: int = 1_000_000
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS):
+        """SpanTracerを初期化
+
+        Args:
+            max_events: 保持するスパンの最大数
+        """
+        self.max_events = max_events
+        # (名前, 開始時刻ns, 所要時間ns, プロセスID, スレッドID, タグ)
+        self._events: deque[tuple] = deque(maxlen=max_events)
+        # (プロセスID, スレッドID) -> (プロセス名, スレッド名)
+        self._names: dict[tuple[int, int], tuple[str, str]] = {}
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, name: str, **tags) -> Iterator[None]:
+        """with 文の間をスパンとして記録する
+
+        Args:
+            name: スパン名
+            **tags: スパンに付けるタグ（ファイル名・バイト数・行数など）
+        """
+        stack = self._stack()
+        stack.append(tags)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            stack.pop()
+            self._record(name, start, end - start, tags)
+
+    def annotate(self, **tags) -> None:
+        """実行中の最も内側のスパンにタグを追加する（行数など処理後に分かる値用）
+
+        Args:
+            **tags: 追加するタグ
+        """
+        stack = self._stack()
+        if stack:
+            stack[-1].update(tags)
+
+    def _stack(self) -> list[dict]:
+        """このスレッドで実行中のスパンのタグ（内側が末尾）"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, name: str, start: int, duration: int, tags: dict) -> None:
+        pid = os.getpid()
+        tid = threading.get_native_id()
+        if (pid, tid) not in self._names:
+            # プロセス・スレッドごとに最初の1回だけ（CLIの起動を遅くしないよう遅延import）
+            import multiprocessing
+
+            self._names[(pid, tid)] = (
+                multiprocessing.current_process().name,
+                threading.current_thread().name,
+            )
+        self._events.append((name, start, duration, pid, tid, tags))
+
+    def merge(self, other: "SpanTracer") -> None:
+        """別のトレーサー（並列読み込みのワーカー）のスパンを合算
+
+        Args:
+            other: 合算するトレーサー
+        """
+        self._events.extend(other._events)
+        self._names.update(other._names)
+
+    def reset(self) -> None:
+        """記録したスパンを破棄"""
+        self._events.clear()
+        self._names.clear()
+
+    @property
+    def event_count(self) -> int:
+        """記録しているスパンの数"""
+        return len(self._events)
+
+    def to_trace_events(self) -> list[dict]:
+        """記録したスパンを trace event 形式の辞書のリストに変換
+
+        各スパンは完了イベント（"ph": "X"）で、時刻は最初のスパンの開始を0とした
+        マイクロ秒です。タグには worker（プロセス名/スレッド名）を加えます。
+        プロセス名・スレッド名はメタデータイベント（"ph": "M"）として加えます。
+
+        Returns:
+            trace event のリスト
+        """
+        if not self._events:
+            return []
+        origin = min(event[1] for event in self._events)
+        events = []
+        for (pid, tid), (process_name, thread_name) in sorted(self._names.items()):
+            events.append({"name": "process_name", "ph": "M", "pid": pid, "tid": tid,
+                           "args": {"name": process_name}})
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                           "args": {"name": thread_name}})
+        for name, start, duration, pid, tid, tags in self._events:
+            process_name, thread_name = self._names[(pid, tid)]
+            events.append({
+                "name": name,
+                "cat": "merge",
+                "ph": "X",
+                "ts": (start - origin) / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": {"worker": f"{process_name}/{thread_name}", **tags},
+            })
+        return events
+
+    def write(self, path: str | Path) -> Path:
+        """trace event 形式の JSON ファイルに書き出す
+
+        Args:
+            path: 出力先のパス
+
+        Returns:
+            書き出したファイルのパス
+        """
+        output = Path(path)
+        trace = {"traceEvents": self.to_trace_events(), "displayTimeUnit": "ms"}
+        output.write_text(json.dumps(trace, ensure_ascii=False, default=str), encoding="utf-8")
+        return output
+
+    def __getstate__(self) -> dict:
+        # threading.local はプロセス間で受け渡せないため、受け取った側で作り直す
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
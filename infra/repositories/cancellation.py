@@ -0,0 +1,89 @@
+"""読み込みの協調的な中止
+
+このモジュールは、並列読み込みでいずれかのファイルが失敗したときに、
+入力順でそれより後の読み込みを行っているワーカーへ中止を伝えるためのトークンを提供します。
+"""
+import threading
+
+from domain.exceptions import LoadCancelledError
+
+
+class _FailedPosition:
+    """プロセス内で共有する、最初に失敗した位置
+
+    multiprocessing.Value と同じく value 属性と get_lock() を持ちます。
+    """
+
+    def __init__(self, value: int):
+        self.value = value
+        self._lock = threading.Lock()
+
+    def get_lock(self) -> threading.Lock:
+        return self._lock
+
+
+class CancellationToken:
+    """読み込みの中止を伝えるトークン
+
+    トークンは入力順の位置（並列読み込みではチャンクの番号）を持ち、ある位置で失敗すると
+    その位置以降の読み込みだけを中止します。前の位置の読み込みは続けるため、
+    入力順で最初の失敗を報告できます。
+    ワーカーは読み込みの区切り（ファイル・まとめてパースするグループごと）で
+    raise_if_cancelled() を呼び、中止されていれば残りを読まずに終了します。
+    プロセス間で共有する場合は multiprocessing の Value("q") を渡します
+    （Value はプロセスプールの initializer の引数として渡す必要があります）。
+    トークンを持つオブジェクトを pickle した場合、複製先は中止されていない
+    新しいトークンになります。
+
+    Attributes:
+        position: このトークンで読み込む位置
+    """
+
+    # 失敗がないことを表す位置（Value("q") に収まる最大値）
+    NOT_FAILED: int = 2**63 - 1
+
+    def __init__(self, failed=None, position: int = 0):
+        """CancellationTokenを初期化
+
+        Args:
+            failed: 最初に失敗した位置を共有する値（value 属性と get_lock() を持つもの。
+                初期値は NOT_FAILED）。Noneの場合はこのプロセス内だけで使う値を作成
+            position: このトークンで読み込む位置
+        """
+        self._failed = failed if failed is not None else _FailedPosition(self.NOT_FAILED)
+        self.position = position
+
+    def __reduce__(self):
+        """pickle用（共有する値は複製できないため、新しいトークンとして複製する）"""
+        return (CancellationToken, ())
+
+    def at(self, position: int) -> "CancellationToken":
+        """同じ値を共有し、別の位置を読み込むトークンを返す
+
+        Args:
+            position: 読み込む位置
+
+        Returns:
+            新しいトークン
+        """
+        return CancellationToken(self._failed, position)
+
+    @property
+    def is_cancelled(self) -> bool:
+        """この位置以前で失敗があり、この位置の読み込みを中止する場合はTrue"""
+        return self._failed.value <= self.position
+
+    def cancel(self) -> None:
+        """この位置で失敗したことを伝え、この位置以降の読み込みを中止する"""
+        with self._failed.get_lock():
+            if self.position < self._failed.value:
+                self._failed.value = self.position
+
+    def raise_if_cancelled(self) -> None:
+        """中止されている場合は LoadCancelledError を送出する
+
+        Raises:
+            LoadCancelledError: 中止されている場合
+        """
+        if self.is_cancelled:
+            raise LoadCancelledError("他のファイルの読み込みに失敗したため、読み込みを中止しました")
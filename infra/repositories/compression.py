@@ -0,0 +1,274 @@
+"""圧縮ファイルの入出力
+
+このモジュールは gzip / zstd で圧縮されたCSVの展開と、
+結合結果の圧縮書き出しを提供します。
+
+- 入力: 拡張子（.gz / .zst）で圧縮形式を判定し、一時ファイルを作らずにメモリ上で展開
+- 出力: gzip はブロックごとに複数スレッドで並列に圧縮（ParallelGzipWriter）、
+  zstd は zstandard のマルチスレッド圧縮を使用
+
+zstd は zstandard パッケージを使用します。必須の依存関係ではないため、
+使用時にのみインポートし、インストールされていない場合は ImportError を送出します。
+"""
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, Protocol
+import gzip
+import io
+import os
+import zlib
+
+from domain.exceptions import InvalidCsvFormatError
+from infra.diagnostics.span_tracer import SpanTracer
+
+
+# 圧縮形式ごとのファイル拡張子
+COMPRESSION_SUFFIXES: dict[str, str] = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+
+class WritableStream(Protocol):
+    """書き出し先のストリーム（write() だけを使う。ファイル・圧縮ストリームなど）"""
+
+    def write(self, data: bytes, /) -> int:
+        ...
+
+
+def _import_zstandard():
+    """zstandard をインポートする
+
+    Returns:
+        zstandard モジュール
+
+    Raises:
+        ImportError: zstandard がインストールされていない場合
+    """
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError('zstd 形式の入出力には zstandard が必要です（pip install "flet-csv[zstd]"）') from e
+    return zstandard
+
+
+def validate_compression(compression: str | None) -> None:
+    """圧縮形式の名前を検証する
+
+    Args:
+        compression: 圧縮形式（"gzip" / "zstd"、Noneの場合は非圧縮）
+
+    Raises:
+        ValueError: 未対応の圧縮形式の場合
+    """
+    if compression is not None and compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(
+            f"未対応の圧縮形式です: {compression}（対応形式: {', '.join(COMPRESSION_SUFFIXES)}）"
+        )
+
+
+def ensure_available(compression: str | None) -> None:
+    """圧縮形式に必要なライブラリが利用できることを確認する
+
+    Args:
+        compression: 圧縮形式（"gzip" / "zstd"、Noneの場合は非圧縮）
+
+    Raises:
+        ValueError: 未対応の圧縮形式の場合
+        ImportError: 必要なライブラリがインストールされていない場合
+    """
+    validate_compression(compression)
+    if compression == "zstd":
+        _import_zstandard()
+
+
+def compression_of(path: Path) -> str | None:
+    """ファイルの拡張子から圧縮形式を判定する
+
+    Args:
+        path: ファイルパス
+
+    Returns:
+        圧縮形式（"gzip" / "zstd"）。圧縮されていない場合はNone
+    """
+    suffix = path.suffix.lower()
+    for compression, compression_suffix in COMPRESSION_SUFFIXES.items():
+        if suffix == compression_suffix:
+            return compression
+    return None
+
+
+def decompress(path: Path, data: bytes) -> bytes:
+    """圧縮されたファイルの内容を展開する
+
+    gzip は複数メンバー（ParallelGzipWriter の出力等）にも対応します。
+
+    Args:
+        path: ファイルパス（圧縮形式の判定とエラーメッセージに使用）
+        data: ファイルの内容（圧縮されたバイト列）
+
+    Returns:
+        展開したバイト列（圧縮されていない場合は data をそのまま返す）
+
+    Raises:
+        InvalidCsvFormatError: 展開に失敗した場合
+        ImportError: zstd の展開に必要な zstandard がない場合
+    """
+    compression = compression_of(path)
+    if compression is None:
+        return data
+    if compression == "zstd":
+        zstandard = _import_zstandard()
+        try:
+            # フレームに展開後のサイズが記録されていない場合もあるためストリームで展開
+            with zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data)) as reader:
+                return reader.read()
+        except zstandard.ZstdError as e:
+            raise InvalidCsvFormatError(f"圧縮ファイルの展開に失敗しました: {path.name}: {e}")
+    try:
+        return gzip.decompress(data)
+    except (OSError, EOFError, zlib.error) as e:
+        raise InvalidCsvFormatError(f"圧縮ファイルの展開に失敗しました: {path.name}: {e}")
+
+
+@contextmanager
+def open_compressed(
+    f: BinaryIO,
+    compression: str | None,
+    workers: int | None = None,
+    tracer: SpanTracer | None = None
+) -> Iterator[WritableStream]:
+    """書き出し先を圧縮ストリームで包む
+
+    Args:
+        f: 書き出し先（バイナリモードのファイル）
+        compression: 圧縮形式（Noneの場合は f をそのまま返す）
+        workers: 圧縮のスレッド数（Noneの場合はCPUコア数）
+        tracer: gzip のブロックの圧縮をスパンとして記録するトレーサー
+
+    Yields:
+        圧縮して f に書き出すストリーム
+    """
+    ensure_available(compression)
+    if compression is None:
+        yield f
+    elif compression == "gzip":
+        with ParallelGzipWriter(f, workers=workers, tracer=tracer) as writer:
+            yield writer
+    else:
+        zstandard = _import_zstandard()
+        compressor = zstandard.ZstdCompressor(threads=workers or -1)
+        with compressor.stream_writer(f, closefd=False) as writer:
+            yield writer
+
+
+class ParallelGzipWriter:
+    """ブロック単位で並列に圧縮する gzip ライター
+
+    書き込まれたデータを block_size バイトごとのブロックに分け、各ブロックを
+    独立した gzip メンバーとしてスレッドプールで圧縮し、元の順序で書き出します。
+    zlib は圧縮中に GIL を解放するため、ブロックは複数コアで同時に圧縮されます。
+    複数メンバーの gzip は gzip / zcat / pandas でそのまま展開できます。
+
+    圧縮待ちのブロックは最大 workers * 2 個に制限するため、
+    出力サイズによらずメモリ使用量は一定です。
+    """
+
+    # 既定のブロックサイズ（1MiB）
+    DEFAULT_BLOCK_SIZE = 1 << 20
+
+    def __init__(
+        self,
+        f: BinaryIO,
+        level: int = 6,
+        workers: int | None = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        tracer: SpanTracer | None = None
+    ):
+        """ParallelGzipWriterを初期化
+
+        Args:
+            f: 書き出し先（バイナリモードのファイル、クローズはしない）
+            level: 圧縮レベル（1〜9）
+            workers: 圧縮のスレッド数（Noneの場合はCPUコア数）
+            block_size: 1ブロックのバイト数
+            tracer: ブロックの圧縮をスパンとして記録するトレーサー（Noneの場合は記録しない）
+        """
+        self._f = f
+        self._level = level
+        self._workers = workers or os.cpu_count() or 1
+        self._block_size = block_size
+        self._buffer = bytearray()
+        self._pending: deque[Future] = deque()
+        self._executor = ThreadPoolExecutor(max_workers=self._workers)
+        self._members = 0
+        self._closed = False
+        self._tracer = tracer
+
+    def write(self, data: bytes) -> int:
+        """データを書き込む
+
+        Args:
+            data: 書き込むバイト列
+
+        Returns:
+            書き込んだバイト数
+        """
+        if self._closed:
+            raise ValueError("クローズ済みのライターには書き込めません")
+        self._buffer += data
+        block_size = self._block_size
+        if len(self._buffer) >= block_size:
+            view = memoryview(self._buffer)
+            full = len(self._buffer) - len(self._buffer) % block_size
+            for start in range(0, full, block_size):
+                self._submit(bytes(view[start:start + block_size]))
+            view.release()
+            del self._buffer[:full]
+        return len(data)
+
+    def close(self) -> None:
+        """残りのデータを圧縮して書き出す（書き出し先はクローズしない）"""
+        if self._closed:
+            return
+        try:
+            if self._buffer or self._members == 0:
+                # 空の入力でも有効な gzip になるよう、最低1メンバーは書き出す
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._f.write(self._pending.popleft().result())
+        finally:
+            self._closed = True
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit(self, block: bytes) -> None:
+        """ブロックの圧縮を依頼し、圧縮待ちが多い場合は先頭から書き出す
+
+        Args:
+            block: 圧縮するブロック
+        """
+        self._pending.append(self._executor.submit(self._compress, block))
+        self._members += 1
+        while len(self._pending) > self._workers * 2:
+            self._f.write(self._pending.popleft().result())
+
+    def _compress(self, block: bytes) -> bytes:
+        """1ブロックを gzip メンバーに圧縮する（mtime=0 で出力を決定的にする）"""
+        if self._tracer is None:
+            return gzip.compress(block, compresslevel=self._level, mtime=0)
+        with self._tracer.span("compress_block", bytes=len(block)):
+            return gzip.compress(block, compresslevel=self._level, mtime=0)
+
+    def __enter__(self) -> "ParallelGzipWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # 例外時は圧縮待ちのブロックを書き出さずに破棄する
+        self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,419 @@
+"""小さなCSVファイルのまとめ読み込み
+
+このモジュールは1ファイル24行程度の小さなCSVを大量に読み込む際に、
+同じレイアウト（ヘッダー行・列数・文字コード）のファイルを連結して
+1回の pandas.read_csv() でパースし、行数の境界でファイルごとに分割し直す
+ローダーを提供します。
+"""
+import csv
+import io
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from domain.models.csv_file import CsvFile
+from domain.models.csv_schema import CsvSchema
+from domain.exceptions import InvalidCsvFormatError
+from infra.repositories.csv_source import CsvSource
+
+
+class _Member(NamedTuple):
+    """グループに属する1ファイル分の入力"""
+
+    position: int
+    source: CsvSource
+    body: str
+    row_count: int
+
+
+class CsvBatchLoader:
+    """同じレイアウトのCSVファイルをまとめてパースするローダー
+
+    読み込み・文字コード判定（CsvRepository.read_source()）と正規化
+    （CsvRepository.normalize()）は CsvRepository の実装をそのまま使い、
+    パース以降のDataFrame操作だけをグループ単位で行います。
+    まとめて処理できないグループ（行数が一致しない、列の型が揃わない等）は
+    ファイルごとの処理（CsvRepository.parse_source()）にフォールバックするため、結果は
+    CsvRepository.load() を1ファイルずつ呼んだ場合と同じになります。
+
+    リポジトリに cancellation が設定されている場合は、失敗したファイルで中止を伝えて
+    それより後のファイルを読まず、前のファイルの処理を終えてから入力順で最初の失敗の
+    例外を送出します。ファイル・グループの区切りごとに他の読み込みからの中止を確認します。
+    """
+
+    # 重複除去時にファイルを区別するための作業用カラム名
+    _FILE_ID_COLUMN = "__file_id__"
+
+    def __init__(self, repository):
+        """CsvBatchLoaderを初期化
+
+        Args:
+            repository: 読み込み処理を提供する CsvRepository
+        """
+        self._repository = repository
+
+    def load(self, file_paths: Sequence[str | Path]) -> list[CsvFile | Exception]:
+        """複数のCSVファイルを読み込む
+
+        Args:
+            file_paths: 読み込むCSVファイルのパスリスト
+
+        Returns:
+            入力順に並んだ結果のリスト（成功時は CsvFile、失敗時はその例外）
+
+        Raises:
+            Exception: リポジトリの cancellation が設定されている場合、入力順で最初に失敗したファイルの例外
+            LoadCancelledError: リポジトリの cancellation で中止された場合
+        """
+        outcomes: dict[int, CsvFile | Exception] = {}
+        groups: dict[tuple, list[_Member]] = {}
+        # cancellation が設定されている場合の、入力順で最初の失敗（位置, 例外）
+        failure: tuple[int, Exception] | None = None
+
+        repository = self._repository
+        timer = repository.phase_timer
+        cancellation = repository.cancellation
+        for index, file_path in enumerate(file_paths):
+            if cancellation is not None:
+                if failure is not None:
+                    # 失敗より後のファイルは読まない（前のファイルのまとめ処理は続ける）
+                    break
+                cancellation.raise_if_cancelled()
+            path = Path(file_path)
+            started = time.perf_counter()
+            try:
+                source = repository.read_source(path)
+                if isinstance(source, CsvFile):
+                    # キャッシュにヒットした
+                    outcomes[index] = source
+                    continue
+
+                with timer.measure("parse", file=path.name):
+                    layout = self._split_layout(source.text)
+                    if layout is not None:
+                        key, body = layout
+                        member = _Member(index, source, body, self._count_rows(body))
+                if layout is None:
+                    # 空ファイル等はファイルごとに処理してエラー内容を揃える
+                    outcome = self._load_single(source)
+                    outcomes[index] = outcome
+                    failure = self._first_failure(failure, index, outcome)
+                    continue
+            except Exception as e:
+                outcomes[index] = e
+                failure = self._first_failure(failure, index, e)
+                continue
+            finally:
+                timer.add_file(path, time.perf_counter() - started)
+
+            groups.setdefault((source.encoding,) + key, []).append(member)
+
+        for key, members in groups.items():
+            if cancellation is not None:
+                if failure is None:
+                    cancellation.raise_if_cancelled()
+                elif members[0].position > failure[0]:
+                    # 最初の失敗より後のファイルだけのグループは処理しない
+                    continue
+            header = key[2] if key[1] == "header" else None
+            started = time.perf_counter()
+            with timer.span(
+                "load_group",
+                files=len(members),
+                rows=sum(member.row_count for member in members),
+                bytes=sum(member.source.size for member in members),
+            ):
+                for member, outcome in zip(members, self._load_group(header, members)):
+                    outcomes[member.position] = outcome
+                    failure = self._first_failure(failure, member.position, outcome)
+            # まとめて処理した時間は行数で按分してファイルごとの時間に加える
+            elapsed = time.perf_counter() - started
+            weights = [max(member.row_count, 1) for member in members]
+            for member, weight in zip(members, weights):
+                timer.add_file(member.source.path, elapsed * weight / sum(weights))
+
+        if failure is not None:
+            raise failure[1]
+        return [outcomes[index] for index in range(len(file_paths))]
+
+    def _first_failure(
+        self,
+        failure: tuple[int, Exception] | None,
+        index: int,
+        outcome: CsvFile | Exception
+    ) -> tuple[int, Exception] | None:
+        """cancellation が設定されている場合、失敗したファイルで中止を伝え、入力順で最初の失敗を返す
+
+        Args:
+            failure: これまでの入力順で最初の失敗（位置, 例外）
+            index: 結果が出たファイルの位置
+            outcome: 1ファイル分の結果
+
+        Returns:
+            入力順で最初の失敗（cancellation が設定されていない場合は常にNone）
+        """
+        cancellation = self._repository.cancellation
+        if cancellation is None or not isinstance(outcome, Exception):
+            return failure
+        cancellation.cancel()
+        if failure is not None and failure[0] < index:
+            return failure
+        return index, outcome
+
+    def _load_single(self, source: CsvSource) -> CsvFile | Exception:
+        """1ファイルを個別に処理する（結果はリポジトリがキャッシュに保存する）
+
+        Args:
+            source: デコード済みのCSV入力
+
+        Returns:
+            CsvFile、または発生した例外
+        """
+        try:
+            return self._repository.parse_source(source)
+        except Exception as e:
+            return e
+
+    def _split_layout(self, text: str) -> tuple[tuple, str] | None:
+        """レイアウトのグループキーとデータ部分を取り出す
+
+        Args:
+            text: デコード済みのCSV文字列
+
+        Returns:
+            (グループキー, データ部分の文字列)。空ファイルの場合はNone
+        """
+        start = 0
+        while start < len(text):
+            end = text.find("\n", start)
+            if end == -1:
+                end = len(text)
+            line = text[start:end]
+            if line.strip():
+                break
+            start = end + 1
+        else:
+            return None
+
+        self._repository.io_counter.add("sniff_header", len(line.encode("utf-8")))
+        fields = next(csv.reader([line]), [""])
+        if CsvSchema.validate_datetime_format(fields[0]):
+            # ヘッダーなし: 先頭行もデータとして扱い、列数でグループ化
+            return ("headerless", len(fields)), text
+        # ヘッダーあり: ヘッダー行が同じファイル同士をグループ化
+        return ("header", line.rstrip("\r")), text[end + 1:]
+
+    @staticmethod
+    def _count_rows(body: str) -> int:
+        """データ部分の行数を数える（空白のみの行は pandas と同様に除外）
+
+        Args:
+            body: データ部分の文字列
+
+        Returns:
+            行数
+        """
+        return sum(1 for line in body.split("\n") if line.strip())
+
+    def _load_group(
+        self, header: str | None, members: list[_Member]
+    ) -> list[CsvFile | Exception]:
+        """同じレイアウトのファイル群をまとめて処理する
+
+        Args:
+            header: ヘッダー行（ヘッダーなしの場合はNone）
+            members: グループに属するファイル
+
+        Returns:
+            members と同じ順に並んだ結果のリスト
+        """
+        if len(members) == 1:
+            return [self._load_single(members[0].source)]
+
+        timer = self._repository.phase_timer
+        counts = np.array([member.row_count for member in members], dtype=np.int64)
+        files = len(members)
+        with timer.measure("parse", files=files):
+            df = self._parse_group(header, members, counts)
+        if df is None:
+            return [self._load_single(member.source) for member in members]
+
+        with timer.measure("normalize", files=files, rows=len(df)):
+            file_ids = np.repeat(np.arange(len(members)), counts)
+            has_no_column = header is not None and "No" in df.columns
+            try:
+                df = self._repository.normalize(df)
+            except Exception as e:
+                return [e for _ in members]
+            if not has_no_column:
+                # 追加されたNo列をファイルごとの連番に振り直す
+                df["No"] = self._positions_in_file(counts) + 1
+
+        with timer.measure("dedup", files=files, rows=len(df)):
+            # 重複行を除去（ファイルをまたいだ行は重複とみなさない）
+            keep = ~df.assign(**{self._FILE_ID_COLUMN: file_ids}).duplicated(keep="first")
+            keep = keep.to_numpy()
+            df = df[keep].reset_index(drop=True)
+            file_ids = file_ids[keep]
+            counts = np.bincount(file_ids, minlength=len(members))
+
+        with timer.measure("normalize", files=files, rows=len(df)):
+            # 整数カラムをまとめて格納型に縮小（グループ全体で収まらない列は
+            # CsvFile 生成時にファイルごとに判定されるため、結果は load() と同じ）
+            df = CsvSchema.to_storage_dtypes(df)
+
+        with timer.measure("validate", files=files, rows=len(df)):
+            return self._split_group(df, members, file_ids, counts)
+
+    def _split_group(
+        self,
+        df: pd.DataFrame,
+        members: list[_Member],
+        file_ids: np.ndarray,
+        counts: np.ndarray,
+    ) -> list[CsvFile | Exception]:
+        """グループを検証・並べ替えして、ファイルごとの CsvFile に分ける
+
+        Args:
+            df: 正規化・重複除去済みのDataFrame
+            members: グループに属するファイル
+            file_ids: 各行のファイル番号
+            counts: ファイルごとのデータ行数
+
+        Returns:
+            members と同じ順に並んだ結果のリスト
+        """
+        # 日時の妥当性をまとめて検証し、不正な行はファイルごとの行番号で報告
+        errors = self._validate_group(df, members, file_ids, counts)
+
+        # ファイル順、日時順に並べ替え
+        timestamps = df[CsvSchema.TIMESTAMP_COLUMN].to_numpy(dtype="datetime64[ns]")
+        order = np.lexsort((timestamps.view(np.int64), file_ids))
+        df = df.take(order).reset_index(drop=True)
+
+        results: list[CsvFile | Exception] = []
+        ends = np.cumsum(counts)
+        for position, member in enumerate(members):
+            if position in errors:
+                results.append(errors[position])
+                continue
+            start = ends[position] - counts[position]
+            data = df.iloc[start:ends[position]].reset_index(drop=True).copy()
+            try:
+                csv_file = CsvFile(file_path=member.source.path, data=data)
+            except Exception as e:
+                results.append(e)
+                continue
+            self._repository.store_cached(member.source, csv_file)
+            results.append(csv_file)
+        return results
+
+    def _parse_group(
+        self, header: str | None, members: list[_Member], counts: np.ndarray
+    ) -> pd.DataFrame | None:
+        """グループを連結して1回でパースする
+
+        Args:
+            header: ヘッダー行（ヘッダーなしの場合はNone）
+            members: グループに属するファイル
+            counts: ファイルごとのデータ行数
+
+        Returns:
+            パース結果。まとめて処理できない場合はNone
+        """
+        bodies = [
+            member.body if member.body.endswith("\n") or not member.body else member.body + "\n"
+            for member in members
+        ]
+        if header is not None:
+            bodies.insert(0, header + "\n")
+        for member in members:
+            self._repository.io_counter.add("parse", member.source.size)
+        try:
+            df = pd.read_csv(io.StringIO("".join(bodies)), header=None if header is None else "infer")
+        except Exception:
+            # ファイルごとに読み込んで、そのファイルの例外を報告する
+            return None
+
+        if len(df) != counts.sum():
+            return None
+
+        if header is None:
+            # 末尾の空列はファイルごとに判定されるため、判定が揃う場合のみまとめる
+            if df.shape[1] == 0:
+                return None
+            filled = np.bincount(
+                np.repeat(np.arange(len(members)), counts),
+                weights=df.iloc[:, -1].notna().to_numpy(),
+                minlength=len(members),
+            )
+            if (filled == 0).all():
+                df = df.iloc[:, :-1]
+            elif (filled == 0).any():
+                return None
+            value_columns = list(df.columns[1:])
+        else:
+            value_columns = [
+                column for column in CsvSchema.REQUIRED_COLUMNS
+                if column in df.columns and column != CsvSchema.TIMESTAMP_COLUMN
+            ]
+
+        # 値の列が整数でない場合は、ファイルごとに型が異なりうるためまとめない
+        if not all(pd.api.types.is_integer_dtype(df[column]) for column in value_columns):
+            return None
+        timestamp_column = df.columns[0] if header is None else CsvSchema.TIMESTAMP_COLUMN
+        if timestamp_column in df.columns and df[timestamp_column].dtype != object:
+            return None
+        return df
+
+    def _validate_group(
+        self,
+        df: pd.DataFrame,
+        members: list[_Member],
+        file_ids: np.ndarray,
+        counts: np.ndarray,
+    ) -> dict[int, Exception]:
+        """日時の妥当性をまとめて検証する
+
+        Args:
+            df: 正規化・重複除去済みのDataFrame（日時列は変換済みに置き換える）
+            members: グループに属するファイル
+            file_ids: 各行のファイル番号
+            counts: ファイルごとのデータ行数
+
+        Returns:
+            グループ内の位置ごとの検証エラー
+        """
+        parsed = CsvSchema.parse_datetime_series(df[CsvSchema.TIMESTAMP_COLUMN])
+        invalid = np.flatnonzero(CsvSchema.invalid_datetime_mask(parsed))
+        df[CsvSchema.TIMESTAMP_COLUMN] = parsed
+
+        errors: dict[int, Exception] = {}
+        if len(invalid) == 0:
+            return errors
+        # ヘッダー行を1行目として、データ行はファイル内の位置+2行目
+        lines = self._positions_in_file(counts)[invalid] + 2
+        for position in np.unique(file_ids[invalid]):
+            errors[int(position)] = InvalidCsvFormatError.with_invalid_lines(
+                members[position].source.path.name,
+                lines[file_ids[invalid] == position].tolist(),
+                error_type="不正な日時",
+            )
+        return errors
+
+    @staticmethod
+    def _positions_in_file(counts: np.ndarray) -> np.ndarray:
+        """各行のファイル内での位置（0始まり）を求める
+
+        Args:
+            counts: ファイルごとの行数
+
+        Returns:
+            各行のファイル内での位置
+        """
+        starts = np.cumsum(counts) - counts
+        return np.arange(int(counts.sum())) - np.repeat(starts, counts)
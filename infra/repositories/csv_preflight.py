@@ -0,0 +1,357 @@
+"""DataFrameを読み込まない入力ファイルの事前チェック
+
+このモジュールは各入力ファイルの先頭・末尾のデータ行だけを読み、
+ファイルの日付・データ行数・レイアウトを推定して、入力全体の重複日・欠損日と
+レイアウトの異常を結合前に報告する事前チェックを提供します。
+
+pandas・numpy には依存しないため、CLIの起動直後（--check）に使えます。
+"""
+from collections.abc import Iterable
+from datetime import date
+from pathlib import Path
+import codecs
+import csv
+import os
+
+from domain.exceptions import CsvFileNotFoundError, CsvMergerError, EmptyDataError, InvalidCsvFormatError
+from domain.models.csv_layout import CsvLayout
+from domain.models.preflight_report import FileProbe, PreflightReport
+from domain.services.datetime_formats import match_datetime
+from domain.services.day_continuity import DayContinuity
+from infra.repositories.compression import compression_of, decompress
+from infra.repositories.encoding_detector import EncodingDetector
+from infra.repositories.io_byte_counter import IoByteCounter
+
+
+class CsvPreflight:
+    """入力ファイルの先頭・末尾のデータ行から結合できるかを確認する事前チェック
+
+    各ファイルは先頭の HEAD_BYTES と、それを超える場合は末尾の TAIL_BYTES だけを
+    seek して読みます（圧縮ファイルは展開が必要なため全体を読みます）。
+    日付は先頭・末尾のデータ行の日時から推定し、重複日・欠損日は
+    CsvMerger と同じ DayContinuity の規則で判定します。
+
+    データ行数は、ファイル全体が先頭ブロックに収まる場合は空行を除いた行数、
+    収まらない場合は先頭ブロックの平均行長からの推定値です。
+
+    読み込みが確実に失敗するレイアウトの異常は FileProbe.error に、全体を読み込んだ場合と
+    同じ例外（同じメッセージ）を設定し、結合の前に全体を読み込まずに報告できるようにします。
+    ヘッダーの有無を判別できない場合（既知の列名がなく、先頭フィールドも日時に見えない場合）や、
+    列数の不一致など別のエラーが先に起きうる場合は設定しません。
+    読み込み済みのファイルには probe_bytes() で、ディスクを読み直さずに同じ確認を行えます。
+    """
+
+    # 先頭から読むバイト数（1日分のファイルは通常これに収まり、全体を1回で読む）
+    HEAD_BYTES: int = 64 * 1024
+
+    # 先頭ブロックに収まらないファイルで、末尾から読むバイト数
+    TAIL_BYTES: int = 4 * 1024
+
+    # 先頭・末尾の行のデコードに試す文字コード（CsvRepository と同じ順）
+    ENCODINGS: tuple[str, ...] = ("utf-8-sig", "utf-8", "cp932", "shift_jis")
+
+    # 以下は CsvSchema と共有する値（pandas を読み込まない CsvLayout から取る）
+    # ヘッダーなしCSVの列（ヘッダーありCSVでも必須の列。No列・参照列は読み込み時に補う）
+    HEADERLESS_COLUMNS: tuple[str, ...] = CsvLayout.HEADERLESS_COLUMNS
+    TIMESTAMP_COLUMN: str = CsvLayout.TIMESTAMP_COLUMN
+    OPTIONAL_COLUMNS: tuple[str, ...] = CsvLayout.HEADERLESS_OMITTED_COLUMNS
+    EXPECTED_RECORDS_PER_DAY: int = CsvLayout.EXPECTED_RECORDS_PER_DAY
+    MIN_VALID_YEAR: int = CsvLayout.MIN_VALID_YEAR
+    MAX_VALID_YEAR: int = CsvLayout.MAX_VALID_YEAR
+
+    # 行末の空白として読み飛ばす文字（pandas.read_csv() が空行とみなす行と揃える）
+    _BLANK: bytes = b" \t\r"
+
+    # 空のファイルを読み込んだ場合と同じエラーメッセージ
+    NO_COLUMNS_MESSAGE: str = "CSVファイルの読み込みに失敗しました: No columns to parse from file"
+
+    def __init__(self, io_counter: IoByteCounter | None = None):
+        """CsvPreflightを初期化
+
+        Args:
+            io_counter: probe() でディスクから読んだバイト数を "scan" として記録するカウンタ
+                （Noneの場合は記録しない）
+        """
+        self._io_counter = io_counter
+
+    def check(self, file_paths: Iterable[str | Path]) -> PreflightReport:
+        """入力ファイルをまとめてチェックする
+
+        Args:
+            file_paths: 入力ファイルのパス
+
+        Returns:
+            ファイルごとの結果と、入力全体の重複日・欠損日
+        """
+        probes = [self.probe(Path(path)) for path in file_paths]
+        continuity = DayContinuity(probe.day for probe in probes if probe.day is not None)
+        return PreflightReport(probes, continuity)
+
+    def probe(self, path: Path) -> FileProbe:
+        """1ファイルの先頭・末尾のデータ行から日付・行数・レイアウトを推定する
+
+        Args:
+            path: ファイルのパス
+
+        Returns:
+            1ファイル分の結果
+        """
+        try:
+            head, tail, size = self._read_edges(path)
+        except FileNotFoundError as e:
+            return FileProbe(path, None, 0, None, None, (f"読み込めません: {e}",),
+                             error=CsvFileNotFoundError(f"CSVファイルが見つかりません: {path}"))
+        except (OSError, ImportError) as e:
+            return FileProbe(path, None, 0, None, None, (f"読み込めません: {e}",))
+        except InvalidCsvFormatError as e:
+            # 圧縮ファイルの展開の失敗
+            return FileProbe(path, None, 0, None, None, (str(e),), error=e)
+        return self._inspect(path, head, tail, size)
+
+    def probe_bytes(self, path: Path, data: bytes) -> FileProbe:
+        """読み込み済みのファイルの内容から、probe() と同じ推定を行う（ディスクは読まない）
+
+        Args:
+            path: ファイルのパス（エラーメッセージ用）
+            data: ファイルの内容（圧縮ファイルの場合は展開後のバイト列）
+
+        Returns:
+            1ファイル分の結果
+        """
+        return self._inspect(path, *self._edges_of(data))
+
+    def _inspect(self, path: Path, head: bytes, tail: bytes | None, size: int) -> FileProbe:
+        """先頭・末尾のブロックから日付・行数・レイアウトを推定する
+
+        Args:
+            path: ファイルのパス
+            head: 先頭ブロック
+            tail: 末尾ブロック（全体が先頭ブロックに収まる場合はNone）
+            size: ファイルのサイズ
+
+        Returns:
+            1ファイル分の結果
+        """
+        data = head
+        # BOM と行末の空白（CRLF の CR を含む）を除き、空行を読み飛ばす
+        if head.startswith(codecs.BOM_UTF8):
+            head = head[len(codecs.BOM_UTF8):]
+        lines = head.split(b"\n")
+        if tail is not None:
+            # 先頭ブロックの最後の行は途中で切れている
+            lines.pop()
+        lines = [line for line in lines if line.rstrip(self._BLANK)]
+        if not lines:
+            return FileProbe(path, None, 0, None, None, ("データがありません",),
+                             error=InvalidCsvFormatError(self.NO_COLUMNS_MESSAGE))
+        last = lines[-1].rstrip(self._BLANK)
+        if tail is not None:
+            # 末尾ブロックの最初の行は途中から始まっている
+            tail_lines = [line for line in tail.split(b"\n")[1:] if line.rstrip(self._BLANK)]
+            if tail_lines:
+                last = tail_lines[-1].rstrip(self._BLANK)
+        # 全体が先頭ブロックに収まり、全行の列数が同じ場合のみ、読み込み時の列数が確定する
+        width = self._uniform_width(lines) if tail is None else None
+        lines = [line.rstrip(self._BLANK) for line in lines]
+
+        decoded = self._decode([lines[0], lines[1] if len(lines) > 1 else b"", last])
+        if decoded is None:
+            # 全体を読んでいる場合のみ、読み込み時と同じ例外を報告できる
+            # （一部だけの場合は読み込みで報告する）
+            return FileProbe(path, None, 0, None, None, ("文字コードを判定できません",),
+                             error=EncodingDetector.undecodable_error(data) if tail is None else None)
+        encoding, (first_text, second_text, last_text) = decoded
+        first_fields = self._fields(first_text)
+        headerless = self._day_of(first_fields[0] if first_fields else "") is not None
+        if tail is None:
+            rows = len(lines) - (0 if headerless else 1)
+        else:
+            # 先頭ブロックの平均行長から全体の行数を推定
+            average = sum(len(line) + 1 for line in lines) / len(lines)
+            rows = max(round(size / average) - (0 if headerless else 1), len(lines))
+
+        issues = []
+        warnings = []
+        error: CsvMergerError | None = None
+        # 既知の列名を含む場合はヘッダーありと判別できる
+        recognized = headerless or any(
+            column in first_fields for column in self.HEADERLESS_COLUMNS + self.OPTIONAL_COLUMNS
+        )
+        if headerless:
+            columns = list(self.HEADERLESS_COLUMNS)
+            data_lines = [first_text, last_text]
+        else:
+            columns = first_fields
+            missing = [column for column in self.HEADERLESS_COLUMNS if column not in columns]
+            if missing:
+                issues.append(f"必須カラムが不足しています: {', '.join(missing)}")
+                if recognized and width is not None:
+                    error = InvalidCsvFormatError(issues[-1])
+            data_lines = [second_text, last_text] if rows > 0 else []
+
+        day = None
+        if rows <= 0:
+            issues.append("データ行がありません")
+            if recognized and error is None:
+                error = EmptyDataError(f"CSV file '{path.name}' contains no data")
+        elif not issues:
+            day = self._check_data_lines(data_lines, columns, headerless, issues)
+            if headerless and width is not None and width != len(columns):
+                error = InvalidCsvFormatError(
+                    f"ヘッダーなしCSVは{len(columns)}列である必要があります（実際: {width}列）"
+                )
+
+        if 0 < rows < self.EXPECTED_RECORDS_PER_DAY:
+            issues.append(f"データ行数が{self.EXPECTED_RECORDS_PER_DAY}行未満です（{rows}行）")
+        elif rows > self.EXPECTED_RECORDS_PER_DAY:
+            warnings.append(
+                f"データ行数が{self.EXPECTED_RECORDS_PER_DAY}行を超えています（{rows}行）。"
+                "完全に同じ行の重複以外は読み込み時にエラーになります"
+            )
+        return FileProbe(path, day, rows, headerless, encoding, tuple(issues), tuple(warnings), error)
+
+    def _check_data_lines(
+        self,
+        data_lines: list[str],
+        columns: list[str],
+        headerless: bool,
+        issues: list[str]
+    ) -> date | None:
+        """先頭・末尾のデータ行の列数と日付を確認する
+
+        Args:
+            data_lines: 先頭・末尾のデータ行
+            columns: 列名（ヘッダーなしの場合は HEADERLESS_COLUMNS）
+            headerless: ヘッダーなしの場合はTrue
+            issues: 見つかった異常を追加するリスト
+
+        Returns:
+            先頭・末尾のデータ行が同じ日付の場合はその日付
+        """
+        index = columns.index(self.TIMESTAMP_COLUMN)
+        days = []
+        for text in data_lines:
+            fields = self._fields(text)
+            if headerless and len(fields) == len(columns) + 1 and fields[-1] == "":
+                # 各行の末尾カンマによる空の列は読み込み時に除かれる
+                fields.pop()
+            if len(fields) != len(columns):
+                label = "ヘッダーなしCSV" if headerless else "ヘッダー"
+                issues.append(f"列数が{label}と一致しません（{len(columns)}列に対して{len(fields)}列）")
+                return None
+            day = self._day_of(fields[index])
+            if day is None:
+                issues.append(f"日時を解釈できません: {fields[index]}")
+                return None
+            if not self.MIN_VALID_YEAR <= day.year <= self.MAX_VALID_YEAR:
+                issues.append(f"日時の年が範囲外です: {fields[index]}")
+                return None
+            days.append(day)
+        if days[0] != days[-1]:
+            issues.append(f"複数日のデータを含みます（{days[0]}〜{days[-1]}）")
+            return None
+        return days[0]
+
+    @staticmethod
+    def _uniform_width(lines: list[bytes]) -> int | None:
+        """全行の列数が同じ場合に、読み込み時の列数を返す
+
+        引用符を含む行がある場合や、行によって列数が異なる場合は、読み込み時の
+        エラー（列数の不一致など）が先に起きうるためNoneを返します。全行の末尾の列が
+        空の場合、その列は読み込み時に除かれるため数えません（ヘッダーなしCSVの末尾カンマ）。
+
+        Args:
+            lines: 空行を除いたファイルの全行（行末の CR は含んでもよい）
+
+        Returns:
+            読み込み時の列数（確定できない場合はNone）
+        """
+        lines = [line.rstrip(b"\r") for line in lines]
+        if any(b'"' in line for line in lines):
+            return None
+        # カンマは cp932 の2バイト目にも現れないため、デコードせずに数えられる
+        widths = {line.count(b",") + 1 for line in lines}
+        if len(widths) != 1:
+            return None
+        width = widths.pop()
+        if width > 1 and all(line.endswith(b",") for line in lines):
+            width -= 1
+        return width
+
+    def _read_edges(self, path: Path) -> tuple[bytes, bytes | None, int]:
+        """ファイルの先頭と末尾のブロックを読む
+
+        Args:
+            path: ファイルのパス
+
+        Returns:
+            (先頭ブロック, 末尾ブロック, ファイルのサイズ)。
+            全体が先頭ブロックに収まる場合、末尾ブロックはNone
+        """
+        if compression_of(path) is not None:
+            raw = path.read_bytes()
+            self._count(len(raw))
+            return self._edges_of(decompress(path, raw))
+        with open(path, "rb") as f:
+            head = f.read(self.HEAD_BYTES)
+            self._count(len(head))
+            if len(head) < self.HEAD_BYTES:
+                return head, None, len(head)
+            size = os.fstat(f.fileno()).st_size
+            if size <= self.HEAD_BYTES:
+                return head, None, size
+            f.seek(max(size - self.TAIL_BYTES, self.HEAD_BYTES))
+            tail = f.read()
+            self._count(len(tail))
+            return head, tail, size
+
+    def _edges_of(self, data: bytes) -> tuple[bytes, bytes | None, int]:
+        """読み込み済みの内容から、_read_edges() と同じ先頭・末尾のブロックを取り出す"""
+        size = len(data)
+        if size <= self.HEAD_BYTES:
+            return data, None, size
+        return data[:self.HEAD_BYTES], data[max(size - self.TAIL_BYTES, self.HEAD_BYTES):], size
+
+    def _count(self, byte_count: int) -> None:
+        if self._io_counter is not None:
+            self._io_counter.add(IoByteCounter.SCAN_PHASE, byte_count)
+
+    def _decode(self, lines: list[bytes]) -> tuple[str, list[str]] | None:
+        """行をまとめてデコードする（CsvRepository と同じ順に文字コードを試す）
+
+        Args:
+            lines: デコードする行
+
+        Returns:
+            (文字コード, デコードした行)。どの文字コードでもデコードできない場合はNone
+            （これらの行を含むファイル全体も、読み込み時にデコードできない）
+        """
+        raw = b"\n".join(lines)
+        for encoding in self.ENCODINGS:
+            try:
+                text = raw.decode(encoding)
+            except (UnicodeDecodeError, LookupError):
+                continue
+            return encoding, text.split("\n")
+        return None
+
+    @staticmethod
+    def _fields(text: str) -> list[str]:
+        """1行をCSVのフィールドに分割する"""
+        return next(csv.reader([text]), [])
+
+    @classmethod
+    def _day_of(cls, value: str) -> date | None:
+        """日時の文字列から日付を取り出す
+
+        DatetimeParser が pandas を呼ばずに判別するフォーマット（DATETIME_FORMATS）だけを
+        解釈します。それ以外の値は全体を読み込んで確認します。
+
+        Args:
+            value: 日時の文字列
+
+        Returns:
+            日付（DATETIME_FORMATS の日時として解釈できない場合はNone）
+        """
+        parsed = match_datetime(value)
+        return None if parsed is None else parsed.date()
@@ -3,15 +3,35 @@
 このモジュールは多様なCSVフォーマットを読み込み、
 統一された7列フォーマットに正規化してDomain層に渡します。
 """
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from datetime import datetime
+import csv
+import io
+import itertools
+import time
 import zipfile
 import tempfile
+import numpy as np
 import pandas as pd
 
 from domain.models.csv_file import CsvFile
+from domain.models.lazy_csv_file import LazyCsvFile
 from domain.models.csv_schema import CsvSchema
-from domain.exceptions import CsvFileNotFoundError, InvalidCsvFormatError
+from domain.exceptions import CsvFileNotFoundError, CsvMergerError, InvalidCsvFormatError
+from infra.cache.encoding_profile import EncodingProfile
+from infra.cache.parsed_csv_cache import ParsedCsvCache
+from infra.diagnostics.phase_timer import PhaseTimer
+from infra.repositories.cancellation import CancellationToken
+from infra.repositories.compression import decompress
+from infra.repositories.csv_batch_loader import CsvBatchLoader
+from infra.repositories.csv_preflight import CsvPreflight
+from infra.repositories.csv_source import CsvSource
+from infra.repositories.csv_writer import CsvWriter
+from infra.repositories.encoding_detector import EncodingDetector
+from infra.repositories.io_byte_counter import IoByteCounter
+from infra.repositories.lazy_csv_loader import LazyCsvLoader
+from infra.sinks.output_sinks import CsvSink, OutputSink
 
 
 class CsvRepository:
@@ -19,14 +39,56 @@ class CsvRepository:
     
     多様なCSVフォーマット（ヘッダーあり/なし、No列あり/なし、
     文字コード多様）を統一された7列フォーマットに正規化します。
+    各ファイルはディスクから1回だけ読み込み、そのバイト列を
+    文字コード判定・ヘッダー判定・パースで共有します。
+
+    Attributes:
+        io_counter: フェーズ別のI/Oバイト数カウンタ
+        cache: 正規化・検証済みデータのディスクキャッシュ（Noneの場合は使用しない）
+        writer: 出力CSVのライター
+        sink: 結合結果の出力形式（既定はCSV）
+        phase_timer: フェーズ別の経過時間・CPU時間・ピークメモリのタイマー
+        encoding_detector: 文字コード判定（入力元ごとに学習した文字コードを最初に試す）
+        cancellation: 読み込みの中止を伝えるトークン。設定されている場合、まとめ読み込みは
+            失敗したファイルで中止を伝えてそれより後のファイルを読まず、入力順で最初の失敗の
+            例外を送出する（Noneの場合はすべて読む）
     """
 
     # 正規化後のカラム順序
     COLUMN_ORDER = ["No", "日時", "電圧", "周波数", "パワー", "工事フラグ", "参照"]
 
+    def __init__(
+        self,
+        io_counter: IoByteCounter | None = None,
+        cache: ParsedCsvCache | None = None,
+        sink: OutputSink | None = None,
+        phase_timer: PhaseTimer | None = None,
+        encoding_profile: EncodingProfile | None = None
+    ):
+        """CsvRepositoryを初期化
+
+        Args:
+            io_counter: I/Oバイト数カウンタ（Noneの場合は新規作成）
+            cache: ディスクキャッシュ（Noneの場合はキャッシュしない）
+            sink: 出力形式（Noneの場合はCSV）
+            phase_timer: フェーズ別のタイマー（Noneの場合は計測しない）
+            encoding_profile: 学習した文字コード（Noneの場合はこの実行の中だけで学習する）
+        """
+        self.io_counter = io_counter or IoByteCounter()
+        self.cache = cache
+        self.writer = CsvWriter()
+        self.sink = sink or CsvSink(self.writer)
+        self.phase_timer = phase_timer or PhaseTimer()
+        self.encoding_detector = EncodingDetector(encoding_profile)
+        self._preflight = CsvPreflight()
+        self.cancellation: CancellationToken | None = None
+
     def load(self, file_path: str | Path) -> CsvFile:
         """CSVファイルを読み込み、正規化してCsvFileを返す
         
+        キャッシュが有効な場合、キャッシュにヒットしたファイルは
+        文字コード判定・パース・検証を行わずにキャッシュから復元します。
+        
         Args:
             file_path: 読み込むCSVファイルのパス
             
@@ -37,36 +99,219 @@ class CsvRepository:
             CsvFileNotFoundError: ファイルが存在しない場合
             InvalidCsvFormatError: CSVフォーマットが不正な場合
         """
-        # ファイル存在チェック
         path = Path(file_path)
-        if not path.exists():
-            raise CsvFileNotFoundError(f"CSVファイルが見つかりません: {file_path}")
+        timer = self.phase_timer
+        started = time.perf_counter()
+        try:
+            with timer.span("load", file=path.name):
+                # ファイルを1回だけ読み込む（以降はこのバイト列を共有）
+                raw = self._read_raw(path)
+                timer.annotate(bytes=len(raw))
+                
+                # キャッシュにヒットすればパーサーを使わずに返す
+                source = self._open_source(path, raw)
+                if isinstance(source, CsvFile):
+                    timer.annotate(rows=source.row_count, cached=True)
+                    return source
+                
+                # パース・正規化・検証を行いCsvFileを生成
+                csv_file = self.parse_source(source)
+                timer.annotate(rows=csv_file.row_count)
+                return csv_file
+        finally:
+            timer.add_file(path, time.perf_counter() - started)
+
+    def load_many(self, file_paths: Sequence[str | Path]) -> list[CsvFile]:
+        """複数のCSVファイルをまとめて読み込む
+        
+        1ファイル24行程度の小さなCSVを大量に読み込む場合に、
+        pandas.read_csv() やDataFrame操作の呼び出し回数を抑えるため、
+        同じレイアウトのファイルをまとめて1回でパース・正規化・検証します。
+        結果と例外は load() を1ファイルずつ呼んだ場合と同じです。
+        
+        Args:
+            file_paths: 読み込むCSVファイルのパスリスト
+            
+        Returns:
+            入力順に並んだCsvFileのリスト
+            
+        Raises:
+            CsvFileNotFoundError: ファイルが存在しない場合（入力順で最初の失敗）
+            InvalidCsvFormatError: CSVフォーマットが不正な場合（同上）
+            LoadCancelledError: cancellation で中止された場合
+        """
+        csv_files = []
+        for outcome in self.load_outcomes(file_paths):
+            if isinstance(outcome, Exception):
+                raise outcome
+            csv_files.append(outcome)
+        return csv_files
+
+    def load_outcomes(self, file_paths: Sequence[str | Path]) -> list[CsvFile | Exception]:
+        """複数のCSVファイルをまとめて読み込み、ファイルごとの結果を返す
+        
+        load_many() と同じ読み込みを行い、失敗したファイルは例外を送出せずに
+        その例外を結果として返します（エラーをまとめて報告する場合に使用）。
+        cancellation が設定されている場合は、入力順で最初に失敗したファイルの例外を送出します。
+        
+        Args:
+            file_paths: 読み込むCSVファイルのパスリスト
+            
+        Returns:
+            入力順に並んだ結果のリスト（成功時は CsvFile、失敗時はその例外）
+            
+        Raises:
+            CsvMergerError: cancellation が設定されている場合、入力順で最初に失敗したファイルの例外
+            LoadCancelledError: cancellation で中止された場合
+        """
+        with self.phase_timer.span("load_many", files=len(file_paths)):
+            return CsvBatchLoader(self).load(file_paths)
+
+    def read_source(self, file_path: str | Path) -> CsvFile | CsvSource:
+        """ファイルを1回だけ読み込み、文字コードを判定してデコードする
+        
+        load() の前半（読み込み・キャッシュの確認・文字コード判定）です。
+        キャッシュにヒットした場合はデコードせず、キャッシュから復元したCsvFileを返します。
+        
+        Args:
+            file_path: 読み込むCSVファイルのパス
+            
+        Returns:
+            デコード済みのCSV入力。キャッシュにヒットした場合はCsvFile
+            
+        Raises:
+            CsvFileNotFoundError: ファイルが存在しない場合
+            InvalidCsvFormatError: どの文字コードでもデコードできない場合
+        """
+        path = Path(file_path)
+        return self._open_source(path, self._read_raw(path))
+
+    def parse_source(self, source: CsvSource) -> CsvFile:
+        """デコード済みのCSV入力をパースしてCsvFileを生成
         
-        # 文字コードを自動判定
-        encoding = self._detect_encoding(path)
+        load() の後半で、パース → 正規化 → 重複除去 → 日時の検証 → 日時順の並べ替えを行い、
+        1日分のデータかを検証したCsvFileを返します。キャッシュが有効な場合は結果を保存します。
+        
+        Args:
+            source: read_source() で読み込んだCSV入力
+            
+        Returns:
+            正規化された CsvFile オブジェクト
+            
+        Raises:
+            InvalidCsvFormatError: CSVフォーマットが不正な場合
+            EmptyDataError: データがない場合
+        """
+        timer = self.phase_timer
+        file_name = source.path.name
         
         # CSVを読み込み
-        df = self._read_csv(path, encoding)
+        self.io_counter.add("parse", source.size)
+        with timer.measure("parse", file=file_name, bytes=source.size):
+            df = self._read_csv(source.text)
+            timer.annotate(rows=len(df))
         
         # 正規化
-        df = self._normalize(df)
+        with timer.measure("normalize", file=file_name, rows=len(df)):
+            df = self.normalize(df)
         
         # 重複行を除去（全列でユニークな行のみ残す）
-        df = self._remove_duplicates(df)
+        with timer.measure("dedup", file=file_name, rows=len(df)):
+            df = self._remove_duplicates(df)
+        
+        with timer.measure("validate", file=file_name, rows=len(df)):
+            # データの妥当性を検証（日時の妥当性チェック）
+            # ソート前に不正な日時がないことを確認し、変換済みの日時カラムを受け取る
+            parsed = self._validate_data(df, file_name)
+            if parsed is not None:
+                df[CsvSchema.TIMESTAMP_COLUMN] = parsed
+            
+            # 日時列でソート（検証済みの正常なデータのみをソート）
+            df = self._sort_by_datetime(df)
+            
+            # CsvFileオブジェクトを作成（1日分のデータかの検証を含む）
+            csv_file = CsvFile(file_path=source.path, data=df)
+        
+        self.store_cached(source, csv_file)
+        return csv_file
+
+    def store_cached(self, source: CsvSource, csv_file: CsvFile) -> None:
+        """読み込んだCsvFileのデータをキャッシュに保存
+        
+        parse_source() を使わずに生成したCsvFile（まとめてパースしたもの）の保存に使います。
+        
+        Args:
+            source: read_source() で読み込んだCSV入力（キャッシュが無効な場合は保存しない）
+            csv_file: 正規化・検証済みのCsvFile
+        """
+        if self.cache is not None and source.cache_key is not None:
+            with self.phase_timer.measure("cache"):
+                self.cache.put(source.cache_key, csv_file.data)
+
+    def scan(self, file_paths: list[str | Path], batch_size: int = 64) -> list[LazyCsvFile]:
+        """入力ファイルを走査し、データを必要な時点で読み込む LazyCsvFile を返す
+        
+        各ファイルの先頭・末尾の行だけを読んで、日付・行数・文字コード・レイアウトと
+        ファイルのサイズ・更新日時を記録します。データは LazyCsvFile.load() の時点で、
+        日付順に batch_size ファイルずつ load_many() でまとめて読み込みます。
         
-        # データの妥当性を検証（日時の妥当性チェック）
-        # ソート前に不正な日時がないことを確認
-        self._validate_data(df, path.name)
+        Args:
+            file_paths: 走査するCSVファイルのパスリスト
+            batch_size: 一度に読み込むファイル数
         
-        # 日時列でソート（検証済みの正常なデータのみをソート）
-        df = self._sort_by_datetime(df)
+        Returns:
+            入力順に並んだ LazyCsvFile のリスト
         
-        # CsvFileオブジェクトを作成して返す
-        return CsvFile(file_path=path, data=df)
+        Raises:
+            CsvFileNotFoundError: ファイルが存在しない場合
+            CsvMergerError: 日付を推定できないファイルの読み込みに失敗した場合
+        """
+        with self.phase_timer.measure("scan", files=len(file_paths)):
+            return LazyCsvLoader(self, batch_size).scan(file_paths)
+
+    def check_inputs(self, file_paths: list[str | Path]) -> dict[int, CsvMergerError]:
+        """パースの前に、安価な確認から順に入力ファイルを確認する
+        
+        1. すべてのファイルの存在
+        2. ファイルのサイズ（空ファイル）
+        
+        どちらもファイルの内容は読みません。先頭・末尾の行のレイアウト
+        （CsvPreflight の FileProbe.error）は、読み込み時にディスクから読んだ
+        バイト列に対して、パースの前に確認します。
+        
+        cancellation が設定されていても送出せず、すべての入力の失敗を返します
+        （呼び出し側は入力順で最初の失敗より前のファイルだけを読み込めます）。
+        
+        Args:
+            file_paths: 確認するCSVファイルのパスリスト
+            
+        Returns:
+            入力のインデックスごとの例外（検出した順。失敗がない場合は空）
+        """
+        errors: dict[int, CsvMergerError] = {}
+        
+        with self.phase_timer.measure("precheck", files=len(file_paths)):
+            paths = [Path(file_path) for file_path in file_paths]
+            sizes: dict[int, int] = {}
+            for index, path in enumerate(paths):
+                try:
+                    sizes[index] = path.stat().st_size
+                except FileNotFoundError:
+                    errors[index] = CsvFileNotFoundError(f"CSVファイルが見つかりません: {path}")
+                except OSError:
+                    # 読み込めない理由は読み込み時に報告する
+                    sizes[index] = -1
+            for index, size in sizes.items():
+                if size == 0:
+                    errors[index] = InvalidCsvFormatError(CsvPreflight.NO_COLUMNS_MESSAGE)
+        return errors
 
     def save(self, csv_file: CsvFile, output_dir: str | Path) -> Path:
         """CsvFileを指定ディレクトリに保存
         
+        出力形式は sink で決まり、ファイルの拡張子も出力形式に合わせます。
+        書き出し中に例外が発生した場合は書きかけのファイルを削除して再送出します。
+        
         Args:
             csv_file: 保存するCsvFileオブジェクト
             output_dir: 出力先のディレクトリ
@@ -74,6 +319,63 @@ class CsvRepository:
         Returns:
             保存されたファイルのパス
         """
+        output_path = self._new_output_path(output_dir)
+        
+        # CSVの場合はUTF-8で保存（日時は書き出し時にのみ標準フォーマットへ文字列化）
+        with self.phase_timer.span("save", file=output_path.name, rows=len(csv_file.data)):
+            try:
+                self.sink.write(csv_file.data, output_path)
+            except BaseException:
+                output_path.unlink(missing_ok=True)
+                raise
+            if self.phase_timer.tracing:
+                self.phase_timer.annotate(bytes=output_path.stat().st_size)
+        
+        return output_path
+
+    def save_stream(self, chunks: Iterable[pd.DataFrame], output_dir: str | Path) -> Path:
+        """DataFrameのチャンクを順に書き出して1つのファイルとして保存
+        
+        結合結果全体をメモリに保持せずに保存するためのメソッドです。
+        出力内容は全チャンクを連結して save() した場合と同じです。
+        最初のチャンクを受け取った時点でファイルを作成し、途中で例外が
+        発生した場合は書きかけのファイルを削除してから例外を再送出します。
+        
+        Args:
+            chunks: 保存するDataFrameのチャンク（先頭から順に書き出す）
+            output_dir: 出力先のディレクトリ
+            
+        Returns:
+            保存されたファイルのパス
+        """
+        chunk_iter = iter(chunks)
+        # 先頭チャンクの生成時（入力の検証時）のエラーではファイルを作成しない
+        first = next(chunk_iter, None)
+        output_path = self._new_output_path(output_dir)
+        
+        with self.phase_timer.span("save_stream", file=output_path.name):
+            try:
+                self.sink.write_stream(
+                    itertools.chain([first], chunk_iter) if first is not None else [],
+                    output_path,
+                )
+            except BaseException:
+                output_path.unlink(missing_ok=True)
+                raise
+            if self.phase_timer.tracing:
+                self.phase_timer.annotate(bytes=output_path.stat().st_size)
+        
+        return output_path
+
+    def _new_output_path(self, output_dir: str | Path) -> Path:
+        """出力ディレクトリを準備し、タイムスタンプ付きの出力パスを生成
+        
+        Args:
+            output_dir: 出力先のディレクトリ
+            
+        Returns:
+            出力ファイルのパス
+        """
         output_dir_path = Path(output_dir)
         
         # 出力ディレクトリが存在しない場合は作成
@@ -81,80 +383,209 @@ class CsvRepository:
         
         # タイムスタンプ付きのファイル名を生成
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file_name = f"merged_{timestamp}.csv"
-        output_path = output_dir_path / output_file_name
+        output_file_name = f"merged_{timestamp}{self.sink.suffix}"
+        return output_dir_path / output_file_name
+
+    # ZIP入力はサポートしない（要件撤廃）
+
+    def _read_raw(self, path: Path) -> bytes:
+        """ファイルの存在を確認し、内容を1回だけ読み込む
+        
+        Args:
+            path: ファイルパス
+            
+        Returns:
+            ファイルの内容（バイト列）
+            
+        Raises:
+            CsvFileNotFoundError: ファイルが存在しない場合
+        """
+        # ファイル存在チェック
+        with self.phase_timer.measure("read", file=path.name):
+            if not path.exists():
+                raise CsvFileNotFoundError(f"CSVファイルが見つかりません: {path}")
+            
+            raw = self._read_bytes(path)
+            self.phase_timer.annotate(bytes=len(raw))
+            return raw
+
+    def _open_source(self, path: Path, raw: bytes) -> CsvFile | CsvSource:
+        """読み込んだバイト列をキャッシュから復元するか、文字コードを判定してデコードする
         
-        # UTF-8で保存
-        csv_file.data.to_csv(output_path, index=False, encoding="utf-8")
+        Args:
+            path: ファイルパス
+            raw: ファイルの内容（バイト列）
+            
+        Returns:
+            デコード済みのCSV入力。キャッシュにヒットした場合はCsvFile
+        """
+        cache_key = self._cache_key(path, raw)
+        cached = self._load_cached(path, cache_key)
+        if cached is not None:
+            return cached
+        
+        # 文字コードを自動判定（判定に成功したデコード結果をそのまま使う）
+        with self.phase_timer.measure("detect_encoding", file=path.name, bytes=len(raw)):
+            encoding, text = self._detect_encoding(raw, path)
+            self.phase_timer.annotate(encoding=encoding)
+        
+        # 読み込みが確実に失敗するレイアウトの異常（空・ヘッダーのみ・必須カラムの不足など）は
+        # パースの前に報告する（ディスクは読み直さず、先頭・末尾の行だけを見る）
+        with self.phase_timer.measure("precheck", file=path.name):
+            error = self._preflight.probe_bytes(path, raw).error
+        if error is not None:
+            raise error
+        
+        return CsvSource(path=path, encoding=encoding, text=text, size=len(raw), cache_key=cache_key)
+
+    def _cache_key(self, path: Path, raw: bytes) -> str | None:
+        """キャッシュキーを生成
         
-        return output_path
+        Args:
+            path: ファイルパス
+            raw: ファイルの内容（バイト列）
+            
+        Returns:
+            キャッシュキー。キャッシュが無効な場合はNone
+        """
+        if self.cache is None:
+            return None
+        with self.phase_timer.measure("cache"):
+            return self.cache.key_for(path, raw)
 
-    # ZIP入力はサポートしない（要件撤廃）
+    def _load_cached(self, path: Path, cache_key: str | None) -> CsvFile | None:
+        """キャッシュからCsvFileを復元
+        
+        Args:
+            path: ファイルパス
+            cache_key: キャッシュキー
+            
+        Returns:
+            復元したCsvFile。キャッシュが無効またはミスの場合はNone
+        """
+        if self.cache is None or cache_key is None:
+            return None
+        with self.phase_timer.measure("cache"):
+            data = self.cache.get(cache_key)
+            if data is None:
+                return None
+            return CsvFile(file_path=path, data=data)
 
-    def _detect_encoding(self, file_path: Path) -> str:
-        """ファイルの文字コードを自動判定
+    def _read_bytes(self, file_path: Path) -> bytes:
+        """ファイル全体をバイト列として1回だけ読み込む
         
-        Windows日本語環境で使われる典型的なエンコーディングを順番に試します。
+        圧縮ファイル（.gz / .zst）は一時ファイルを作らずにメモリ上で展開し、
+        文字コード判定・ヘッダー判定・パースは展開後のバイト列に対して行います。
         
         Args:
             file_path: ファイルパス
             
         Returns:
-            検出されたエンコーディング名
+            ファイルの内容（圧縮ファイルの場合は展開後のバイト列）
         """
-        # 試行するエンコーディングのリスト（優先順）
-        # utf-8-sig: BOM付きUTF-8
-        encodings = ["utf-8-sig", "utf-8", "cp932", "shift_jis"]
+        raw = file_path.read_bytes()
+        self.io_counter.add(IoByteCounter.READ_PHASE, len(raw))
+        data = decompress(file_path, raw)
+        if data is not raw:
+            self.io_counter.add("decompress", len(data))
+        return data
+
+    def _detect_encoding(self, raw: bytes, path: Path | None = None) -> tuple[str, str]:
+        """バイト列の文字コードを自動判定
         
-        for encoding in encodings:
-            try:
-                with open(file_path, "r", encoding=encoding) as f:
-                    # ファイル全体を読み込んで、エラーが発生しないか確認
-                    f.read()
-                # 正常に読み込めたらこのエンコーディングを使用
-                return encoding
-            except (UnicodeDecodeError, LookupError):
-                # このエンコーディングでは読めない、次を試す
-                continue
+        Windows日本語環境で使われる典型的なエンコーディングを優先順に試します。
+        ディスクは再読み込みせず、読み込み済みのバイト列をデコードします。
+        path を指定した場合は入力元ごとに学習した文字コードを最初に試し、
+        他の候補は先頭の標本だけで除外します（結果は優先順に試した場合と同じ）。
         
-        # どれも読めない場合はUTF-8をデフォルトとする
-        return "utf-8"
+        Args:
+            raw: ファイルの内容（バイト列）
+            path: ファイルパス（Noneの場合は学習した文字コードを使わない）
+            
+        Returns:
+            (検出されたエンコーディング名, デコード済みの文字列) のタプル
+        """
+        return self.encoding_detector.detect(raw, path, self.io_counter)
 
-    def _read_csv(self, file_path: Path, encoding: str) -> pd.DataFrame:
-        """CSVファイルを読み込む
+    def _read_csv(self, text: str) -> pd.DataFrame:
+        """デコード済みのCSV文字列を読み込む
         
-        ヘッダーの有無を自動判定して読み込みます。
+        先頭行の最初のフィールドでヘッダーの有無を判定し、
+        pandas.read_csv() を1回だけ呼び出して読み込みます。
         
         Args:
-            file_path: ファイルパス
-            encoding: 文字コード
+            text: デコード済みのCSV文字列
+            
+        Returns:
+            読み込んだDataFrame
+        """
+        try:
+            # 先頭フィールドが日時フォーマットなら → ヘッダーなし
+            headerless = self._looks_like_datetime(self._sniff_first_field(text))
+        except Exception as e:
+            raise InvalidCsvFormatError(f"CSVファイルの読み込みに失敗しました: {e}")
+        
+        df = self._read_raw_csv(text, headerless=headerless)
+        if headerless:
+            return self._drop_trailing_empty_column(df)
+        return df
+
+    def _read_raw_csv(self, text: str, headerless: bool) -> pd.DataFrame:
+        """pandas.read_csv() でCSV文字列をそのまま読み込む
+        
+        Args:
+            text: デコード済みのCSV文字列
+            headerless: ヘッダーなしとして読み込む場合はTrue
             
         Returns:
             読み込んだDataFrame
+            
+        Raises:
+            InvalidCsvFormatError: 読み込みに失敗した場合
         """
-        # まずヘッダーありとして読み込んでみる
         try:
-            df_with_header = pd.read_csv(file_path, encoding=encoding)
-            
-            # カラム名をチェックしてヘッダーの有無を判定
-            # ヘッダーなしの場合、カラム名が日時フォーマットになっている
-            first_col_name = str(df_with_header.columns[0])
-            
-            # カラム名が日時フォーマットなら → ヘッダーなし
-            if self._looks_like_datetime(first_col_name):
-                df = pd.read_csv(file_path, encoding=encoding, header=None)
-                # 末尾列が全行 NaN（ヘッダーなしで各行が末尾カンマ等）なら削除
-                if df.shape[1] > 0:
-                    last_col = df.iloc[:, -1]
-                    if last_col.isna().all():
-                        df = df.iloc[:, :-1]
-                return df
-            else:
-                # ヘッダーありと判断
-                return df_with_header
+            if headerless:
+                return pd.read_csv(io.StringIO(text), header=None)
+            # ヘッダーありと判断
+            return pd.read_csv(io.StringIO(text))
         except Exception as e:
             raise InvalidCsvFormatError(f"CSVファイルの読み込みに失敗しました: {e}")
 
+    def _drop_trailing_empty_column(self, df: pd.DataFrame) -> pd.DataFrame:
+        """ヘッダーなしCSVで末尾列が全行 NaN（各行が末尾カンマ等）なら削除
+        
+        Args:
+            df: ヘッダーなしで読み込んだDataFrame
+            
+        Returns:
+            末尾の空列を除いたDataFrame
+        """
+        if df.shape[1] > 0:
+            last_col = df.iloc[:, -1]
+            if last_col.isna().all():
+                df = df.iloc[:, :-1]
+        return df
+
+    def _sniff_first_field(self, text: str) -> str:
+        """先頭の空でない行から最初のフィールドを取り出す
+        
+        pandas.read_csv() と同様に空行を読み飛ばし、
+        クォートを外したフィールド値を返します。
+        
+        Args:
+            text: デコード済みのCSV文字列
+            
+        Returns:
+            最初のフィールドの値（データがない場合は空文字列）
+        """
+        for line in io.StringIO(text):
+            if not line.strip():
+                continue
+            self.io_counter.add("sniff_header", len(line.encode("utf-8")))
+            fields = next(csv.reader([line]), [])
+            return fields[0] if fields else ""
+        return ""
+
     def _looks_like_datetime(self, value: str) -> bool:
         """文字列が日時フォーマットに見えるかチェック
         
@@ -166,9 +597,12 @@ class CsvRepository:
         """
         return CsvSchema.validate_datetime_format(value)
 
-    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+    def normalize(self, df: pd.DataFrame) -> pd.DataFrame:
         """DataFrameを7列統一フォーマットに正規化
         
+        ヘッダーなし（列名が 0, 1, 2, ...）の場合は列名を設定してNo列・参照列を補い、
+        ヘッダーありの場合は不足するNo列・参照列を補って必須カラムを確認します。
+        
         Args:
             df: 正規化するDataFrame
             
@@ -243,37 +677,39 @@ class CsvRepository:
         
         return df
 
-    def _validate_data(self, df: pd.DataFrame, file_name: str) -> None:
+    def _validate_data(self, df: pd.DataFrame, file_name: str) -> pd.Series | None:
         """データの妥当性を検証
         
-        日時カラムの各行をチェックし、不正な値があれば詳細なエラーを発生させます。
+        日時カラム全体を1回のベクトル化変換で解釈し、不正な行を配列演算で
+        抽出して、不正な値があれば詳細なエラーを発生させます。
         
         Args:
             df: 検証するDataFrame
             file_name: ファイル名（エラーメッセージ用）
             
+        Returns:
+            検証済みの日時カラム（datetime64型）。日時カラムがない場合はNone
+            
         Raises:
             InvalidCsvFormatError: 不正な値が検出された場合
         """
         if CsvSchema.TIMESTAMP_COLUMN not in df.columns:
-            return
+            return None
         
-        invalid_lines = []
-        
-        # 各行の日時をチェック（1行目はヘッダーなので、データは2行目から）
-        for idx, datetime_value in enumerate(df[CsvSchema.TIMESTAMP_COLUMN], start=2):
-            datetime_str = str(datetime_value)
-            # 日時の妥当性をチェック
-            if not CsvSchema.validate_datetime_value(datetime_str):
-                invalid_lines.append(idx)
+        parsed = CsvSchema.parse_datetime_series(df[CsvSchema.TIMESTAMP_COLUMN])
+        invalid = CsvSchema.invalid_datetime_mask(parsed)
         
         # 不正な行が見つかった場合はエラーを発生
-        if invalid_lines:
+        if invalid.any():
+            # 1行目はヘッダーなので、データは2行目から
+            invalid_lines = (np.flatnonzero(invalid) + 2).tolist()
             raise InvalidCsvFormatError.with_invalid_lines(
                 file_name=file_name,
                 invalid_lines=invalid_lines,
                 error_type="不正な日時"
             )
+        
+        return parsed
 
     def _remove_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
         """全列でユニークな行のみを残す
@@ -292,24 +728,13 @@ class CsvRepository:
     def _sort_by_datetime(self, df: pd.DataFrame) -> pd.DataFrame:
         """日時列でソート
         
-        日時列を一時的にdatetime型に変換してソートし、
-        標準フォーマットに戻します。
+        日時列はdatetime64型のままソートします（文字列化は書き出し時のみ）。
         このメソッドは検証済みの正常なデータに対してのみ呼ばれます。
         
         Args:
-            df: 処理対象のDataFrame（検証済み）
+            df: 処理対象のDataFrame（検証済み、日時列はdatetime64型）
             
         Returns:
             日時順にソートされたDataFrame
         """
-        timestamp_col = CsvSchema.TIMESTAMP_COLUMN
-        
-        # 日時列をdatetime型に変換してソート
-        df[timestamp_col] = pd.to_datetime(df[timestamp_col])
-        df = df.sort_values(by=timestamp_col).reset_index(drop=True)
-        
-        # 標準フォーマット（YYYY/MM/DD HH:MM:SS）に統一
-        df[timestamp_col] = df[timestamp_col].dt.strftime("%Y/%m/%d %H:%M:%S")
-        
-        return df
-
+        return df.sort_values(by=CsvSchema.TIMESTAMP_COLUMN).reset_index(drop=True)
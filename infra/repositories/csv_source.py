@@ -0,0 +1,25 @@
+"""デコード済みのCSV入力
+
+このモジュールはディスクから1回だけ読み込み、文字コードを判定して
+デコードしたCSVファイルの内容を表す値オブジェクトを定義します。
+"""
+from pathlib import Path
+from typing import NamedTuple
+
+
+class CsvSource(NamedTuple):
+    """デコード済みのCSV入力
+
+    Attributes:
+        path: CSVファイルのパス
+        encoding: 判定された文字コード
+        text: デコード済みのCSV文字列
+        size: ディスクから読み込んだバイト数
+        cache_key: キャッシュキー（キャッシュが無効な場合はNone）
+    """
+
+    path: Path
+    encoding: str
+    text: str
+    size: int
+    cache_key: str | None = None
@@ -0,0 +1,162 @@
+"""結合結果のCSV書き出し
+
+このモジュールは整数カラムと1時間単位の日時カラムからなる出力を、
+DataFrame.to_csv() を使わずに列単位でまとめて文字列化して書き出す
+ライターを提供します。出力されるバイト列は to_csv() と同じです。
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from domain.models.csv_schema import CsvSchema
+from infra.repositories.compression import WritableStream
+
+
+class CsvWriter:
+    """DataFrameをCSVとして書き出すライター
+
+    to_csv() はセルごとに汎用の書式化を行い、日時は1行ずつ strftime() します。
+    このライターは BLOCK_ROWS 行ごとに次の方法で文字列化し、
+    UTF-8 のバイト列としてまとめて書き出します。
+
+    - 整数カラム: 値の範囲が狭い場合は範囲内の文字列の表を作って引き、
+      広い場合は列全体を一括で str() に変換する
+    - 日時カラム: 日付部分は日ごとに1回だけ strftime() し、
+      時刻部分は24時間分の文字列の表から引く
+
+    書き出せない型（浮動小数点・文字列・欠損値・1時間単位でない日時等）を
+    含むDataFrameは、同じ引数の to_csv() にフォールバックします。
+    """
+
+    # 1回の文字列化・書き出しで処理する行数
+    BLOCK_ROWS = 65536
+
+    # 日時1時間分のナノ秒
+    _HOUR_NS = 3_600_000_000_000
+
+    # to_csv() がクォートするカラム名の文字
+    _QUOTED_CHARS = (",", '"', "\n", "\r")
+
+    def __init__(self, date_format: str = CsvSchema.DATETIME_OUTPUT_FORMAT):
+        """CsvWriterを初期化
+
+        Args:
+            date_format: 日時の書式（"日付部分 時刻部分" の形式）
+        """
+        self.date_format = date_format
+        self._day_format, _, self._time_format = date_format.partition(" ")
+        epoch = pd.Timestamp(0)
+        self._hour_strings = [
+            " " + (epoch + pd.Timedelta(hours=hour)).strftime(self._time_format)
+            for hour in range(24)
+        ]
+        self._line_terminator = os.linesep
+
+    def write(self, df: pd.DataFrame, f: WritableStream, header: bool = True) -> None:
+        """DataFrameをCSVとして書き出す
+
+        Args:
+            df: 書き出すDataFrame
+            f: 書き出し先（バイナリモードのファイル、または open_compressed() の圧縮ストリーム）
+            header: ヘッダー行を書き出す場合はTrue
+        """
+        if not self._is_supported(df):
+            f.write(self._to_csv(df, header).encode("utf-8"))
+            return
+
+        terminator = self._line_terminator
+        if header:
+            f.write((",".join(df.columns) + terminator).encode("utf-8"))
+
+        columns = [df[column].to_numpy() for column in df.columns]
+        for start in range(0, len(df), self.BLOCK_ROWS):
+            stop = start + self.BLOCK_ROWS
+            texts = [self._format_column(values[start:stop]) for values in columns]
+            lines = map(",".join, zip(*texts))
+            f.write((terminator.join(lines) + terminator).encode("utf-8"))
+
+    def _to_csv(self, df: pd.DataFrame, header: bool) -> str:
+        """to_csv() で文字列化する（フォールバック）
+
+        Args:
+            df: 書き出すDataFrame
+            header: ヘッダー行を書き出す場合はTrue
+
+        Returns:
+            CSV文字列
+        """
+        return df.to_csv(
+            header=header,
+            index=False,
+            date_format=self.date_format,
+            lineterminator=self._line_terminator,
+        )
+
+    def _is_supported(self, df: pd.DataFrame) -> bool:
+        """列単位で書き出せるDataFrameか判定する
+
+        Args:
+            df: 判定するDataFrame
+
+        Returns:
+            すべてのカラムが整数、または欠損のない1時間単位の日時の場合True
+        """
+        if len(df.columns) == 0 or not self._time_format:
+            return False
+        for name, dtype in zip(df.columns, df.dtypes):
+            if not isinstance(name, str) or any(c in name for c in self._QUOTED_CHARS):
+                return False
+            if not isinstance(dtype, np.dtype):
+                return False
+            if dtype.kind in "iu":
+                continue
+            if dtype != np.dtype("datetime64[ns]"):
+                return False
+            stamps = df[name].to_numpy()
+            if np.isnat(stamps).any() or (stamps.view(np.int64) % self._HOUR_NS != 0).any():
+                return False
+        return True
+
+    def _format_column(self, values: np.ndarray) -> list[str]:
+        """1カラム分の値を文字列のリストに変換する
+
+        Args:
+            values: 整数、または1時間単位の日時の配列
+
+        Returns:
+            各行の文字列
+        """
+        if values.dtype.kind == "M":
+            return self._format_hourly(values)
+        if len(values) == 0:
+            return []
+        low = int(values.min())
+        span = int(values.max()) - low + 1
+        if span > len(values) or values.dtype == np.uint64:
+            return list(map(str, values.tolist()))
+        table = np.array([str(value) for value in range(low, low + span)], dtype=object)
+        return table[values.astype(np.int64) - low].tolist()
+
+    def _format_hourly(self, values: np.ndarray) -> list[str]:
+        """1時間単位の日時を文字列のリストに変換する
+
+        Args:
+            values: datetime64[ns] の配列
+
+        Returns:
+            各行の文字列
+        """
+        hours = values.view(np.int64) // self._HOUR_NS
+        days, hour_of_day = np.divmod(hours, 24)
+        unique_days, day_index = np.unique(days, return_inverse=True)
+        midnights = pd.DatetimeIndex(unique_days * (24 * self._HOUR_NS))
+        table = np.array(
+            [
+                day + hour
+                for day in midnights.strftime(self._day_format)
+                for hour in self._hour_strings
+            ],
+            dtype=object,
+        )
+        return table[day_index * 24 + hour_of_day].tolist()
@@ -0,0 +1,132 @@
+"""日数 × 24時間の配列のメモリマップ保存
+
+このモジュールは HourlyDayTensor の配列を .npy ファイルとしてディレクトリに保存し、
+np.load(mmap_mode="r") でメモリマップして読み込むアーカイブを提供します。
+数十年分のデータでも、読み込み時にはアクセスした範囲だけがディスクから読まれます。
+"""
+from datetime import date
+from pathlib import Path
+from typing import Literal
+import json
+import shutil
+import tempfile
+
+import numpy as np
+
+from domain.exceptions import MergeError
+from domain.models.hourly_day_tensor import HourlyDayTensor
+
+
+class DayTensorArchive:
+    """HourlyDayTensor を保存・メモリマップして読み込むアーカイブ
+
+    ディレクトリの構成:
+        meta.json: フォーマットのバージョン・先頭の日付・値のカラム・格納型
+        values.npy: 値（日数 × 24 × 値のカラム）
+        offsets.npy: 各時の先頭からのオフセット（日数 × 24、ナノ秒。すべて毎正時の場合は保存しない）
+        present.npy: 各日にデータがある場合True（日数）
+
+    保存は一時ディレクトリに書いてから置き換えるため、途中で失敗しても
+    以前のアーカイブは壊れません。
+
+    Attributes:
+        directory: アーカイブのディレクトリ
+    """
+
+    # 保存形式のバージョン（形式の変更時に更新）
+    FORMAT_VERSION: int = 1
+
+    _ARRAYS: tuple[str, ...] = ("values", "offsets", "present")
+
+    def __init__(self, directory: str | Path):
+        """DayTensorArchiveを初期化
+
+        Args:
+            directory: アーカイブのディレクトリ（保存時に作成）
+        """
+        self.directory = Path(directory)
+
+    def exists(self) -> bool:
+        """保存済みのアーカイブがある場合はTrue"""
+        return (self.directory / "meta.json").is_file()
+
+    def save(self, tensor: HourlyDayTensor) -> Path:
+        """最小日〜最大日の配列を保存する
+
+        Args:
+            tensor: 保存するデータ
+
+        Returns:
+            アーカイブのディレクトリ
+
+        Raises:
+            MergeError: 重複日を含む場合（どちらの日を保存するか決められないため）
+        """
+        if tensor.duplicate_days:
+            raise MergeError(
+                f"重複日を含むため保存できません: {', '.join(map(str, tensor.duplicate_days[:5]))}"
+            )
+        meta = {
+            "version": self.FORMAT_VERSION,
+            "first_day": tensor.first_day.isoformat() if tensor.first_day is not None else None,
+            "columns": list(tensor.VALUE_COLUMNS),
+            "dtype": tensor.DTYPE.str,
+        }
+        self.directory.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=self.directory.parent, prefix=f".{self.directory.name}."))
+        try:
+            for name in self._ARRAYS:
+                array = getattr(tensor, name)
+                if array is not None:
+                    np.save(staging / f"{name}.npy", array)
+            (staging / "meta.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+            self._replace(staging)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return self.directory
+
+    def load(self, mmap: bool = True) -> HourlyDayTensor:
+        """保存したアーカイブを読み込む
+
+        Args:
+            mmap: Trueの場合は配列をメモリマップする（読み取り専用。日付を追加するとコピーされる）
+
+        Returns:
+            保存したデータ
+
+        Raises:
+            FileNotFoundError: アーカイブがない場合
+            ValueError: 形式のバージョン・値のカラム・格納型が異なる場合
+        """
+        meta = json.loads((self.directory / "meta.json").read_text(encoding="utf-8"))
+        if (
+            meta.get("version") != self.FORMAT_VERSION
+            or meta.get("columns") != list(HourlyDayTensor.VALUE_COLUMNS)
+            or meta.get("dtype") != HourlyDayTensor.DTYPE.str
+        ):
+            raise ValueError(f"アーカイブの形式が異なります: {self.directory}")
+        if meta["first_day"] is None:
+            return HourlyDayTensor()
+        mmap_mode: Literal["r"] | None = "r" if mmap else None
+        values = np.load(self.directory / "values.npy", mmap_mode=mmap_mode)
+        present = np.load(self.directory / "present.npy", mmap_mode=mmap_mode)
+        # すべて毎正時の場合、オフセットの配列は保存しない
+        offsets_path = self.directory / "offsets.npy"
+        offsets = np.load(offsets_path, mmap_mode=mmap_mode) if offsets_path.is_file() else None
+        return HourlyDayTensor.from_arrays(date.fromisoformat(meta["first_day"]), values, offsets, present)
+
+    def _replace(self, staging: Path) -> None:
+        """書き終えた一時ディレクトリをアーカイブのディレクトリに置き換える"""
+        if not self.directory.exists():
+            staging.rename(self.directory)
+            return
+        retired = Path(tempfile.mkdtemp(dir=self.directory.parent, prefix=f".{self.directory.name}.old."))
+        retired.rmdir()
+        self.directory.rename(retired)
+        try:
+            staging.rename(self.directory)
+        except BaseException:
+            retired.rename(self.directory)
+            raise
+        shutil.rmtree(retired, ignore_errors=True)
@@ -0,0 +1,184 @@
+"""学習する文字コード判定
+
+このモジュールは、入力元ごとに学習した文字コードを最初に試し、
+先頭の一定バイト数の標本だけで他の候補を除外する文字コード判定を提供します。
+判定結果は候補を固定の順に全体でデコードした場合と同じです。
+"""
+from pathlib import Path
+import codecs
+
+from domain.exceptions import InvalidCsvFormatError
+from infra.cache.encoding_profile import EncodingProfile
+from infra.repositories.io_byte_counter import IoByteCounter
+
+
+# 値の文字コードで失敗するバイト列は、キーの文字コードでも失敗する
+# （utf-8-sig は先頭のBOMを除くだけなので、utf-8-sig で失敗するバイト列は utf-8 でも失敗する）
+_IMPLIED_BY: dict[str, str] = {"utf-8": "utf-8-sig"}
+
+
+class EncodingDetector:
+    """候補を固定の順に試した場合と同じ結果を、少ないデコードで求める文字コード判定
+
+    判定結果は「CANDIDATES の順に全体をデコードし、最初に成功したもの」です。
+    ファイルの大きさによらず、次のとおりに判定します（ファイル全体が先頭 SAMPLE_BYTES に
+    収まる場合は、全体を標本として確認し、確認で得たデコード結果をそのまま使います）。
+
+    1. 学習した文字コードがある場合、それより前の候補がすべて先頭 SAMPLE_BYTES の
+       標本で失敗すれば（インクリメンタルデコーダーで末尾の途中の文字は保留する）、
+       学習した文字コードで全体をデコードし、成功すればそれを採用します。
+    2. 標本では判断できない（前の候補も標本をデコードできる）場合や、学習した文字コードで
+       全体をデコードできない場合は、CANDIDATES の順に全体をデコードして確認します。
+       標本で失敗した候補は全体をデコードしません。
+
+    BOM付きUTF-8（utf-8-sig）で失敗するバイト列は UTF-8（utf-8）でも失敗するため、
+    utf-8-sig が失敗した場合は utf-8 を試しません。
+    どの候補でもデコードできない場合は、読めない文字を置換せずに
+    InvalidCsvFormatError を送出します。
+
+    Attributes:
+        profile: 入力元ごとに学習した文字コード（判定のたびに採用した文字コードを記録）
+    """
+
+    # 試行する文字コード（優先順。utf-8-sig: BOM付きUTF-8）
+    CANDIDATES: tuple[str, ...] = ("utf-8-sig", "utf-8", "cp932", "shift_jis")
+
+    # 候補の除外に使う先頭の標本のバイト数
+    SAMPLE_BYTES: int = 8 * 1024
+
+    def __init__(self, profile: EncodingProfile | None = None):
+        """EncodingDetectorを初期化
+
+        Args:
+            profile: 学習した文字コード（Noneの場合はこの判定器の中だけで学習する）
+        """
+        self.profile = profile or EncodingProfile()
+
+    def detect(
+        self,
+        raw: bytes,
+        path: Path | None = None,
+        io_counter: IoByteCounter | None = None
+    ) -> tuple[str, str]:
+        """バイト列の文字コードを判定してデコードする
+
+        Args:
+            raw: ファイルの内容（バイト列）
+            path: ファイルのパス（学習した文字コードの参照・記録に使う。Noneの場合は使わない）
+            io_counter: デコードしたバイト数を detect_encoding として記録するカウンタ
+
+        Returns:
+            (検出されたエンコーディング名, デコード済みの文字列) のタプル
+
+        Raises:
+            InvalidCsvFormatError: どの候補でもデコードできない場合
+        """
+        learned = self.profile.lookup(path) if path is not None else None
+        decoded = self._decode_sampled(raw, learned, io_counter)
+        if decoded is None:
+            raise self.undecodable_error(raw)
+        encoding, text = decoded
+        if path is not None:
+            self.profile.record(path, encoding)
+        return encoding, text
+
+    @staticmethod
+    def undecodable_error(raw: bytes) -> InvalidCsvFormatError:
+        """どの候補でもデコードできない場合の例外を作成する
+
+        decode() と、ファイルの一部だけを読む CsvPreflight が同じメッセージで報告するために使います。
+
+        Args:
+            raw: デコードできなかったバイト列
+
+        Returns:
+            UTF-8でのデコードの失敗を報告する InvalidCsvFormatError
+        """
+        try:
+            raw.decode("utf-8")
+        except UnicodeDecodeError as e:
+            return InvalidCsvFormatError(f"CSVファイルの読み込みに失敗しました: {e}")
+        return InvalidCsvFormatError("CSVファイルの読み込みに失敗しました: 文字コードを判定できません")
+
+    def _decode_sampled(
+        self,
+        raw: bytes,
+        learned: str | None,
+        io_counter: IoByteCounter | None
+    ) -> tuple[str, str] | None:
+        """標本で候補を除外しながらデコードする（どれも失敗した場合はNone）"""
+        attempt = _Attempt(raw, self.SAMPLE_BYTES, io_counter)
+        if learned is not None and learned in self.CANDIDATES:
+            earlier = self.CANDIDATES[:self.CANDIDATES.index(learned)]
+            if all(attempt.fails_on_sample(encoding) for encoding in earlier):
+                text = attempt.decode(learned)
+                if text is not None:
+                    return learned, text
+
+        for encoding in self.CANDIDATES:
+            if attempt.fails_on_sample(encoding):
+                continue
+            text = attempt.decode(encoding)
+            if text is not None:
+                return encoding, text
+        return None
+
+
+class _Attempt:
+    """1ファイルの判定で、候補ごとのデコードの結果を覚えておく
+
+    ファイル全体が標本に収まる場合は、標本の確認として全体をデコードし、
+    その結果を decode() でも使う（同じ候補で全体を2回デコードしない）。
+    """
+
+    def __init__(self, raw: bytes, sample_bytes: int, io_counter: IoByteCounter | None):
+        self._raw = raw
+        self._sample_bytes = sample_bytes
+        self._io_counter = io_counter
+        self._whole = len(raw) <= sample_bytes
+        self._failed: set[str] = set()
+        self._sample_ok: set[str] = set()
+        self._texts: dict[str, str] = {}
+
+    def failed(self, encoding: str) -> bool:
+        """標本・全体のどちらかのデコードで失敗した場合はTrue"""
+        return encoding in self._failed or _IMPLIED_BY.get(encoding) in self._failed
+
+    def fails_on_sample(self, encoding: str) -> bool:
+        """先頭の標本をデコードできない場合はTrue"""
+        if self.failed(encoding):
+            return True
+        if encoding in self._sample_ok:
+            return False
+        if self._whole:
+            return self.decode(encoding) is None
+        self._count(self._sample_bytes)
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            # 末尾で途中になったマルチバイト文字は final=False で保留される
+            decoder.decode(self._raw[:self._sample_bytes], final=False)
+        except (UnicodeDecodeError, LookupError):
+            self._failed.add(encoding)
+            return True
+        self._sample_ok.add(encoding)
+        return False
+
+    def decode(self, encoding: str) -> str | None:
+        """全体をデコードする（失敗した場合はNone）"""
+        if self.failed(encoding):
+            return None
+        if encoding in self._texts:
+            return self._texts[encoding]
+        self._count(len(self._raw))
+        try:
+            text = self._raw.decode(encoding)
+        except (UnicodeDecodeError, LookupError):
+            self._failed.add(encoding)
+            return None
+        self._texts[encoding] = text
+        self._sample_ok.add(encoding)
+        return text
+
+    def _count(self, byte_count: int) -> None:
+        if self._io_counter is not None:
+            self._io_counter.add("detect_encoding", byte_count)
@@ -0,0 +1,87 @@
+"""読み込み処理のI/Oバイト数カウンタ
+
+このモジュールはCsvRepositoryの読み込みフェーズごとに
+処理したバイト数を集計するカウンタを提供します。
+"""
+
+
+class IoByteCounter:
+    """フェーズ別のI/Oバイト数カウンタ
+
+    CsvRepository.load() の各フェーズ（ディスク読み込み、文字コード判定、
+    ヘッダー判定、パース）が扱ったバイト数を記録します。
+    ディスクからの読み込みは、ファイル全体の読み込みを "read" フェーズに、
+    CsvRepository.scan() の走査で読んだ先頭・末尾のブロックを "scan" フェーズに
+    計上するため、1ファイルを1回だけ読んでいることを確認できます。
+
+    Attributes:
+        bytes_by_phase: フェーズ名ごとの累積バイト数
+        calls_by_phase: フェーズ名ごとの呼び出し回数
+    """
+
+    # ディスクから読み込んだバイト数を表すフェーズ名（ファイル全体）
+    READ_PHASE: str = "read"
+
+    # 走査でディスクから読み込んだバイト数を表すフェーズ名（先頭・末尾のブロック）
+    SCAN_PHASE: str = "scan"
+
+    def __init__(self):
+        """IoByteCounterを初期化"""
+        self._bytes_by_phase: dict[str, int] = {}
+        self._calls_by_phase: dict[str, int] = {}
+
+    def add(self, phase: str, byte_count: int) -> None:
+        """指定フェーズにバイト数を加算
+
+        Args:
+            phase: フェーズ名（例: "read", "detect_encoding", "sniff_header", "parse"）
+            byte_count: 加算するバイト数
+        """
+        self._bytes_by_phase[phase] = self._bytes_by_phase.get(phase, 0) + byte_count
+        self._calls_by_phase[phase] = self._calls_by_phase.get(phase, 0) + 1
+
+    def merge(self, other: "IoByteCounter") -> None:
+        """別のカウンタの値を合算
+
+        Args:
+            other: 合算するカウンタ
+        """
+        for phase, byte_count in other.bytes_by_phase.items():
+            self._bytes_by_phase[phase] = self._bytes_by_phase.get(phase, 0) + byte_count
+        for phase, calls in other.calls_by_phase.items():
+            self._calls_by_phase[phase] = self._calls_by_phase.get(phase, 0) + calls
+
+    def reset(self) -> None:
+        """カウンタをリセット"""
+        self._bytes_by_phase.clear()
+        self._calls_by_phase.clear()
+
+    @property
+    def bytes_by_phase(self) -> dict[str, int]:
+        """フェーズ別の累積バイト数を取得"""
+        return dict(self._bytes_by_phase)
+
+    @property
+    def calls_by_phase(self) -> dict[str, int]:
+        """フェーズ別の呼び出し回数を取得"""
+        return dict(self._calls_by_phase)
+
+    @property
+    def bytes_read(self) -> int:
+        """ディスクから読み込んだ総バイト数を取得（走査の読み込みを含む）"""
+        return self._bytes_by_phase.get(self.READ_PHASE, 0) + self._bytes_by_phase.get(self.SCAN_PHASE, 0)
+
+    def get(self, phase: str) -> int:
+        """指定フェーズの累積バイト数を取得
+
+        Args:
+            phase: フェーズ名
+
+        Returns:
+            累積バイト数（未計上のフェーズは0）
+        """
+        return self._bytes_by_phase.get(phase, 0)
+
+    def __repr__(self) -> str:
+        """repr表現"""
+        return f"IoByteCounter({self._bytes_by_phase!r})"
@@ -0,0 +1,144 @@
+"""入力ファイルの走査と、必要になった時点でのまとめ読み込み
+
+このモジュールは、各入力ファイルの先頭・末尾の行だけを読んでメタデータを取得し、
+データは LazyCsvFile が読み込まれた時点で、日付順に一定数ずつ
+まとめて読み込むローダーを提供します。
+"""
+from bisect import bisect_left
+from pathlib import Path
+
+from domain.exceptions import CsvFileNotFoundError, MergeError
+from domain.models.csv_file import CsvFile
+from domain.models.csv_file_metadata import CsvFileMetadata
+from domain.models.lazy_csv_file import LazyCsvFile
+from infra.repositories.csv_preflight import CsvPreflight
+
+
+class LazyCsvLoader:
+    """入力ファイルを走査し、LazyCsvFile の読み込みをまとめて行うローダー
+
+    走査では CsvPreflight で先頭・末尾の行だけを読み、日付・行数・文字コード・
+    レイアウトとファイルのサイズ・更新日時を記録します（読んだバイト数は
+    リポジトリの IoByteCounter に "scan" として計上）。読み込みが確実に失敗する
+    レイアウトの異常はその場で FileProbe.error を送出し、日付を推定できない、
+    または確認が必要な点があるファイルは走査時に読み込んでメタデータを作り、
+    読み込んだ結果は取り出されるまで保持します（同じファイルを2回読み込まない）。
+
+    読み込みは要求されたファイルから日付順に batch_size 個を load_many() で
+    まとめて行い、取り出したファイルはローダーからも解放します。
+    まとめて読み込んだファイルは取り出されるまで保持し、すでに保持している
+    ファイルは読み込み直しません（日付順以外の順で取り出しても2回読み込まない）。
+    結合処理は日付順にファイルを使うため、入力の並び順によらず
+    まとめ読み込みの効果を得つつ、保持するのは最大 batch_size ファイル分です
+    （日付順以外の順で取り出した場合は、まだ取り出していないファイルの分だけ増える）。
+    """
+
+    def __init__(self, repository, batch_size: int):
+        """LazyCsvLoaderを初期化
+
+        Args:
+            repository: 読み込み処理を提供する CsvRepository
+            batch_size: 一度に読み込むファイル数
+        """
+        self._repository = repository
+        self._batch_size = batch_size
+        self._ordered: list[CsvFileMetadata] = []
+        self._days: list[int] = []
+        self._loaded: dict[int, CsvFile] = {}
+        self._scanned: dict[int, CsvFile] = {}
+
+    def scan(self, file_paths: list[str | Path]) -> list[LazyCsvFile]:
+        """入力ファイルを走査してメタデータを取得する
+
+        Args:
+            file_paths: 入力ファイルのパスリスト
+
+        Returns:
+            入力順に並んだ LazyCsvFile のリスト
+
+        Raises:
+            CsvFileNotFoundError: ファイルが存在しない場合
+            CsvMergerError: 走査時に読み込んだファイルの読み込みに失敗した場合
+        """
+        preflight = CsvPreflight(self._repository.io_counter)
+        metadata = []
+        # 走査時に読み込んだファイル（入力のインデックスごと）
+        scanned: dict[int, CsvFile] = {}
+        for index, file_path in enumerate(file_paths):
+            path = file_path if isinstance(file_path, Path) else Path(file_path)
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                raise CsvFileNotFoundError(f"CSVファイルが見つかりません: {path}") from None
+            probe = preflight.probe(path)
+            if probe.error is not None:
+                # 読み込みが確実に失敗するため、読み込まずに報告する
+                raise probe.error
+            if probe.day is not None and not probe.issues and not probe.warnings:
+                day, rows = CsvFileMetadata.day_number(probe.day), probe.rows
+            else:
+                scanned[index] = self._repository.load(path)
+                summary = scanned[index].summary
+                if summary is None or summary.day is None:
+                    # 1日分制約は通常 CsvFile 側で保証されるが、念のため（CsvMerger と同じ例外）
+                    raise MergeError("各入力CSVは1日分のデータである必要があります")
+                day, rows = summary.day, summary.rows
+            fingerprint = CsvFileMetadata.fingerprint_of(stat.st_size, stat.st_mtime_ns)
+            metadata.append(CsvFileMetadata(
+                path, day, rows, probe.encoding, probe.headerless, fingerprint
+            ))
+
+        # 日付順に並べ、読み込み時の位置は日番号の二分探索で求める
+        # （ファイルごとに位置を保持しない）
+        order = sorted(range(len(metadata)), key=lambda index: metadata[index].day)
+        self._ordered = [metadata[index] for index in order]
+        self._days = [item.day for item in self._ordered]
+        self._loaded = {}
+        self._scanned = {
+            position: scanned[index] for position, index in enumerate(order) if index in scanned
+        }
+        load = self.load
+        return [LazyCsvFile(item, load) for item in metadata]
+
+    def load(self, metadata: CsvFileMetadata) -> CsvFile:
+        """走査したファイルを読み込んで取り出す
+
+        Args:
+            metadata: scan() で取得したメタデータ
+
+        Returns:
+            読み込んだCsvFile
+
+        Raises:
+            MergeError: 直近の scan() で取得したメタデータではない場合、
+                または走査後にファイルが変更された場合
+        """
+        position = bisect_left(self._days, metadata.day)
+        # 重複日の場合は同じ日番号の中から探す
+        while position < len(self._ordered) and self._ordered[position] is not metadata:
+            position += 1
+        if position == len(self._ordered):
+            raise MergeError(f"{metadata.path.name}: 直近の走査で取得したメタデータではありません")
+        csv_file = self._scanned.pop(position, None)
+        if csv_file is None:
+            csv_file = self._loaded.pop(position, None)
+        if csv_file is None:
+            # 走査時に読み込んだファイル・まとめて読み込んで保持しているファイルは読み込み直さない
+            positions = [
+                index for index in range(position, min(position + self._batch_size, len(self._ordered)))
+                if index not in self._scanned and index not in self._loaded
+            ]
+            batch = [self._ordered[index] for index in positions]
+            for item in batch:
+                try:
+                    stat = item.path.stat()
+                except FileNotFoundError:
+                    # 読み込み時の例外（CsvFileNotFoundError）で報告する
+                    continue
+                if CsvFileMetadata.fingerprint_of(stat.st_size, stat.st_mtime_ns) != item.fingerprint:
+                    raise MergeError(f"{item.path.name}: 走査後にファイルが変更されました")
+            loaded = self._repository.load_many([item.path for item in batch])
+            self._loaded.update(zip(positions, loaded))
+            csv_file = self._loaded.pop(position)
+        return csv_file
+
@@ -0,0 +1 @@
+"""Sinks - 結合結果の出力形式"""
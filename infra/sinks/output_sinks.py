@@ -0,0 +1,354 @@
+"""結合結果の出力形式（シンク）
+
+このモジュールは結合結果のDataFrameをファイルに書き出すシンクを定義します。
+CSVのほか、後段の分析で再パースせずに読み込める列指向形式
+（Parquet、Feather / Arrow IPC）に対応します。
+
+列指向形式は pyarrow を使用します。pyarrow は必須の依存関係ではないため、
+使用時にのみインポートし、インストールされていない場合は ImportError を送出します。
+
+CLIの引数解析で出力形式の一覧を参照するため、pandas / numpy と
+それらに依存するモジュールは書き出し時にのみインポートします。
+"""
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from infra.diagnostics.span_tracer import SpanTracer
+from infra.repositories.compression import (
+    COMPRESSION_SUFFIXES,
+    ensure_available,
+    open_compressed,
+    validate_compression,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from infra.repositories.csv_writer import CsvWriter
+
+
+def _import_pyarrow():
+    """pyarrow をインポートする
+
+    Returns:
+        pyarrow モジュール
+
+    Raises:
+        ImportError: pyarrow がインストールされていない場合
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Parquet / Feather / Arrow 形式での出力には pyarrow が必要です"
+            "（pip install \"flet-csv[columnar]\"）"
+        ) from e
+    return pyarrow
+
+
+class OutputSink:
+    """結合結果の出力形式の基底クラス
+
+    Attributes:
+        format_name: 出力形式の名前（CLIの --format で指定する値）
+        suffix: 出力ファイルの拡張子
+    """
+
+    format_name: str = ""
+    suffix: str = ""
+
+    def ensure_available(self) -> None:
+        """出力に必要なライブラリが利用できることを確認する
+
+        Raises:
+            ImportError: 必要なライブラリがインストールされていない場合
+        """
+
+    def write(self, df: "pd.DataFrame", path: Path) -> None:
+        """DataFrameをファイルに書き出す
+
+        Args:
+            df: 書き出すDataFrame
+            path: 出力ファイルのパス
+        """
+        self.write_stream([df], path)
+
+    def write_stream(self, chunks: Iterable["pd.DataFrame"], path: Path) -> None:
+        """DataFrameのチャンクを順に書き出して1つのファイルにする
+
+        出力内容は全チャンクを連結して write() した場合と同じです。
+
+        Args:
+            chunks: 書き出すDataFrameのチャンク（先頭から順に書き出す）
+            path: 出力ファイルのパス
+        """
+        raise NotImplementedError
+
+
+class CsvSink(OutputSink):
+    """CSV形式の出力（UTF-8、ヘッダーあり）
+
+    compression を指定した場合は圧縮して書き出し、拡張子に
+    圧縮形式の拡張子（.gz / .zst）を付けます。gzip はブロック単位で
+    複数スレッドで並列に圧縮します。
+    """
+
+    format_name = "csv"
+    suffix = ".csv"
+
+    def __init__(
+        self,
+        writer: "CsvWriter | None" = None,
+        compression: str | None = None,
+        compress_workers: int | None = None,
+        tracer: SpanTracer | None = None
+    ):
+        """CsvSinkを初期化
+
+        Args:
+            writer: CSVのライター（Noneの場合は新規作成）
+            compression: 圧縮形式（"gzip" / "zstd"、Noneの場合は非圧縮）
+            compress_workers: 圧縮のスレッド数（Noneの場合はCPUコア数）
+            tracer: 圧縮スレッドの処理をスパンとして記録するトレーサー
+
+        Raises:
+            ValueError: 未対応の圧縮形式の場合
+        """
+        from infra.repositories.csv_writer import CsvWriter
+
+        validate_compression(compression)
+        self.writer = writer or CsvWriter()
+        self.compression = compression
+        self.compress_workers = compress_workers
+        self.tracer = tracer
+        if compression is not None:
+            self.suffix = CsvSink.suffix + COMPRESSION_SUFFIXES[compression]
+
+    def ensure_available(self) -> None:
+        """圧縮に必要なライブラリが利用できることを確認する
+
+        Raises:
+            ImportError: zstd 圧縮に必要な zstandard がない場合
+        """
+        ensure_available(self.compression)
+
+    def write_stream(self, chunks: Iterable["pd.DataFrame"], path: Path) -> None:
+        """DataFrameのチャンクを順に書き出す（ヘッダーは最初のチャンクのみ）
+
+        Args:
+            chunks: 書き出すDataFrameのチャンク
+            path: 出力ファイルのパス
+        """
+        with open(path, "wb") as raw:
+            with open_compressed(raw, self.compression, self.compress_workers, self.tracer) as f:
+                for position, chunk in enumerate(chunks):
+                    self.writer.write(chunk, f, header=position == 0)
+
+
+class _ArrowSink(OutputSink):
+    """pyarrow を使用する出力形式の共通処理
+
+    各チャンクは CsvSchema の格納型に変換してから Arrow のテーブルにします。
+    整数カラムの型は CsvSchema.STORAGE_DTYPES に固定するため、ファイルのスキーマは
+    データやチャンクの区切り方に依存しません。格納型に収まらない値を含むチャンクは
+    書き出さずに ValueError を送出します。
+    """
+
+    def ensure_available(self) -> None:
+        """pyarrow が利用できることを確認する
+
+        Raises:
+            ImportError: pyarrow がインストールされていない場合
+        """
+        _import_pyarrow()
+
+    def write_stream(self, chunks: Iterable["pd.DataFrame"], path: Path) -> None:
+        """DataFrameのチャンクを順に書き出す
+
+        Args:
+            chunks: 書き出すDataFrameのチャンク
+            path: 出力ファイルのパス
+
+        Raises:
+            ValueError: 整数カラムの値が CsvSchema.STORAGE_DTYPES の格納型に収まらない場合
+        """
+        import numpy as np
+
+        from domain.models.csv_schema import CsvSchema
+
+        pa = _import_pyarrow()
+        writer = None
+        schema = None
+        try:
+            for chunk in chunks:
+                self._check_storage_range(chunk)
+                table = pa.Table.from_pandas(
+                    CsvSchema.to_storage_dtypes(chunk), preserve_index=False
+                )
+                if schema is None:
+                    schema = table.schema
+                    writer = self._open(pa, path, schema)
+                else:
+                    table = table.cast(schema)
+                self._write_table(writer, table)
+            if writer is None:
+                # チャンクがない場合も、格納型のスキーマで空のファイルを作る
+                schema = pa.schema([
+                    (name, pa.from_numpy_dtype(np.dtype(dtype)))
+                    for name, dtype in CsvSchema.STORAGE_DTYPES.items()
+                ])
+                writer = self._open(pa, path, schema)
+            self._finish(writer)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _check_storage_range(self, chunk: "pd.DataFrame") -> None:
+        """整数カラムの値が格納型に収まることを確認する
+
+        Args:
+            chunk: 書き出すDataFrameのチャンク
+
+        Raises:
+            ValueError: 格納型に収まらない値を含むカラムがある場合
+        """
+        from domain.models.csv_schema import CsvSchema
+
+        fallbacks = CsvSchema.storage_fallbacks(chunk)
+        if fallbacks:
+            column, (low, high) = next(iter(fallbacks.items()))
+            raise ValueError(
+                f"{column}: 値の範囲（{low}〜{high}）が {self.format_name} 形式の"
+                f"出力の型 {CsvSchema.STORAGE_DTYPES[column]} に収まりません"
+            )
+
+    def _open(self, pa, path: Path, schema):
+        """出力ファイルのライターを作成する"""
+        raise NotImplementedError
+
+    def _write_table(self, writer, table) -> None:
+        """テーブルを1つ書き出す"""
+        writer.write_table(table)
+
+    def _finish(self, writer) -> None:
+        """書き残したデータを書き出す（クローズの直前に呼ばれる）"""
+
+
+class ParquetSink(_ArrowSink):
+    """Parquet形式の出力
+
+    行数が row_group_rows に達するまでチャンクをためてから1つの行グループとして
+    書き出すため、行グループの大きさはチャンクの大きさに依存しません。
+    """
+
+    format_name = "parquet"
+    suffix = ".parquet"
+
+    # 1行グループあたりの既定の行数（格納型で約22MB）
+    DEFAULT_ROW_GROUP_ROWS = 1_000_000
+
+    def __init__(self, row_group_rows: int = DEFAULT_ROW_GROUP_ROWS, compression: str = "snappy"):
+        """ParquetSinkを初期化
+
+        Args:
+            row_group_rows: 1行グループあたりの行数
+            compression: 圧縮方式（pyarrow.parquet.ParquetWriter に渡す値）
+
+        Raises:
+            ValueError: row_group_rows が1未満の場合
+        """
+        if row_group_rows < 1:
+            raise ValueError(f"行グループの行数は1以上を指定してください: {row_group_rows}")
+        self.row_group_rows = row_group_rows
+        self.compression = compression
+        # 行グループにまとめる前の pyarrow.Table
+        self._pending: list[Any] = []
+        self._pending_rows = 0
+
+    def _open(self, pa, path: Path, schema):
+        self._pending = []
+        self._pending_rows = 0
+        return pa.parquet.ParquetWriter(path, schema, compression=self.compression)
+
+    def _write_table(self, writer, table) -> None:
+        self._pending.append(table)
+        self._pending_rows += table.num_rows
+        if self._pending_rows >= self.row_group_rows:
+            self._flush(writer, keep_remainder=True)
+
+    def _finish(self, writer) -> None:
+        self._flush(writer, keep_remainder=False)
+
+    def _flush(self, writer, keep_remainder: bool) -> None:
+        """ためたチャンクを行グループ単位で書き出す
+
+        Args:
+            writer: ParquetWriter
+            keep_remainder: 行グループに満たない末尾の行を次回に持ち越す場合はTrue
+        """
+        if not self._pending:
+            return
+        pa = _import_pyarrow()
+        table = pa.concat_tables(self._pending)
+        rows = table.num_rows
+        if keep_remainder:
+            rows -= rows % self.row_group_rows
+        if rows > 0 or table.num_rows == 0:
+            writer.write_table(table.slice(0, rows), row_group_size=self.row_group_rows)
+        self._pending = [table.slice(rows)] if rows < table.num_rows else []
+        self._pending_rows = table.num_rows - rows
+
+
+class ArrowIpcSink(_ArrowSink):
+    """Arrow IPC ファイル形式の出力
+
+    圧縮せずに書き出すため、pyarrow.memory_map() で開いて
+    コピーなしに読み込めます。
+    """
+
+    format_name = "arrow"
+    suffix = ".arrow"
+
+    def _open(self, pa, path: Path, schema):
+        return pa.ipc.new_file(str(path), schema)
+
+
+class FeatherSink(ArrowIpcSink):
+    """Feather（V2）形式の出力
+
+    Feather V2 は Arrow IPC ファイル形式そのもので、pandas.read_feather() や
+    pyarrow.feather.read_table(memory_map=True) で読み込めます。
+    """
+
+    format_name = "feather"
+    suffix = ".feather"
+
+
+# CLIの --format で指定できる出力形式
+OUTPUT_FORMATS: dict[str, type[OutputSink]] = {
+    sink.format_name: sink
+    for sink in (CsvSink, ParquetSink, FeatherSink, ArrowIpcSink)
+}
+
+
+def create_sink(format_name: str, **options) -> OutputSink:
+    """出力形式の名前からシンクを作成する
+
+    Args:
+        format_name: 出力形式の名前（OUTPUT_FORMATS のキー）
+        **options: シンクのコンストラクタに渡す引数
+
+    Returns:
+        作成したシンク
+
+    Raises:
+        ValueError: 未対応の出力形式の場合
+    """
+    if format_name not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"未対応の出力形式です: {format_name}（対応形式: {', '.join(OUTPUT_FORMATS)}）"
+        )
+    return OUTPUT_FORMATS[format_name](**options)
@@ -1,13 +1,23 @@
 """CSVファイル結合アプリケーションのエントリーポイント
 
 このモジュールは、複数のCSVファイルを結合するCLIアプリケーションです。
+
+引数の誤りや入力ディレクトリの問題をすぐに報告できるよう、pandas に依存する
+リポジトリ・ユースケースは、引数解析・入力ファイルの検出・出力形式の確認が
+済んでからインポートします。
 """
 import argparse
+import json
 import sys
 from pathlib import Path
 import logging
 
-from usecase.merge_csv_files import MergeCsvFilesUseCase
+from infra.diagnostics.phase_timer import PhaseTimer
+from infra.diagnostics.run_profiler import RunProfiler
+from infra.diagnostics.span_tracer import SpanTracer
+from infra.repositories.compression import COMPRESSION_SUFFIXES
+from infra.repositories.csv_preflight import CsvPreflight
+from infra.sinks.output_sinks import OUTPUT_FORMATS, ParquetSink, create_sink
 
 
 # ロガーの設定
@@ -19,6 +29,48 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _non_negative_int(value: str) -> int:
+    """0以上の整数の引数を解析
+    
+    Args:
+        value: 引数の文字列
+        
+    Returns:
+        解析した整数
+        
+    Raises:
+        argparse.ArgumentTypeError: 整数でない、または負の場合
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"整数を指定してください: {value}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"0以上の整数を指定してください: {value}")
+    return number
+
+
+def _positive_int(value: str) -> int:
+    """1以上の整数の引数を解析
+    
+    Args:
+        value: 引数の文字列
+        
+    Returns:
+        解析した整数
+        
+    Raises:
+        argparse.ArgumentTypeError: 整数でない、または1未満の場合
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"整数を指定してください: {value}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1以上の整数を指定してください: {value}")
+    return number
+
+
 def parse_arguments() -> argparse.Namespace:
     """コマンドライン引数を解析
     
@@ -32,6 +84,16 @@ def parse_arguments() -> argparse.Namespace:
 使用例:
   python main.py
   python main.py --input time_case --output static/downloads
+  python main.py --jobs 8
+  python main.py --streaming
+  python main.py --cache-dir .csv_cache
+  python main.py --encoding-profile .csv_encodings.json
+  python main.py --format parquet
+  python main.py --compress gzip
+  python main.py --stats json
+  python main.py --profile profile.txt --profile-memory memory.txt
+  python main.py --trace trace.json
+  python main.py --check
   python main.py --help
         """
     )
@@ -50,12 +112,119 @@ def parse_arguments() -> argparse.Namespace:
         help="結合後のCSVファイルを保存するディレクトリ（デフォルト: static/downloads）"
     )
     
+    parser.add_argument(
+        "--jobs",
+        type=_non_negative_int,
+        default=1,
+        help="ファイル読み込みの並列ワーカー数（デフォルト: 1、0でCPUコア数。負の値は指定不可）"
+    )
+    
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="結合結果全体をメモリに保持せず、入力を順に読みながら書き出す（大規模データ向け、--jobsは無視）"
+    )
+    
+    parser.add_argument(
+        "--collect-errors",
+        action="store_true",
+        help="最初の失敗で中止せずにすべての入力を確認し、失敗したファイルをまとめて表示する"
+             "（--streaming では読み込み前の確認の失敗のみ）"
+    )
+    
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="正規化・検証済みデータのキャッシュディレクトリ（指定した場合のみキャッシュを使用）"
+    )
+    
+    parser.add_argument(
+        "--cache-max-mb",
+        type=_non_negative_int,
+        default=None,
+        help="キャッシュの合計サイズの上限（MB、デフォルト: 256）。超えた場合は古いものから削除（負の値は指定不可）"
+    )
+    
+    parser.add_argument(
+        "--encoding-profile",
+        type=str,
+        default=None,
+        help="入力元ごとに学習した文字コードの保存先（JSON）。次回以降はその文字コードを最初に試す"
+    )
+    
+    parser.add_argument(
+        "--format",
+        choices=list(OUTPUT_FORMATS),
+        default="csv",
+        help="出力形式（デフォルト: csv）。parquet / feather / arrow には pyarrow が必要"
+    )
+    
+    parser.add_argument(
+        "--row-group-rows",
+        type=_positive_int,
+        default=ParquetSink.DEFAULT_ROW_GROUP_ROWS,
+        help=f"Parquet出力の1行グループあたりの行数（デフォルト: {ParquetSink.DEFAULT_ROW_GROUP_ROWS}、1以上）"
+    )
+    
+    parser.add_argument(
+        "--compress",
+        choices=list(COMPRESSION_SUFFIXES),
+        default=None,
+        help="CSV出力を圧縮する（gzipはCPUコア数のスレッドで並列に圧縮、zstdにはzstandardが必要）"
+    )
+    
+    parser.add_argument(
+        "--stats",
+        choices=["text", "json"],
+        default=None,
+        help="フェーズ別の経過時間・CPU時間・ピークメモリと遅いファイルを表示する（jsonは1行のJSON）"
+    )
+    
+    parser.add_argument(
+        "--profile",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="cProfile で計測し、CPU時間の上位の関数（累積時間順・自己時間順）をPATHに書き出す"
+    )
+    
+    parser.add_argument(
+        "--profile-memory",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="tracemalloc で計測し、フェーズごとにメモリの割り当てが多い行をPATHに書き出す"
+    )
+    
+    parser.add_argument(
+        "--trace",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="読み込み・結合・保存の各処理のタイムラインを trace event 形式のJSONでPATHに書き出す"
+             "（chrome://tracing / Perfetto で表示）"
+    )
+    
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="結合せずに、各ファイルの先頭・末尾の行だけから重複日・欠損日・レイアウトの異常を確認する"
+             "（結合できる場合は終了コード0）"
+    )
+    
     return parser.parse_args()
 
 
+# 入力として扱うファイルのパターン（圧縮されたCSVを含む）
+CSV_FILE_PATTERNS = ["*.csv"] + [f"*.csv{suffix}" for suffix in COMPRESSION_SUFFIXES.values()]
+
+
 def get_csv_files(input_dir: Path) -> list[Path]:
     """指定されたディレクトリ内のすべてのCSVファイルを取得
     
+    圧縮されたCSV（.csv.gz / .csv.zst）も対象とし、ファイル名順に並べます。
+    
     Args:
         input_dir: 入力ディレクトリ
         
@@ -72,7 +241,9 @@ def get_csv_files(input_dir: Path) -> list[Path]:
     if not input_dir.is_dir():
         raise ValueError(f"指定されたパスはディレクトリではありません: {input_dir}")
     
-    csv_files = sorted(input_dir.glob("*.csv"))
+    csv_files = sorted(
+        {path for pattern in CSV_FILE_PATTERNS for path in input_dir.glob(pattern)}
+    )
     
     if not csv_files:
         raise ValueError(f"CSVファイルが見つかりませんでした: {input_dir}")
@@ -80,6 +251,72 @@ def get_csv_files(input_dir: Path) -> list[Path]:
     return csv_files
 
 
+def format_stats(stats) -> str:
+    """計測結果を表形式の文字列にする
+    
+    Args:
+        stats: フェーズ別の計測結果（MergeStats）
+        
+    Returns:
+        表示用の文字列
+    """
+    lines = [f"{'フェーズ':<16}{'経過(秒)':>10}{'CPU(秒)':>10}{'ピーク(MB)':>12}{'回数':>8}"]
+    for name, phase in stats.phases.items():
+        peak = "-" if phase.peak_memory_bytes is None else f"{phase.peak_memory_bytes / 1e6:.1f}"
+        lines.append(
+            f"{name:<16}{phase.wall_seconds:>10.3f}{phase.cpu_seconds:>10.3f}{peak:>12}{phase.calls:>8}"
+        )
+    lines.append(f"{'合計':<16}{stats.total_wall_seconds:>10.3f}{stats.total_cpu_seconds:>10.3f}")
+    if stats.slowest_files:
+        lines.append("時間のかかったファイル:")
+        lines += [f"  {timing.seconds:.3f}秒 {timing.path}" for timing in stats.slowest_files]
+    return "\n".join(lines)
+
+
+# 事前チェックの結果で、1項目あたりに表示する日付・ファイルの最大数
+CHECK_REPORT_LIMIT = 10
+
+
+def format_check_report(report) -> str:
+    """事前チェックの結果を表示用の文字列にする
+    
+    Args:
+        report: 事前チェックの結果（PreflightReport）
+        
+    Returns:
+        表示用の文字列
+    """
+    day_format = "%Y/%m/%d"
+    period = ""
+    if report.first_day is not None:
+        period = f"（{report.first_day.strftime(day_format)}〜{report.last_day.strftime(day_format)}）"
+    lines = [f"事前チェック: {report.file_count}ファイル、{report.total_rows}行{period}"]
+    
+    def add_section(title: str, unit: str, items: list[str]) -> None:
+        if not items:
+            lines.append(f"{title}: なし")
+            return
+        lines.append(f"{title}: {len(items)}{unit}")
+        lines.extend(f"  {item}" for item in items[:CHECK_REPORT_LIMIT])
+        if len(items) > CHECK_REPORT_LIMIT:
+            lines.append(f"  ...ほか{len(items) - CHECK_REPORT_LIMIT}{unit}")
+    
+    continuity = report.continuity
+    add_section("重複日", "日", [
+        f"{day.strftime(day_format)}: {', '.join(path.name for path in report.files_on(day))}"
+        for day in continuity.duplicate_days
+    ])
+    add_section("欠損日", "日", [day.strftime(day_format) for day in continuity.missing_days])
+    add_section("レイアウトの異常", "ファイル", [
+        f"{probe.path.name}: {' / '.join(probe.issues)}" for probe in report.files_with_issues
+    ])
+    add_section("確認が必要な点", "ファイル", [
+        f"{probe.path.name}: {' / '.join(probe.warnings)}" for probe in report.files_with_warnings
+    ])
+    lines.append("結果: " + ("結合できます" if report.is_mergeable else "結合できません"))
+    return "\n".join(lines)
+
+
 def main() -> int:
     """メイン関数
     
@@ -100,24 +337,102 @@ def main() -> int:
         logger.info(f"入力ディレクトリ: {input_dir.absolute()}")
         logger.info(f"出力ディレクトリ: {output_dir.absolute()}")
         
-        # 出力ディレクトリを作成（存在しない場合）
-        output_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"出力ディレクトリを準備しました: {output_dir}")
+        # --stats / --profile / --profile-memory / --trace の場合は入力ファイルの検出から計測する
+        tracer = SpanTracer() if args.trace else None
+        phase_timer = PhaseTimer(enabled=args.stats is not None, trace_memory=True, tracer=tracer)
+        profiler = RunProfiler(cpu=args.profile is not None, memory=args.profile_memory is not None)
         
         # CSVファイルを取得
-        csv_files = get_csv_files(input_dir)
+        with phase_timer.measure("discovery"), profiler.cpu_profile(), profiler.memory_phase("discovery"):
+            csv_files = get_csv_files(input_dir)
         logger.info(f"入力CSVファイル数: {len(csv_files)}")
         for i, csv_file in enumerate(csv_files, 1):
             logger.info(f"  {i}. {csv_file.name}")
         
+        # --check の場合は各ファイルの先頭・末尾の行だけを確認して終了する（結合・出力はしない）
+        if args.check:
+            check_report = CsvPreflight().check(csv_files)
+            logger.info(f"事前チェック: {check_report!r}")
+            print(format_check_report(check_report))
+            return 0 if check_report.is_mergeable else 1
+        
+        # 出力ディレクトリを作成（存在しない場合）
+        output_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(f"出力ディレクトリを準備しました: {output_dir}")
+        
         # UseCaseを実行
         logger.info("-" * 60)
         logger.info("結合処理を実行中...")
-        usecase = MergeCsvFilesUseCase()
-        result = usecase.execute(csv_files, output_dir)
+        cache = None
+        if args.cache_dir:
+            from infra.cache.parsed_csv_cache import ParsedCsvCache
+            max_bytes = (
+                ParsedCsvCache.DEFAULT_MAX_BYTES if args.cache_max_mb is None
+                else args.cache_max_mb * 1024 * 1024
+            )
+            cache = ParsedCsvCache(args.cache_dir, max_bytes=max_bytes)
+            logger.info(f"キャッシュディレクトリ: {Path(args.cache_dir).absolute()}")
+        encoding_profile = None
+        if args.encoding_profile:
+            from infra.cache.encoding_profile import EncodingProfile
+            encoding_profile = EncodingProfile(args.encoding_profile)
+            logger.info(f"文字コードの学習結果: {Path(args.encoding_profile).absolute()}")
+        options = {}
+        if args.format == "parquet":
+            options["row_group_rows"] = args.row_group_rows
+        if args.compress:
+            if args.format != "csv":
+                raise ValueError("--compress は --format csv の場合のみ指定できます")
+            options["compression"] = args.compress
+            options["tracer"] = tracer
+        sink = create_sink(args.format, **options)
+        sink.ensure_available()
+        logger.info(f"出力形式: {args.format}" + (f"（{args.compress}圧縮）" if args.compress else ""))
+        
+        # pandas に依存するモジュールは、ここまでの確認が済んでからインポートする
+        from infra.repositories.csv_repository import CsvRepository
+        from usecase.merge_csv_files import MergeCsvFilesUseCase
+        
+        usecase = MergeCsvFilesUseCase(
+            repository=CsvRepository(cache=cache, sink=sink, encoding_profile=encoding_profile),
+            jobs=args.jobs,
+            streaming=args.streaming,
+            phase_timer=phase_timer,
+            profiler=profiler,
+            collect_errors=args.collect_errors
+        )
+        if usecase.streaming:
+            logger.info("ストリーミング結合: 有効")
+        elif usecase.jobs > 1:
+            logger.info(f"並列読み込み: {usecase.jobs}ワーカー")
+        with profiler.cpu_profile():
+            result = usecase.execute(csv_files, output_dir)
+        profiler.stop()
+        if encoding_profile is not None and encoding_profile.save():
+            logger.info(f"文字コードの学習結果を保存しました（{len(encoding_profile.entries)}件）")
         
         # 結果を表示
         logger.info("-" * 60)
+        if cache is not None:
+            logger.info(f"キャッシュ: ヒット {cache.hits}件 / ミス {cache.misses}件")
+            print(f"キャッシュ: ヒット {cache.hits}件 / ミス {cache.misses}件")
+        if result.stats is not None:
+            if args.stats == "json":
+                print(json.dumps(result.stats.to_dict(), ensure_ascii=False))
+            else:
+                print(format_stats(result.stats))
+        if tracer is not None:
+            trace = tracer.write(args.trace)
+            logger.info(f"トレース: {trace.absolute()}（{tracer.event_count}スパン）")
+            print(f"トレース: {trace}")
+        if args.profile:
+            cpu_report = profiler.write_cpu_report(args.profile)
+            logger.info(f"CPUプロファイル: {cpu_report.absolute()}")
+            print(f"CPUプロファイル: {cpu_report}")
+        if args.profile_memory:
+            memory_report = profiler.write_memory_report(args.profile_memory)
+            logger.info(f"メモリプロファイル: {memory_report.absolute()}")
+            print(f"メモリプロファイル: {memory_report}")
         if result.is_successful:
             logger.info("[成功] 結合処理が成功しました！")
             logger.info(f"   出力ファイル: {result.output_path}")
@@ -150,6 +465,11 @@ def main() -> int:
         print(f"エラー: {e}", file=sys.stderr)
         return 1
     
+    except ImportError as e:
+        logger.error(f"[エラー] 必要なパッケージがありません: {e}")
+        print(f"エラー: {e}", file=sys.stderr)
+        return 1
+    
     except Exception as e:
         logger.exception(f"[エラー] 予期しないエラーが発生しました: {e}")
         print(f"予期しないエラー: {e}", file=sys.stderr)
@@ -2,6 +2,7 @@
 
 このモジュールは、main.pyのCLI機能のエンドツーエンドテストを提供します。
 """
+import json
 from pathlib import Path
 import subprocess
 import sys
@@ -95,6 +96,224 @@ class TestMainCLI:
         assert "2" in result.stdout  # 2ファイル結合
         assert "48" in result.stdout  # 48行
 
+    def test_main_success_with_parallel_jobs(self, sample_csv_files, input_dir, output_dir):
+        """--jobsで並列読み込みを指定しても同じ結果になる"""
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir), "--jobs", "2"],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 0
+        assert "2" in result.stdout  # 2ファイル結合
+        assert "48" in result.stdout  # 48行
+
+        output_files = list(output_dir.glob("merged_*.csv"))
+        assert len(output_files) == 1
+        lines = output_files[0].read_text(encoding="utf-8").strip().split("\n")
+        assert len(lines) == 49
+        assert lines[1].startswith("1,2025/01/01 00:00:00")
+        assert lines[-1].startswith("48,2025/01/02 23:00:00")
+
+    def test_main_success_with_streaming(self, sample_csv_files, input_dir, output_dir):
+        """--streamingでチャンク単位に書き出しても同じ結果になる"""
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir), "--streaming"],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 0
+        assert "48" in result.stdout  # 48行
+
+        output_files = list(output_dir.glob("merged_*.csv"))
+        assert len(output_files) == 1
+        lines = output_files[0].read_text(encoding="utf-8").strip().split("\n")
+        assert len(lines) == 49
+        assert lines[1].startswith("1,2025/01/01 00:00:00")
+        assert lines[-1].startswith("48,2025/01/02 23:00:00")
+
+    def test_main_reports_cache_hits_and_misses(self, sample_csv_files, input_dir, output_dir, tmp_path):
+        """--cache-dirを指定すると、キャッシュのヒット・ミス件数を表示する"""
+        cache_dir = tmp_path / "cache"
+        command = [
+            sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir),
+            "--cache-dir", str(cache_dir),
+        ]
+
+        first = subprocess.run(command, capture_output=True, text=True)
+        # 2回目は並列読み込みで、ワーカー側の件数も合算されることを確認
+        second = subprocess.run(command + ["--jobs", "2"], capture_output=True, text=True)
+
+        assert first.returncode == 0
+        assert "キャッシュ: ヒット 0件 / ミス 2件" in first.stdout
+        assert second.returncode == 0
+        assert "キャッシュ: ヒット 2件 / ミス 0件" in second.stdout
+        outputs = sorted(output_dir.glob("merged_*.csv"))
+        assert outputs[0].read_bytes() == outputs[-1].read_bytes()
+
+    def test_main_saves_encoding_profile(self, sample_csv_files, input_dir, output_dir, tmp_path):
+        """--encoding-profileを指定すると、並列読み込みでも学習した文字コードを保存する"""
+        profile_path = tmp_path / "encodings.json"
+
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir),
+             "--encoding-profile", str(profile_path), "--jobs", "2"],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 0
+        entries = json.loads(profile_path.read_text(encoding="utf-8"))["entries"]
+        assert entries[str(input_dir.absolute() / "file#.csv")] == "utf-8-sig"
+
+    def test_main_writes_selected_output_format(self, sample_csv_files, input_dir, output_dir):
+        """--formatで指定した形式で出力する（pyarrowがない場合はエラーで終了）"""
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir),
+             "--format", "feather"],
+            capture_output=True,
+            text=True
+        )
+
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            assert result.returncode == 1
+            assert "pyarrow" in result.stderr
+            assert list(output_dir.iterdir()) == []
+            return
+
+        import pandas as pd
+        assert result.returncode == 0
+        output_files = list(output_dir.glob("merged_*.feather"))
+        assert len(output_files) == 1
+        assert f"出力: {output_files[0]}" in result.stdout
+        df = pd.read_feather(output_files[0])
+        assert len(df) == 48
+        assert str(df["電圧"].dtype) == "int16"
+
+    def test_main_reads_and_writes_gzip(self, sample_csv_files, input_dir, output_dir):
+        """.csv.gz の入力も対象とし、--compress gzipで圧縮して出力する"""
+        import gzip
+        compressed = input_dir / "file2.csv.gz"
+        compressed.write_bytes(gzip.compress(sample_csv_files[1].read_bytes()))
+        sample_csv_files[1].unlink()
+
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir),
+             "--compress", "gzip"],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 0
+        assert "file2.csv.gz" in result.stderr  # 入力ファイル一覧のログ
+        output_files = list(output_dir.glob("merged_*.csv.gz"))
+        assert len(output_files) == 1
+        lines = gzip.decompress(output_files[0].read_bytes()).decode("utf-8").strip().split("\n")
+        assert len(lines) == 49
+        assert lines[-1].startswith("48,2025/01/02 23:00:00")
+
+    def test_main_prints_stats_json(self, sample_csv_files, input_dir, output_dir):
+        """--stats json でフェーズ別の計測結果を1行のJSONで表示する"""
+        import json
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir),
+             "--stats", "json"],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 0
+        stats_line = next(line for line in result.stdout.splitlines() if line.startswith("{"))
+        stats = json.loads(stats_line)
+        assert list(stats["phases"])[0] == "discovery"
+        assert {"parse", "merge", "write"} <= set(stats["phases"])
+        assert stats["phases"]["parse"]["peak_memory_bytes"] > 0
+        assert len(stats["slowest_files"]) == 2
+
+    def test_main_writes_profile_reports(self, sample_csv_files, input_dir, output_dir, tmp_path):
+        """--profile / --profile-memory でCPU・メモリのプロファイルをファイルに書き出す"""
+        cpu_report = tmp_path / "profile.txt"
+        memory_report = tmp_path / "memory.txt"
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir),
+             "--jobs", "2", "--profile", str(cpu_report), "--profile-memory", str(memory_report)],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 0
+        assert f"CPUプロファイル: {cpu_report}" in result.stdout
+        assert "(load_many)" in cpu_report.read_text(encoding="utf-8")
+        memory_text = memory_report.read_text(encoding="utf-8")
+        assert "=== discovery" in memory_text and "=== load" in memory_text
+
+    def test_main_writes_trace_events(self, sample_csv_files, input_dir, output_dir, tmp_path):
+        """--trace で各処理のスパンを trace event 形式のJSONに書き出す"""
+        import json
+        trace_path = tmp_path / "trace.json"
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir),
+             "--trace", str(trace_path), "--compress", "gzip"],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 0
+        events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+        loads = [event for event in events if event["name"] == "load_group"]
+        assert loads and loads[0]["args"]["files"] == 2 and loads[0]["args"]["rows"] == 48
+        assert any(event["name"] == "compress_block" for event in events)
+
+    def test_main_check_reports_mergeable_directory(self, sample_csv_files, input_dir, tmp_path):
+        """--check は結合せずに確認結果を表示し、出力ディレクトリも作らない"""
+        output_dir = tmp_path / "not_created"
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir), "--check"],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 0
+        assert "事前チェック: 2ファイル、48行（2025/01/01〜2025/01/02）" in result.stdout
+        assert "結果: 結合できます" in result.stdout
+        assert not output_dir.exists()
+
+    def test_main_check_reports_missing_day(self, sample_csv_files, input_dir, output_dir):
+        """--check は欠損日を報告し、終了コード1で終了する"""
+        sample_csv_files[1].write_text(
+            sample_csv_files[1].read_text(encoding="utf-8").replace("2025/01/02", "2025/01/04"),
+            encoding="utf-8"
+        )
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir), "--check"],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 1
+        assert "欠損日: 2日" in result.stdout
+        assert "2025/01/03" in result.stdout
+        assert "結果: 結合できません" in result.stdout
+
+    def test_main_collect_errors_reports_every_failed_file(self, sample_csv_files, input_dir, output_dir):
+        """--collect-errors は失敗したすべてのファイルを1回の実行で表示する"""
+        sample_csv_files[0].write_text("", encoding="utf-8")
+        sample_csv_files[1].write_text("No,日時,電圧\n1,2025/01/02 00:00:00,100\n", encoding="utf-8")
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir),
+             "--collect-errors"],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 1
+        assert "エラー: 2件のファイルでエラーが発生しました:" in result.stderr
+        assert "file1.csv: CSVフォーマットが不正です: CSVファイルの読み込みに失敗しました" in result.stderr
+        assert "file2.csv: CSVフォーマットが不正です: 必須カラムが不足しています" in result.stderr
+
     def test_main_failure_with_nonexistent_input_directory(self, output_dir):
         """存在しない入力ディレクトリを指定すると失敗する"""
         nonexistent_dir = Path("nonexistent_directory")
@@ -141,8 +360,45 @@ class TestMainCLI:
         # ヘルプメッセージが含まれることを確認
         assert "--input" in result.stdout
         assert "--output" in result.stdout
+        assert "--jobs" in result.stdout
         assert "usage" in result.stdout.lower() or "使用方法" in result.stdout
 
+    def test_main_rejects_negative_jobs(self, input_dir, output_dir):
+        """--jobsに負の値を指定すると引数エラーになる（0のみCPUコア数）"""
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir), "--jobs", "-3"],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 2
+        assert "0以上の整数を指定してください: -3" in result.stderr
+
+    def test_main_rejects_negative_cache_max_mb(self, input_dir, output_dir):
+        """--cache-max-mbに負の値を指定すると引数エラーになる"""
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir),
+             "--cache-dir", str(output_dir / "cache"), "--cache-max-mb", "-1"],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 2
+        assert "0以上の整数を指定してください: -1" in result.stderr
+
+    @pytest.mark.parametrize("rows", ["0", "-5"])
+    def test_main_rejects_non_positive_row_group_rows(self, input_dir, output_dir, rows):
+        """--row-group-rowsに1未満の値を指定すると引数エラーになる"""
+        result = subprocess.run(
+            [sys.executable, "main.py", "--input", str(input_dir), "--output", str(output_dir),
+             "--row-group-rows", rows],
+            capture_output=True,
+            text=True
+        )
+
+        assert result.returncode == 2
+        assert f"1以上の整数を指定してください: {rows}" in result.stderr
+
     def test_main_handles_invalid_csv_format(self, tmp_path, output_dir):
         """不正なCSVフォーマットの場合、適切なエラーメッセージを表示する"""
         input_dir = tmp_path / "invalid_input"
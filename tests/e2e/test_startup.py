@@ -0,0 +1,89 @@
+"""main.pyの起動時間のテスト
+
+このモジュールは、-X importtime の出力からCLIの起動時にインポートされる
+モジュールと所要時間を調べ、ヘルプ表示や引数・入力の誤りが pandas を
+インポートせずに素早く返ることを確認します。
+"""
+from pathlib import Path
+import subprocess
+import sys
+import pytest
+
+
+# main.py のインポートにかける時間の上限（マイクロ秒）。pandas を読み込むと 200ms 前後かかる
+IMPORT_BUDGET_US = 150_000
+
+# 起動時にインポートしてはならない重いモジュール
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow")
+
+# main.py のあるディレクトリ
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _run_with_importtime(*args: str) -> tuple[subprocess.CompletedProcess, dict[str, int]]:
+    """-X importtime 付きで実行し、モジュール名ごとの累積インポート時間（µs）を返す"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, total, name = line.split("|")
+        cumulative[name.strip()] = int(total.strip())
+    return result, cumulative
+
+
+def _heavy_imports(modules: dict[str, int]) -> list[str]:
+    return [name for name in modules if name.split(".")[0] in HEAVY_MODULES]
+
+
+class TestCliStartup:
+    """CLIの起動時間のテスト"""
+
+    def test_import_main_is_within_budget(self):
+        """main.py のインポートは pandas を読み込まず、時間の上限内に収まる"""
+        result, modules = _run_with_importtime("-c", "import main")
+
+        assert result.returncode == 0
+        assert _heavy_imports(modules) == []
+        assert modules["main"] < IMPORT_BUDGET_US
+
+    def test_help_does_not_import_pandas(self):
+        """ヘルプの表示では pandas をインポートしない"""
+        result, modules = _run_with_importtime("main.py", "--help")
+
+        assert result.returncode == 0
+        assert "--input" in result.stdout
+        assert _heavy_imports(modules) == []
+
+    @pytest.mark.parametrize("arguments", [
+        ["--jobs", "abc"],
+        ["--format", "xlsx"],
+        ["--input", "nonexistent_directory"],
+    ])
+    def test_argument_and_input_errors_do_not_import_pandas(self, arguments, tmp_path):
+        """引数の誤りや入力ディレクトリの誤りは pandas をインポートせずに返る"""
+        result, modules = _run_with_importtime(
+            "main.py", *arguments, "--output", str(tmp_path / "output")
+        )
+
+        assert result.returncode != 0
+        assert _heavy_imports(modules) == []
+
+    def test_check_does_not_import_pandas(self, tmp_path):
+        """--check は pandas をインポートせずに入力ファイルを確認する"""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        lines = ["No,日時,電圧,周波数,パワー,工事フラグ,参照"]
+        lines += [f"{hour + 1},2025/01/01 {hour:02d}:00:00,100,50,1000,0,0" for hour in range(24)]
+        (input_dir / "day.csv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        result, modules = _run_with_importtime("main.py", "--input", str(input_dir), "--check")
+
+        assert result.returncode == 0
+        assert "結合できます" in result.stdout
+        assert _heavy_imports(modules) == []
@@ -0,0 +1,69 @@
+"""ベンチマーク用データ生成のテスト"""
+from datetime import date
+
+import pytest
+
+from benchmarks.data_generator import ENCODINGS, LAYOUTS, generate_dataset
+from benchmarks.run_benchmarks import compare_with_baseline
+from domain.services.csv_merger import CsvMerger
+from infra.repositories.csv_repository import CsvRepository
+
+
+class TestGenerateDataset:
+    """generate_dataset()のテスト"""
+
+    @pytest.mark.parametrize("encoding", ENCODINGS)
+    @pytest.mark.parametrize("layout", list(LAYOUTS))
+    def test_every_layout_and_encoding_is_accepted(self, tmp_path, layout, encoding):
+        """すべてのレイアウト・文字コードが CsvRepository で読み込め、値は同じになる"""
+        reference = generate_dataset(tmp_path / "full", 1, layout="full", encoding="utf-8")
+        dataset = generate_dataset(tmp_path / "out", 1, layout=layout, encoding=encoding)
+
+        expected = CsvRepository().load(reference.files[0]).data
+        result = CsvRepository().load(dataset.files[0]).data
+
+        assert len(result) == 24
+        value_columns = ["日時", "電圧", "周波数", "パワー", "工事フラグ"]
+        assert result[value_columns].equals(expected[value_columns])
+
+    def test_mixed_dataset_merges(self, tmp_path):
+        """レイアウト・文字コードが混在したデータセットを結合できる"""
+        dataset = generate_dataset(tmp_path, 40, start=date(2024, 2, 20), compression="gzip", seed=3)
+
+        merged = CsvMerger().merge(CsvRepository().load_many(dataset.files))
+
+        assert len(merged.data) == dataset.rows == 40 * 24
+        assert all(path.name.endswith(".csv.gz") for path in dataset.files)
+
+    def test_same_seed_generates_same_files(self, tmp_path):
+        """同じシードからは同じファイルが生成される"""
+        first = generate_dataset(tmp_path / "a", 5, seed=7)
+        second = generate_dataset(tmp_path / "b", 5, seed=7)
+
+        assert [p.read_bytes() for p in first.files] == [p.read_bytes() for p in second.files]
+
+    def test_rejects_dates_outside_valid_years(self, tmp_path):
+        """妥当な年の範囲を超える場合はValueError"""
+        with pytest.raises(ValueError, match="妥当な範囲"):
+            generate_dataset(tmp_path, 10, start=date(2100, 12, 25))
+
+
+class TestCompareWithBaseline:
+    """compare_with_baseline()のテスト"""
+
+    @staticmethod
+    def _result(load: float, merge: float, save: float) -> dict:
+        return {"results": {"1y": {"phases": {
+            "load": {"seconds": load}, "merge": {"seconds": merge}, "save": {"seconds": save},
+        }}}}
+
+    def test_reports_phases_slower_than_tolerance(self):
+        """許容幅を超えて遅くなったフェーズのみを返す"""
+        baseline = self._result(1.0, 1.0, 1.0)
+        result = self._result(1.2, 1.3, 0.5)
+
+        assert compare_with_baseline(result, baseline, tolerance=0.25) == ["1y/merge"]
+
+    def test_ignores_scales_missing_in_baseline(self):
+        """ベースラインにない規模は比較しない"""
+        assert compare_with_baseline(self._result(9, 9, 9), {"results": {}}) == []
@@ -3,7 +3,7 @@ import pytest
 import pandas as pd
 from pathlib import Path
 from domain.models.csv_file import CsvFile
-from domain.exceptions import InvalidCsvFormatError, EmptyDataError
+from domain.exceptions import InvalidCsvFormatError, EmptyDataError, StorageDtypeWarning
 
 
 # テスト用の有効なカラム名
@@ -315,3 +315,100 @@ class TestCsvFile:
         
         assert "1日分のデータ（00時〜23時）" in str(exc_info.value)
 
+
+    def test_csv_file_keeps_integer_columns_in_storage_dtypes(self):
+        """整数カラムは格納型に縮小され、1行あたり22バイトで保持される"""
+        # Arrange
+        datetime_list = [f"2025/10/18 {hour:02d}:00:00" for hour in range(24)]
+        data = pd.DataFrame({
+            "日時": datetime_list,
+            "No": list(range(1, 25)),
+            "電圧": [100] * 24,
+            "周波数": [50] * 24,
+            "パワー": [1000] * 24,
+            "工事フラグ": [0] * 24,
+            "参照": [1] * 24,
+        })
+        
+        # Act
+        csv_file = CsvFile(file_path=Path("compact.csv"), data=data)
+        
+        # Assert
+        assert {column: str(dtype) for column, dtype in csv_file.data.dtypes.items()} == {
+            "日時": "datetime64[ns]",
+            "No": "int32",
+            "電圧": "int16",
+            "周波数": "int16",
+            "パワー": "int32",
+            "工事フラグ": "int8",
+            "参照": "int8",
+        }
+        assert csv_file.bytes_per_row == 22
+        assert data["電圧"].dtype == "int64"  # 呼び出し元のDataFrameは変更しない
+
+    def test_csv_file_reports_columns_kept_in_original_dtype(self):
+        """格納型に収まらないカラムは警告され、storage_fallbacks で確認できる"""
+        # Arrange: 電圧が int16 の範囲を超える
+        datetime_list = [f"2025/10/18 {hour:02d}:00:00" for hour in range(24)]
+        data = pd.DataFrame({
+            "日時": datetime_list,
+            "No": list(range(1, 25)),
+            "電圧": [100] * 23 + [40000],
+            "周波数": [50] * 24,
+            "パワー": [1000] * 24,
+            "工事フラグ": [0] * 24,
+            "参照": [1] * 24,
+        })
+        
+        # Act
+        with pytest.warns(StorageDtypeWarning, match="電圧"):
+            csv_file = CsvFile(file_path=Path("wide.csv"), data=data)
+        
+        # Assert: 電圧だけ int64 のまま（8 - 2 バイト大きい）
+        assert csv_file.data["電圧"].dtype == "int64"
+        assert csv_file.storage_fallbacks == {"電圧": (100, 40000)}
+        assert csv_file.bytes_per_row == 28
+
+    def test_csv_file_summarizes_timestamps_once(self):
+        """日時カラムの要約（日番号・最小/最大の日時・並び順・行数）を生成時に求める"""
+        # Arrange: 逆順に並んだ1日分のデータ
+        datetime_list = [f"2025/10/18 {hour:02d}:00:00" for hour in reversed(range(24))]
+        data = pd.DataFrame({
+            "No": list(range(1, 25)),
+            "日時": datetime_list,
+            "電圧": [100] * 24,
+            "周波数": [50] * 24,
+            "パワー": [1000] * 24,
+            "工事フラグ": [0] * 24,
+            "参照": [1] * 24,
+        })
+        
+        # Act
+        csv_file = CsvFile(file_path=Path("reversed.csv"), data=data)
+        
+        # Assert
+        summary = csv_file.summary
+        assert (summary.rows, summary.is_sorted) == (24, False)
+        assert summary.day == (pd.Timestamp("2025-10-18") - pd.Timestamp("1970-01-01")).days
+        assert summary.first_stamp == pd.Timestamp("2025-10-18 00:00:00").value
+        assert summary.last_stamp == pd.Timestamp("2025-10-18 23:00:00").value
+
+    def test_csv_file_without_parsed_timestamps_has_no_summary(self):
+        """日時をdatetime64型に変換できない場合は要約なし"""
+        # Arrange
+        data = pd.DataFrame({
+            "No": [1],
+            "日時": ["invalid"],
+            "電圧": [100],
+            "周波数": [50],
+            "パワー": [1000],
+            "工事フラグ": [0],
+            "参照": [1],
+        })
+        
+        # Act
+        csv_file = CsvFile(file_path=Path("invalid.csv"), data=data, skip_daily_validation=True)
+        
+        # Assert
+        assert csv_file.summary is None
+
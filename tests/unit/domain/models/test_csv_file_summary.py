@@ -0,0 +1,70 @@
+"""CsvFileSummary モデルのテスト"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from domain.models.csv_file_summary import CsvFileSummary
+
+
+def stamps_of(*values: str) -> np.ndarray:
+    """日時の文字列から datetime64[ns] の配列を作成"""
+    return pd.to_datetime(list(values)).to_numpy(dtype="datetime64[ns]")
+
+
+def day_number(day: date) -> int:
+    """1970-01-01からの日数"""
+    return (day - date(1970, 1, 1)).days
+
+
+class TestCsvFileSummary:
+    """CsvFileSummaryモデルのテスト"""
+
+    def test_sorted_single_day(self):
+        """ソート済みの1日分の日時の要約"""
+        stamps = stamps_of("2025-10-18 00:00:00", "2025-10-18 01:00:00", "2025-10-18 23:00:00")
+
+        summary = CsvFileSummary.of(stamps)
+
+        assert summary == CsvFileSummary(
+            rows=3,
+            first_stamp=int(pd.Timestamp("2025-10-18 00:00:00").value),
+            last_stamp=int(pd.Timestamp("2025-10-18 23:00:00").value),
+            is_sorted=True,
+            day=day_number(date(2025, 10, 18)),
+        )
+
+    def test_unsorted_or_duplicated(self):
+        """並び順が崩れている・重複がある場合は is_sorted がFalseで、最小・最大の日時を返す"""
+        unsorted = CsvFileSummary.of(stamps_of("2025-10-18 05:00:00", "2025-10-18 01:00:00"))
+        duplicated = CsvFileSummary.of(stamps_of("2025-10-18 01:00:00", "2025-10-18 01:00:00"))
+
+        assert not unsorted.is_sorted
+        assert unsorted.first_stamp == pd.Timestamp("2025-10-18 01:00:00").value
+        assert unsorted.last_stamp == pd.Timestamp("2025-10-18 05:00:00").value
+        assert not duplicated.is_sorted
+
+    def test_multiple_days(self):
+        """複数日にまたがる場合は日番号なし"""
+        summary = CsvFileSummary.of(stamps_of("2025-10-18 23:00:00", "2025-10-19 00:00:00"))
+
+        assert summary.day is None
+        assert summary.is_sorted
+
+    def test_day_before_epoch(self):
+        """1970年より前の日付も日単位で切り捨てた日番号になる"""
+        summary = CsvFileSummary.of(stamps_of("1969-12-31 00:00:00", "1969-12-31 23:00:00"))
+
+        assert summary.day == -1
+
+    def test_empty_or_nat(self):
+        """空の場合・欠損値を含む場合はNone"""
+        assert CsvFileSummary.of(np.array([], dtype="datetime64[ns]")) is None
+        assert CsvFileSummary.of(np.array(["2025-10-18", "NaT"], dtype="datetime64[ns]")) is None
+
+    def test_day_start(self):
+        """日番号の日の0時の日時"""
+        day = day_number(date(2025, 10, 18))
+
+        assert CsvFileSummary.day_start(day) == pd.Timestamp("2025-10-18 00:00:00").value
+        assert CsvFileSummary._fields == ("rows", "first_stamp", "last_stamp", "is_sorted", "day")
@@ -1,7 +1,8 @@
 """CSVスキーマのテスト"""
+import pandas as pd
 import pytest
 from domain.models.csv_schema import CsvSchema
-from domain.exceptions import InvalidCsvFormatError
+from domain.exceptions import InvalidCsvFormatError, StorageDtypeWarning
 
 
 class TestCsvSchema:
@@ -268,3 +269,124 @@ class TestCsvSchema:
         
         assert result is False
 
+
+    def test_parse_datetime_series_accepts_mixed_formats(self):
+        """フォーマットが混在する日時カラムを一括で変換できる"""
+        values = pd.Series([
+            "2025/10/18 00:00:00",
+            "2025-10-18 01:00:00",   # ISO 8601形式
+            "2025-10-18T02:00:00",   # T区切り
+            "invalid",
+        ])
+        
+        parsed = CsvSchema.parse_datetime_series(values)
+        
+        assert str(parsed.dtype) == "datetime64[ns]"
+        assert parsed.iloc[0] == pd.Timestamp("2025-10-18 00:00:00")
+        assert parsed.iloc[1] == pd.Timestamp("2025-10-18 01:00:00")
+        assert parsed.iloc[2] == pd.Timestamp("2025-10-18 02:00:00")
+        assert pd.isna(parsed.iloc[3])
+
+    def test_invalid_datetime_mask_matches_scalar_validation(self):
+        """ベクトル化した不正日時マスクが validate_datetime_value と一致する"""
+        values = [
+            "2025/10/18 10:00:00",
+            "0002/10/12 00:00:00",  # 異常に古い年
+            "9999/12/31 23:00:00",  # 異常に新しい年
+            "2023/02/29 10:00:00",  # 平年の2月29日
+            "2025/13/01 10:00:00",  # 13月
+            "2025/04/31 10:00:00",  # 4月31日（存在しない）
+            "1899/12/31 23:00:00",  # 範囲外（1900年未満）
+            "2100/12/31 23:00:00",  # 範囲内（上限）
+            "2025-10-18 11:00:00",  # ISO 8601形式
+        ]
+        
+        mask = CsvSchema.invalid_datetime_mask(
+            CsvSchema.parse_datetime_series(pd.Series(values))
+        )
+        
+        expected = [not CsvSchema.validate_datetime_value(v) for v in values]
+        assert mask.tolist() == expected
+
+    def test_invalid_datetime_mask_treats_missing_values_as_invalid(self):
+        """欠損値（NaN）は不正な日時として扱う"""
+        values = pd.Series(["2025/10/18 00:00:00", None])
+        
+        mask = CsvSchema.invalid_datetime_mask(CsvSchema.parse_datetime_series(values))
+        
+        assert mask.tolist() == [False, True]
+
+    def test_validate_daily_time_series_with_datetime64_column(self):
+        """変換済みのdatetime64カラムをそのまま検証できる"""
+        values = pd.Series(pd.date_range("2025-10-18 00:00:00", periods=24, freq="h"))
+        
+        assert CsvSchema.validate_daily_time_series(values) is True
+
+    def test_validate_daily_time_series_detects_duplicate_hour(self):
+        """24レコードでも時刻が重複している場合を検出できる"""
+        hours = list(range(23)) + [22]  # 23時が欠け、22時が重複
+        values = pd.Series([f"2025/10/18 {hour:02d}:00:00" for hour in hours])
+        
+        assert CsvSchema.validate_daily_time_series(values) is False
+
+    def test_validate_daily_time_series_detects_other_date(self):
+        """24レコードに異なる日付が混在する場合を検出できる"""
+        values = pd.Series(
+            [f"2025/10/18 {hour:02d}:00:00" for hour in range(23)] + ["2025/10/19 23:00:00"]
+        )
+        
+        assert CsvSchema.validate_daily_time_series(values) is False
+
+    def test_validate_daily_time_series_detects_unparseable_value(self):
+        """解釈できない日時を含む場合を検出できる"""
+        values = pd.Series(
+            [f"2025/10/18 {hour:02d}:00:00" for hour in range(23)] + ["invalid"]
+        )
+        
+        assert CsvSchema.validate_daily_time_series(values) is False
+
+    def test_to_storage_dtypes_downcasts_integer_columns(self):
+        """範囲に収まる整数カラムは格納型に縮小される"""
+        df = pd.DataFrame({"No": [1, 2], "電圧": [100, 6600], "工事フラグ": [0, 1], "備考": [1, 2]})
+        
+        result = CsvSchema.to_storage_dtypes(df)
+        
+        assert result["No"].dtype == "int32"
+        assert result["電圧"].dtype == "int16"
+        assert result["工事フラグ"].dtype == "int8"
+        assert result["備考"].dtype == "int64"  # スキーマ外のカラムはそのまま
+        assert result["電圧"].tolist() == [100, 6600]
+
+    def test_to_storage_dtypes_keeps_dtype_when_values_do_not_fit(self):
+        """格納型の範囲に収まらない値を含むカラムは元の型のまま残る（値は失われない）"""
+        df = pd.DataFrame({"電圧": [100, 40000], "参照": [0, 300], "周波数": [50.0, 50.5]})
+        
+        with pytest.warns(StorageDtypeWarning):
+            result = CsvSchema.to_storage_dtypes(df)
+        
+        assert result["電圧"].dtype == "int64"
+        assert result["電圧"].tolist() == [100, 40000]
+        assert result["参照"].dtype == "int64"
+        assert result["周波数"].dtype == "float64"  # 整数型でないカラムは変換しない
+
+    def test_to_storage_dtypes_warns_column_and_range_when_values_do_not_fit(self):
+        """格納型に収まらないカラムはカラム名と値の範囲を警告する"""
+        df = pd.DataFrame({"電圧": [-5, 40000], "No": [1, 2]})
+        
+        with pytest.warns(StorageDtypeWarning, match="電圧: 値の範囲（-5〜40000）が格納型 int16") as record:
+            CsvSchema.to_storage_dtypes(df)
+        
+        assert len(record) == 1  # 収まるカラムは警告しない
+
+    def test_storage_fallbacks_reports_columns_kept_in_original_dtype(self):
+        """格納型に収まらない整数カラムと値の範囲を返す"""
+        df = pd.DataFrame({"電圧": [100, 40000], "参照": [0, 1], "周波数": [50.0, 50.5]})
+        
+        assert CsvSchema.storage_fallbacks(df) == {"電圧": (100, 40000)}
+        assert CsvSchema.storage_fallbacks(pd.DataFrame({"電圧": [100, 6600]})) == {}
+
+    def test_to_storage_dtypes_returns_same_frame_when_already_compact(self):
+        """すでに格納型の場合は元のDataFrameをそのまま返す"""
+        df = pd.DataFrame({"No": pd.Series([1, 2], dtype="int32")})
+        
+        assert CsvSchema.to_storage_dtypes(df) is df
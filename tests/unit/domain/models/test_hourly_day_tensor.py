@@ -0,0 +1,129 @@
+"""HourlyDayTensor モデルのテスト"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from domain.exceptions import MergeError
+from domain.models.csv_file import CsvFile
+from domain.models.hourly_day_tensor import HourlyDayTensor
+from domain.services.csv_merger import CsvMerger
+
+
+def day_file(day: str, voltage: int = 100, hours: list[int] | None = None, minute: int = 0) -> CsvFile:
+    """1日分のCsvFileを作成（hours の順に行を並べる）"""
+    hours = list(range(24)) if hours is None else hours
+    data = pd.DataFrame({
+        "No": list(range(1, 25)),
+        "日時": [f"{day} {hour:02d}:{minute:02d}:00" for hour in hours],
+        "電圧": [voltage + hour for hour in hours],
+        "周波数": [50] * 24,
+        "パワー": [1000 * hour for hour in hours],
+        "工事フラグ": [0] * 24,
+        "参照": [1] * 24,
+    })
+    return CsvFile(file_path=f"{day.replace('/', '')}.csv", data=data)
+
+
+class TestHourlyDayTensor:
+    """HourlyDayTensorモデルのテスト"""
+
+    def test_to_frame_matches_merger(self):
+        """結合結果は CsvMerger.merge() と同じ値・日時・No列になる"""
+        files = [
+            day_file("2025/10/20", 120),
+            day_file("2025/10/18", 100, hours=list(reversed(range(24)))),  # ファイル内の順序は問わない
+            day_file("2025/10/19", 110),
+        ]
+
+        frame = HourlyDayTensor.from_csv_files(files).to_frame()
+        merged = CsvMerger().merge(files).data
+
+        assert list(frame.columns) == list(merged.columns)
+        for column in merged.columns:
+            assert frame[column].tolist() == merged[column].tolist(), column
+
+    def test_to_frame_does_not_copy_values(self):
+        """値のカラムは格納している配列のビュー"""
+        tensor = HourlyDayTensor.from_csv_files([day_file("2025/10/18"), day_file("2025/10/19")])
+
+        frame = tensor.to_frame()
+
+        for column in HourlyDayTensor.VALUE_COLUMNS:
+            assert np.shares_memory(frame[column].to_numpy(), tensor.values)
+
+    def test_add_in_any_order(self):
+        """前後どちらの日付を追加しても、最小日〜最大日の位置に格納する"""
+        tensor = HourlyDayTensor()
+        for day in ("2025/10/20", "2025/10/18", "2025/10/22", "2025/10/19", "2025/10/21"):
+            tensor.add(day_file(day))
+
+        assert tensor.day_count == 5
+        assert (tensor.first_day, tensor.last_day) == (date(2025, 10, 18), date(2025, 10, 22))
+        assert tensor.values.shape == (5, 24, len(HourlyDayTensor.VALUE_COLUMNS))
+        assert tensor.is_continuous
+
+    def test_duplicate_and_missing_days(self):
+        """重複日・欠損日を位置から求め、DayContinuity と同じ MergeError を送出する"""
+        tensor = HourlyDayTensor.from_csv_files([
+            day_file("2025/10/18", 100),
+            day_file("2025/10/18", 200),
+            day_file("2025/10/21"),
+        ])
+
+        assert tensor.duplicate_days == [date(2025, 10, 18)]
+        assert tensor.missing_days == [date(2025, 10, 19), date(2025, 10, 20)]
+        assert tensor.values[0, 0, 0] == 100  # 最初に追加したデータを保持
+        with pytest.raises(MergeError, match="重複日"):
+            tensor.to_frame()
+
+    def test_missing_days_only(self):
+        """欠損日のみの場合は欠損日のエラー"""
+        tensor = HourlyDayTensor.from_csv_files([day_file("2025/10/18"), day_file("2025/10/20")])
+
+        with pytest.raises(MergeError, match="欠損日"):
+            tensor.validate()
+
+    def test_keeps_offsets_within_hour(self):
+        """毎正時でない日時はオフセットとして保持する"""
+        tensor = HourlyDayTensor.from_csv_files([day_file("2025/10/18")])
+        assert tensor.offsets is None
+
+        tensor.add(day_file("2025/10/19", minute=30))
+
+        stamps = tensor.to_frame()["日時"]
+        assert stamps.iloc[0] == pd.Timestamp("2025-10-18 00:00:00")
+        assert stamps.iloc[24] == pd.Timestamp("2025-10-19 00:30:00")
+
+    def test_rejects_non_daily_file(self):
+        """1日分でないファイルは追加しない"""
+        data = day_file("2025/10/18").data.copy()
+        data.loc[23, "日時"] = pd.Timestamp("2025-10-19 00:00:00")
+        tensor = HourlyDayTensor()
+
+        with pytest.raises(MergeError, match="1日分"):
+            tensor.add(CsvFile("bad.csv", data, skip_daily_validation=True))
+        assert tensor.day_count == 0
+
+    def test_from_arrays_copies_on_write(self):
+        """読み取り専用の配列は、日付を追加した時点でコピーする"""
+        source = HourlyDayTensor.from_csv_files([day_file("2025/10/18"), day_file("2025/10/19")])
+        values = source.values.copy()
+        values.setflags(write=False)
+        present = source.present.copy()
+        present.setflags(write=False)
+
+        tensor = HourlyDayTensor.from_arrays(date(2025, 10, 18), values, None, present)
+        tensor.add(day_file("2025/10/20"))
+
+        assert tensor.day_count == 3
+        assert tensor.is_continuous
+        assert not values.flags.writeable
+
+    def test_from_arrays_rejects_wrong_shape(self):
+        """配列の形が合わない場合は ValueError"""
+        with pytest.raises(ValueError):
+            HourlyDayTensor.from_arrays(
+                date(2025, 10, 18), np.zeros((2, 24, 3), dtype=np.int32), None, np.ones(2, dtype=bool)
+            )
@@ -0,0 +1,99 @@
+"""LazyCsvFile / CsvFileMetadata モデルのテスト"""
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from domain.exceptions import MergeError
+from domain.models.csv_file import CsvFile
+from domain.models.csv_file_metadata import CsvFileMetadata
+from domain.models.lazy_csv_file import LazyCsvFile
+
+
+def day_file(day: str) -> CsvFile:
+    """1日分のCsvFileを作成"""
+    data = pd.DataFrame({
+        "No": list(range(1, 25)),
+        "日時": [f"{day} {hour:02d}:00:00" for hour in range(24)],
+        "電圧": [100] * 24,
+        "周波数": [50] * 24,
+        "パワー": [1000] * 24,
+        "工事フラグ": [0] * 24,
+        "参照": [1] * 24,
+    })
+    return CsvFile(file_path=f"{day.replace('/', '')}.csv", data=data)
+
+
+def metadata_of(day: date, path: str = "20251018.csv") -> CsvFileMetadata:
+    """メタデータを作成"""
+    return CsvFileMetadata(
+        Path(path), CsvFileMetadata.day_number(day), 24, "utf-8", False,
+        CsvFileMetadata.fingerprint_of(1024, 1_760_000_000_000_000_000)
+    )
+
+
+class TestCsvFileMetadata:
+    """CsvFileMetadataモデルのテスト"""
+
+    def test_day_number(self):
+        """日付は1970-01-01からの日数で保持する"""
+        metadata = metadata_of(date(2025, 10, 18))
+
+        assert metadata.day == (date(2025, 10, 18) - date(1970, 1, 1)).days
+        assert metadata.date == date(2025, 10, 18)
+
+    def test_fingerprint_changes_with_size_or_mtime(self):
+        """サイズ・更新日時のどちらかが変われば同一性の値が変わる"""
+        base = CsvFileMetadata.fingerprint_of(1024, 10)
+
+        assert CsvFileMetadata.fingerprint_of(1024, 10) == base
+        assert CsvFileMetadata.fingerprint_of(1025, 10) != base
+        assert CsvFileMetadata.fingerprint_of(1024, 11) != base
+
+    def test_is_slotted(self):
+        """属性を __slots__ で固定し、インスタンス辞書を持たない"""
+        metadata = metadata_of(date(2025, 10, 18))
+
+        assert not hasattr(metadata, "__dict__")
+        with pytest.raises(AttributeError):
+            metadata.extra = 1
+
+
+class TestLazyCsvFile:
+    """LazyCsvFileモデルのテスト"""
+
+    def test_metadata_without_loading(self):
+        """日付・行数・ファイル名はデータを読み込まずに返す"""
+        loaded = []
+        lazy = LazyCsvFile(metadata_of(date(2025, 10, 18)), lambda metadata: loaded.append(metadata))
+
+        assert (lazy.file_name, lazy.row_count, lazy.day) == (
+            "20251018.csv", 24, CsvFileMetadata.day_number(date(2025, 10, 18))
+        )
+        assert loaded == []
+
+    def test_loads_each_time_without_keeping_data(self):
+        """load() のたびに読み込み、読み込んだCsvFileは保持しない"""
+        loaded = []
+
+        def loader(metadata):
+            loaded.append(metadata.path.name)
+            return day_file("2025/10/18")
+
+        lazy = LazyCsvFile(metadata_of(date(2025, 10, 18)), loader)
+
+        first = lazy.load()
+        second = lazy.data
+
+        assert first.row_count == 24
+        assert len(second) == 24
+        assert loaded == ["20251018.csv", "20251018.csv"]
+        assert not hasattr(lazy, "__dict__")
+
+    def test_rejects_day_changed_after_scan(self):
+        """読み込んだデータの日付が走査時と異なる場合は MergeError"""
+        lazy = LazyCsvFile(metadata_of(date(2025, 10, 18)), lambda metadata: day_file("2025/10/19"))
+
+        with pytest.raises(MergeError, match="走査時の日付"):
+            lazy.load()
@@ -204,3 +204,23 @@ class TestMergeResult:
         assert result_with_path.output_file_name == "output.csv"
         assert result_without_path.output_file_name is None
 
+
+    def test_merge_result_with_stats(self):
+        """with_stats()は計測結果を付けた複製を返す"""
+        # Arrange
+        from domain.models.merge_stats import MergeStats
+        result = MergeResult.create_success(
+            output_path=Path("output.csv"),
+            merged_file_count=2,
+            total_rows=48
+        )
+        stats = MergeStats({}, [], total_wall_seconds=1.0, total_cpu_seconds=0.5)
+        
+        # Act
+        with_stats = result.with_stats(stats)
+        
+        # Assert
+        assert result.stats is None
+        assert with_stats.stats is stats
+        assert with_stats.output_path == result.output_path
+        assert with_stats.message == result.message
@@ -0,0 +1,39 @@
+"""MergeStats model のテスト"""
+from pathlib import Path
+
+from domain.models.merge_stats import FileTiming, MergeStats, PhaseStats
+
+
+class TestMergeStats:
+    """MergeStatsモデルのテスト"""
+
+    def test_phases_are_ordered_by_phase_order(self):
+        """フェーズは処理順（PHASE_ORDER）に並び、未知のフェーズは末尾に並ぶ"""
+        phase = PhaseStats(wall_seconds=0.1, cpu_seconds=0.1, peak_memory_bytes=None, calls=1)
+
+        stats = MergeStats(
+            {"write": phase, "custom": phase, "discovery": phase, "parse": phase},
+            slowest_files=[],
+            total_wall_seconds=1.0,
+            total_cpu_seconds=0.5,
+        )
+
+        assert list(stats.phases) == ["discovery", "parse", "write", "custom"]
+
+    def test_to_dict(self):
+        """JSON出力用の辞書に変換できる"""
+        stats = MergeStats(
+            {"parse": PhaseStats(0.1234567, 0.1, 2048, 3)},
+            slowest_files=[FileTiming(Path("a.csv"), 0.25)],
+            total_wall_seconds=1.0,
+            total_cpu_seconds=0.5,
+        )
+
+        assert stats.to_dict() == {
+            "total_wall_seconds": 1.0,
+            "total_cpu_seconds": 0.5,
+            "phases": {
+                "parse": {"wall_seconds": 0.123457, "cpu_seconds": 0.1, "peak_memory_bytes": 2048, "calls": 3},
+            },
+            "slowest_files": [{"path": "a.csv", "seconds": 0.25}],
+        }
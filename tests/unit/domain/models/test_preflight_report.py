@@ -0,0 +1,49 @@
+"""PreflightReport model のテスト"""
+from datetime import date
+from pathlib import Path
+
+from domain.models.preflight_report import FileProbe, PreflightReport
+from domain.services.day_continuity import DayContinuity
+
+
+def _report(probes: list[FileProbe]) -> PreflightReport:
+    return PreflightReport(probes, DayContinuity(probe.day for probe in probes if probe.day is not None))
+
+
+class TestPreflightReport:
+    """PreflightReportモデルのテスト"""
+
+    def test_mergeable_when_continuous_without_issues(self):
+        """レイアウトの異常・重複日・欠損日がなければ結合できる"""
+        report = _report([
+            FileProbe(Path("b.csv"), date(2025, 10, 19), 24, False, "utf-8"),
+            FileProbe(Path("a.csv"), date(2025, 10, 18), 24, True, "cp932",
+                      warnings=("データ行数が24行を超えています",)),
+        ])
+
+        assert report.is_mergeable
+        assert report.file_count == 2
+        assert report.total_rows == 48
+        assert (report.first_day, report.last_day) == (date(2025, 10, 18), date(2025, 10, 19))
+        assert [probe.path.name for probe in report.files_with_warnings] == ["a.csv"]
+
+    def test_not_mergeable_with_layout_issue(self):
+        """レイアウトの異常があるファイルがあれば結合できない"""
+        report = _report([
+            FileProbe(Path("a.csv"), date(2025, 10, 18), 24, False, "utf-8"),
+            FileProbe(Path("bad.csv"), None, 3, False, "utf-8", issues=("データ行数が24行未満です（3行）",)),
+        ])
+
+        assert not report.is_mergeable
+        assert [probe.path.name for probe in report.files_with_issues] == ["bad.csv"]
+
+    def test_files_on_duplicate_day(self):
+        """重複日のファイルを取得できる"""
+        report = _report([
+            FileProbe(Path("a.csv"), date(2025, 10, 18), 24, False, "utf-8"),
+            FileProbe(Path("copy.csv"), date(2025, 10, 18), 24, False, "utf-8"),
+        ])
+
+        assert not report.is_mergeable
+        assert report.continuity.duplicate_days == [date(2025, 10, 18)]
+        assert report.files_on(date(2025, 10, 18)) == [Path("a.csv"), Path("copy.csv")]
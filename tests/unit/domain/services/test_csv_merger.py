@@ -5,6 +5,8 @@ from pathlib import Path
 
 from domain.services.csv_merger import CsvMerger
 from domain.models.csv_file import CsvFile
+from domain.models.csv_file_metadata import CsvFileMetadata
+from domain.models.lazy_csv_file import LazyCsvFile
 from domain.exceptions import MergeError
 
 
@@ -99,10 +101,10 @@ class TestCsvMerger:
         # Act
         result = csv_merger.merge(csv_files)
         
-        # Assert
+        # Assert（日時はdatetime64型で保持され、文字列化は書き出し時のみ）
         datetimes = result.data["日時"].tolist()
-        assert datetimes[0] == "2025/10/18 00:00:00"  # 最初
-        assert datetimes[-1] == "2025/10/20 23:00:00"  # 最後
+        assert datetimes[0] == pd.Timestamp("2025-10-18 00:00:00")  # 最初
+        assert datetimes[-1] == pd.Timestamp("2025-10-20 23:00:00")  # 最後
         # ソート確認
         assert datetimes == sorted(datetimes)
 
@@ -174,8 +176,8 @@ class TestCsvMerger:
         # Assert
         assert result.row_count == 24 * 3
         datetimes = result.data["日時"].tolist()
-        assert datetimes[0] == "2025/10/18 00:00:00"
-        assert datetimes[-1] == "2025/10/20 23:00:00"
+        assert datetimes[0] == pd.Timestamp("2025-10-18 00:00:00")
+        assert datetimes[-1] == pd.Timestamp("2025-10-20 23:00:00")
 
     def test_merge_with_empty_list_raises_error(self, csv_merger):
         """空リストを渡すとエラーを発生させる"""
@@ -220,11 +222,207 @@ class TestCsvMerger:
         # Assert
         # 1日目の最初のレコード
         first_row = result.data.iloc[0]
-        assert first_row["日時"] == "2025/10/18 00:00:00"
+        assert first_row["日時"] == pd.Timestamp("2025-10-18 00:00:00")
         assert first_row["電圧"] == 100
         
         # 2日目の最初のレコード（25行目）
         day2_first_row = result.data.iloc[24]
-        assert day2_first_row["日時"] == "2025/10/19 00:00:00"
+        assert day2_first_row["日時"] == pd.Timestamp("2025-10-19 00:00:00")
         assert day2_first_row["電圧"] == 105
 
+
+    def test_merge_keeps_datetime64_column(self, csv_merger, valid_csv_file_day1, valid_csv_file_day2):
+        """結合後の日時カラムはdatetime64型のまま保持される"""
+        # Act
+        result = csv_merger.merge([valid_csv_file_day2, valid_csv_file_day1])
+        
+        # Assert
+        assert pd.api.types.is_datetime64_dtype(result.data["日時"])
+
+    def test_merge_day_ordered_inputs_without_global_sort(
+        self, csv_merger, valid_csv_file_day1, valid_csv_file_day2, valid_csv_file_day3, monkeypatch
+    ):
+        """各ファイルがソート済みなら、日付順に並べて連結するだけで全体のソートは行わない"""
+        # Arrange: 全体のソートが呼ばれたら失敗させる
+        def fail_sort(*args, **kwargs):
+            raise AssertionError("sort_values should not be called")
+        monkeypatch.setattr(pd.DataFrame, "sort_values", fail_sort)
+        
+        # Act
+        result = csv_merger.merge([valid_csv_file_day3, valid_csv_file_day1, valid_csv_file_day2])
+        
+        # Assert
+        datetimes = result.data["日時"].tolist()
+        assert datetimes == sorted(datetimes)
+        assert result.data["電圧"].tolist() == [100] * 24 + [105] * 24 + [110] * 24
+
+    def test_merge_validates_days_from_summary(
+        self, csv_merger, valid_csv_file_day1, valid_csv_file_day2, valid_csv_file_day3, monkeypatch
+    ):
+        """連続日検証・昇順の確認はCsvFileの要約だけで行い、日時カラムを参照しない"""
+        # Arrange: 日時カラムの配列化・連結後の昇順の確認が呼ばれたら失敗させる
+        def fail(*args, **kwargs):
+            raise AssertionError("timestamps should not be scanned")
+        csv_files = [valid_csv_file_day3, valid_csv_file_day1, valid_csv_file_day2]
+        
+        # Act
+        with monkeypatch.context() as patch:
+            patch.setattr(pd.Series, "to_numpy", fail)
+            days = csv_merger._validate_continuous_days(csv_files)
+            with pytest.raises(MergeError, match="重複日"):
+                csv_merger.merge([valid_csv_file_day1, valid_csv_file_day1])
+        monkeypatch.setattr(csv_merger, "_is_strictly_increasing", fail)
+        result = csv_merger.merge(csv_files)
+        
+        # Assert
+        assert (days - days.min()).tolist() == [2, 0, 1]
+        assert result.data["電圧"].tolist() == [100] * 24 + [105] * 24 + [110] * 24
+
+    def test_merge_rejects_multiple_days_file(self, csv_merger, valid_csv_file_day1, valid_csv_file_day2):
+        """1日分の検証をスキップした複数日のファイルは結合しない"""
+        # Arrange
+        two_days = CsvFile(
+            file_path="two_days.csv",
+            data=pd.concat([valid_csv_file_day1.data, valid_csv_file_day2.data]),
+            skip_daily_validation=True
+        )
+        
+        # Act & Assert
+        with pytest.raises(MergeError, match="1日分"):
+            csv_merger.merge([two_days, valid_csv_file_day1])
+
+    def test_merge_sorts_when_file_is_not_sorted(self, csv_merger, valid_csv_file_day1):
+        """ファイル内の日時順が崩れている場合は日時カラムでソートする"""
+        # Arrange: 2日目を逆順に並べたCsvFile
+        datetime_list = [f"2025/10/19 {hour:02d}:00:00" for hour in reversed(range(24))]
+        data = pd.DataFrame({
+            "No": list(range(1, 25)),
+            "日時": datetime_list,
+            "電圧": list(range(24)),
+            "周波数": [51] * 24,
+            "パワー": [1100] * 24,
+            "工事フラグ": [0] * 24,
+            "参照": [0] * 24,
+        })
+        unsorted_day2 = CsvFile(file_path="day2.csv", data=data)
+        
+        # Act
+        result = csv_merger.merge([unsorted_day2, valid_csv_file_day1])
+        
+        # Assert
+        datetimes = result.data["日時"].tolist()
+        assert datetimes == sorted(datetimes)
+        assert result.data["電圧"].tolist()[24:] == list(reversed(range(24)))
+
+    def test_merge_streaming_matches_merge(
+        self, csv_merger, valid_csv_file_day1, valid_csv_file_day2, valid_csv_file_day3
+    ):
+        """merge_streaming()のチャンクを連結するとmerge()と同じ結果になる"""
+        # Arrange
+        csv_files = [valid_csv_file_day3, valid_csv_file_day1, valid_csv_file_day2]
+        sources = [lambda f=f: f for f in csv_files]
+        
+        # Act
+        chunks = list(csv_merger.merge_streaming(sources, chunk_rows=10))
+        
+        # Assert
+        assert [len(chunk) for chunk in chunks] == [10] * 7 + [2]
+        pd.testing.assert_frame_equal(
+            pd.concat(chunks, ignore_index=True), csv_merger.merge(csv_files).data
+        )
+
+    def test_merge_streaming_opens_one_input_at_a_time(
+        self, csv_merger, valid_csv_file_day1, valid_csv_file_day2, valid_csv_file_day3
+    ):
+        """日付が重ならない入力は先頭日時の取得後、日付順に1つずつ開かれる"""
+        # Arrange: 読み込み中の入力数を記録する
+        opened = []
+        events = []
+
+        def source_of(csv_file):
+            def open_source():
+                opened.append(csv_file.file_name)
+                return csv_file
+            return open_source
+
+        sources = [source_of(f) for f in [valid_csv_file_day2, valid_csv_file_day1, valid_csv_file_day3]]
+        
+        # Act: チャンクを受け取るたびに、それまでに開かれた入力を記録
+        for chunk in csv_merger.merge_streaming(sources, chunk_rows=24):
+            events.append(list(opened[3:]))
+        
+        # Assert: 先頭日時の取得（3回）の後は、日付順に1つずつ開かれる
+        assert events == [["day1.csv"], ["day1.csv", "day2.csv"], ["day1.csv", "day2.csv", "day3.csv"]]
+
+    def test_merge_streaming_detects_duplicate_datetime(self, csv_merger, valid_csv_file_day1):
+        """ストリーミング結合でも日時の重複を検出する"""
+        # Arrange: 同じ日時を含む2つの入力を1ファイル扱いで渡す
+        data = valid_csv_file_day1.data.copy()
+        duplicated = CsvFile(file_path="dup.csv", data=pd.concat([data, data.iloc[[5]]]), skip_daily_validation=True)
+        
+        # Act & Assert
+        with pytest.raises(MergeError) as exc_info:
+            list(csv_merger.merge_streaming([lambda: duplicated]))
+        
+        assert str(exc_info.value) == "日時の重複が検出されました: 2025/10/18 05:00:00"
+
+    def test_merge_streaming_requires_consecutive_days(
+        self, csv_merger, valid_csv_file_day1, valid_csv_file_day3
+    ):
+        """ストリーミング結合でも欠損日があれば出力前にMergeErrorを発生させる"""
+        # Act & Assert
+        chunks = csv_merger.merge_streaming([lambda: valid_csv_file_day1, lambda: valid_csv_file_day3])
+        with pytest.raises(MergeError) as exc_info:
+            next(chunks)
+        
+        assert "欠損日" in str(exc_info.value)
+
+    @staticmethod
+    def _lazy(csv_file, opened):
+        """データを読み込むたびに opened に記録する LazyCsvFile"""
+        day = csv_file.data["日時"].iloc[0].date()
+        metadata = CsvFileMetadata(csv_file.file_path, CsvFileMetadata.day_number(day), 24, "utf-8", False, 0)
+
+        def loader(metadata):
+            opened.append(csv_file.file_name)
+            return csv_file
+
+        return LazyCsvFile(metadata, loader)
+
+    def test_merge_lazy_files_validates_days_without_loading(
+        self, csv_merger, valid_csv_file_day1, valid_csv_file_day2, valid_csv_file_day3
+    ):
+        """LazyCsvFileは走査時の日付で検証し、日付順に連結する時点で読み込む"""
+        # Arrange
+        csv_files = [valid_csv_file_day3, valid_csv_file_day1, valid_csv_file_day2]
+        opened = []
+        
+        # Act
+        result = csv_merger.merge([self._lazy(f, opened) for f in csv_files])
+        
+        # Assert
+        pd.testing.assert_frame_equal(result.data, csv_merger.merge(csv_files).data)
+        assert opened == ["day1.csv", "day2.csv", "day3.csv"]
+        
+        # 欠損日は読み込む前に検出する
+        opened.clear()
+        with pytest.raises(MergeError, match="欠損日"):
+            csv_merger.merge([self._lazy(f, opened) for f in [valid_csv_file_day1, valid_csv_file_day3]])
+        assert opened == []
+
+    def test_merge_streaming_lazy_files_opens_each_input_once(
+        self, csv_merger, valid_csv_file_day1, valid_csv_file_day2, valid_csv_file_day3
+    ):
+        """LazyCsvFileは先頭日時の取得のために開かず、日付順に1回ずつ開かれる"""
+        # Arrange
+        csv_files = [valid_csv_file_day2, valid_csv_file_day1, valid_csv_file_day3]
+        opened = []
+        
+        # Act
+        chunks = list(csv_merger.merge_streaming([self._lazy(f, opened) for f in csv_files], chunk_rows=10))
+        
+        # Assert
+        assert opened == ["day1.csv", "day2.csv", "day3.csv"]
+        pd.testing.assert_frame_equal(
+            pd.concat(chunks, ignore_index=True), csv_merger.merge(csv_files).data
+        )
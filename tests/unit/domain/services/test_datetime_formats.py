@@ -0,0 +1,48 @@
+"""日時のフォーマットの定義のテスト"""
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from domain.services.datetime_formats import DATETIME_FORMATS, match_datetime
+
+
+class TestMatchDatetime:
+    """match_datetime() のテスト"""
+
+    @pytest.mark.parametrize("value", [
+        "2025/10/18 05:00:00",
+        "2025-10-18 05:00:00",
+        "2025-10-18T05:00:00",
+        "2025/10/18 05:00",
+        "2025-10-18 05:00",
+    ])
+    def test_matches_like_pandas(self, value):
+        """一致した値は、そのフォーマットで pd.to_datetime() した値と同じ日時になる"""
+        directive = next(
+            candidate.directive for candidate in DATETIME_FORMATS if candidate.pattern.fullmatch(value)
+        )
+
+        assert match_datetime(value) == datetime(2025, 10, 18, 5)
+        assert match_datetime(value) == pd.to_datetime(value, format=directive).to_pydatetime()
+
+    @pytest.mark.parametrize("value", [
+        "2025/10/18",
+        "2025-10-18",
+    ])
+    def test_date_only(self, value):
+        """日付だけの値は0時の日時"""
+        assert match_datetime(value) == datetime(2025, 10, 18)
+
+    @pytest.mark.parametrize("value", [
+        "2025/1/5 00:00:00",  # 0埋めしていない
+        "2025.10.18 00:00:00",  # 判別しない区切り文字
+        "２０２５/10/18",  # 全角数字
+        "2025/13/01 00:00:00",  # 実在しない月
+        "2025/04/31",  # 実在しない日
+        "日時",
+        "",
+    ])
+    def test_unmatched_or_invalid(self, value):
+        """一致しない値・実在しない日時はNone（pandas の解釈に任せる）"""
+        assert match_datetime(value) is None
@@ -0,0 +1,95 @@
+"""DatetimeParser service のテスト"""
+import pandas as pd
+import pytest
+
+from domain.services.datetime_parser import DatetimeParser
+
+
+def parses_with_pandas(value: str) -> bool:
+    """pd.to_datetime() で解釈できるか（判定の基準）"""
+    try:
+        pd.to_datetime(value)
+        return True
+    except Exception:
+        return False
+
+
+class TestDatetimeParser:
+    """DatetimeParserドメインサービスのテスト"""
+
+    @pytest.mark.parametrize("values, directive", [
+        (["2025/10/18 00:00:00", "2025/10/18 01:00:00"], "%Y/%m/%d %H:%M:%S"),
+        (["2025-10-18 00:00:00"], "%Y-%m-%d %H:%M:%S"),
+        (["2025-10-18T00:00:00"], "%Y-%m-%dT%H:%M:%S"),
+        (["2025/10/18 00:00"], "%Y/%m/%d %H:%M"),
+        (["2025-10-18 00:00"], "%Y-%m-%d %H:%M"),
+        (["2025/10/18"], "%Y/%m/%d"),
+        (["2025-10-18"], "%Y-%m-%d"),
+    ])
+    def test_classify(self, values, directive):
+        """先頭の値から日時のフォーマットを判別する"""
+        assert DatetimeParser.classify(values).directive == directive
+
+    @pytest.mark.parametrize("values", [
+        [],
+        ["2025/10/18 00:00:00", "2025-10-18 01:00:00"],  # 先頭の値でフォーマットが混在
+        ["2025/1/5 1:00:00"],                            # 0埋めなし
+        ["２０２５/１０/１８"],                            # 全角数字
+        ["2025-10-18T00:00:00+09:00"],                   # タイムゾーン付き
+    ])
+    def test_classify_unknown(self, values):
+        """共通のフォーマットを判別できない場合はNone"""
+        assert DatetimeParser.classify(values) is None
+
+    @pytest.mark.parametrize("value", [
+        "2025/10/18 00:00:00",
+        "2025-10-18T23:59:59",
+        "2025/13/01 10:00:00",   # 13月（pandas の解釈に任せる）
+        "2025/04/31 10:00:00",   # 存在しない日付
+        "0002/10/12 00:00:00",   # datetime64[ns] の範囲外
+        "2262/12/31",
+        "2025/1/5 1:00:00",
+        "10:00:00",
+        "No",
+        "日時",
+        "today",
+    ])
+    def test_is_datetime_matches_pandas(self, value):
+        """判定結果は pd.to_datetime() で解釈できるかと同じ"""
+        assert DatetimeParser.is_datetime(value) is parses_with_pandas(value)
+
+    def test_parse_with_detected_format(self):
+        """判別したフォーマットで変換し、合わない行だけ個別に解釈する"""
+        values = pd.Series([
+            "2025/10/18 00:00:00",
+            "2025/10/18 01:00:00",
+            "2025-10-18T02:00:00",   # 判別したフォーマットと異なる
+            "2025/10/18 03:00:00+09:00",
+            "invalid",
+            None,
+        ])
+
+        parsed = DatetimeParser.parse(values)
+
+        assert str(parsed.dtype) == "datetime64[ns]"
+        assert parsed.iloc[:4].tolist() == [
+            pd.Timestamp("2025-10-18 00:00:00"),
+            pd.Timestamp("2025-10-18 01:00:00"),
+            pd.Timestamp("2025-10-18 02:00:00"),
+            pd.Timestamp("2025-10-18 03:00:00"),
+        ]
+        assert parsed.iloc[4:].isna().all()
+
+    def test_parse_without_detected_format(self):
+        """フォーマットを判別できない場合も同じ値を受け付ける"""
+        values = pd.Series(["2025/1/5 1:00:00", "2025/1/5 2:00:00"])
+
+        parsed = DatetimeParser.parse(values)
+
+        assert parsed.tolist() == [pd.Timestamp("2025-01-05 01:00:00"), pd.Timestamp("2025-01-05 02:00:00")]
+
+    def test_parse_keeps_datetime64(self):
+        """datetime64型の列はそのまま返す"""
+        values = pd.Series(pd.date_range("2025-10-18", periods=3, freq="h"))
+
+        assert DatetimeParser.parse(values) is values
@@ -0,0 +1,47 @@
+"""DayContinuity service のテスト"""
+from datetime import date
+
+import pytest
+
+from domain.exceptions import MergeError
+from domain.services.day_continuity import DayContinuity
+
+
+class TestDayContinuity:
+    """DayContinuityドメインサービスのテスト"""
+
+    def test_continuous_days_in_any_order(self):
+        """入力順に関係なく、重複日・欠損日がなければ連続とみなす"""
+        continuity = DayContinuity([date(2025, 10, 20), date(2025, 10, 18), date(2025, 10, 19)])
+
+        assert continuity.is_continuous
+        assert continuity.duplicate_days == []
+        assert continuity.missing_days == []
+        continuity.validate()
+
+    def test_reports_duplicate_and_missing_days(self):
+        """重複日と、最小日〜最大日の間の欠損日を昇順に返す"""
+        continuity = DayContinuity([
+            date(2025, 10, 18), date(2025, 10, 21), date(2025, 10, 18), date(2025, 10, 23),
+        ])
+
+        assert continuity.duplicate_days == [date(2025, 10, 18)]
+        assert continuity.missing_days == [date(2025, 10, 19), date(2025, 10, 20), date(2025, 10, 22)]
+        assert not continuity.is_continuous
+
+    def test_validate_raises_duplicate_before_missing(self):
+        """CsvMerger と同じく、重複日を欠損日より先に報告する"""
+        continuity = DayContinuity([date(2025, 10, 18), date(2025, 10, 18), date(2025, 10, 20)])
+
+        with pytest.raises(MergeError, match="重複日"):
+            continuity.validate()
+
+    def test_validate_raises_on_missing_day(self):
+        """欠損日があればMergeErrorを発生させる"""
+        with pytest.raises(MergeError, match="欠損日"):
+            DayContinuity([date(2025, 12, 31), date(2026, 1, 2)]).validate()
+
+    def test_empty_and_single_day_are_continuous(self):
+        """日付がない場合・1日のみの場合は連続とみなす"""
+        assert DayContinuity([]).is_continuous
+        assert DayContinuity([date(2025, 10, 18)]).is_continuous
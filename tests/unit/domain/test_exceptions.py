@@ -1,4 +1,6 @@
 """Domain exceptions のテスト"""
+from pathlib import Path
+
 import pytest
 from domain.exceptions import (
     CsvMergerError,
@@ -6,6 +8,9 @@ from domain.exceptions import (
     CsvFileNotFoundError,
     MergeError,
     EmptyDataError,
+    LoadCancelledError,
+    MultipleFileErrors,
+    StorageDtypeWarning,
 )
 
 
@@ -106,3 +111,24 @@ class TestDomainExceptions:
         assert "5行目から10行目" in error_message or "5-10行目" in error_message
         assert "フォーマットエラー" in error_message
 
+    def test_load_cancelled_error_inherits_from_base(self):
+        """LoadCancelledErrorはCsvMergerErrorを継承する"""
+        error = LoadCancelledError("cancelled")
+        assert isinstance(error, CsvMergerError)
+        assert str(error) == "cancelled"
+
+    def test_multiple_file_errors_keeps_errors_in_order(self):
+        """MultipleFileErrorsはファイルごとの例外を保持し、件数をメッセージにする"""
+        errors = [
+            (Path("a.csv"), CsvFileNotFoundError("a")),
+            (Path("b.csv"), InvalidCsvFormatError("b")),
+        ]
+        error = MultipleFileErrors(errors)
+        assert isinstance(error, CsvMergerError)
+        assert error.errors == errors
+        assert str(error) == "2件のファイルでエラーが発生しました"
+
+    def test_storage_dtype_warning_is_not_an_error(self):
+        """StorageDtypeWarningは警告であり、ドメイン例外としては扱わない"""
+        assert issubclass(StorageDtypeWarning, UserWarning)
+        assert not issubclass(StorageDtypeWarning, CsvMergerError)
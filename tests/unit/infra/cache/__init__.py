@@ -0,0 +1 @@
+"""Infrastructure cache のテストパッケージ"""
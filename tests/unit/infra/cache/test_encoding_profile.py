@@ -0,0 +1,83 @@
+"""EncodingProfile のテスト"""
+import json
+from pathlib import Path
+
+from infra.cache.encoding_profile import EncodingProfile
+
+
+class TestEncodingProfile:
+    """EncodingProfileのテスト"""
+
+    def test_pattern_replaces_digits(self):
+        """ファイル名の数字の並びを "#" に置き換えたものがパターンになる"""
+        assert EncodingProfile.pattern_of(Path("logs/20251018_unit3.csv")) == "#_unit#.csv"
+
+    def test_lookup_recorded_pattern(self, tmp_path):
+        """記録したファイルと同じパターンのファイルは、記録した文字コードを返す"""
+        profile = EncodingProfile()
+        profile.record(tmp_path / "20251018.csv", "cp932")
+
+        assert profile.lookup(tmp_path / "20251019.csv") == "cp932"
+        assert profile.lookup(tmp_path / "summary.csv") is None
+
+    def test_directory_takes_precedence(self, tmp_path):
+        """同じパターンでも、ディレクトリごとの記録をパターンのみの記録より優先する"""
+        profile = EncodingProfile()
+        profile.record(tmp_path / "a" / "20251018.csv", "cp932")
+        profile.record(tmp_path / "b" / "20251018.csv", "utf-8")
+
+        assert profile.lookup(tmp_path / "a" / "20251019.csv") == "cp932"
+        assert profile.lookup(tmp_path / "b" / "20251019.csv") == "utf-8"
+        # 記録のないディレクトリでは最後に記録したパターンの文字コード
+        assert profile.lookup(tmp_path / "c" / "20251019.csv") == "utf-8"
+
+    def test_save_and_reload(self, tmp_path):
+        """保存した記録は次回の読み込みで使える"""
+        path = tmp_path / "profile" / "encodings.json"
+        profile = EncodingProfile(path)
+        profile.record(tmp_path / "20251018.csv", "cp932")
+
+        assert profile.save() is True
+        assert profile.save() is False  # 変更がなければ保存しない
+
+        reloaded = EncodingProfile(path)
+        assert reloaded.lookup(tmp_path / "20251019.csv") == "cp932"
+        assert not reloaded.changed
+        assert json.loads(path.read_text(encoding="utf-8"))["version"] == EncodingProfile.FORMAT_VERSION
+
+    def test_save_without_path(self, tmp_path):
+        """保存先がない場合は保存しない"""
+        profile = EncodingProfile()
+        profile.record(tmp_path / "20251018.csv", "cp932")
+
+        assert profile.save() is False
+
+    def test_ignores_unreadable_file(self, tmp_path):
+        """壊れた・形式の異なるファイルは無視して空の状態から始める"""
+        broken = tmp_path / "broken.json"
+        broken.write_text("{", encoding="utf-8")
+        other_version = tmp_path / "other.json"
+        other_version.write_text(json.dumps({"version": 0, "entries": {"#.csv": "cp932"}}), encoding="utf-8")
+
+        assert EncodingProfile(broken).entries == {}
+        assert EncodingProfile(other_version).entries == {}
+
+    def test_evicts_oldest_entries(self, tmp_path, monkeypatch):
+        """記録数が上限を超えた場合は、最後に記録した時期が古いものから削除する"""
+        monkeypatch.setattr(EncodingProfile, "MAX_ENTRIES", 2)
+        profile = EncodingProfile()
+        profile.record(tmp_path / "a.csv", "cp932")
+        profile.record(tmp_path / "b.csv", "utf-8")
+
+        assert list(profile.entries) == [str(tmp_path / "b.csv"), "b.csv"]
+
+    def test_merge(self, tmp_path):
+        """別のプロファイル（並列読み込みのワーカー）の記録を合算する"""
+        profile = EncodingProfile()
+        worker = EncodingProfile()
+        worker.record(tmp_path / "20251018.csv", "cp932")
+
+        profile.merge(worker)
+
+        assert profile.lookup(tmp_path / "20251019.csv") == "cp932"
+        assert profile.changed
@@ -0,0 +1,119 @@
+"""ParsedCsvCache のテスト"""
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from domain.models.csv_schema import CsvSchema
+from infra.cache.parsed_csv_cache import ParsedCsvCache
+
+
+class TestParsedCsvCache:
+    """ParsedCsvCacheのテスト"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """ParsedCsvCacheインスタンスを提供"""
+        return ParsedCsvCache(tmp_path / "cache")
+
+    @pytest.fixture
+    def sample_data(self):
+        """正規化・検証済みの形式のデータを提供"""
+        data = pd.DataFrame({
+            "No": list(range(1, 25)),
+            "日時": pd.date_range("2025-10-18", periods=24, freq="h"),
+            "電圧": [100] * 24,
+            "周波数": [50] * 24,
+            "パワー": [1000] * 24,
+            "工事フラグ": [0] * 24,
+            "参照": [1] * 24,
+        })
+        return CsvSchema.to_storage_dtypes(data)
+
+    @pytest.fixture
+    def csv_path(self, tmp_path):
+        """キーの生成に使うCSVファイルを提供"""
+        csv_path = tmp_path / "day1.csv"
+        csv_path.write_bytes(b"2025/10/18 00:00:00,100,50,1000,0\n")
+        return csv_path
+
+    def test_put_and_get_round_trip(self, cache, sample_data):
+        """保存したデータがカラム順・型・値を保ったまま復元される"""
+        # Act
+        stored = cache.put("key", sample_data)
+        restored = cache.get("key")
+
+        # Assert
+        assert stored is True
+        pd.testing.assert_frame_equal(restored, sample_data)
+        assert cache.stats == {"hits": 1, "misses": 0, "stores": 1, "evictions": 0}
+
+    def test_get_missing_key_counts_miss(self, cache):
+        """存在しないキーはミスとして集計される"""
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+    def test_key_changes_when_content_changes(self, cache, csv_path):
+        """ファイルの内容が変わるとキーが変わる"""
+        # Arrange
+        key_before = cache.key_for(csv_path, csv_path.read_bytes())
+        csv_path.write_bytes(b"2025/10/18 00:00:00,101,50,1000,0\n")
+
+        # Act
+        key_after = cache.key_for(csv_path, csv_path.read_bytes())
+
+        # Assert
+        assert key_before != key_after
+
+    def test_key_changes_when_schema_version_changes(self, cache, csv_path, monkeypatch):
+        """スキーマバージョンが変わるとキーが変わる（古いエントリは使われない）"""
+        # Arrange
+        raw = csv_path.read_bytes()
+        key_before = cache.key_for(csv_path, raw)
+        monkeypatch.setattr(CsvSchema, "SCHEMA_VERSION", CsvSchema.SCHEMA_VERSION + 1)
+
+        # Act & Assert
+        assert cache.key_for(csv_path, raw) != key_before
+
+    def test_corrupted_entry_is_removed_and_treated_as_miss(self, cache, sample_data):
+        """壊れたエントリは削除され、ミスとして扱われる"""
+        # Arrange
+        cache.put("key", sample_data)
+        entry = cache.cache_dir / f"key{ParsedCsvCache.ENTRY_SUFFIX}"
+        entry.write_bytes(entry.read_bytes()[:-3])
+
+        # Act & Assert
+        assert cache.get("key") is None
+        assert not entry.exists()
+
+    def test_evicts_least_recently_used_entries(self, tmp_path, sample_data):
+        """合計サイズが上限を超えると、最後に使われた時刻が古いエントリから削除される"""
+        # Arrange: 2エントリ分より少し大きい上限
+        cache = ParsedCsvCache(tmp_path / "cache")
+        cache.put("probe", sample_data)
+        entry_size = (cache.cache_dir / f"probe{ParsedCsvCache.ENTRY_SUFFIX}").stat().st_size
+        (cache.cache_dir / f"probe{ParsedCsvCache.ENTRY_SUFFIX}").unlink()
+        cache = ParsedCsvCache(tmp_path / "cache", max_bytes=entry_size * 2 + entry_size // 2)
+
+        cache.put("old", sample_data)
+        cache.put("recent", sample_data)
+        # "old" を先に使われたことにし、"recent" を後から使う
+        os.utime(cache.cache_dir / f"old{ParsedCsvCache.ENTRY_SUFFIX}", ns=(1, 1_000_000_000))
+        os.utime(cache.cache_dir / f"recent{ParsedCsvCache.ENTRY_SUFFIX}", ns=(2, 2_000_000_000))
+
+        # Act
+        cache.put("new", sample_data)
+
+        # Assert
+        assert cache.get("old") is None
+        assert cache.get("recent") is not None
+        assert cache.get("new") is not None
+        assert cache.stats["evictions"] == 1
+
+    def test_does_not_store_non_numeric_columns(self, cache):
+        """数値・日時以外のカラムを含むデータは保存しない"""
+        data = pd.DataFrame({"日時": ["2025/10/18 00:00:00"], "No": [1]})
+
+        assert cache.put("key", data) is False
+        assert cache.get("key") is None
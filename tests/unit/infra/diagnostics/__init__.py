@@ -0,0 +1 @@
+"""Infrastructure diagnostics のテストパッケージ"""
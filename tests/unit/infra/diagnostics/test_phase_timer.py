@@ -0,0 +1,89 @@
+"""PhaseTimerのテスト"""
+import time
+import tracemalloc
+from pathlib import Path
+
+from infra.diagnostics.phase_timer import PhaseTimer
+from infra.repositories.csv_repository import CsvRepository
+
+
+class TestPhaseTimer:
+    """PhaseTimerのテスト"""
+
+    def test_disabled_timer_records_nothing(self):
+        """無効なタイマーは何も記録せず、計測結果も空になる"""
+        timer = PhaseTimer()
+
+        with timer.measure("parse"):
+            pass
+        timer.add_file(Path("a.csv"), 1.0)
+        stats = timer.to_stats()
+
+        assert stats.phases == {}
+        assert stats.slowest_files == []
+
+    def test_nested_phase_time_is_exclusive(self):
+        """入れ子のフェーズの時間は外側のフェーズから除かれる"""
+        timer = PhaseTimer(enabled=True)
+
+        with timer.measure("merge"):
+            with timer.measure("parse"):
+                time.sleep(0.05)
+
+        phases = timer.to_stats().phases
+        assert phases["parse"].wall_seconds >= 0.05
+        assert phases["merge"].wall_seconds < 0.05
+        assert phases["merge"].calls == phases["parse"].calls == 1
+
+    def test_measure_iter_times_each_item(self):
+        """measure_iter() は要素の生成のたびに計測し、要素はそのまま返す"""
+        timer = PhaseTimer(enabled=True)
+
+        items = list(timer.measure_iter("merge", iter([1, 2, 3])))
+
+        assert items == [1, 2, 3]
+        assert timer.to_stats().phases["merge"].calls == 4
+
+    def test_trace_memory_records_peak_and_stops_tracing(self):
+        """trace_memory の場合はピークメモリを記録し、to_stats() で tracemalloc を停止する"""
+        timer = PhaseTimer(enabled=True, trace_memory=True)
+
+        with timer.measure("parse"):
+            buffer = bytearray(1_000_000)
+        del buffer
+        stats = timer.to_stats()
+
+        assert stats.phases["parse"].peak_memory_bytes >= 1_000_000
+        assert not tracemalloc.is_tracing()
+
+    def test_merge_and_slowest_files(self):
+        """merge() は時間を合算し、遅いファイルは遅い順に指定数だけ記録する"""
+        timer = PhaseTimer(enabled=True)
+        other = PhaseTimer(enabled=True)
+        timer.add_file(Path("a.csv"), 0.1)
+        other.add_file(Path("a.csv"), 0.3)
+        other.add_file(Path("b.csv"), 0.2)
+        other.add_file(Path("c.csv"), 0.05)
+        with other.measure("read"):
+            pass
+
+        timer.merge(other)
+        stats = timer.to_stats(slowest=2)
+
+        assert [timing.path.name for timing in stats.slowest_files] == ["a.csv", "b.csv"]
+        assert abs(stats.slowest_files[0].seconds - 0.4) < 1e-9
+        assert stats.phases["read"].calls == 1
+
+    def test_repository_records_load_phases(self, tmp_path):
+        """CsvRepositoryの読み込みは各フェーズとファイルごとの時間を記録する"""
+        lines = ["No,日時,電圧,周波数,パワー,工事フラグ,参照"]
+        lines += [f"{hour + 1},2025/01/01 {hour:02d}:00:00,100,50,1000,0,1" for hour in range(24)]
+        path = tmp_path / "day.csv"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        timer = PhaseTimer(enabled=True)
+
+        CsvRepository(phase_timer=timer).load(path)
+        stats = timer.to_stats()
+
+        assert {"read", "detect_encoding", "parse", "normalize", "dedup", "validate"} <= set(stats.phases)
+        assert [timing.path for timing in stats.slowest_files] == [path]
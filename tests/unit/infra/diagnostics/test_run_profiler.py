@@ -0,0 +1,74 @@
+"""RunProfilerのテスト"""
+import pickle
+import tracemalloc
+
+from infra.diagnostics.run_profiler import RunProfiler
+
+
+def _allocate() -> list[bytearray]:
+    return [bytearray(1000) for _ in range(100)]
+
+
+class TestRunProfiler:
+    """RunProfilerのテスト"""
+
+    def test_disabled_profiler_does_nothing(self, tmp_path):
+        """無効なプロファイラは計測せず、tracemalloc も開始しない"""
+        profiler = RunProfiler()
+
+        with profiler.cpu_profile(), profiler.memory_phase("load"):
+            _allocate()
+
+        assert profiler.enabled is False
+        assert not tracemalloc.is_tracing()
+        report = profiler.write_cpu_report(tmp_path / "cpu.txt").read_text(encoding="utf-8")
+        assert "計測結果がありません" in report
+
+    def test_cpu_report_lists_profiled_functions(self, tmp_path):
+        """CPUレポートに計測した関数が累積時間順・自己時間順で含まれる"""
+        profiler = RunProfiler(cpu=True)
+
+        with profiler.cpu_profile():
+            _allocate()
+        with profiler.cpu_profile():
+            _allocate()
+
+        report = profiler.write_cpu_report(tmp_path / "cpu.txt").read_text(encoding="utf-8")
+        assert "累積時間順" in report and "自己時間順" in report
+        assert "(_allocate)" in report
+
+    def test_memory_report_lists_allocating_lines_per_phase(self, tmp_path):
+        """メモリレポートにフェーズごとの割り当ての多い行が含まれる"""
+        profiler = RunProfiler(memory=True)
+
+        with profiler.memory_phase("load"):
+            kept = _allocate()
+            # 入れ子のフェーズは外側のフェーズに含めて集計する
+            with profiler.memory_phase("merge"):
+                kept += _allocate()
+        profiler.stop()
+
+        report = profiler.write_memory_report(tmp_path / "memory.txt").read_text(encoding="utf-8")
+        assert "=== load" in report
+        assert "=== merge" not in report
+        assert "test_run_profiler.py:9" in report
+        assert not tracemalloc.is_tracing()
+        del kept
+
+    def test_merge_worker_results(self, tmp_path):
+        """ワーカー（複製）で計測した結果を合算できる"""
+        profiler = RunProfiler(cpu=True, memory=True)
+        with profiler.memory_phase("load"):
+            worker = pickle.loads(pickle.dumps(profiler))
+            # 複製には計測中のフェーズを引き継がないため、ワーカー側でも計測できる
+            with worker.cpu_profile(), worker.memory_phase("load"):
+                kept = _allocate()
+        profiler.stop()
+
+        profiler.merge(worker)
+
+        cpu_report = profiler.write_cpu_report(tmp_path / "cpu.txt").read_text(encoding="utf-8")
+        memory_report = profiler.write_memory_report(tmp_path / "memory.txt").read_text(encoding="utf-8")
+        assert "(_allocate)" in cpu_report
+        assert "test_run_profiler.py:9" in memory_report
+        del kept
@@ -0,0 +1,98 @@
+"""SpanTracerのテスト"""
+import json
+import os
+import pickle
+import threading
+
+from infra.diagnostics.phase_timer import PhaseTimer
+from infra.diagnostics.span_tracer import SpanTracer
+
+
+class TestSpanTracer:
+    """SpanTracerのテスト"""
+
+    def test_span_records_complete_event_with_tags(self):
+        """スパンはタグと annotate() で追加したタグ付きの完了イベントになる"""
+        tracer = SpanTracer()
+
+        with tracer.span("load", file="day.csv"):
+            with tracer.span("parse"):
+                tracer.annotate(rows=24)
+            tracer.annotate(bytes=100)
+
+        events = [event for event in tracer.to_trace_events() if event["ph"] == "X"]
+        parse, load = events
+        assert parse["name"] == "parse" and parse["args"]["rows"] == 24
+        assert load["args"]["file"] == "day.csv" and load["args"]["bytes"] == 100
+        assert load["pid"] == os.getpid()
+        assert load["ts"] <= parse["ts"] and parse["ts"] + parse["dur"] <= load["ts"] + load["dur"]
+        assert load["args"]["worker"] == "MainProcess/MainThread"
+
+    def test_spans_from_threads_have_own_thread_ids(self):
+        """別スレッドのスパンはそのスレッドのIDと名前で記録される"""
+        tracer = SpanTracer()
+
+        def work():
+            with tracer.span("compress_block", bytes=10):
+                pass
+
+        thread = threading.Thread(target=work, name="compressor")
+        thread.start()
+        thread.join()
+        with tracer.span("save"):
+            pass
+
+        events = tracer.to_trace_events()
+        thread_names = {event["args"]["name"] for event in events if event["name"] == "thread_name"}
+        spans = {event["name"]: event for event in events if event["ph"] == "X"}
+        assert thread_names == {"compressor", "MainThread"}
+        assert spans["compress_block"]["tid"] != spans["save"]["tid"]
+
+    def test_merge_after_pickle(self):
+        """プロセス間で受け渡したトレーサーのスパンを合算できる"""
+        tracer = SpanTracer()
+        worker = pickle.loads(pickle.dumps(tracer))
+        with worker.span("load_chunk", files=2):
+            pass
+
+        tracer.merge(worker)
+
+        assert [event["name"] for event in tracer.to_trace_events() if event["ph"] == "X"] == ["load_chunk"]
+
+    def test_max_events_keeps_latest_spans(self):
+        """max_events を超えたスパンは古いものから捨てる"""
+        tracer = SpanTracer(max_events=2)
+
+        for index in range(5):
+            with tracer.span(f"span{index}"):
+                pass
+
+        assert tracer.event_count == 2
+        assert [event["name"] for event in tracer.to_trace_events() if event["ph"] == "X"] == ["span3", "span4"]
+
+    def test_write_trace_event_json(self, tmp_path):
+        """trace event 形式の JSON に書き出す"""
+        tracer = SpanTracer()
+        with tracer.span("execute", files=1):
+            pass
+
+        path = tracer.write(tmp_path / "trace.json")
+
+        trace = json.loads(path.read_text(encoding="utf-8"))
+        assert trace["displayTimeUnit"] == "ms"
+        assert {"process_name", "thread_name", "execute"} == {event["name"] for event in trace["traceEvents"]}
+
+    def test_phase_timer_forwards_phases_to_tracer(self):
+        """PhaseTimer は集計が無効でも tracer があればフェーズをスパンとして記録する"""
+        tracer = SpanTracer()
+        timer = PhaseTimer(tracer=tracer)
+
+        with timer.measure("parse", file="day.csv"):
+            timer.annotate(rows=24)
+        items = list(timer.measure_iter("merge", [1, 2]))
+
+        spans = [event for event in tracer.to_trace_events() if event["ph"] == "X"]
+        assert items == [1, 2]
+        assert [span["name"] for span in spans] == ["parse", "merge", "merge", "merge"]
+        assert spans[0]["args"]["rows"] == 24
+        assert timer.to_stats().phases == {}
@@ -0,0 +1,61 @@
+"""読み込みの協調的な中止のテスト"""
+import multiprocessing
+import pickle
+
+import pytest
+
+from domain.exceptions import LoadCancelledError
+from infra.repositories.cancellation import CancellationToken
+
+
+class TestCancellationToken:
+    """CancellationTokenのテスト"""
+
+    def test_cancel(self):
+        """cancel() 後は raise_if_cancelled() が LoadCancelledError を送出する"""
+        token = CancellationToken()
+        token.raise_if_cancelled()
+
+        token.cancel()
+
+        assert token.is_cancelled
+        with pytest.raises(LoadCancelledError):
+            token.raise_if_cancelled()
+
+    def test_shares_given_value(self):
+        """渡した値（プロセス間で共有する Value）で中止を伝える"""
+        failed = multiprocessing.Value("q", CancellationToken.NOT_FAILED)
+        token = CancellationToken(failed)
+
+        failed.value = 0
+
+        assert token.is_cancelled
+
+    def test_cancels_only_later_positions(self):
+        """失敗した位置以降の読み込みだけを中止し、前の位置の読み込みは続ける"""
+        token = CancellationToken()
+        earlier, failing, later = token.at(1), token.at(2), token.at(3)
+
+        failing.cancel()
+
+        assert not earlier.is_cancelled
+        assert failing.is_cancelled
+        assert later.is_cancelled
+        earlier.raise_if_cancelled()
+
+    def test_keeps_earliest_failed_position(self):
+        """後の位置で失敗しても、前の位置の失敗は上書きしない"""
+        token = CancellationToken()
+        token.at(1).cancel()
+        token.at(3).cancel()
+
+        assert token.at(2).is_cancelled
+
+    def test_pickled_copy_is_a_new_token(self):
+        """pickle した複製は中止されていない新しいトークンになる"""
+        token = CancellationToken()
+        token.cancel()
+
+        copied = pickle.loads(pickle.dumps(token))
+
+        assert not copied.is_cancelled
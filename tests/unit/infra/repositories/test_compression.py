@@ -0,0 +1,157 @@
+"""圧縮ファイルの入出力のテスト"""
+import gzip
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+from domain.exceptions import InvalidCsvFormatError
+from infra.repositories.compression import (
+    ParallelGzipWriter,
+    compression_of,
+    decompress,
+    ensure_available,
+)
+from infra.repositories.csv_repository import CsvRepository
+from infra.sinks.output_sinks import CsvSink
+
+
+def _day_csv(day: str = "2025/01/01") -> str:
+    """1日分のヘッダーありCSV"""
+    lines = ["No,日時,電圧,周波数,パワー,工事フラグ,参照"]
+    lines += [f"{hour + 1},{day} {hour:02d}:00:00,100,50,1000,0,1" for hour in range(24)]
+    return "\n".join(lines) + "\n"
+
+
+class TestDecompress:
+    """入力の展開のテスト"""
+
+    @pytest.mark.parametrize("name, expected", [
+        ("day.csv", None),
+        ("day.csv.gz", "gzip"),
+        ("DAY.CSV.GZ", "gzip"),
+        ("day.csv.zst", "zstd"),
+    ])
+    def test_compression_of(self, name, expected):
+        """拡張子から圧縮形式を判定する"""
+        assert compression_of(Path(name)) == expected
+
+    def test_decompress_multi_member_gzip(self):
+        """複数メンバーの gzip もすべて展開する"""
+        data = gzip.compress(b"abc", mtime=0) + gzip.compress(b"def", mtime=0)
+
+        assert decompress(Path("x.csv.gz"), data) == b"abcdef"
+
+    def test_decompress_broken_gzip_raises_invalid_format(self):
+        """壊れた gzip はInvalidCsvFormatError"""
+        with pytest.raises(InvalidCsvFormatError, match="圧縮ファイルの展開に失敗しました: x.csv.gz"):
+            decompress(Path("x.csv.gz"), b"not gzip")
+
+    def test_zstd_requires_zstandard(self, monkeypatch):
+        """zstandard がない場合、zstd はImportError"""
+        monkeypatch.setitem(sys.modules, "zstandard", None)
+
+        with pytest.raises(ImportError, match="zstandard"):
+            ensure_available("zstd")
+        with pytest.raises(ImportError, match="zstandard"):
+            decompress(Path("x.csv.zst"), b"")
+
+    def test_ensure_available_rejects_unknown_compression(self):
+        """未対応の圧縮形式はValueError"""
+        with pytest.raises(ValueError, match="未対応の圧縮形式です: bz2"):
+            ensure_available("bz2")
+
+
+class TestCompressedInput:
+    """CsvRepositoryでの圧縮入力のテスト"""
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "cp932"])
+    def test_load_gzip_matches_plain(self, tmp_path, encoding):
+        """gzip 入力は展開後の内容で文字コード判定・パースされ、非圧縮と同じ結果になる"""
+        plain = tmp_path / "day.csv"
+        plain.write_bytes(_day_csv().encode(encoding))
+        compressed = tmp_path / "day.csv.gz"
+        compressed.write_bytes(gzip.compress(plain.read_bytes()))
+        repository = CsvRepository()
+
+        expected = CsvRepository().load(plain)
+        result = repository.load(compressed)
+
+        assert result.data.equals(expected.data)
+        assert repository.io_counter.bytes_by_phase["read"] == compressed.stat().st_size
+        assert repository.io_counter.bytes_by_phase["decompress"] == plain.stat().st_size
+
+    def test_load_many_mixes_compressed_and_plain(self, tmp_path):
+        """load_many() は圧縮・非圧縮の入力をまとめて読み込める"""
+        first = tmp_path / "day1.csv.gz"
+        first.write_bytes(gzip.compress(_day_csv("2025/01/01").encode("utf-8")))
+        second = tmp_path / "day2.csv"
+        second.write_text(_day_csv("2025/01/02"), encoding="utf-8")
+
+        results = CsvRepository().load_many([first, second])
+
+        assert [len(result.data) for result in results] == [24, 24]
+        assert str(results[1].data["日時"].iloc[0]) == "2025-01-02 00:00:00"
+
+
+class TestParallelGzipWriter:
+    """ParallelGzipWriterのテスト"""
+
+    def test_output_decompresses_to_input(self):
+        """ブロックごとの gzip メンバーを連結した出力は入力に展開できる"""
+        data = bytes(range(256)) * 1000
+        buffer = io.BytesIO()
+
+        with ParallelGzipWriter(buffer, workers=3, block_size=1000) as writer:
+            for start in range(0, len(data), 777):
+                writer.write(data[start:start + 777])
+
+        assert gzip.decompress(buffer.getvalue()) == data
+
+    def test_output_does_not_depend_on_write_sizes(self):
+        """出力はブロック単位で決まるため、書き込みの区切り方によらない"""
+        data = b"0123456789" * 500
+        outputs = []
+        for step in (1, 333, len(data)):
+            buffer = io.BytesIO()
+            with ParallelGzipWriter(buffer, workers=2, block_size=64) as writer:
+                for start in range(0, len(data), step):
+                    writer.write(data[start:start + step])
+            outputs.append(buffer.getvalue())
+
+        assert outputs[0] == outputs[1] == outputs[2]
+
+    def test_empty_input_writes_valid_gzip(self):
+        """何も書き込まない場合も有効な gzip を書き出す"""
+        buffer = io.BytesIO()
+
+        with ParallelGzipWriter(buffer):
+            pass
+
+        assert gzip.decompress(buffer.getvalue()) == b""
+
+
+class TestCompressedOutput:
+    """CsvSinkの圧縮出力のテスト"""
+
+    def test_gzip_sink_suffix_and_content(self, tmp_path):
+        """gzip 圧縮のCSVは .csv.gz で保存され、展開すると非圧縮の出力と同じになる"""
+        csv_file = CsvRepository().load(_write(tmp_path / "day.csv", _day_csv()))
+        plain_path = CsvRepository().save(csv_file, tmp_path / "plain")
+
+        sink = CsvSink(compression="gzip", compress_workers=2)
+        compressed_path = CsvRepository(sink=sink).save(csv_file, tmp_path / "compressed")
+
+        assert compressed_path.name.endswith(".csv.gz")
+        assert gzip.decompress(compressed_path.read_bytes()) == plain_path.read_bytes()
+
+    def test_csv_sink_rejects_unknown_compression(self):
+        """未対応の圧縮形式はValueError"""
+        with pytest.raises(ValueError, match="未対応の圧縮形式です"):
+            CsvSink(compression="bz2")
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
@@ -0,0 +1,195 @@
+"""入力ファイルの事前チェックのテスト"""
+import gzip
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from domain.exceptions import CsvFileNotFoundError, EmptyDataError, InvalidCsvFormatError
+from domain.models.csv_schema import CsvSchema
+from infra.repositories.csv_preflight import CsvPreflight
+
+
+def _header_csv(day: str = "2025/10/18", rows: int = 24) -> str:
+    """1日分のヘッダーありCSV"""
+    lines = ["No,日時,電圧,周波数,パワー,工事フラグ,参照"]
+    lines += [f"{hour + 1},{day} {hour:02d}:00:00,100,50,1000,0,1" for hour in range(rows)]
+    return "\n".join(lines) + "\n"
+
+
+def _headerless_csv(day: str = "2025-10-18", trailing: str = "") -> str:
+    """1日分のヘッダーなしCSV"""
+    return "".join(f"{day} {hour:02d}:00:00,100,50,1000,0{trailing}\r\n" for hour in range(24))
+
+
+class TestCsvPreflight:
+    """CsvPreflightのテスト"""
+
+    @pytest.fixture
+    def preflight(self):
+        return CsvPreflight()
+
+    def test_constants_match_csv_schema(self):
+        """CsvLayout から取った値が CsvSchema と一致する"""
+        assert list(CsvPreflight.HEADERLESS_COLUMNS) == [
+            column for column in CsvSchema.REQUIRED_COLUMNS
+            if column not in CsvSchema.HEADERLESS_OMITTED_COLUMNS
+        ]
+        assert CsvPreflight.TIMESTAMP_COLUMN == CsvSchema.TIMESTAMP_COLUMN
+        assert CsvPreflight.EXPECTED_RECORDS_PER_DAY == CsvSchema.EXPECTED_RECORDS_PER_DAY
+        assert CsvPreflight.MIN_VALID_YEAR == CsvSchema.MIN_VALID_YEAR
+        assert CsvPreflight.MAX_VALID_YEAR == CsvSchema.MAX_VALID_YEAR
+
+    def test_does_not_import_pandas(self):
+        """CsvPreflight は pandas を読み込まない"""
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "import sys, infra.repositories.csv_preflight; print('pandas' in sys.modules)"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parents[4]
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_probe_header_and_headerless_files(self, preflight, tmp_path):
+        """ヘッダーあり・なし（CRLF、末尾カンマ、cp932）のファイルから日付と行数を推定する"""
+        header = tmp_path / "header.csv"
+        header.write_text("\n" + _header_csv() + "\n\n", encoding="utf-8-sig")
+        headerless = tmp_path / "headerless.csv"
+        headerless.write_bytes(_headerless_csv("2025/10/19", trailing=",").encode("cp932"))
+
+        first = preflight.probe(header)
+        second = preflight.probe(headerless)
+
+        assert (first.day, first.rows, first.headerless, first.issues) == (date(2025, 10, 18), 24, False, ())
+        assert (second.day, second.rows, second.headerless, second.issues) == (date(2025, 10, 19), 24, True, ())
+
+    def test_check_reports_duplicate_and_missing_days(self, preflight, tmp_path):
+        """重複日・欠損日を CsvMerger と同じ規則で報告する"""
+        for name, day in [("a.csv", "2025/10/18"), ("b.csv", "2025/10/18"), ("c.csv", "2025/10/21")]:
+            (tmp_path / name).write_text(_header_csv(day), encoding="utf-8")
+
+        report = preflight.check(sorted(tmp_path.glob("*.csv")))
+
+        assert not report.is_mergeable
+        assert report.continuity.duplicate_days == [date(2025, 10, 18)]
+        assert report.continuity.missing_days == [date(2025, 10, 19), date(2025, 10, 20)]
+        assert [path.name for path in report.files_on(date(2025, 10, 18))] == ["a.csv", "b.csv"]
+
+    @pytest.mark.parametrize("content, issue", [
+        ("", "データがありません"),
+        ("No,日時,電圧\n", "必須カラムが不足しています: 周波数, パワー, 工事フラグ"),
+        ("No,日時,電圧,周波数,パワー,工事フラグ,参照\n", "データ行がありません"),
+        (_header_csv().replace("0,1\n", "0\n", 1), "列数がヘッダーと一致しません（7列に対して6列）"),
+        (_header_csv().replace("2025/10/18 23", "2025/10/19 23"), "複数日のデータを含みます（2025-10-18〜2025-10-19）"),
+        (_header_csv().replace("2025/10/18 00", "yesterday 00"), "日時を解釈できません: yesterday 00:00:00"),
+        (_header_csv("1800/10/18"), "日時の年が範囲外です: 1800/10/18 00:00:00"),
+    ])
+    def test_layout_issues(self, preflight, tmp_path, content, issue):
+        """レイアウトの異常を報告し、日付は推定しない"""
+        path = tmp_path / "bad.csv"
+        path.write_text(content, encoding="utf-8")
+
+        probe = preflight.probe(path)
+
+        assert issue in probe.issues
+        assert probe.day is None
+
+    @pytest.mark.parametrize("content, error_type, message", [
+        ("\n\n", InvalidCsvFormatError, "CSVファイルの読み込みに失敗しました: No columns to parse from file"),
+        ("No,日時,電圧\n" + "1,2025/10/18 00:00:00,100\n", InvalidCsvFormatError,
+         "必須カラムが不足しています: 周波数, パワー, 工事フラグ"),
+        ("No,日時,電圧,周波数,パワー,工事フラグ,参照\n", EmptyDataError, "CSV file 'bad.csv' contains no data"),
+        (_headerless_csv().replace(",0\r\n", "\r\n"), InvalidCsvFormatError,
+         "ヘッダーなしCSVは5列である必要があります（実際: 4列）"),
+        (_headerless_csv(trailing=",,"), InvalidCsvFormatError,
+         "ヘッダーなしCSVは5列である必要があります（実際: 6列）"),
+    ])
+    def test_layout_errors_that_always_fail_to_load(self, preflight, tmp_path, content, error_type, message):
+        """読み込みが確実に失敗するレイアウトの異常は、全体を読み込んだ場合と同じ例外を error に設定する"""
+        path = tmp_path / "bad.csv"
+        path.write_text(content, encoding="utf-8")
+
+        probe = preflight.probe(path)
+
+        assert isinstance(probe.error, error_type)
+        assert str(probe.error) == message
+
+    @pytest.mark.parametrize("content", [
+        _header_csv(rows=10),
+        _header_csv().replace("2025/10/18 00", "yesterday 00"),
+        _header_csv().replace("0,1\n", "0\n", 1),
+        "name,value\n",
+        # 列数の不一致（読み込み時は列数のエラーが先に起きる）
+        _headerless_csv().replace(",0\r\n", "\r\n", 1),
+    ])
+    def test_issues_left_to_the_full_load_are_not_errors(self, preflight, tmp_path, content):
+        """値・行数の異常や、ヘッダーを判別できないファイルは error を設定しない"""
+        path = tmp_path / "bad.csv"
+        path.write_text(content, encoding="utf-8")
+
+        probe = preflight.probe(path)
+
+        assert probe.issues
+        assert probe.error is None
+
+    def test_fewer_rows_than_a_day(self, preflight, tmp_path):
+        """24行未満の場合は異常として報告する（日付は連続日の確認に使う）"""
+        path = tmp_path / "short.csv"
+        path.write_text(_header_csv(rows=10), encoding="utf-8")
+
+        probe = preflight.probe(path)
+
+        assert probe.issues == ("データ行数が24行未満です（10行）",)
+        assert probe.day == date(2025, 10, 18)
+
+    def test_more_rows_than_a_day_is_a_warning(self, preflight, tmp_path):
+        """24行を超える場合は、重複行の可能性があるため警告にとどめる"""
+        path = tmp_path / "dup.csv"
+        path.write_text(_header_csv() + _header_csv().split("\n", 1)[1], encoding="utf-8")
+
+        probe = preflight.probe(path)
+
+        assert probe.issues == ()
+        assert probe.rows == 48
+        assert probe.warnings
+
+    def test_large_file_reads_tail_by_seek(self, preflight, tmp_path):
+        """先頭ブロックに収まらないファイルは末尾を seek して読み、行数は推定する"""
+        preflight.HEAD_BYTES = 256
+        preflight.TAIL_BYTES = 128
+        path = tmp_path / "large.csv"
+        path.write_text(_header_csv().replace("2025/10/18 23", "2025/10/19 23"), encoding="utf-8")
+
+        probe = preflight.probe(path)
+
+        assert "複数日のデータを含みます（2025-10-18〜2025-10-19）" in probe.issues
+        assert 20 <= probe.rows <= 28
+
+    def test_compressed_file(self, preflight, tmp_path):
+        """圧縮ファイルは展開して確認する"""
+        path = tmp_path / "day.csv.gz"
+        path.write_bytes(gzip.compress(_header_csv("2025/10/20").encode("utf-8")))
+
+        probe = preflight.probe(path)
+
+        assert (probe.day, probe.rows, probe.issues) == (date(2025, 10, 20), 24, ())
+
+    def test_undecodable_lines(self, preflight, tmp_path):
+        """どの文字コードでもデコードできない行は置換せず、読み込みが失敗するエラーとする"""
+        path = tmp_path / "undecodable.csv"
+        path.write_bytes(_header_csv().encode("utf-8").replace(b"1000", b"1\xff\xfd0"))
+
+        probe = preflight.probe(path)
+
+        assert probe.issues == ("文字コードを判定できません",)
+        assert str(probe.error).startswith("CSVファイルの読み込みに失敗しました: 'utf-8' codec can't decode")
+
+    def test_unreadable_file(self, preflight, tmp_path):
+        """読み込めないファイルはレイアウトの異常として報告する"""
+        probe = preflight.probe(tmp_path / "missing.csv")
+
+        assert probe.issues and probe.issues[0].startswith("読み込めません")
+        assert probe.day is None
+        assert isinstance(probe.error, CsvFileNotFoundError)
@@ -4,9 +4,10 @@ from pathlib import Path
 import tempfile
 import shutil
 
+from infra.repositories.cancellation import CancellationToken
 from infra.repositories.csv_repository import CsvRepository
 from domain.models.csv_file import CsvFile
-from domain.exceptions import CsvFileNotFoundError, InvalidCsvFormatError
+from domain.exceptions import CsvFileNotFoundError, EmptyDataError, InvalidCsvFormatError, LoadCancelledError
 
 
 class TestCsvRepository:
@@ -175,3 +176,274 @@ class TestCsvRepository:
         assert "5行目" in error_message  # 13月
         assert "6行目" in error_message  # 4月31日
         assert "8行目" in error_message  # 9999年
+
+    def test_load_reads_file_from_disk_only_once(self, csv_repository, fixtures_dir):
+        """1ファイルの読み込みでディスクアクセスは1回だけ（文字コード判定・ヘッダー判定で再読込しない）"""
+        # Arrange: 文字コード判定で複数回デコードが走るShift-JISと、ヘッダーなしCSV
+        csv_paths = [fixtures_dir / "shift_jis.csv", fixtures_dir / "no_header.csv"]
+        
+        for csv_path in csv_paths:
+            csv_repository.io_counter.reset()
+            
+            # Act
+            csv_repository.load(csv_path)
+            
+            # Assert
+            assert csv_repository.io_counter.calls_by_phase["read"] == 1
+            assert csv_repository.io_counter.bytes_read == csv_path.stat().st_size
+            assert csv_repository.io_counter.get("parse") == csv_path.stat().st_size
+            assert csv_repository.io_counter.get("sniff_header") > 0
+
+    def test_load_undecodable_file_raises_error(self, csv_repository, temp_dir):
+        """どの文字コードでもデコードできないファイルは、置換して読み込まずにエラーにする"""
+        # Arrange: 電圧の値に UTF-8・cp932 のどちらでも読めないバイトを含む
+        lines = ["No,日時,電圧,周波数,パワー,工事フラグ,参照\n"]
+        lines += [f"{hour + 1},2025/10/18 {hour:02d}:00:00,100,50,1000,0,1\n" for hour in range(24)]
+        raw = "".join(lines).encode("utf-8").replace(b",100,", b",1\xff\xfd0,", 1)
+        csv_path = temp_dir / "undecodable.csv"
+        csv_path.write_bytes(raw)
+        
+        # Act & Assert
+        with pytest.raises(InvalidCsvFormatError, match="CSVファイルの読み込みに失敗しました: 'utf-8' codec can't decode byte 0xff"):
+            csv_repository.load(csv_path)
+        with pytest.raises(InvalidCsvFormatError, match="'utf-8' codec can't decode byte 0xff"):
+            csv_repository.load_many([csv_path])
+
+    def test_load_csv_with_missing_datetime_reports_line_number(self, csv_repository, temp_dir):
+        """日時が空欄の行は不正な日時として行番号付きで検出される"""
+        # Arrange: 4行目（データ3行目）の日時が空欄
+        lines = ["No,日時,電圧,周波数,パワー,工事フラグ,参照\n"]
+        for hour in range(24):
+            datetime_str = "" if hour == 2 else f"2025/10/18 {hour:02d}:00:00"
+            lines.append(f"{hour + 1},{datetime_str},100,50,1000,0,1\n")
+        csv_path = temp_dir / "missing_datetime.csv"
+        csv_path.write_text("".join(lines), encoding="utf-8")
+        
+        # Act & Assert
+        with pytest.raises(InvalidCsvFormatError) as exc_info:
+            csv_repository.load(csv_path)
+        
+        assert str(exc_info.value) == "missing_datetime.csv: 不正な日時が検出されました（4行目）"
+
+    def test_load_keeps_datetime64_and_save_formats_it(self, csv_repository, fixtures_dir, temp_dir):
+        """読み込み後の日時はdatetime64型で保持され、保存時にのみ標準フォーマットへ文字列化される"""
+        # Arrange
+        loaded = csv_repository.load(fixtures_dir / "full_format.csv")
+        
+        # Act
+        output_path = csv_repository.save(loaded, temp_dir)
+        
+        # Assert
+        import pandas as pd
+        assert pd.api.types.is_datetime64_dtype(loaded.data["日時"])
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == "No,日時,電圧,周波数,パワー,工事フラグ,参照"
+        assert lines[1] == "1,2025/10/18 00:00:00,100,50,1000,0,1"
+        assert lines[-1] == "24,2025/10/18 23:00:00,100,50,1000,0,1"
+
+    def test_load_many_matches_load_per_file(self, csv_repository, fixtures_dir, temp_dir):
+        """load_many()は同じレイアウトのファイルをまとめて読み込み、load()と同じ結果を返す"""
+        # Arrange: 同じレイアウトのファイルが複数ずつ含まれるようにコピーを作る
+        import pandas as pd
+        names = [
+            "full_format.csv", "no_header.csv", "headerless_trailing_comma.csv",
+            "shift_jis.csv", "quoted.csv", "wrong_order.csv", "no_column_missing.csv",
+        ]
+        csv_paths = []
+        for name in names:
+            for copy_index in range(2):
+                copied = temp_dir / f"{copy_index}_{name}"
+                copied.write_bytes((fixtures_dir / name).read_bytes())
+                csv_paths.append(copied)
+        
+        # Act
+        loaded = csv_repository.load_many(csv_paths)
+        
+        # Assert
+        assert [csv_file.file_path for csv_file in loaded] == csv_paths
+        for csv_path, csv_file in zip(csv_paths, loaded):
+            pd.testing.assert_frame_equal(csv_file.data, csv_repository.load(csv_path).data)
+
+    def test_load_many_reports_line_number_within_each_file(self, csv_repository, temp_dir):
+        """まとめて読み込んでも不正な日時の行番号はファイルごとに数えられる"""
+        # Arrange: 同じヘッダーの2ファイルのうち、2ファイル目の4行目の日時が空欄
+        csv_paths = []
+        for day, missing_hour in [(18, None), (19, 2)]:
+            lines = ["No,日時,電圧,周波数,パワー,工事フラグ,参照\n"]
+            for hour in range(24):
+                datetime_str = "" if hour == missing_hour else f"2025/10/{day} {hour:02d}:00:00"
+                lines.append(f"{hour + 1},{datetime_str},100,50,1000,0,1\n")
+            csv_path = temp_dir / f"day_{day}.csv"
+            csv_path.write_text("".join(lines), encoding="utf-8")
+            csv_paths.append(csv_path)
+        
+        # Act & Assert
+        with pytest.raises(InvalidCsvFormatError) as exc_info:
+            csv_repository.load_many(csv_paths)
+        
+        assert str(exc_info.value) == "day_19.csv: 不正な日時が検出されました（4行目）"
+
+    def test_load_many_raises_first_failure_in_input_order(self, csv_repository, fixtures_dir):
+        """load_many()は入力順で最初に失敗したファイルの例外を送出する"""
+        # Arrange
+        csv_paths = [
+            fixtures_dir / "full_format.csv",
+            fixtures_dir / "nonexistent.csv",
+            fixtures_dir / "invalid_dates.csv",
+        ]
+        
+        # Act & Assert
+        with pytest.raises(CsvFileNotFoundError):
+            csv_repository.load_many(csv_paths)
+
+    def test_load_outcomes_returns_failures_as_results(self, csv_repository, fixtures_dir):
+        """load_outcomes()は失敗したファイルの例外を入力順の結果として返す"""
+        # Arrange
+        csv_paths = [
+            fixtures_dir / "full_format.csv",
+            fixtures_dir / "nonexistent.csv",
+            fixtures_dir / "invalid_dates.csv",
+        ]
+        
+        # Act
+        outcomes = csv_repository.load_outcomes(csv_paths)
+        
+        # Assert
+        assert isinstance(outcomes[0], CsvFile)
+        assert isinstance(outcomes[1], CsvFileNotFoundError)
+        assert isinstance(outcomes[2], InvalidCsvFormatError)
+
+    def test_load_many_with_cancellation_stops_at_first_failure(self, csv_repository, fixtures_dir):
+        """cancellation を設定すると、最初に失敗したファイルで中止を伝えて残りを読まない"""
+        # Arrange
+        csv_repository.cancellation = CancellationToken()
+        csv_paths = [fixtures_dir / "nonexistent.csv", fixtures_dir / "full_format.csv"]
+        
+        # Act & Assert
+        with pytest.raises(CsvFileNotFoundError):
+            csv_repository.load_many(csv_paths)
+        assert csv_repository.cancellation.is_cancelled
+        assert csv_repository.io_counter.bytes_read == 0
+
+    def test_load_many_with_cancellation_reports_first_failure_in_input_order(self, csv_repository, fixtures_dir):
+        """後のファイルの読み込みで先に失敗しても、前のファイルの処理を終えて入力順で最初の失敗を送出する"""
+        # Arrange
+        csv_repository.cancellation = CancellationToken()
+        csv_paths = [
+            fixtures_dir / "invalid_dates.csv",
+            fixtures_dir / "nonexistent.csv",
+            fixtures_dir / "full_format.csv",
+        ]
+        
+        # Act & Assert
+        with pytest.raises(InvalidCsvFormatError, match="invalid_dates.csv"):
+            csv_repository.load_many(csv_paths)
+        assert csv_repository.io_counter.bytes_read == (fixtures_dir / "invalid_dates.csv").stat().st_size
+
+    def test_load_many_raises_when_cancelled(self, csv_repository, fixtures_dir):
+        """他の読み込みから中止された場合は LoadCancelledError を送出する"""
+        # Arrange
+        csv_repository.cancellation = CancellationToken()
+        csv_repository.cancellation.cancel()
+        
+        # Act & Assert
+        with pytest.raises(LoadCancelledError):
+            csv_repository.load_many([fixtures_dir / "full_format.csv"])
+
+    def test_check_inputs_orders_cheap_checks_first(self, csv_repository, fixtures_dir, temp_dir):
+        """存在 → サイズの順に確認し、検出した順に返す（ファイルの内容は読まない）"""
+        # Arrange
+        empty = temp_dir / "empty.csv"
+        empty.write_bytes(b"")
+        header_only = temp_dir / "header_only.csv"
+        header_only.write_text("No,日時,電圧,周波数,パワー,工事フラグ,参照\n", encoding="utf-8")
+        csv_paths = [header_only, empty, fixtures_dir / "invalid_dates.csv", temp_dir / "missing.csv"]
+        
+        # Act
+        errors = csv_repository.check_inputs(csv_paths)
+        
+        # Assert: レイアウトと日時の値の異常は読み込み時に確認する
+        assert list(errors) == [3, 1]
+        assert str(errors[3]) == f"CSVファイルが見つかりません: {csv_paths[3]}"
+        assert str(errors[1]) == "CSVファイルの読み込みに失敗しました: No columns to parse from file"
+        assert csv_repository.io_counter.bytes_read == 0
+
+    def test_load_checks_layout_on_bytes_already_read(self, csv_repository, temp_dir):
+        """レイアウトの異常はパースの前に、読み込んだバイト列で確認する（読み直さない）"""
+        # Arrange
+        header_only = temp_dir / "header_only.csv"
+        header_only.write_text("No,日時,電圧,周波数,パワー,工事フラグ,参照\n", encoding="utf-8")
+        
+        # Act & Assert
+        with pytest.raises(EmptyDataError, match="CSV file 'header_only.csv' contains no data"):
+            csv_repository.load(header_only)
+        assert csv_repository.io_counter.bytes_read == header_only.stat().st_size
+        assert csv_repository.io_counter.get("parse") == 0
+
+    def test_check_inputs_with_cancellation_returns_every_failure(self, csv_repository, temp_dir):
+        """cancellation を設定しても送出せず、入力順で最初の失敗を呼び出し側が選べるようにすべて返す"""
+        # Arrange
+        empty = temp_dir / "empty.csv"
+        empty.write_bytes(b"")
+        csv_repository.cancellation = CancellationToken()
+        
+        # Act
+        errors = csv_repository.check_inputs([empty, temp_dir / "missing.csv"])
+        
+        # Assert
+        assert sorted(errors) == [0, 1]
+        assert isinstance(errors[1], CsvFileNotFoundError)
+        assert not csv_repository.cancellation.is_cancelled
+
+    def test_save_stream_writes_same_bytes_as_save(self, csv_repository, fixtures_dir, temp_dir):
+        """save_stream()はチャンクを連結してsave()した場合と同じ内容を書き出す"""
+        # Arrange
+        loaded = csv_repository.load(fixtures_dir / "full_format.csv")
+        chunks = [loaded.data.iloc[:10], loaded.data.iloc[10:20], loaded.data.iloc[20:]]
+        
+        # Act
+        expected = csv_repository.save(loaded, temp_dir / "save")
+        output_path = csv_repository.save_stream(chunks, temp_dir / "stream")
+        
+        # Assert
+        assert output_path.read_bytes() == expected.read_bytes()
+
+    def test_save_stream_removes_partial_file_on_failure(self, csv_repository, fixtures_dir, temp_dir):
+        """チャンクの生成中に失敗した場合、書きかけのファイルを削除して例外を再送出する"""
+        # Arrange
+        loaded = csv_repository.load(fixtures_dir / "full_format.csv")
+
+        def failing_chunks():
+            yield loaded.data.iloc[:10]
+            raise InvalidCsvFormatError("途中で失敗")
+        
+        # Act & Assert
+        with pytest.raises(InvalidCsvFormatError):
+            csv_repository.save_stream(failing_chunks(), temp_dir)
+        
+        assert list(temp_dir.glob("merged_*.csv")) == []
+
+    def test_load_serves_cache_hit_without_parsing(self, fixtures_dir, temp_dir, monkeypatch):
+        """キャッシュにヒットしたファイルはCSVパーサーを使わずに同じ内容で返す"""
+        # Arrange
+        import pandas as pd
+        from infra.cache.parsed_csv_cache import ParsedCsvCache
+        cache = ParsedCsvCache(temp_dir / "cache")
+        csv_paths = [fixtures_dir / "shift_jis.csv", fixtures_dir / "no_header.csv"]
+        first = [CsvRepository(cache=cache).load(csv_path) for csv_path in csv_paths]
+
+        def fail_read_csv(*args, **kwargs):
+            raise AssertionError("read_csv should not be called on cache hit")
+        monkeypatch.setattr(pd, "read_csv", fail_read_csv)
+        
+        # Act
+        repository = CsvRepository(cache=cache)
+        second = [repository.load(csv_paths[0])] + repository.load_many(csv_paths[1:])
+        
+        # Assert
+        assert cache.stats["hits"] == 2
+        assert cache.stats["misses"] == 2
+        for before, after in zip(first, second):
+            assert after.file_path == before.file_path
+            pd.testing.assert_frame_equal(after.data, before.data)
+        assert "detect_encoding" not in repository.io_counter.bytes_by_phase
@@ -0,0 +1,80 @@
+"""CsvWriter のテスト"""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from domain.models.csv_schema import CsvSchema
+from infra.repositories.csv_writer import CsvWriter
+
+
+def _to_csv_bytes(df: pd.DataFrame, header: bool = True) -> bytes:
+    """to_csv() による出力（比較の基準）"""
+    buffer = io.StringIO()
+    df.to_csv(buffer, header=header, index=False, date_format=CsvSchema.DATETIME_OUTPUT_FORMAT)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _write_bytes(df: pd.DataFrame, header: bool = True) -> bytes:
+    """CsvWriter による出力"""
+    buffer = io.BytesIO()
+    CsvWriter().write(df, buffer, header=header)
+    return buffer.getvalue()
+
+
+class TestCsvWriter:
+    """CsvWriterのテスト"""
+
+    @pytest.fixture
+    def merged_df(self):
+        """結合結果と同じ形式のDataFrameを提供（日をまたぐ1時間単位）"""
+        rows = 100
+        return CsvSchema.to_storage_dtypes(pd.DataFrame({
+            "No": np.arange(1, rows + 1),
+            "日時": pd.date_range("2025-12-31 20:00:00", periods=rows, freq="h"),
+            "電圧": np.arange(rows) % 7 + 98,
+            "周波数": np.full(rows, 50),
+            "パワー": np.arange(rows) * 997 - 30000,
+            "工事フラグ": np.arange(rows) % 2,
+            "参照": np.ones(rows, dtype=np.int64),
+        }))
+
+    def test_write_matches_to_csv(self, merged_df):
+        """結合結果の形式では to_csv() と同じバイト列を書き出す"""
+        assert _write_bytes(merged_df) == _to_csv_bytes(merged_df)
+
+    def test_write_without_header_matches_to_csv(self, merged_df):
+        """ヘッダーなしでも to_csv() と同じバイト列を書き出す"""
+        assert _write_bytes(merged_df, header=False) == _to_csv_bytes(merged_df, header=False)
+
+    def test_write_across_blocks_matches_to_csv(self, merged_df, monkeypatch):
+        """複数ブロックに分けて書き出しても to_csv() と同じになる"""
+        monkeypatch.setattr(CsvWriter, "BLOCK_ROWS", 7)
+        assert _write_bytes(merged_df) == _to_csv_bytes(merged_df)
+
+    def test_write_empty_dataframe_writes_header_only(self, merged_df):
+        """0行のDataFrameはヘッダー行のみ書き出す"""
+        empty = merged_df.iloc[:0]
+        assert _write_bytes(empty) == _to_csv_bytes(empty)
+        assert _write_bytes(empty, header=False) == b""
+
+    def test_write_wide_integer_range_matches_to_csv(self):
+        """値の範囲が広い整数カラムも to_csv() と同じになる"""
+        df = pd.DataFrame({
+            "a": np.array([-2**62, 0, 2**62], dtype=np.int64),
+            "b": np.array([0, 2**64 - 1, 5], dtype=np.uint64),
+            "c": np.array([-128, 127, 0], dtype=np.int8),
+        })
+        assert _write_bytes(df) == _to_csv_bytes(df)
+
+    @pytest.mark.parametrize("df", [
+        pd.DataFrame({"日時": pd.to_datetime(["2025-01-01 00:30:00"]), "電圧": [1]}),
+        pd.DataFrame({"日時": pd.DatetimeIndex(["2025-01-01 01:00:00", pd.NaT]), "電圧": [1, 2]}),
+        pd.DataFrame({"電圧": [1.5, np.nan]}),
+        pd.DataFrame({"電圧": ["a,b", "c"]}),
+        pd.DataFrame({"a,b": [1, 2]}),
+    ])
+    def test_write_falls_back_to_to_csv(self, df):
+        """列単位で書き出せないDataFrameは to_csv() と同じ出力になる"""
+        assert _write_bytes(df) == _to_csv_bytes(df)
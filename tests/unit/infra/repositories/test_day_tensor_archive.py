@@ -0,0 +1,85 @@
+"""DayTensorArchive のテスト"""
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+from domain.exceptions import MergeError
+from domain.models.hourly_day_tensor import HourlyDayTensor
+from infra.repositories.day_tensor_archive import DayTensorArchive
+
+
+def tensor_of(*days: date, offset: int = 0) -> HourlyDayTensor:
+    """日付ごとに日番号を値とするHourlyDayTensorを作成"""
+    tensor = HourlyDayTensor()
+    for day in days:
+        values = np.full((24, len(HourlyDayTensor.VALUE_COLUMNS)), day.toordinal() % 1000, dtype=np.int32)
+        tensor.add_day(day, values, np.full(24, offset, dtype=np.int64) if offset else None)
+    return tensor
+
+
+class TestDayTensorArchive:
+    """DayTensorArchiveのテスト"""
+
+    def test_save_and_load_with_mmap(self, tmp_path):
+        """保存した配列をメモリマップして読み込む"""
+        tensor = tensor_of(date(2025, 10, 18), date(2025, 10, 19), date(2025, 10, 21))
+        archive = DayTensorArchive(tmp_path / "archive")
+
+        archive.save(tensor)
+        loaded = archive.load()
+
+        assert archive.exists()
+        assert isinstance(loaded.values, np.memmap)
+        assert loaded.first_day == date(2025, 10, 18)
+        assert loaded.missing_days == [date(2025, 10, 20)]
+        assert np.array_equal(loaded.values, tensor.values)
+        assert not (tmp_path / "archive" / "offsets.npy").exists()  # すべて毎正時
+
+    def test_save_replaces_existing_archive(self, tmp_path):
+        """保存し直すと、読み込み済みのアーカイブに日付を追加した結果で置き換える"""
+        archive = DayTensorArchive(tmp_path / "archive")
+        archive.save(tensor_of(date(2025, 10, 18)))
+
+        loaded = archive.load()
+        loaded.add_day(date(2025, 10, 19), np.zeros((24, len(HourlyDayTensor.VALUE_COLUMNS)), dtype=np.int32))
+        archive.save(loaded)
+
+        assert archive.load().day_count == 2
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["archive"]
+
+    def test_keeps_offsets(self, tmp_path):
+        """毎正時でない日時のオフセットも保存する"""
+        archive = DayTensorArchive(tmp_path / "archive")
+        archive.save(tensor_of(date(2025, 10, 18), offset=30 * 60 * 10**9))
+
+        frame = archive.load(mmap=False).to_frame()
+
+        assert str(frame["日時"].iloc[0]) == "2025-10-18 00:30:00"
+
+    def test_rejects_duplicate_days(self, tmp_path):
+        """重複日を含むデータは保存しない"""
+        tensor = tensor_of(date(2025, 10, 18), date(2025, 10, 18))
+
+        with pytest.raises(MergeError, match="重複日"):
+            DayTensorArchive(tmp_path / "archive").save(tensor)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_rejects_other_format(self, tmp_path):
+        """形式のバージョンが異なるアーカイブは読み込まない"""
+        archive = DayTensorArchive(tmp_path / "archive")
+        archive.save(tensor_of(date(2025, 10, 18)))
+        meta_path = tmp_path / "archive" / "meta.json"
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        meta_path.write_text(json.dumps({**meta, "version": 0}), encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            archive.load()
+
+    def test_empty_tensor(self, tmp_path):
+        """データのないアーカイブは空のHourlyDayTensorとして読み込む"""
+        archive = DayTensorArchive(tmp_path / "archive")
+        archive.save(HourlyDayTensor())
+
+        assert archive.load().day_count == 0
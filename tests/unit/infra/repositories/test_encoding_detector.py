@@ -0,0 +1,118 @@
+"""EncodingDetector のテスト"""
+import pytest
+
+from domain.exceptions import InvalidCsvFormatError
+from infra.cache.encoding_profile import EncodingProfile
+from infra.repositories.encoding_detector import EncodingDetector
+from infra.repositories.io_byte_counter import IoByteCounter
+
+HEADER = "日時,電圧,周波数,パワー,工事フラグ\n"
+ROW = "2025/10/18 00:00:00,100,50,1000,0\n"
+
+
+def fixed_order(raw: bytes) -> tuple[str, str]:
+    """候補を固定の順に全体でデコードした場合の結果"""
+    for encoding in EncodingDetector.CANDIDATES:
+        try:
+            return encoding, raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    raise AssertionError("どの候補でもデコードできません")
+
+
+class TestEncodingDetector:
+    """EncodingDetectorのテスト"""
+
+    @pytest.fixture
+    def detector(self, monkeypatch):
+        """標本を小さくしたEncodingDetectorを提供（標本に収まらないファイルを小さく作るため）"""
+        monkeypatch.setattr(EncodingDetector, "SAMPLE_BYTES", 64)
+        return EncodingDetector()
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "cp932", "shift_jis"])
+    @pytest.mark.parametrize("rows", [1, 20])
+    def test_same_result_as_fixed_order(self, detector, tmp_path, encoding, rows):
+        """標本に収まる・収まらないファイルのどちらも、固定の順に試した場合と同じ結果になる"""
+        raw = (HEADER + ROW * rows).encode(encoding)
+
+        assert detector.detect(raw, tmp_path / "20251018.csv") == fixed_order(raw)
+
+    def test_records_detected_encoding(self, detector, tmp_path):
+        """採用した文字コードを入力元ごとに記録する"""
+        detector.detect((HEADER + ROW).encode("cp932"), tmp_path / "20251018.csv")
+
+        assert detector.profile.lookup(tmp_path / "20251019.csv") == "cp932"
+
+    def test_learned_encoding_skips_full_decode_of_earlier_candidates(self, detector, tmp_path):
+        """学習した文字コードより前の候補は、標本で失敗すれば全体をデコードしない"""
+        raw = (HEADER + ROW * 20).encode("cp932")
+        detector.profile.record(tmp_path / "20251018.csv", "cp932")
+        io_counter = IoByteCounter()
+
+        assert detector.detect(raw, tmp_path / "20251019.csv", io_counter) == ("cp932", raw.decode("cp932"))
+        # utf-8-sig の標本（utf-8 は utf-8-sig の失敗から除外）と cp932 の全体のみ
+        assert io_counter.bytes_by_phase["detect_encoding"] == EncodingDetector.SAMPLE_BYTES + len(raw)
+
+    def test_learned_encoding_is_used_for_small_file(self, tmp_path, monkeypatch):
+        """標本に収まる小さなファイルでも学習した文字コードを参照し、各候補は1回だけデコードする"""
+        detector = EncodingDetector()
+        raw = (HEADER + ROW * 24).encode("cp932")
+        assert len(raw) <= EncodingDetector.SAMPLE_BYTES
+        detector.profile.record(tmp_path / "20251018.csv", "cp932")
+        looked_up = []
+        lookup = detector.profile.lookup
+        monkeypatch.setattr(detector.profile, "lookup", lambda path: looked_up.append(path) or lookup(path))
+        io_counter = IoByteCounter()
+
+        assert detector.detect(raw, tmp_path / "20251019.csv", io_counter) == ("cp932", raw.decode("cp932"))
+        assert looked_up == [tmp_path / "20251019.csv"]
+        # utf-8-sig の失敗（utf-8 は除外）と cp932 の成功の2回のみ（cp932 を2回デコードしない）
+        assert io_counter.calls_by_phase["detect_encoding"] == 2
+        assert io_counter.bytes_by_phase["detect_encoding"] == 2 * len(raw)
+
+    def test_learned_encoding_does_not_override_earlier_candidate(self, detector, tmp_path):
+        """学習した文字コードがあっても、前の候補でデコードできるファイルはその候補になる"""
+        raw = (HEADER + ROW * 20).encode("utf-8")
+        detector.profile.record(tmp_path / "20251018.csv", "cp932")
+
+        assert detector.detect(raw, tmp_path / "20251019.csv") == ("utf-8-sig", raw.decode("utf-8-sig"))
+        assert detector.profile.lookup(tmp_path / "20251019.csv") == "utf-8-sig"
+
+    def test_ambiguous_sample_falls_back_to_full_check(self, detector, tmp_path):
+        """標本がASCIIのみで判断できない場合は、全体をデコードして確認する"""
+        raw = (ROW * 20 + HEADER).encode("cp932")
+        detector.profile.record(tmp_path / "20251018.csv", "cp932")
+
+        assert detector.detect(raw, tmp_path / "20251019.csv") == ("cp932", raw.decode("cp932"))
+
+    @pytest.mark.parametrize("rows", [1, 20])
+    def test_undecodable_bytes_raise(self, detector, tmp_path, rows):
+        """どの候補でもデコードできない場合は、置換せずに InvalidCsvFormatError を送出する"""
+        # UTF-8 の見出しは cp932 として読めず、0xFF は UTF-8 として読めない
+        raw = HEADER.encode("utf-8") + (ROW.encode("utf-8") + b"\xff") * rows
+
+        with pytest.raises(InvalidCsvFormatError, match="'utf-8' codec can't decode byte 0xff"):
+            detector.detect(raw, tmp_path / "20251018.csv")
+        assert detector.profile.entries == {}
+
+    def test_undecodable_error_matches_detect(self, detector):
+        """undecodable_error() は detect() と同じメッセージの例外を作成する"""
+        raw = HEADER.encode("utf-8") + b"\xff"
+
+        with pytest.raises(InvalidCsvFormatError) as raised:
+            detector.detect(raw)
+        assert str(EncodingDetector.undecodable_error(raw)) == str(raised.value)
+
+    def test_without_path_does_not_record(self, detector):
+        """パスを指定しない場合は学習しない"""
+        detector.detect((HEADER + ROW).encode("cp932"))
+
+        assert detector.profile.entries == {}
+
+    def test_uses_given_profile(self, tmp_path):
+        """渡したプロファイルに記録する"""
+        profile = EncodingProfile()
+
+        EncodingDetector(profile).detect((HEADER + ROW).encode("cp932"), tmp_path / "20251018.csv")
+
+        assert profile.lookup(tmp_path / "20251019.csv") == "cp932"
@@ -0,0 +1,161 @@
+"""入力ファイルの走査と必要時の読み込みのテスト"""
+import os
+
+import pytest
+
+from domain.exceptions import CsvFileNotFoundError, EmptyDataError, InvalidCsvFormatError, MergeError
+from infra.repositories.csv_repository import CsvRepository
+from infra.repositories.lazy_csv_loader import LazyCsvLoader
+
+
+def _header_csv(day: str, rows: int = 24, voltage: int = 100) -> str:
+    """1日分のヘッダーありCSV"""
+    lines = ["No,日時,電圧,周波数,パワー,工事フラグ,参照"]
+    lines += [f"{hour + 1},{day} {hour:02d}:00:00,{voltage},50,1000,0,1" for hour in range(rows)]
+    return "\n".join(lines) + "\n"
+
+
+class _CountingRepository(CsvRepository):
+    """load_many() に渡されたファイル名を記録するリポジトリ"""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def load_many(self, file_paths):
+        self.batches.append([path.name for path in file_paths])
+        return super().load_many(file_paths)
+
+
+class TestLazyCsvLoader:
+    """CsvRepository.scan() / LazyCsvLoaderのテスト"""
+
+    @pytest.fixture
+    def input_paths(self, tmp_path):
+        """入力順が日付順と逆の3日分のファイル"""
+        paths = []
+        for name, day in [("c.csv", "2025/10/20"), ("b.csv", "2025/10/19"), ("a.csv", "2025/10/18")]:
+            path = tmp_path / name
+            path.write_text(_header_csv(day), encoding="utf-8")
+            paths.append(path)
+        return paths
+
+    def test_scan_reads_metadata_only(self, input_paths):
+        """走査ではデータを読み込まず、日付・行数・レイアウトを記録する"""
+        repository = _CountingRepository()
+
+        lazy_files = repository.scan(input_paths)
+
+        assert [lazy.metadata.date.isoformat() for lazy in lazy_files] == [
+            "2025-10-20", "2025-10-19", "2025-10-18"
+        ]
+        assert [(lazy.row_count, lazy.metadata.headerless) for lazy in lazy_files] == [(24, False)] * 3
+        assert lazy_files[0].metadata.path is input_paths[0]
+        assert repository.batches == []
+
+    def test_loads_in_day_order_batches(self, input_paths):
+        """要求されたファイルから日付順に batch_size 個をまとめて読み込む"""
+        repository = _CountingRepository()
+        lazy_files = repository.scan(input_paths, batch_size=2)
+
+        days = [lazy_files[index].load().data["日時"].iloc[0].day for index in (2, 1, 0)]
+
+        assert days == [18, 19, 20]
+        assert repository.batches == [["a.csv", "b.csv"], ["c.csv"]]
+
+    def test_reloads_released_file(self, input_paths):
+        """取り出したファイルは保持せず、再度要求されると読み込み直す（保持中のファイルは読み込まない）"""
+        repository = _CountingRepository()
+        lazy_files = repository.scan(input_paths, batch_size=3)
+
+        lazy_files[2].load()
+        lazy_files[2].load()
+
+        assert repository.batches == [["a.csv", "b.csv", "c.csv"], ["a.csv"]]
+
+    def test_keeps_prefetched_files_when_loaded_out_of_day_order(self, input_paths):
+        """日付順以外の順で取り出しても、まとめて読み込んだ未取り出しのファイルは読み込み直さない"""
+        repository = _CountingRepository()
+        lazy_files = repository.scan(input_paths, batch_size=2)
+
+        days = [lazy_files[index].load().data["日時"].iloc[0].day for index in (2, 0, 1)]
+
+        assert days == [18, 20, 19]
+        assert repository.batches == [["a.csv", "b.csv"], ["c.csv"]]
+
+    def test_rejects_file_changed_after_scan(self, input_paths):
+        """走査後に変更されたファイルは読み込まない"""
+        lazy_files = CsvRepository().scan(input_paths)
+        input_paths[2].write_text(_header_csv("2025/10/18", voltage=200), encoding="utf-8")
+        os.utime(input_paths[2], ns=(0, 0))
+
+        with pytest.raises(MergeError, match="走査後にファイルが変更されました"):
+            lazy_files[2].load()
+
+    def test_scan_loads_files_with_issues(self, input_paths, tmp_path):
+        """日付を推定できないファイルは走査時に読み込み、読み込み時と同じ例外を送出する"""
+        broken = tmp_path / "d.csv"
+        broken.write_text(_header_csv("2025/10/21", rows=23), encoding="utf-8")
+
+        with pytest.raises(InvalidCsvFormatError):
+            CsvRepository().scan(input_paths + [broken])
+
+    def test_keeps_file_loaded_during_scan(self, input_paths, tmp_path):
+        """走査時に読み込んだファイルは保持し、読み込み直さない"""
+        repository = _CountingRepository()
+        duplicated = tmp_path / "d.csv"
+        duplicated.write_text(
+            _header_csv("2025/10/21") + "24,2025/10/21 23:00:00,100,50,1000,0,1\n", encoding="utf-8"
+        )
+        lazy_files = repository.scan(input_paths + [duplicated], batch_size=4)
+
+        csv_files = [lazy.load() for lazy in lazy_files]
+
+        assert csv_files[3].row_count == 24
+        # c.csv は2回目にまとめて読み込んだものを保持しているため、3回目には読み込まない
+        assert repository.batches == [["c.csv"], ["b.csv", "c.csv"], ["a.csv", "b.csv"]]
+
+    def test_scan_reports_undecodable_file_like_load(self, input_paths, tmp_path):
+        """デコードできないファイルは、読み込み時と同じ例外で報告する"""
+        undecodable = tmp_path / "d.csv"
+        undecodable.write_bytes(_header_csv("2025/10/21").encode("utf-8").replace(b"1000", b"1\xff\xfd0"))
+        with pytest.raises(InvalidCsvFormatError) as expected:
+            CsvRepository().load(undecodable)
+
+        with pytest.raises(InvalidCsvFormatError) as actual:
+            CsvRepository().scan(input_paths + [undecodable])
+
+        assert str(actual.value) == str(expected.value)
+
+    def test_scan_missing_file(self, tmp_path):
+        """存在しないファイルは CsvFileNotFoundError"""
+        with pytest.raises(CsvFileNotFoundError):
+            CsvRepository().scan([tmp_path / "missing.csv"])
+
+    def test_scan_counts_edge_reads(self, input_paths):
+        """走査で読んだバイト数は "scan" として計上し、ファイル全体は読まない"""
+        repository = _CountingRepository()
+
+        repository.scan(input_paths)
+
+        assert repository.io_counter.get("scan") == sum(path.stat().st_size for path in input_paths)
+        assert repository.io_counter.get("read") == 0
+
+    def test_scan_raises_layout_error_without_loading(self, input_paths, tmp_path):
+        """読み込みが確実に失敗するファイルは、読み込まずに走査時の例外で報告する"""
+        repository = _CountingRepository()
+        header_only = tmp_path / "d.csv"
+        header_only.write_text(_header_csv("2025/10/21", rows=0), encoding="utf-8")
+
+        with pytest.raises(EmptyDataError, match="CSV file 'd.csv' contains no data"):
+            repository.scan(input_paths + [header_only])
+        assert repository.io_counter.get("read") == 0
+
+    def test_rejects_metadata_from_other_scan(self, input_paths):
+        """直近の走査で取得していないメタデータは MergeError（探索が範囲外に出ない）"""
+        loader = LazyCsvLoader(CsvRepository(), batch_size=2)
+        stale = loader.scan(input_paths)
+        loader.scan(input_paths)
+
+        with pytest.raises(MergeError, match="c.csv: 直近の走査で取得したメタデータではありません"):
+            loader.load(stale[0].metadata)
@@ -0,0 +1 @@
+"""Infrastructure sinks のテストパッケージ"""
@@ -0,0 +1,201 @@
+"""出力シンクのテスト"""
+import io
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from domain.models.csv_file import CsvFile
+from domain.models.csv_schema import CsvSchema
+from infra.repositories.csv_repository import CsvRepository
+from infra.repositories.csv_writer import CsvWriter
+from infra.sinks.output_sinks import (
+    ArrowIpcSink,
+    CsvSink,
+    FeatherSink,
+    OutputSink,
+    ParquetSink,
+    create_sink,
+)
+
+
+@pytest.fixture
+def merged_df():
+    """結合結果と同じ形式のDataFrameを提供（48行）"""
+    rows = 48
+    return CsvSchema.to_storage_dtypes(pd.DataFrame({
+        "No": np.arange(1, rows + 1),
+        "日時": pd.date_range("2025-01-01", periods=rows, freq="h"),
+        "電圧": np.full(rows, 100),
+        "周波数": np.full(rows, 50),
+        "パワー": np.arange(rows) * 10,
+        "工事フラグ": np.zeros(rows, dtype=np.int64),
+        "参照": np.ones(rows, dtype=np.int64),
+    }))
+
+
+def _chunks(df: pd.DataFrame, size: int) -> list[pd.DataFrame]:
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+
+class TestCreateSink:
+    """create_sink()のテスト"""
+
+    @pytest.mark.parametrize("format_name, sink_class, suffix", [
+        ("csv", CsvSink, ".csv"),
+        ("parquet", ParquetSink, ".parquet"),
+        ("feather", FeatherSink, ".feather"),
+        ("arrow", ArrowIpcSink, ".arrow"),
+    ])
+    def test_create_sink_by_format_name(self, format_name, sink_class, suffix):
+        """出力形式の名前から対応するシンクを作成する"""
+        sink = create_sink(format_name)
+
+        assert type(sink) is sink_class
+        assert sink.suffix == suffix
+
+    def test_create_sink_passes_options(self):
+        """オプションはシンクのコンストラクタに渡される"""
+        assert create_sink("parquet", row_group_rows=10).row_group_rows == 10
+
+    def test_create_sink_rejects_unknown_format(self):
+        """未対応の出力形式はValueError"""
+        with pytest.raises(ValueError, match="未対応の出力形式です: xlsx"):
+            create_sink("xlsx")
+
+    def test_parquet_sink_rejects_non_positive_row_group_rows(self):
+        """行グループの行数が1未満の場合はValueError"""
+        with pytest.raises(ValueError, match="行グループの行数"):
+            ParquetSink(row_group_rows=0)
+
+
+class TestCsvSink:
+    """CsvSinkのテスト"""
+
+    def test_write_stream_matches_single_write(self, merged_df, tmp_path):
+        """チャンクに分けて書き出しても、まとめて書き出した場合と同じになる"""
+        whole = tmp_path / "whole.csv"
+        streamed = tmp_path / "streamed.csv"
+
+        CsvSink().write(merged_df, whole)
+        CsvSink().write_stream(_chunks(merged_df, 10), streamed)
+
+        buffer = io.BytesIO()
+        CsvWriter().write(merged_df, buffer, header=True)
+        assert whole.read_bytes() == buffer.getvalue()
+        assert streamed.read_bytes() == buffer.getvalue()
+
+
+class TestArrowSinksWithoutPyarrow:
+    """pyarrowがない環境での列指向シンクのテスト"""
+
+    @pytest.mark.parametrize("sink_class", [ParquetSink, FeatherSink, ArrowIpcSink])
+    def test_ensure_available_raises_import_error(self, sink_class, monkeypatch):
+        """pyarrowがインストールされていない場合はImportError"""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+        with pytest.raises(ImportError, match="pyarrow"):
+            sink_class().ensure_available()
+
+    def test_csv_sink_does_not_require_pyarrow(self, monkeypatch):
+        """CSV出力はpyarrowを必要としない"""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+        CsvSink().ensure_available()
+
+
+class TestArrowSinks:
+    """列指向シンクのテスト（pyarrowが必要）"""
+
+    @pytest.fixture(autouse=True)
+    def pyarrow(self):
+        return pytest.importorskip("pyarrow")
+
+    def test_parquet_row_groups_do_not_depend_on_chunk_size(self, merged_df, tmp_path):
+        """行グループはチャンクの大きさによらず row_group_rows 行ずつになる"""
+        import pyarrow.parquet as pq
+        path = tmp_path / "out.parquet"
+
+        ParquetSink(row_group_rows=20).write_stream(_chunks(merged_df, 7), path)
+
+        metadata = pq.ParquetFile(path).metadata
+        assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [20, 20, 8]
+        pd.testing.assert_frame_equal(pd.read_parquet(path), merged_df)
+
+    @pytest.mark.parametrize("sink_class", [FeatherSink, ArrowIpcSink])
+    def test_ipc_file_is_memory_mappable(self, pyarrow, sink_class, merged_df, tmp_path):
+        """Feather / Arrow IPC はメモリマップで読み込め、格納型を保つ"""
+        path = tmp_path / f"out{sink_class.suffix}"
+
+        sink_class().write_stream(_chunks(merged_df, 10), path)
+
+        with pyarrow.memory_map(str(path)) as source:
+            table = pyarrow.ipc.open_file(source).read_all()
+        pd.testing.assert_frame_equal(table.to_pandas(), merged_df)
+        assert table.schema.field("電圧").type == pyarrow.int16()
+
+
+    @pytest.mark.parametrize("sink_class", [ParquetSink, FeatherSink, ArrowIpcSink])
+    def test_out_of_range_value_in_later_chunk_raises_value_error(self, sink_class, merged_df, tmp_path):
+        """後のチャンクだけが格納型に収まらない場合も、まとめて書き出す場合と同じValueError"""
+        wide = merged_df.astype({"電圧": np.int64})
+        wide.loc[30, "電圧"] = 40000
+        message = "電圧: 値の範囲（100〜40000）が .* 形式の出力の型 int16 に収まりません"
+
+        with pytest.raises(ValueError, match=message):
+            sink_class().write_stream(_chunks(wide, 24), tmp_path / f"streamed{sink_class.suffix}")
+        with pytest.raises(ValueError, match=message):
+            sink_class().write(wide, tmp_path / f"whole{sink_class.suffix}")
+
+    def test_schema_uses_storage_dtypes_regardless_of_chunk_values(self, pyarrow, merged_df, tmp_path):
+        """チャンクごとの値の範囲によらず、スキーマは格納型になる"""
+        import pyarrow.parquet as pq
+        path = tmp_path / "out.parquet"
+        chunks = [chunk.astype({"電圧": np.int8}) if position == 0 else chunk.astype({"電圧": np.int64})
+                  for position, chunk in enumerate(_chunks(merged_df, 24))]
+
+        ParquetSink().write_stream(chunks, path)
+
+        assert pq.read_schema(path).field("電圧").type == pyarrow.int16()
+        pd.testing.assert_frame_equal(pd.read_parquet(path), merged_df)
+
+class TestCsvRepositoryWithSink:
+    """CsvRepositoryから出力シンクを使うテスト"""
+
+    class _RecordingSink(OutputSink):
+        """書き出したDataFrameを記録するシンク"""
+
+        format_name = "recording"
+        suffix = ".rec"
+
+        def __init__(self):
+            self.frames = []
+
+        def write_stream(self, chunks, path):
+            self.frames = list(chunks)
+            path.write_bytes(b"")
+
+    def test_save_uses_sink_and_its_suffix(self, merged_df, tmp_path):
+        """save()はシンクで書き出し、出力パスの拡張子はシンクに合わせる"""
+        sink = self._RecordingSink()
+        repository = CsvRepository(sink=sink)
+
+        output_path = repository.save(CsvFile(file_path="merged.csv", data=merged_df.iloc[:24]), tmp_path)
+
+        assert output_path.suffix == ".rec"
+        assert output_path.exists()
+        pd.testing.assert_frame_equal(sink.frames[0], merged_df.iloc[:24])
+
+    def test_save_removes_partial_file_on_failure(self, merged_df, tmp_path):
+        """書き出しに失敗した場合は書きかけのファイルを削除する"""
+        class FailingSink(self._RecordingSink):
+            def write_stream(self, chunks, path):
+                path.write_bytes(b"partial")
+                raise RuntimeError("disk full")
+
+        repository = CsvRepository(sink=FailingSink())
+
+        with pytest.raises(RuntimeError):
+            repository.save(CsvFile(file_path="merged.csv", data=merged_df.iloc[:24]), tmp_path)
+        assert list(tmp_path.iterdir()) == []
@@ -3,10 +3,17 @@
 このモジュールは、CSV結合ユースケースの統合テストを提供します。
 """
 from pathlib import Path
+import os
+import multiprocessing
 import pytest
 from unittest.mock import Mock, MagicMock
 
+from usecase import merge_csv_files
 from usecase.merge_csv_files import MergeCsvFilesUseCase
+from infra.diagnostics.phase_timer import PhaseTimer
+from infra.diagnostics.run_profiler import RunProfiler
+from infra.diagnostics.span_tracer import SpanTracer
+from infra.repositories.csv_repository import CsvRepository
 from domain.models.csv_file import CsvFile
 from domain.models.merge_result import MergeResult
 from domain.exceptions import (
@@ -14,6 +21,8 @@ from domain.exceptions import (
     InvalidCsvFormatError,
     MergeError,
     EmptyDataError,
+    LoadCancelledError,
+    MultipleFileErrors,
 )
 
 
@@ -22,8 +31,10 @@ class TestMergeCsvFilesUseCase:
 
     @pytest.fixture
     def mock_repository(self):
-        """モックリポジトリのフィクスチャ"""
-        return Mock()
+        """モックリポジトリのフィクスチャ（読み込み前の確認はすべて成功）"""
+        repository = Mock()
+        repository.check_inputs.return_value = {}
+        return repository
 
     @pytest.fixture
     def mock_merger(self):
@@ -54,7 +65,7 @@ class TestMergeCsvFilesUseCase:
         mock_merged_file.data = [1, 2, 3, 4, 5]  # 5行のデータ
         mock_output_path = Path("static/downloads/merged_20251019_120000.csv")
 
-        mock_repository.load.side_effect = [mock_csv_file1, mock_csv_file2]
+        mock_repository.load_many.return_value = [mock_csv_file1, mock_csv_file2]
         mock_merger.merge.return_value = mock_merged_file
         mock_repository.save.return_value = mock_output_path
 
@@ -64,7 +75,7 @@ class TestMergeCsvFilesUseCase:
         # Assert
         assert result.is_successful is True
         assert result.output_path == mock_output_path
-        assert mock_repository.load.call_count == 2
+        mock_repository.load_many.assert_called_once_with(input_paths)
         mock_merger.merge.assert_called_once()
         mock_repository.save.assert_called_once_with(mock_merged_file, output_dir)
 
@@ -79,7 +90,7 @@ class TestMergeCsvFilesUseCase:
         mock_merged_file.data = [1, 2, 3]  # 3行のデータ
         mock_output_path = Path("static/downloads/merged_20251019_120000.csv")
 
-        mock_repository.load.return_value = mock_csv_file
+        mock_repository.load_many.return_value = [mock_csv_file]
         mock_merger.merge.return_value = mock_merged_file
         mock_repository.save.return_value = mock_output_path
 
@@ -96,7 +107,7 @@ class TestMergeCsvFilesUseCase:
         input_paths = [Path("nonexistent.csv")]
         output_dir = Path("static/downloads")
 
-        mock_repository.load.side_effect = CsvFileNotFoundError(
+        mock_repository.load_many.side_effect = CsvFileNotFoundError(
             "CSVファイルが見つかりません: nonexistent.csv"
         )
 
@@ -114,7 +125,7 @@ class TestMergeCsvFilesUseCase:
         input_paths = [Path("tests/fixtures/csv/invalid_dates.csv")]
         output_dir = Path("static/downloads")
 
-        mock_repository.load.side_effect = InvalidCsvFormatError(
+        mock_repository.load_many.side_effect = InvalidCsvFormatError(
             "invalid_dates.csv: 不正な日時が検出されました（3行目、5行目から6行目）"
         )
 
@@ -138,7 +149,7 @@ class TestMergeCsvFilesUseCase:
         mock_csv_file1 = Mock(spec=CsvFile)
         mock_csv_file2 = Mock(spec=CsvFile)
 
-        mock_repository.load.side_effect = [mock_csv_file1, mock_csv_file2]
+        mock_repository.load_many.return_value = [mock_csv_file1, mock_csv_file2]
         mock_merger.merge.side_effect = MergeError(
             "日時の重複が検出されました: 2025/10/18 10:00:00"
         )
@@ -157,7 +168,7 @@ class TestMergeCsvFilesUseCase:
         input_paths = [Path("tests/fixtures/csv/empty.csv")]
         output_dir = Path("static/downloads")
 
-        mock_repository.load.side_effect = EmptyDataError(
+        mock_repository.load_many.side_effect = EmptyDataError(
             "CSVファイルが空です"
         )
 
@@ -192,7 +203,7 @@ class TestMergeCsvFilesUseCase:
         mock_merged_file.data = [1, 2, 3, 4]  # 4行のデータ
         mock_output_path = Path("static/downloads/merged_20251019_120000.csv")
 
-        mock_repository.load.return_value = mock_csv_file
+        mock_repository.load_many.return_value = [mock_csv_file]
         mock_merger.merge.return_value = mock_merged_file
         mock_repository.save.return_value = mock_output_path
 
@@ -217,7 +228,7 @@ class TestMergeCsvFilesUseCase:
         mock_merged_file.data = [1, 2, 3, 4, 5, 6, 7]  # 7行のデータ
         mock_output_path = Path("static/downloads/merged_20251019_120000.csv")
 
-        mock_repository.load.side_effect = mock_csv_files
+        mock_repository.load_many.return_value = mock_csv_files
         mock_merger.merge.return_value = mock_merged_file
         mock_repository.save.return_value = mock_output_path
 
@@ -226,7 +237,7 @@ class TestMergeCsvFilesUseCase:
 
         # Assert
         assert result.is_successful is True
-        assert mock_repository.load.call_count == 3
+        mock_repository.load_many.assert_called_once_with(input_paths)
         # mergerには3つのCsvFileオブジェクトが渡されることを確認
         called_csv_files = mock_merger.merge.call_args[0][0]
         assert len(called_csv_files) == 3
@@ -237,3 +248,361 @@ class TestMergeCsvFilesUseCase:
 
     # ZIP入力関連のテストは要件撤廃につき削除
 
+
+class TestMergeCsvFilesUseCaseParallelLoad:
+    """MergeCsvFilesUseCaseの並列読み込みモードのテスト
+
+    プロセスプールに渡すため、リポジトリは実物（CsvRepository）を使用します。
+    """
+
+    @pytest.fixture
+    def fixtures_dir(self):
+        """テストフィクスチャディレクトリのパスを提供"""
+        return Path(__file__).parent.parent.parent / "fixtures" / "csv"
+
+    @pytest.fixture
+    def mock_merger(self):
+        """モックマージャーのフィクスチャ"""
+        mock_merger = Mock()
+        mock_merger.merge.return_value = Mock(spec=CsvFile, data=[1, 2, 3])
+        return mock_merger
+
+    @pytest.fixture
+    def mock_repository_save(self, monkeypatch):
+        """保存処理をモック化（ファイルを書き出さない）"""
+        mock_save = Mock(return_value=Path("static/downloads/merged_20251019_120000.csv"))
+        monkeypatch.setattr(CsvRepository, "save", mock_save)
+        return mock_save
+
+    def test_parallel_load_returns_files_in_input_order(
+        self, fixtures_dir, mock_merger, mock_repository_save
+    ):
+        """並列読み込みでも入力順にCsvFileが並ぶ"""
+        # Arrange
+        input_paths = [
+            fixtures_dir / "day3_2025-10-20.csv",
+            fixtures_dir / "day1_2025-10-18.csv",
+            fixtures_dir / "day2_2025-10-19.csv",
+        ]
+        usecase = MergeCsvFilesUseCase(merger=mock_merger, jobs=2)
+
+        # Act
+        result = usecase.execute(input_paths, Path("static/downloads"))
+
+        # Assert
+        assert result.is_successful is True
+        called_csv_files = mock_merger.merge.call_args[0][0]
+        assert [f.file_name for f in called_csv_files] == [p.name for p in input_paths]
+        assert all(f.row_count == 24 for f in called_csv_files)
+
+    def test_parallel_load_reports_first_failure_in_input_order(
+        self, fixtures_dir, mock_merger, mock_repository_save
+    ):
+        """並列読み込みで失敗した場合、入力順で最初の失敗を逐次と同じメッセージで返す"""
+        # Arrange
+        input_paths = [
+            fixtures_dir / "day1_2025-10-18.csv",
+            fixtures_dir / "invalid_dates.csv",
+            Path("nonexistent.csv"),
+        ]
+        usecase = MergeCsvFilesUseCase(merger=mock_merger, jobs=2)
+        sequential = MergeCsvFilesUseCase(merger=mock_merger, jobs=1)
+
+        # Act
+        result = usecase.execute(input_paths, Path("static/downloads"))
+        expected = sequential.execute(input_paths, Path("static/downloads"))
+
+        # Assert
+        assert result.is_successful is False
+        assert "CSVフォーマットが不正です" in result.error_message
+        assert "invalid_dates.csv" in result.error_message
+        assert result.error_message == expected.error_message
+        mock_merger.merge.assert_not_called()
+
+    def test_parallel_load_reports_parse_failure_like_sequential(
+        self, fixtures_dir, mock_merger, mock_repository_save
+    ):
+        """並列読み込みでパースに失敗した場合、逐次と同じメッセージで返す"""
+        # Arrange
+        input_paths = [
+            fixtures_dir / "day1_2025-10-18.csv",
+            fixtures_dir / "invalid_dates.csv",
+            fixtures_dir / "day2_2025-10-19.csv",
+        ]
+        usecase = MergeCsvFilesUseCase(merger=mock_merger, jobs=2)
+        sequential = MergeCsvFilesUseCase(merger=mock_merger, jobs=1)
+
+        # Act
+        result = usecase.execute(input_paths, Path("static/downloads"))
+        expected = sequential.execute(input_paths, Path("static/downloads"))
+
+        # Assert
+        assert result.is_successful is False
+        assert "CSVフォーマットが不正です" in result.error_message
+        assert "invalid_dates.csv" in result.error_message
+        assert result.error_message == expected.error_message
+        mock_merger.merge.assert_not_called()
+
+    def test_worker_stops_when_cancelled(self, fixtures_dir):
+        """前のチャンクが失敗したワーカーは読み込まずに中止する"""
+        # Arrange
+        failed = multiprocessing.Value("q", 0)
+        repository = CsvRepository()
+        repository.load_many = Mock()
+        merge_csv_files._init_worker(failed)
+
+        # Act & Assert
+        try:
+            with pytest.raises(LoadCancelledError):
+                merge_csv_files._load_chunk(repository, RunProfiler(), [fixtures_dir / "day1_2025-10-18.csv"], 1)
+        finally:
+            merge_csv_files._init_worker(None)
+        repository.load_many.assert_not_called()
+
+    def test_worker_before_failed_chunk_keeps_loading(self, fixtures_dir):
+        """失敗したチャンクより前のチャンクのワーカーは読み込みを続ける"""
+        # Arrange
+        failed = multiprocessing.Value("q", 1)
+        repository = CsvRepository()
+        merge_csv_files._init_worker(failed)
+
+        # Act
+        try:
+            outcomes = merge_csv_files._load_chunk(
+                repository, RunProfiler(), [fixtures_dir / "day1_2025-10-18.csv"], 0
+            )[0]
+        finally:
+            merge_csv_files._init_worker(None)
+
+        # Assert
+        assert isinstance(outcomes[0], CsvFile)
+
+    def test_jobs_zero_uses_cpu_count(self):
+        """jobsに0を指定するとCPUコア数のワーカーを使う"""
+        import os
+
+        usecase = MergeCsvFilesUseCase(jobs=0)
+
+        assert usecase.jobs == (os.cpu_count() or 1)
+
+    def test_negative_jobs_are_rejected(self):
+        """jobsに負の値を指定するとエラーにする（CPUコア数とはみなさない）"""
+        with pytest.raises(ValueError, match="0以上"):
+            MergeCsvFilesUseCase(jobs=-3)
+
+    def test_workers_are_not_forked(self):
+        """ワーカーはスレッドのある親プロセスを fork せずに起動する"""
+        assert merge_csv_files._worker_context().get_start_method() in ("forkserver", "spawn")
+
+
+class TestMergeCsvFilesUseCaseStreaming:
+    """MergeCsvFilesUseCaseのストリーミング結合モードのテスト"""
+
+    @pytest.fixture
+    def fixtures_dir(self):
+        """テストフィクスチャディレクトリのパスを提供"""
+        return Path(__file__).parent.parent.parent / "fixtures" / "csv"
+
+    def test_streaming_writes_same_output_as_in_memory_merge(self, fixtures_dir, tmp_path):
+        """ストリーミング結合の出力は通常の結合と同じ内容になる"""
+        # Arrange
+        input_paths = [
+            fixtures_dir / "day3_2025-10-20.csv",
+            fixtures_dir / "day1_2025-10-18.csv",
+            fixtures_dir / "day2_2025-10-19.csv",
+        ]
+
+        # Act
+        expected = MergeCsvFilesUseCase().execute(input_paths, tmp_path / "memory")
+        result = MergeCsvFilesUseCase(streaming=True).execute(input_paths, tmp_path / "stream")
+
+        # Assert
+        assert result.is_successful is True
+        assert result.merged_file_count == 3
+        assert result.total_rows == expected.total_rows == 72
+        assert result.output_path.read_bytes() == expected.output_path.read_bytes()
+
+    def test_streaming_failure_leaves_no_output_file(self, fixtures_dir, tmp_path):
+        """ストリーミング結合が失敗した場合、出力ファイルは残らない"""
+        # Arrange: 欠損日（10/19）がある入力
+        input_paths = [
+            fixtures_dir / "day1_2025-10-18.csv",
+            fixtures_dir / "day3_2025-10-20.csv",
+        ]
+
+        # Act
+        result = MergeCsvFilesUseCase(streaming=True).execute(input_paths, tmp_path)
+
+        # Assert
+        assert result.is_successful is False
+        assert "結合処理でエラーが発生しました" in result.error_message
+        assert list(tmp_path.glob("merged_*.csv")) == []
+
+
+class TestMergeCsvFilesUseCaseStats:
+    """MergeCsvFilesUseCaseのフェーズ別計測のテスト"""
+
+    @pytest.fixture
+    def fixtures_dir(self):
+        """テストフィクスチャディレクトリのパスを提供"""
+        return Path(__file__).parent.parent.parent / "fixtures" / "csv"
+
+    @pytest.mark.parametrize("options", [{}, {"streaming": True}, {"jobs": 2}])
+    def test_stats_cover_load_merge_and_write(self, fixtures_dir, tmp_path, options):
+        """phase_timer を指定すると、読み込み・結合・保存の各フェーズを計測結果に含む"""
+        # Arrange
+        input_paths = [
+            fixtures_dir / "day1_2025-10-18.csv",
+            fixtures_dir / "day2_2025-10-19.csv",
+        ]
+        usecase = MergeCsvFilesUseCase(phase_timer=PhaseTimer(enabled=True), **options)
+
+        # Act
+        result = usecase.execute(input_paths, tmp_path)
+
+        # Assert
+        assert result.is_successful is True
+        assert {"read", "parse", "validate", "merge", "write"} <= set(result.stats.phases)
+        assert {timing.path for timing in result.stats.slowest_files} == set(input_paths)
+
+    def test_stats_are_attached_to_failure(self, fixtures_dir, tmp_path):
+        """失敗した場合も計測結果を含む"""
+        # Arrange
+        input_paths = [fixtures_dir / "invalid_dates.csv"]
+        usecase = MergeCsvFilesUseCase(phase_timer=PhaseTimer(enabled=True))
+
+        # Act
+        result = usecase.execute(input_paths, tmp_path)
+
+        # Assert
+        assert result.is_successful is False
+        assert "read" in result.stats.phases
+
+    def test_no_stats_without_phase_timer(self, fixtures_dir, tmp_path):
+        """phase_timer を指定しない場合、計測結果はNone"""
+        # Act
+        result = MergeCsvFilesUseCase().execute([fixtures_dir / "day1_2025-10-18.csv"], tmp_path)
+
+        # Assert
+        assert result.is_successful is True
+        assert result.stats is None
+
+    def test_profiler_aggregates_parallel_workers(self, fixtures_dir, tmp_path):
+        """並列読み込みではワーカー内でプロファイルし、結果を合算する"""
+        # Arrange
+        input_paths = [
+            fixtures_dir / "day1_2025-10-18.csv",
+            fixtures_dir / "day2_2025-10-19.csv",
+        ]
+        profiler = RunProfiler(cpu=True, memory=True)
+        usecase = MergeCsvFilesUseCase(jobs=2, profiler=profiler)
+
+        # Act
+        result = usecase.execute(input_paths, tmp_path)
+        profiler.stop()
+
+        # Assert
+        assert result.is_successful is True
+        cpu_report = profiler.write_cpu_report(tmp_path / "cpu.txt").read_text(encoding="utf-8")
+        memory_report = profiler.write_memory_report(tmp_path / "memory.txt").read_text(encoding="utf-8")
+        assert "(load_many)" in cpu_report
+        phases = [line.split("（")[0] for line in memory_report.splitlines() if line.startswith("===")]
+        assert phases == ["=== load", "=== merge", "=== write"]
+
+    def test_trace_covers_worker_spans(self, fixtures_dir, tmp_path):
+        """並列読み込みのワーカーのスパンも親プロセスのトレースに含まれる"""
+        # Arrange
+        input_paths = [
+            fixtures_dir / "day1_2025-10-18.csv",
+            fixtures_dir / "day2_2025-10-19.csv",
+        ]
+        tracer = SpanTracer()
+        usecase = MergeCsvFilesUseCase(jobs=2, phase_timer=PhaseTimer(tracer=tracer))
+
+        # Act
+        result = usecase.execute(input_paths, tmp_path)
+
+        # Assert
+        assert result.is_successful is True
+        assert result.stats is None
+        spans = [event for event in tracer.to_trace_events() if event["ph"] == "X"]
+        names = {span["name"] for span in spans}
+        assert {"execute", "load_chunk", "read", "parse", "merge", "write", "save"} <= names
+        reads = [span for span in spans if span["name"] == "read"]
+        assert {span["args"]["file"] for span in reads} == {path.name for path in input_paths}
+        assert all(span["pid"] != os.getpid() for span in reads)
+        execute = next(span for span in spans if span["name"] == "execute")
+        assert execute["args"]["rows"] == 48
+
+
+class TestMergeCsvFilesUseCaseCollectErrors:
+    """MergeCsvFilesUseCaseのエラーをまとめて報告するモードのテスト"""
+
+    @pytest.fixture
+    def fixtures_dir(self):
+        """テストフィクスチャディレクトリのパスを提供"""
+        return Path(__file__).parent.parent.parent / "fixtures" / "csv"
+
+    @pytest.fixture
+    def input_paths(self, fixtures_dir, tmp_path):
+        """正常なファイルと、存在しない・空・日時が不正なファイルを含む入力"""
+        empty = tmp_path / "empty.csv"
+        empty.write_bytes(b"")
+        return [
+            fixtures_dir / "day1_2025-10-18.csv",
+            fixtures_dir / "invalid_dates.csv",
+            tmp_path / "missing.csv",
+            empty,
+            fixtures_dir / "day2_2025-10-19.csv",
+        ]
+
+    @pytest.mark.parametrize("options", [{}, {"jobs": 2}], ids=["sequential", "parallel"])
+    def test_reports_all_failures_in_input_order(self, input_paths, tmp_path, options):
+        """すべての失敗を、件数の行に続けて入力順に1ファイル1行で報告する"""
+        # Act
+        result = MergeCsvFilesUseCase(collect_errors=True, **options).execute(input_paths, tmp_path / "out")
+
+        # Assert
+        assert result.is_successful is False
+        lines = result.error_message.split("\n")
+        assert lines[0] == "3件のファイルでエラーが発生しました:"
+        assert lines[1] == "  CSVフォーマットが不正です: invalid_dates.csv: 不正な日時が検出されました（3行目、5行目から6行目、8行目）"
+        assert lines[2] == f"  ファイルが見つかりません: CSVファイルが見つかりません: {input_paths[2]}"
+        assert lines[3] == "  empty.csv: CSVフォーマットが不正です: CSVファイルの読み込みに失敗しました: No columns to parse from file"
+        assert not (tmp_path / "out").exists()
+
+    def test_streaming_collects_precheck_failures(self, input_paths, tmp_path):
+        """ストリーミング結合では、読み込み前の確認の失敗をまとめて報告する"""
+        # Act
+        result = MergeCsvFilesUseCase(streaming=True, collect_errors=True).execute(input_paths, tmp_path)
+
+        # Assert
+        assert result.is_successful is False
+        assert result.error_message.startswith("2件のファイルでエラーが発生しました:")
+
+    def test_fail_fast_reports_first_failure_without_parsing_later_files(self, input_paths, tmp_path):
+        """既定では、入力順で最初の失敗を報告し、それより後のファイルはパースしない"""
+        # Arrange
+        repository = CsvRepository()
+        repository.load_many = Mock(wraps=repository.load_many)
+
+        # Act
+        result = MergeCsvFilesUseCase(repository=repository).execute(input_paths[::-1], tmp_path)
+
+        # Assert
+        assert result.error_message == (
+            "CSVフォーマットが不正です: CSVファイルの読み込みに失敗しました: No columns to parse from file"
+        )
+        repository.load_many.assert_called_once_with([input_paths[4]])
+        assert repository.cancellation is None
+
+    def test_prefixes_file_name_when_message_lacks_it(self):
+        """メッセージにファイル名を含まないエラーはファイル名を前に付ける"""
+        # Arrange
+        error = MultipleFileErrors([(Path("a.csv"), MergeError("不正"))])
+
+        # Act
+        result = MergeCsvFilesUseCase()._handle_exception(error)
+
+        # Assert
+        assert result.error_message == "1件のファイルでエラーが発生しました:\n  a.csv: 結合処理でエラーが発生しました: 不正"
@@ -2,8 +2,13 @@
 
 このモジュールは、複数のCSVファイルを結合するユースケースを提供します。
 """
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+import multiprocessing
+import os
 
+from domain.models.csv_file import CsvFile
 from domain.models.merge_result import MergeResult
 from domain.exceptions import (
     CsvFileNotFoundError,
@@ -11,8 +16,15 @@ from domain.exceptions import (
     MergeError,
     EmptyDataError,
     CsvMergerError,
+    LoadCancelledError,
+    MultipleFileErrors,
 )
+from infra.cache.encoding_profile import EncodingProfile
+from infra.diagnostics.phase_timer import PhaseTimer
+from infra.diagnostics.run_profiler import RunProfiler
+from infra.repositories.cancellation import CancellationToken
 from infra.repositories.csv_repository import CsvRepository
+from infra.repositories.io_byte_counter import IoByteCounter
 from domain.services.csv_merger import CsvMerger
 
 
@@ -21,24 +33,67 @@ class MergeCsvFilesUseCase:
     
     複数のCSVファイルを読み込み、結合して保存するユースケースを実行します。
     
+    読み込みの前に、安価な確認から順に（すべてのファイルの存在 → サイズ →
+    先頭・末尾の行のレイアウト）入力を確認し、失敗したファイルより後のファイルは
+    パースしません。読み込み中に失敗した場合もそれより後のファイルの読み込みを中止し、
+    並列読み込みでは後のチャンクのワーカーに中止を伝え、待機中の後のチャンクは開始しません。
+    報告する失敗は逐次読み込みと同じく、入力順で最初の失敗です。
+    collect_errors の場合は中止せずにすべての入力を確認し、失敗をまとめて報告します。
+    
     Attributes:
         repository: CSVファイルの読み書きを担当するリポジトリ
         merger: CSV結合のドメインサービス
+        jobs: ファイル読み込みの並列ワーカー数（1の場合は逐次読み込み）
+        streaming: 結合結果全体をメモリに保持せずにチャンク単位で書き出す場合はTrue
+        collect_errors: 最初の失敗で中止せず、すべての入力のエラーをまとめて報告する場合はTrue
+        phase_timer: フェーズ別の計測に使うタイマー（リポジトリと共有）
+        profiler: CPU・メモリのプロファイラ
     """
 
+    # ストリーミング結合で一度にまとめて読み込むファイル数
+    STREAMING_BATCH_SIZE: int = 64
+
+    # 計測結果に記録する、読み込みに時間のかかったファイルの数
+    STATS_SLOWEST_FILES: int = 10
+
     def __init__(
         self,
         repository: CsvRepository | None = None,
-        merger: CsvMerger | None = None
+        merger: CsvMerger | None = None,
+        jobs: int = 1,
+        streaming: bool = False,
+        phase_timer: PhaseTimer | None = None,
+        profiler: RunProfiler | None = None,
+        collect_errors: bool = False
     ):
         """初期化
         
         Args:
             repository: CSVリポジトリ（Noneの場合は新規作成）
             merger: CSVマージャー（Noneの場合は新規作成）
+            jobs: ファイル読み込みの並列ワーカー数（0の場合はCPUコア数）
+            streaming: ストリーミング結合を行う場合はTrue（jobsは使用しない）
+            phase_timer: フェーズ別の計測に使うタイマー（Noneの場合は計測しない）。
+                指定した場合はリポジトリの読み込みの計測にも同じタイマーを使う
+            profiler: CPU・メモリのプロファイラ（Noneの場合はプロファイルしない）。
+                並列読み込みではワーカー内でもプロファイルし、結果を合算する
+            collect_errors: すべての入力のエラーをまとめて MultipleFileErrors として
+                報告する場合はTrue。ストリーミング結合では読み込み前の確認のエラーのみまとめる
+        
+        Raises:
+            ValueError: jobs が負の場合
         """
+        if jobs < 0:
+            raise ValueError(f"jobs には0以上を指定してください（0でCPUコア数）: {jobs}")
         self.repository = repository or CsvRepository()
         self.merger = merger or CsvMerger()
+        self.jobs = jobs or (os.cpu_count() or 1)
+        self.streaming = streaming
+        self.collect_errors = collect_errors
+        self.phase_timer = phase_timer or PhaseTimer()
+        if phase_timer is not None:
+            self.repository.phase_timer = phase_timer
+        self.profiler = profiler or RunProfiler()
 
     def execute(
         self,
@@ -52,7 +107,8 @@ class MergeCsvFilesUseCase:
             output_dir: 出力先ディレクトリ
             
         Returns:
-            結合結果を表すMergeResultオブジェクト
+            結合結果を表すMergeResultオブジェクト。phase_timer が有効な場合は、
+            成功・失敗のどちらでもフェーズ別の計測結果を含む
         """
         # 入力ファイルリストの検証
         if not input_paths:
@@ -60,21 +116,223 @@ class MergeCsvFilesUseCase:
                 error_message="入力ファイルが指定されていません。"
             )
 
-        try:
-            # 1. ファイルを読み込み
-            csv_files = [self.repository.load(path) for path in input_paths]
-            # 2-4. 結合して保存し、結果を生成
-            return self._merge_and_save(csv_files, output_dir)
-        except Exception as e:
-            return self._handle_exception(e)
+        with self.phase_timer.span("execute", files=len(input_paths), streaming=self.streaming):
+            # collect_errors でない場合は、最初に失敗したファイルで読み込みを中止する
+            previous_cancellation = self.repository.cancellation
+            self.repository.cancellation = None if self.collect_errors else CancellationToken()
+            try:
+                # 0. 存在・サイズの安価な確認を、ファイルを読む前にすべての入力に行う
+                # （レイアウトは読み込み・走査で読んだバイト列で確認する）
+                errors = self.repository.check_inputs(input_paths)
+                if self.streaming:
+                    if self.collect_errors:
+                        self._raise_collected(input_paths, [errors.get(index) for index in range(len(input_paths))])
+                    elif errors:
+                        # 入力順で最初の失敗より前のファイルだけを走査し、そこで失敗しなければ報告する
+                        first = min(errors)
+                        self.repository.scan(input_paths[:first], self.STREAMING_BATCH_SIZE)
+                        raise errors[first]
+                    # 読み込み・結合・保存をチャンク単位で行う
+                    with self.profiler.memory_phase("load_merge_write"):
+                        result = self._merge_and_save_streaming(input_paths, output_dir)
+                else:
+                    # 1. ファイルを読み込み
+                    with self.profiler.memory_phase("load"):
+                        csv_files = self._load_files(input_paths, errors)
+                    # 2-4. 結合して保存し、結果を生成
+                    result = self._merge_and_save(csv_files, output_dir)
+            except Exception as e:
+                result = self._handle_exception(e)
+            finally:
+                self.repository.cancellation = previous_cancellation
+            self.phase_timer.annotate(success=result.success, rows=result.total_rows)
+
+        if self.phase_timer.enabled:
+            result = result.with_stats(self.phase_timer.to_stats(slowest=self.STATS_SLOWEST_FILES))
+        return result
 
 
     # ZIP入力はサポートしない（要件撤廃）
 
+    def _load_files(
+        self,
+        input_paths: list[str | Path],
+        errors: Mapping[int, Exception] | None = None
+    ) -> list[CsvFile]:
+        """入力ファイルを読み込む
+        
+        同じレイアウトの小さなファイルはリポジトリ側でまとめてパースされます。
+        jobsが2以上の場合は、入力を連続したチャンクに分け、CPUバウンドな
+        パース処理をプロセスプールで並列実行します。結果は入力順で返します。
+        
+        失敗した場合はそれより後のファイルの読み込みを中止し、前のファイルを読み終えてから
+        入力順で最初の失敗の例外を送出します（事前の確認で失敗したファイルより後は読みません）。
+        collect_errors の場合は事前の確認で失敗したファイル以外をすべて読み込み、
+        失敗があれば事前の確認の失敗と合わせて MultipleFileErrors を送出します。
+        
+        Args:
+            input_paths: 入力CSVファイルのパスリスト
+            errors: 事前の確認で失敗したファイルの例外（入力のインデックスごと）
+            
+        Returns:
+            入力順に並んだCsvFileのリスト
+        """
+        errors = errors or {}
+        if self.collect_errors:
+            paths = [path for index, path in enumerate(input_paths) if index not in errors]
+        else:
+            # 入力順で最初の失敗より後のファイルは読まない（前のファイルの失敗を先に報告する）
+            paths = input_paths[:min(errors, default=len(input_paths))]
+        if self.jobs <= 1 or len(paths) <= 1:
+            loaded = self._load_sequential(paths)
+        else:
+            loaded = self._load_parallel(paths)
+        if not self.collect_errors:
+            csv_files = self._csv_files_of(loaded)
+            if errors:
+                raise errors[min(errors)]
+            return csv_files
+        remaining = iter(loaded)
+        outcomes = [
+            errors[index] if index in errors else next(remaining)
+            for index in range(len(input_paths))
+        ]
+        self._raise_collected(input_paths, outcomes)
+        return self._csv_files_of(outcomes)
+
+    @staticmethod
+    def _csv_files_of(outcomes: Sequence[CsvFile | Exception]) -> list[CsvFile]:
+        """ファイルごとの結果から CsvFile を取り出す
+        
+        Args:
+            outcomes: 入力順に並んだ結果
+            
+        Returns:
+            入力順に並んだCsvFileのリスト
+            
+        Raises:
+            Exception: 結果に失敗が含まれる場合、入力順で最初の失敗の例外
+        """
+        csv_files = []
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+            csv_files.append(outcome)
+        return csv_files
+
+    @staticmethod
+    def _raise_collected(
+        input_paths: list[str | Path],
+        outcomes: Sequence[CsvFile | Exception | None]
+    ) -> None:
+        """ファイルごとの結果に失敗があれば MultipleFileErrors を送出する
+        
+        Args:
+            input_paths: 入力CSVファイルのパスリスト
+            outcomes: 入力順に並んだ結果（失敗したファイルは例外）
+        """
+        failures = [
+            (Path(path), outcome)
+            for path, outcome in zip(input_paths, outcomes)
+            if isinstance(outcome, Exception)
+        ]
+        if failures:
+            raise MultipleFileErrors(failures)
+
+    def _load_sequential(self, input_paths: list[str | Path]) -> Sequence[CsvFile | Exception]:
+        """このプロセスで入力ファイルを読み込む
+        
+        Args:
+            input_paths: 入力CSVファイルのパスリスト
+            
+        Returns:
+            入力順に並んだ結果のリスト（失敗を含むのは collect_errors の場合のみ）
+        """
+        if self.collect_errors:
+            return self.repository.load_outcomes(input_paths)
+        return self.repository.load_many(input_paths)
+
+    def _load_parallel(self, input_paths: list[str | Path]) -> Sequence[CsvFile | Exception]:
+        """入力を連続したチャンクに分け、プロセスプールで並列に読み込む
+        
+        ワーカーは fork ではなく forkserver（使えない環境では spawn）で起動します。
+        親プロセスは pyarrow や gzip 書き出しのスレッドを動かしている場合があり、
+        スレッドのあるプロセスを fork するとロックを持ったまま複製されてデッドロックしうるためです。
+        
+        ワーカーはプロセス間で共有する「最初に失敗したチャンクの番号」を受け取り、
+        いずれかのチャンクが失敗すると、それより後のチャンクを読み込んでいるワーカーは
+        区切りで中止し、開始前の後のチャンクは取り消されます。前のチャンクは読み終えるまで待ち、
+        入力順で最初の失敗を報告します（collect_errors の場合は中止しません）。
+        
+        Args:
+            input_paths: 入力CSVファイルのパスリスト
+            
+        Returns:
+            入力順に並んだ結果のリスト（失敗を含むのは collect_errors の場合のみ）
+            
+        Raises:
+            CsvMergerError: collect_errors でない場合、入力順で最初の失敗の例外
+        """
+        workers = min(self.jobs, len(input_paths))
+        context = _worker_context()
+        # まとめてパースする効果と負荷分散の両立のため、ワーカーあたり2チャンクに分ける
+        chunk_count = min(len(input_paths), workers * 2)
+        chunk_size = -(-len(input_paths) // chunk_count)
+        chunks = [
+            input_paths[start:start + chunk_size]
+            for start in range(0, len(input_paths), chunk_size)
+        ]
+        # Value はワーカーの起動時に initializer の引数としてのみ渡せる
+        failed = None if self.collect_errors else context.Value("q", CancellationToken.NOT_FAILED)
+        results: list[Sequence[CsvFile | Exception]] = [[] for _ in chunks]
+        failures: dict[int, Exception] = {}
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=_init_worker, initargs=(failed,)
+        ) as executor:
+            futures = {
+                executor.submit(_load_chunk, self.repository, self.profiler, chunk, position): position
+                for position, chunk in enumerate(chunks)
+            }
+            for future in as_completed(futures):
+                position = futures[future]
+                if failures and position > min(failures):
+                    # 前のチャンクの失敗により中止・取り消したチャンク（結果は使わない）
+                    continue
+                try:
+                    (outcomes, io_counter, cache_stats, phase_timer, profiler,
+                     encoding_profile) = future.result()
+                except LoadCancelledError:
+                    # 前のチャンクの失敗による中止（その失敗を報告する）
+                    continue
+                except Exception as e:
+                    failures[position] = e
+                    if failed is not None:
+                        CancellationToken(failed, position).cancel()
+                    for pending, pending_position in futures.items():
+                        if pending_position > position:
+                            pending.cancel()
+                    continue
+                results[position] = outcomes
+                # ワーカー側で集計したI/Oバイト数・キャッシュ件数・フェーズ別の時間・プロファイル・
+                # 学習した文字コードを合算
+                self.repository.io_counter.merge(io_counter)
+                self.phase_timer.merge(phase_timer)
+                self.profiler.merge(profiler)
+                self.repository.encoding_detector.profile.merge(encoding_profile)
+                if self.repository.cache is not None:
+                    self.repository.cache.merge_stats(cache_stats)
+        if failures:
+            raise failures[min(failures)]
+        return [outcome for outcomes in results for outcome in outcomes]
+
     # 共通処理の抽出
     def _merge_and_save(self, csv_files, output_dir: str | Path) -> MergeResult:
-        merged_file = self.merger.merge(csv_files)
-        output_path = self.repository.save(merged_file, output_dir)
+        timer = self.phase_timer
+        with timer.measure("merge", files=len(csv_files)), self.profiler.memory_phase("merge"):
+            merged_file = self.merger.merge(csv_files)
+            timer.annotate(rows=len(merged_file.data))
+        with timer.measure("write"), self.profiler.memory_phase("write"):
+            output_path = self.repository.save(merged_file, output_dir)
         return MergeResult.create_success(
             output_path=output_path,
             merged_file_count=len(csv_files),
@@ -82,16 +340,143 @@ class MergeCsvFilesUseCase:
             message=f"CSVファイルの結合が完了しました。出力: {output_path}"
         )
 
+    def _merge_and_save_streaming(
+        self,
+        input_paths: list[str | Path],
+        output_dir: str | Path
+    ) -> MergeResult:
+        """入力を順に読みながら結合し、チャンク単位で保存する
+        
+        入力はまず先頭・末尾の行だけを走査して日付・行数を取得し（scan()）、
+        連続日の検証はデータを読み込まずに行います。各入力は結合で必要になった
+        時点で読み込まれ、書き出し後に解放されるため、結合後のDataFrame全体は
+        メモリに保持されません。読み込みは日付順に STREAMING_BATCH_SIZE ファイルずつ
+        load_many() でまとめて行います。
+        
+        Args:
+            input_paths: 入力CSVファイルのパスリスト
+            output_dir: 出力先ディレクトリ
+            
+        Returns:
+            結合結果を表すMergeResultオブジェクト
+        """
+        sources = self.repository.scan(input_paths, self.STREAMING_BATCH_SIZE)
+        total_rows = 0
+        
+        def count_rows(chunks):
+            nonlocal total_rows
+            for chunk in chunks:
+                total_rows += len(chunk)
+                yield chunk
+        
+        # 入力の読み込みと結合はチャンクを取り出すたびに実行されるため、
+        # 取り出しの時間を merge（内側の読み込みの各フェーズを除く）として計測する
+        timer = self.phase_timer
+        chunks = timer.measure_iter("merge", self.merger.merge_streaming(sources))
+        with timer.measure("write"):
+            output_path = self.repository.save_stream(count_rows(chunks), output_dir)
+        return MergeResult.create_success(
+            output_path=output_path,
+            merged_file_count=len(input_paths),
+            total_rows=total_rows,
+            message=f"CSVファイルの結合が完了しました。出力: {output_path}"
+        )
+
     def _handle_exception(self, e: Exception) -> MergeResult:
+        if isinstance(e, MultipleFileErrors):
+            # 1行目に件数、以降にファイルごとのエラーを並べる
+            lines = [f"{str(e)}:"]
+            for path, error in e.errors:
+                message = self._describe_error(error)
+                lines.append(f"  {message}" if path.name in message else f"  {path.name}: {message}")
+            return MergeResult.create_failure(error_message="\n".join(lines))
+        return MergeResult.create_failure(error_message=self._describe_error(e))
+
+    @staticmethod
+    def _describe_error(e: Exception) -> str:
         if isinstance(e, CsvFileNotFoundError):
-            return MergeResult.create_failure(error_message=f"ファイルが見つかりません: {str(e)}")
+            return f"ファイルが見つかりません: {str(e)}"
         if isinstance(e, InvalidCsvFormatError):
-            return MergeResult.create_failure(error_message=f"CSVフォーマットが不正です: {str(e)}")
+            return f"CSVフォーマットが不正です: {str(e)}"
         if isinstance(e, MergeError):
-            return MergeResult.create_failure(error_message=f"結合処理でエラーが発生しました: {str(e)}")
+            return f"結合処理でエラーが発生しました: {str(e)}"
         if isinstance(e, EmptyDataError):
-            return MergeResult.create_failure(error_message=f"データが空です: {str(e)}")
+            return f"データが空です: {str(e)}"
         if isinstance(e, CsvMergerError):
-            return MergeResult.create_failure(error_message=f"CSV結合エラー: {str(e)}")
-        return MergeResult.create_failure(error_message=f"予期しないエラーが発生しました: {str(e)}")
+            return f"CSV結合エラー: {str(e)}"
+        return f"予期しないエラーが発生しました: {str(e)}"
+
+
+def _worker_context() -> multiprocessing.context.BaseContext:
+    """ワーカープロセスの起動方法（forkserver、使えない環境では spawn）を返す
+    
+    Returns:
+        プロセスプールに渡すコンテキスト
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+# ワーカープロセスで共有する読み込みの中止トークン（_init_worker で設定）
+_worker_cancellation: CancellationToken | None = None
+
+
+def _init_worker(failed) -> None:
+    """ワーカープロセスの起動時に、最初に失敗したチャンクの番号を共有する値を受け取る
+    
+    Args:
+        failed: プロセス間で共有する値（Noneの場合は中止しない）
+    """
+    global _worker_cancellation
+    _worker_cancellation = CancellationToken(failed) if failed is not None else None
+
+
+def _load_chunk(
+    repository: CsvRepository,
+    profiler: RunProfiler,
+    input_paths: list[str | Path],
+    position: int = 0
+) -> tuple[
+    Sequence[CsvFile | Exception], IoByteCounter, dict[str, int], PhaseTimer, RunProfiler, EncodingProfile
+]:
+    """ワーカープロセスで入力ファイルのチャンクを読み込む
+    
+    ワーカーに渡されたリポジトリ・プロファイラは親プロセスの複製のため、
+    集計値をリセットしてから読み込み、このチャンク分の集計値を結果と一緒に返します。
+    中止トークンがある場合は、失敗したファイルで後のチャンクのワーカーに中止を伝えて
+    このチャンクで入力順に最初の失敗の例外を送出し、前のチャンクが失敗した場合は
+    LoadCancelledError を送出します。
+    中止トークンがない場合（collect_errors）は、失敗したファイルの例外を結果として返します。
+    
+    Args:
+        repository: CSVリポジトリ（親プロセスの複製）
+        profiler: プロファイラ（親プロセスの複製）
+        input_paths: 読み込むCSVファイルのパスリスト
+        position: チャンクの番号（入力順）
+        
+    Returns:
+        (入力順に並んだ結果のリスト, I/Oバイト数, キャッシュの集計値, フェーズ別の時間, プロファイル,
+        学習した文字コード)
+    """
+    cancellation = _worker_cancellation.at(position) if _worker_cancellation is not None else None
+    repository.cancellation = cancellation
+    load: Callable[[list[str | Path]], Sequence[CsvFile | Exception]]
+    if cancellation is not None:
+        # 開始前に前のチャンクが失敗していれば読み込まない
+        cancellation.raise_if_cancelled()
+        load = repository.load_many
+    else:
+        load = repository.load_outcomes
+    repository.io_counter.reset()
+    repository.phase_timer.reset()
+    profiler.reset()
+    if repository.cache is not None:
+        repository.cache.reset_stats()
+    with repository.phase_timer.span("load_chunk", files=len(input_paths)):
+        with profiler.cpu_profile(), profiler.memory_phase("load"):
+            outcomes = load(input_paths)
+    cache_stats = repository.cache.stats if repository.cache is not None else {}
+    return (outcomes, repository.io_counter, cache_stats, repository.phase_timer, profiler,
+            repository.encoding_detector.profile)
 